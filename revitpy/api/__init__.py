@@ -6,8 +6,10 @@ Provides a high-level, intuitive interface to the Revit API with modern Python c
 
 from .element import Element, ElementSet
 from .exceptions import ElementNotFoundError, RevitAPIError, TransactionError
+from .paging import ElementCursor, ElementPage, ElementPager
 from .query import Query, QueryBuilder
-from .transaction import Transaction, TransactionGroup
+from .spatial import BoundingBox, SpatialIndex
+from .transaction import CoalescingTransaction, Transaction, TransactionGroup
 from .wrapper import RevitAPI
 
 __all__ = [
@@ -15,7 +17,13 @@ __all__ = [
     "ElementSet",
     "Transaction",
     "TransactionGroup",
+    "CoalescingTransaction",
     "RevitAPI",
+    "ElementCursor",
+    "ElementPage",
+    "ElementPager",
+    "BoundingBox",
+    "SpatialIndex",
     "Query",
     "QueryBuilder",
     "RevitAPIError",
@@ -5,7 +5,9 @@ Pythonic Element wrapper with modern Python conventions.
 from __future__ import annotations
 
 import weakref
-from collections.abc import Iterator
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import (
     Any,
@@ -23,6 +25,8 @@ from .exceptions import (
     RevitAPIError,
     ValidationError,
 )
+from .spatial import BoundingBox
+from .transaction import ITransactionProvider, Transaction, TransactionOptions
 
 T = TypeVar("T", bound="Element")
 P = TypeVar("P")
@@ -154,7 +158,12 @@ class Element(metaclass=ElementMetaclass):
         self._revit_element = revit_element
         self._parameter_cache: dict[str, ParameterValue] = {}
         self._change_tracker: dict[str, Any] = {}
+        # Value still in Revit for each change staged by deferred_changes()
+        self._unwritten: dict[str, Any] = {}
+        self._defer_depth = 0
         self._is_dirty = False
+        # Called after changes are written, e.g. to refresh a spatial index
+        self._write_listener: Callable[[Element], None] | None = None
 
         # Create weak reference to avoid circular references
         self._weak_ref = weakref.ref(self)
@@ -174,6 +183,19 @@ class Element(metaclass=ElementMetaclass):
         """Set the element name."""
         self.set_parameter_value("Name", value)
 
+    @property
+    def bounding_box(self) -> BoundingBox | None:
+        """Get the element's axis-aligned bounding box, if it has geometry."""
+        accessor = getattr(self._revit_element, "get_BoundingBox", None)
+        if accessor is None:
+            return None
+
+        try:
+            return BoundingBox.from_revit(accessor(None))
+        except Exception as e:
+            logger.warning(f"Failed to get bounding box of element {self.id}: {e}")
+            return None
+
     @property
     def is_dirty(self) -> bool:
         """Check if element has unsaved changes."""
@@ -184,6 +206,32 @@ class Element(metaclass=ElementMetaclass):
         """Get tracked changes."""
         return self._change_tracker.copy()
 
+    @property
+    def dirty_parameters(self) -> list[str]:
+        """Get the names of parameters with changes not yet written to Revit."""
+        return list(self._unwritten)
+
+    @contextmanager
+    def deferred_changes(self) -> Iterator[Element]:
+        """
+        Stage tracked changes instead of writing them to Revit immediately.
+
+        Changes made inside the scope stay pending until ``save_changes`` or
+        ``save_elements`` writes them, so many changes can share one
+        transaction. Scopes can be nested.
+
+        Example:
+            with wall.deferred_changes():
+                wall.name = "Exterior"
+                wall.mark = "W1"
+            wall.save_changes(provider)
+        """
+        self._defer_depth += 1
+        try:
+            yield self
+        finally:
+            self._defer_depth -= 1
+
     def get_parameter_value(self, parameter_name: str, use_cache: bool = True) -> Any:
         """
         Get parameter value with caching and type conversion.
@@ -231,6 +279,11 @@ class Element(metaclass=ElementMetaclass):
         """
         Set parameter value with type conversion and change tracking.
 
+        The value is written to Revit immediately, unless the change is
+        tracked inside ``deferred_changes()``; then it is staged and written
+        by ``save_changes``. Setting a parameter back to its original value
+        removes it from the tracked changes.
+
         Args:
             parameter_name: Name of the parameter
             value: New value
@@ -244,18 +297,12 @@ class Element(metaclass=ElementMetaclass):
             # Convert Python value to Revit type
             revit_value = self._convert_to_revit(value)
 
-            # Set the value
-            self._revit_element.SetParameterValue(parameter_name, revit_value)
-
-            # Track changes
+            deferred = track_changes and self._defer_depth > 0
             if track_changes:
-                old_value = self._parameter_cache.get(parameter_name, {}).get("value")
-                if old_value != value:
-                    self._change_tracker[parameter_name] = {
-                        "old": old_value,
-                        "new": value,
-                    }
-                    self._is_dirty = True
+                self._stage_change(parameter_name, value, deferred)
+            if not deferred:
+                self._revit_element.SetParameterValue(parameter_name, revit_value)
+                self._notify_written()
 
             # Update cache
             param_value = ParameterValue(
@@ -281,6 +328,33 @@ class Element(metaclass=ElementMetaclass):
                 cause=e,
             )
 
+    def _stage_change(self, parameter_name: str, value: Any, deferred: bool) -> None:
+        """Record a change, diffing against the original value."""
+        change = self._change_tracker.get(parameter_name)
+        if change is None:
+            try:
+                original = self.get_parameter_value(parameter_name)
+            except ElementNotFoundError:
+                original = None
+            written = original
+        else:
+            original = change["old"]
+            written = self._unwritten.get(parameter_name, change["new"])
+
+        if deferred and value != written:
+            self._unwritten[parameter_name] = written
+        else:
+            self._unwritten.pop(parameter_name, None)
+            if not deferred:
+                written = value
+
+        if value == original and written == original:
+            self._change_tracker.pop(parameter_name, None)
+        else:
+            self._change_tracker[parameter_name] = {"old": original, "new": value}
+
+        self._is_dirty = bool(self._change_tracker)
+
     def get_all_parameters(
         self, refresh_cache: bool = False
     ) -> dict[str, ParameterValue]:
@@ -309,17 +383,42 @@ class Element(metaclass=ElementMetaclass):
 
         return parameters
 
-    def save_changes(self) -> None:
-        """Save all tracked changes to Revit."""
+    def save_changes(self, provider: ITransactionProvider | None = None) -> None:
+        """
+        Save all tracked changes to Revit.
+
+        Changes staged by ``deferred_changes()`` are written; changes that
+        were written immediately only stop being tracked.
+
+        Args:
+            provider: Transaction provider used to apply the changes in a
+                single transaction. Without one, the caller is expected to
+                have a transaction open already.
+
+        Raises:
+            TransactionError: If the transaction fails; changes stay pending
+        """
         if not self._is_dirty:
             return
 
-        # In a real implementation, this would batch the changes
-        # and apply them in a transaction
-        logger.info(f"Saving {len(self._change_tracker)} changes to element {self.id}")
+        save_elements([self], provider)
+
+    def _write_change(self, parameter_name: str) -> None:
+        """Write one pending change to the underlying Revit element."""
+        value = self._change_tracker[parameter_name]["new"]
+        self._revit_element.SetParameterValue(
+            parameter_name, self._convert_to_revit(value)
+        )
+
+    def _notify_written(self) -> None:
+        """Tell the write listener that changes reached Revit."""
+        if self._write_listener is not None:
+            self._write_listener(self)
 
-        # Clear change tracking
+    def _mark_saved(self) -> None:
+        """Clear pending changes after they have been written."""
         self._change_tracker.clear()
+        self._unwritten.clear()
         self._is_dirty = False
 
     def discard_changes(self) -> None:
@@ -333,6 +432,7 @@ class Element(metaclass=ElementMetaclass):
                 del self._parameter_cache[param_name]
 
         self._change_tracker.clear()
+        self._unwritten.clear()
         self._is_dirty = False
 
         logger.info(f"Discarded changes for element {self.id}")
@@ -341,6 +441,7 @@ class Element(metaclass=ElementMetaclass):
         """Refresh element data from Revit."""
         self._parameter_cache.clear()
         self._change_tracker.clear()
+        self._unwritten.clear()
         self._is_dirty = False
 
         logger.debug(f"Refreshed element {self.id}")
@@ -509,6 +610,11 @@ class ElementSet(Generic[T]):
 
         return groups
 
+    def save_changes(self, provider: ITransactionProvider | None = None) -> int:
+        """Save tracked changes of all elements in the set together."""
+        self._ensure_evaluated()
+        return save_elements(self._elements, provider)
+
     def _ensure_evaluated(self) -> None:
         """Ensure the query is evaluated."""
         if self._is_evaluated:
@@ -542,3 +648,74 @@ class ElementSet(Generic[T]):
     def __contains__(self, item: T) -> bool:
         self._ensure_evaluated()
         return item in self._elements
+
+
+def save_elements(
+    elements: Iterable[Element], provider: ITransactionProvider | None = None
+) -> int:
+    """
+    Save the tracked changes of many elements in one pass.
+
+    Changes staged by ``Element.deferred_changes()`` are grouped by
+    parameter name so that every parameter definition is written in one
+    run, through the provider's ``set_parameter_values`` bulk hook when it
+    offers one. With a provider, all writes happen in a single transaction.
+
+    Args:
+        elements: Elements whose pending changes should be saved
+        provider: Transaction provider for the enclosing transaction
+
+    Returns:
+        Number of elements that had changes saved
+
+    Raises:
+        TransactionError: If the transaction fails; changes stay pending
+    """
+    dirty = [element for element in elements if element.is_dirty]
+    if not dirty:
+        return 0
+
+    updates: dict[str, list[Element]] = defaultdict(list)
+    for element in dirty:
+        for parameter_name in element.dirty_parameters:
+            updates[parameter_name].append(element)
+
+    def write_all() -> None:
+        bulk_setter = getattr(provider, "set_parameter_values", None)
+        for parameter_name, targets in updates.items():
+            if bulk_setter is not None:
+                bulk_setter(
+                    parameter_name,
+                    [
+                        (
+                            element._revit_element,
+                            element._convert_to_revit(
+                                element._change_tracker[parameter_name]["new"]
+                            ),
+                        )
+                        for element in targets
+                    ],
+                )
+            else:
+                for element in targets:
+                    element._write_change(parameter_name)
+
+    change_count = sum(len(targets) for targets in updates.values())
+
+    if provider is None:
+        write_all()
+    elif updates:
+        options = TransactionOptions(name=f"Save {len(dirty)} elements")
+        with Transaction(provider, options) as trans:
+            trans.add_operation(write_all)
+
+    written = {
+        id(element): element for targets in updates.values() for element in targets
+    }
+    for element in dirty:
+        element._mark_saved()
+    for element in written.values():
+        element._notify_written()
+
+    logger.info(f"Saved {change_count} changes to {len(dirty)} elements")
+    return len(dirty)
@@ -0,0 +1,177 @@
+"""
+Cursor-based paged enumeration of document elements.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any
+
+from loguru import logger
+
+from .element import Element, IRevitElement
+
+
+@dataclass(frozen=True)
+class ElementCursor:
+    """Resumable position within an element enumeration."""
+
+    offset: int = 0
+    last_element_id: int | None = None
+
+    def to_token(self) -> str:
+        """Serialize the cursor to an opaque position token."""
+        last_id = "" if self.last_element_id is None else str(self.last_element_id)
+        return f"{self.offset}:{last_id}"
+
+    @classmethod
+    def from_token(cls, token: str) -> ElementCursor:
+        """Restore a cursor from a position token."""
+        try:
+            offset, _, last_id = token.partition(":")
+            return cls(
+                offset=int(offset),
+                last_element_id=int(last_id) if last_id else None,
+            )
+        except ValueError as e:
+            raise ValueError(f"Invalid element cursor token: {token!r}") from e
+
+
+@dataclass
+class ElementPage:
+    """A page of wrapped elements and the cursor following it."""
+
+    elements: list[Element]
+    cursor: ElementCursor
+    page_number: int
+    has_more: bool
+
+    def __iter__(self) -> Iterator[Element]:
+        return iter(self.elements)
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+
+class ElementPager:
+    """
+    Iterate over document elements one page at a time.
+
+    Only the raw elements of the current page are wrapped; previous pages
+    are not referenced by the pager, so their wrappers can be released as
+    soon as the caller drops them. :attr:`cursor` always points after the
+    last page returned and can be persisted to resume an interrupted run.
+    """
+
+    def __init__(
+        self,
+        source: Callable[[], Iterable[IRevitElement]],
+        wrap: Callable[[IRevitElement], Element],
+        page_size: int = 500,
+        cursor: ElementCursor | str | None = None,
+    ) -> None:
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+
+        if isinstance(cursor, str):
+            cursor = ElementCursor.from_token(cursor)
+
+        self._source = source
+        self._wrap = wrap
+        self._page_size = page_size
+        self._cursor = cursor or ElementCursor()
+        self._iterator: Iterator[IRevitElement] | None = None
+        self._lookahead: IRevitElement | None = None
+        self._page_number = 0
+        self._exhausted = False
+
+    @property
+    def page_size(self) -> int:
+        """Get the number of elements per page."""
+        return self._page_size
+
+    @property
+    def cursor(self) -> ElementCursor:
+        """Get the position after the last page returned."""
+        return self._cursor
+
+    @property
+    def position_token(self) -> str:
+        """Get the current position as a token for checkpointing."""
+        return self._cursor.to_token()
+
+    def __iter__(self) -> Iterator[ElementPage]:
+        return self
+
+    def __next__(self) -> ElementPage:
+        if self._exhausted:
+            raise StopIteration
+
+        iterator = self._ensure_iterator()
+
+        raw_elements: list[IRevitElement] = []
+        if self._lookahead is not None:
+            raw_elements.append(self._lookahead)
+            self._lookahead = None
+        raw_elements.extend(islice(iterator, self._page_size - len(raw_elements)))
+
+        if not raw_elements:
+            self._exhausted = True
+            raise StopIteration
+
+        self._lookahead = next(iterator, None)
+        has_more = self._lookahead is not None
+        self._exhausted = not has_more
+
+        self._page_number += 1
+        self._cursor = ElementCursor(
+            offset=self._cursor.offset + len(raw_elements),
+            last_element_id=_element_id(raw_elements[-1]),
+        )
+
+        return ElementPage(
+            elements=[self._wrap(raw) for raw in raw_elements],
+            cursor=self._cursor,
+            page_number=self._page_number,
+            has_more=has_more,
+        )
+
+    def iter_elements(self) -> Iterator[Element]:
+        """Iterate element by element, fetching pages on demand."""
+        for page in self:
+            yield from page.elements
+
+    def _ensure_iterator(self) -> Iterator[IRevitElement]:
+        """Open the underlying collector and skip to the cursor position."""
+        if self._iterator is not None:
+            return self._iterator
+
+        iterator = iter(self._source())
+        offset = self._cursor.offset
+
+        if offset:
+            skipped = None
+            for skipped in islice(iterator, offset):
+                pass
+
+            expected_id = self._cursor.last_element_id
+            if expected_id is not None and (
+                skipped is None or _element_id(skipped) != expected_id
+            ):
+                logger.warning(
+                    f"Element enumeration changed since cursor was taken: expected "
+                    f"element {expected_id} at offset {offset}"
+                )
+
+        self._iterator = iterator
+        return iterator
+
+
+def _element_id(revit_element: Any) -> int | None:
+    """Get the integer ID of a raw Revit element, if available."""
+    try:
+        return int(revit_element.Id.IntegerValue)
+    except (AttributeError, TypeError, ValueError):
+        return None
@@ -4,9 +4,12 @@ LINQ-style querying system for Revit elements.
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import heapq
+import re
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
 from enum import Enum
+from itertools import islice
 from typing import (
     Any,
     Generic,
@@ -18,6 +21,15 @@ from typing import (
 from loguru import logger
 
 from .element import Element, ElementSet
+from .spatial import (
+    BoundingBox,
+    SpatialIndex,
+    bounding_box_of,
+    confirm_spatial,
+    nearest_elements,
+    search_index,
+    spatial_test,
+)
 
 T = TypeVar("T", bound=Element)
 
@@ -41,6 +53,22 @@ class FilterOperator(Enum):
     REGEX = "regex"
 
 
+_COMPARATORS: dict[FilterOperator, Callable[[Any, Any], bool]] = {
+    FilterOperator.EQUALS: lambda x, y: x == y,
+    FilterOperator.NOT_EQUALS: lambda x, y: x != y,
+    FilterOperator.GREATER_THAN: lambda x, y: x > y,
+    FilterOperator.LESS_THAN: lambda x, y: x < y,
+    FilterOperator.GREATER_EQUAL: lambda x, y: x >= y,
+    FilterOperator.LESS_EQUAL: lambda x, y: x <= y,
+}
+
+_STRING_COMPARATORS: dict[FilterOperator, Callable[[str, str], bool]] = {
+    FilterOperator.CONTAINS: lambda x, y: y in x,
+    FilterOperator.STARTS_WITH: lambda x, y: x.startswith(y),
+    FilterOperator.ENDS_WITH: lambda x, y: x.endswith(y),
+}
+
+
 class SortDirection(Enum):
     """Sort direction for queries."""
 
@@ -59,64 +87,79 @@ class FilterCriteria:
 
     def apply(self, element: Element) -> bool:
         """Apply this filter criteria to an element."""
-        try:
-            element_value = element.get_parameter_value(self.property_name)
-
-            if self.operator == FilterOperator.EQUALS:
-                return self._compare_values(
-                    element_value, self.value, lambda x, y: x == y
-                )
-            elif self.operator == FilterOperator.NOT_EQUALS:
-                return self._compare_values(
-                    element_value, self.value, lambda x, y: x != y
-                )
-            elif self.operator == FilterOperator.GREATER_THAN:
-                return self._compare_values(
-                    element_value, self.value, lambda x, y: x > y
-                )
-            elif self.operator == FilterOperator.LESS_THAN:
-                return self._compare_values(
-                    element_value, self.value, lambda x, y: x < y
-                )
-            elif self.operator == FilterOperator.GREATER_EQUAL:
-                return self._compare_values(
-                    element_value, self.value, lambda x, y: x >= y
-                )
-            elif self.operator == FilterOperator.LESS_EQUAL:
-                return self._compare_values(
-                    element_value, self.value, lambda x, y: x <= y
-                )
-            elif self.operator == FilterOperator.CONTAINS:
-                return self._string_compare(
-                    element_value, self.value, lambda x, y: y in x
-                )
-            elif self.operator == FilterOperator.STARTS_WITH:
-                return self._string_compare(
-                    element_value, self.value, lambda x, y: x.startswith(y)
-                )
-            elif self.operator == FilterOperator.ENDS_WITH:
-                return self._string_compare(
-                    element_value, self.value, lambda x, y: x.endswith(y)
-                )
-            elif self.operator == FilterOperator.IN:
-                return element_value in self.value if self.value else False
-            elif self.operator == FilterOperator.NOT_IN:
-                return element_value not in self.value if self.value else True
-            elif self.operator == FilterOperator.IS_NULL:
+        return self.compile()(element)
+
+    def compile(self) -> Callable[[Element], bool]:
+        """
+        Compile this criteria into a predicate.
+
+        Operator dispatch, regex compilation and case folding of the
+        comparison value happen once here rather than for every element.
+        """
+        property_name = self.property_name
+        operator = self.operator
+        value = self.value
+
+        if operator in _COMPARATORS:
+            comparator = _COMPARATORS[operator]
+
+            def test(element_value: Any) -> bool:
+                return self._compare_values(element_value, value, comparator)
+
+        elif operator in _STRING_COMPARATORS:
+            comparator = _STRING_COMPARATORS[operator]
+            str_value = str(value) if value is not None else ""
+            if not self.case_sensitive:
+                str_value = str_value.lower()
+            case_sensitive = self.case_sensitive
+
+            def test(element_value: Any) -> bool:
+                str_a = str(element_value) if element_value is not None else ""
+                if not case_sensitive:
+                    str_a = str_a.lower()
+                return comparator(str_a, str_value)
+
+        elif operator == FilterOperator.IN:
+
+            def test(element_value: Any) -> bool:
+                return element_value in value if value else False
+
+        elif operator == FilterOperator.NOT_IN:
+
+            def test(element_value: Any) -> bool:
+                return element_value not in value if value else True
+
+        elif operator == FilterOperator.IS_NULL:
+
+            def test(element_value: Any) -> bool:
                 return element_value is None
-            elif self.operator == FilterOperator.IS_NOT_NULL:
+
+        elif operator == FilterOperator.IS_NOT_NULL:
+
+            def test(element_value: Any) -> bool:
                 return element_value is not None
-            elif self.operator == FilterOperator.REGEX:
-                import re
 
-                pattern = self.value if self.case_sensitive else f"(?i){self.value}"
-                return bool(re.search(pattern, str(element_value)))
+        elif operator == FilterOperator.REGEX:
+            try:
+                pattern = re.compile(value, 0 if self.case_sensitive else re.IGNORECASE)
+            except (re.error, TypeError) as e:
+                logger.warning(f"Invalid regex for filter {property_name}: {e}")
+                return lambda element: False
+
+            def test(element_value: Any) -> bool:
+                return pattern.search(str(element_value)) is not None
 
-            return False
+        else:
+            return lambda element: False
+
+        def predicate(element: Element) -> bool:
+            try:
+                return test(element.get_parameter_value(property_name))
+            except Exception as e:
+                logger.warning(f"Error applying filter {property_name}: {e}")
+                return False
 
-        except Exception as e:
-            logger.warning(f"Error applying filter {self.property_name}: {e}")
-            return False
+        return predicate
 
     def _compare_values(
         self, a: Any, b: Any, comparator: Callable[[Any, Any], bool]
@@ -139,19 +182,6 @@ class FilterCriteria:
             # Fall back to string comparison
             return comparator(str(a), str(b))
 
-    def _string_compare(
-        self, a: Any, b: Any, comparator: Callable[[str, str], bool]
-    ) -> bool:
-        """Compare values as strings."""
-        str_a = str(a) if a is not None else ""
-        str_b = str(b) if b is not None else ""
-
-        if not self.case_sensitive:
-            str_a = str_a.lower()
-            str_b = str_b.lower()
-
-        return comparator(str_a, str_b)
-
 
 @dataclass
 class SortCriteria:
@@ -168,6 +198,30 @@ class SortCriteria:
         except Exception:
             return ""
 
+    def get_directed_sort_key(self, element: Element) -> Any:
+        """Get the sort key for an element, wrapped to honour the direction."""
+        key = self.get_sort_key(element)
+        if self.direction == SortDirection.DESCENDING:
+            return _DescendingKey(key)
+        return key
+
+
+class _DescendingKey:
+    """Sort key wrapper that inverts ordering for descending sorts."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __lt__(self, other: _DescendingKey) -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _DescendingKey) and self.value == other.value
+
+    __hash__ = None  # type: ignore[assignment]
+
 
 @runtime_checkable
 class IElementProvider(Protocol):
@@ -197,6 +251,8 @@ class QueryBuilder(Generic[T]):
         self._skip_count = 0
         self._take_count: int | None = None
         self._distinct_property: str | None = None
+        self._spatial_filters: list[tuple[str, Any]] = []
+        self._nearest: tuple[Any, int] | None = None
 
     def where(
         self,
@@ -264,6 +320,28 @@ class QueryBuilder(Generic[T]):
         """Filter by regular expression."""
         return self.where(property_name, FilterOperator.REGEX, pattern, case_sensitive)
 
+    def intersects(self, box: BoundingBox) -> QueryBuilder[T]:
+        """Filter elements whose bounding box overlaps ``box``."""
+        self._spatial_filters.append(("intersects", box))
+        return self
+
+    def within(self, box: BoundingBox) -> QueryBuilder[T]:
+        """Filter elements whose bounding box lies entirely inside ``box``."""
+        self._spatial_filters.append(("within", box))
+        return self
+
+    def contains_point(self, point: Any) -> QueryBuilder[T]:
+        """Filter elements whose bounding box contains ``point``."""
+        self._spatial_filters.append(("contains_point", point))
+        return self
+
+    def nearest(self, point: Any, count: int = 1) -> QueryBuilder[T]:
+        """Keep the ``count`` matching elements closest to ``point``."""
+        if count < 1:
+            raise ValueError("count must be at least 1")
+        self._nearest = (point, count)
+        return self
+
     def order_by(
         self, property_name: str, direction: SortDirection = SortDirection.ASCENDING
     ) -> QueryBuilder[T]:
@@ -303,60 +381,131 @@ class QueryBuilder(Generic[T]):
         else:
             elements = self._provider.get_all_elements()
 
-        # Apply filters
-        filtered_elements = elements
-        for criteria in self._filters:
-            filtered_elements = [
-                element for element in filtered_elements if criteria.apply(element)
-            ]
-
-        # Apply sorting
-        if self._sorts:
-
-            def sort_key(element: Element) -> tuple:
-                keys = []
-                for sort_criteria in self._sorts:
-                    key = sort_criteria.get_sort_key(element)
-                    if sort_criteria.direction == SortDirection.DESCENDING:
-                        # For descending, we need to reverse the comparison
-                        if isinstance(key, str):
-                            key = key[::-1] if key else ""
-                        elif isinstance(key, int | float):
-                            key = -key
-                    keys.append(key)
-                return tuple(keys)
-
-            filtered_elements = sorted(filtered_elements, key=sort_key)
-
-        # Apply distinct
-        if self._distinct_property:
-            seen_values = set()
-            distinct_elements = []
-
-            for element in filtered_elements:
-                try:
-                    value = element.get_parameter_value(self._distinct_property)
-                    if value not in seen_values:
-                        seen_values.add(value)
-                        distinct_elements.append(element)
-                except Exception:
-                    # Include elements where property can't be read
-                    distinct_elements.append(element)
-
-            filtered_elements = distinct_elements
+        # Filters and distinct run in a single pass over the source
+        spatial_index = self._get_spatial_index()
+        matched = self._iter_matching(elements, spatial_index)
+        if self._nearest is not None:
+            matched = iter(self._select_nearest(matched, spatial_index))
 
-        # Apply skip and take
         start_index = self._skip_count
         end_index = start_index + self._take_count if self._take_count else None
 
-        final_elements = filtered_elements[start_index:end_index]
+        if self._sorts:
+            sort_key = self._compile_sort_key()
+            if end_index is not None:
+                # Equivalent to a stable sort followed by a slice, but only
+                # keeps end_index rows alive.
+                ordered = heapq.nsmallest(end_index, matched, key=sort_key)
+            else:
+                ordered = list(matched)
+                ordered.sort(key=sort_key)
+            final_elements = ordered[start_index:end_index]
+        else:
+            final_elements = list(islice(matched, start_index, end_index))
 
         logger.debug(
-            f"Query executed: {len(elements)} -> {len(filtered_elements)} -> {len(final_elements)} elements"
+            f"Query executed: {len(elements)} -> {len(final_elements)} elements"
         )
 
         return ElementSet(final_elements)
 
+    def _compile_predicate(
+        self, include_spatial: bool = False
+    ) -> Callable[[Element], bool] | None:
+        """Combine all filter criteria into a single predicate."""
+        predicates = [criteria.compile() for criteria in self._filters]
+        if include_spatial:
+            predicates.extend(
+                _spatial_predicate(kind, argument)
+                for kind, argument in self._spatial_filters
+            )
+        if not predicates:
+            return None
+        if len(predicates) == 1:
+            return predicates[0]
+
+        def predicate(element: Element) -> bool:
+            return all(p(element) for p in predicates)
+
+        return predicate
+
+    def _compile_sort_key(self) -> Callable[[Element], tuple]:
+        """Build a key function producing one tuple entry per sort criteria."""
+        key_getters = [criteria.get_directed_sort_key for criteria in self._sorts]
+
+        def sort_key(element: Element) -> tuple:
+            return tuple(get_key(element) for get_key in key_getters)
+
+        return sort_key
+
+    def _get_spatial_index(self) -> SpatialIndex | None:
+        """Get the provider's spatial index if spatial operations need it."""
+        if not self._spatial_filters and self._nearest is None:
+            return None
+
+        index = getattr(self._provider, "spatial_index", None)
+        return index if isinstance(index, SpatialIndex) else None
+
+    def _spatial_candidates(self, index: SpatialIndex | None) -> set[Any] | None:
+        """Resolve spatial filters to a set of element keys using the index."""
+        if index is None or not self._spatial_filters:
+            return None
+
+        candidates: set[Any] | None = None
+        for kind, argument in self._spatial_filters:
+            keys = search_index(index, kind, argument)
+            candidates = keys if candidates is None else candidates & keys
+
+        return candidates
+
+    def _select_nearest(
+        self, elements: Iterable[Element], index: SpatialIndex | None
+    ) -> list[Element]:
+        """Keep the elements closest to the requested point, nearest first."""
+        point, count = self._nearest
+
+        if index is not None:
+            return nearest_elements(index, elements, point, count)
+
+        with_boxes = (
+            (box.distance_to_point(point), position, element)
+            for position, element in enumerate(elements)
+            if (box := bounding_box_of(element)) is not None
+        )
+        return [element for _, _, element in heapq.nsmallest(count, with_boxes)]
+
+    def _iter_matching(
+        self, elements: Iterable[Element], spatial_index: SpatialIndex | None = None
+    ) -> Iterator[Element]:
+        """Yield elements passing the filters, de-duplicated if requested."""
+        candidates = self._spatial_candidates(spatial_index)
+        box_tests = [
+            spatial_test(kind, argument) for kind, argument in self._spatial_filters
+        ]
+        predicate = self._compile_predicate(include_spatial=spatial_index is None)
+        distinct_property = self._distinct_property
+        seen_values: set[Any] = set()
+
+        for element in elements:
+            if candidates is not None and not confirm_spatial(
+                element, spatial_index, candidates, box_tests
+            ):
+                continue
+            if predicate is not None and not predicate(element):
+                continue
+
+            if distinct_property:
+                try:
+                    value = element.get_parameter_value(distinct_property)
+                    if value in seen_values:
+                        continue
+                    seen_values.add(value)
+                except Exception:
+                    # Include elements where property can't be read
+                    pass
+
+            yield element
+
     def count(self) -> int:
         """Get count of elements matching query."""
         result = self.execute()
@@ -396,6 +545,17 @@ class QueryBuilder(Generic[T]):
         return self.execute().to_list()
 
 
+def _spatial_predicate(kind: str, argument: Any) -> Callable[[Element], bool]:
+    """Build a bounding box predicate for use when no spatial index exists."""
+    test = spatial_test(kind, argument)
+
+    def predicate(element: Element) -> bool:
+        box = bounding_box_of(element)
+        return box is not None and test(box)
+
+    return predicate
+
+
 class Query:
     """
     Static factory class for creating queries.
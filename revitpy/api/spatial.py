@@ -0,0 +1,620 @@
+"""
+Spatial indexing of element bounding boxes.
+
+Provides an R-tree over axis-aligned bounding boxes that is bulk loaded with
+Sort-Tile-Recursive (STR) packing and updated incrementally afterwards. It
+answers intersection, containment and nearest-neighbour queries without
+calling geometry accessors on every element.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from dataclasses import dataclass
+from itertools import count
+from typing import Any
+
+Point3D = tuple[float, float, float]
+
+
+@dataclass(frozen=True)
+class BoundingBox:
+    """Immutable axis-aligned 3D bounding box."""
+
+    min_x: float
+    min_y: float
+    min_z: float
+    max_x: float
+    max_y: float
+    max_z: float
+
+    def __post_init__(self) -> None:
+        if (
+            self.min_x > self.max_x
+            or self.min_y > self.max_y
+            or self.min_z > self.max_z
+        ):
+            raise ValueError(f"Bounding box minimum exceeds maximum: {self}")
+
+    @classmethod
+    def from_points(cls, minimum: Any, maximum: Any) -> BoundingBox:
+        """Create a bounding box from two corner points."""
+        min_x, min_y, min_z = as_point(minimum)
+        max_x, max_y, max_z = as_point(maximum)
+        return cls(min_x, min_y, min_z, max_x, max_y, max_z)
+
+    @classmethod
+    def from_revit(cls, revit_box: Any) -> BoundingBox | None:
+        """Create a bounding box from a Revit ``BoundingBoxXYZ``."""
+        if revit_box is None:
+            return None
+        return cls.from_points(revit_box.Min, revit_box.Max)
+
+    @property
+    def center(self) -> Point3D:
+        """Get the center point of the box."""
+        return (
+            (self.min_x + self.max_x) / 2,
+            (self.min_y + self.max_y) / 2,
+            (self.min_z + self.max_z) / 2,
+        )
+
+    @property
+    def volume(self) -> float:
+        """Get the volume of the box."""
+        return (
+            (self.max_x - self.min_x)
+            * (self.max_y - self.min_y)
+            * (self.max_z - self.min_z)
+        )
+
+    @property
+    def margin(self) -> float:
+        """Get the sum of the box extents."""
+        return (
+            (self.max_x - self.min_x)
+            + (self.max_y - self.min_y)
+            + (self.max_z - self.min_z)
+        )
+
+    def intersects(self, other: BoundingBox) -> bool:
+        """Check whether this box overlaps another (touching counts)."""
+        return (
+            self.min_x <= other.max_x
+            and other.min_x <= self.max_x
+            and self.min_y <= other.max_y
+            and other.min_y <= self.max_y
+            and self.min_z <= other.max_z
+            and other.min_z <= self.max_z
+        )
+
+    def contains(self, other: BoundingBox) -> bool:
+        """Check whether another box lies entirely inside this one."""
+        return (
+            self.min_x <= other.min_x
+            and other.max_x <= self.max_x
+            and self.min_y <= other.min_y
+            and other.max_y <= self.max_y
+            and self.min_z <= other.min_z
+            and other.max_z <= self.max_z
+        )
+
+    def contains_point(self, point: Any) -> bool:
+        """Check whether a point lies inside this box."""
+        x, y, z = as_point(point)
+        return (
+            self.min_x <= x <= self.max_x
+            and self.min_y <= y <= self.max_y
+            and self.min_z <= z <= self.max_z
+        )
+
+    def union(self, other: BoundingBox) -> BoundingBox:
+        """Get the smallest box enclosing this box and another."""
+        return BoundingBox(
+            min(self.min_x, other.min_x),
+            min(self.min_y, other.min_y),
+            min(self.min_z, other.min_z),
+            max(self.max_x, other.max_x),
+            max(self.max_y, other.max_y),
+            max(self.max_z, other.max_z),
+        )
+
+    def distance_to_point(self, point: Any) -> float:
+        """Get the Euclidean distance from a point to the box (0 if inside)."""
+        x, y, z = as_point(point)
+        dx = max(self.min_x - x, 0.0, x - self.max_x)
+        dy = max(self.min_y - y, 0.0, y - self.max_y)
+        dz = max(self.min_z - z, 0.0, z - self.max_z)
+        return math.sqrt(dx * dx + dy * dy + dz * dz)
+
+
+def as_point(value: Any) -> Point3D:
+    """Convert a tuple or Revit ``XYZ``-like object into a 3D point."""
+    if hasattr(value, "X"):
+        return (float(value.X), float(value.Y), float(value.Z))
+
+    coordinates = tuple(float(c) for c in value)
+    if len(coordinates) == 2:
+        return (coordinates[0], coordinates[1], 0.0)
+    if len(coordinates) != 3:
+        raise ValueError(f"Expected a 2D or 3D point, got: {value!r}")
+    return coordinates  # type: ignore[return-value]
+
+
+def bounding_box_of(element: Any) -> BoundingBox | None:
+    """
+    Get the bounding box of an element, if it has one.
+
+    Understands objects exposing a ``bounding_box`` attribute, Revit-style
+    ``get_BoundingBox(view)`` accessors and API wrappers around them.
+    """
+    box = getattr(element, "bounding_box", None)
+    if isinstance(box, BoundingBox):
+        return box
+    if box is not None and hasattr(box, "Min"):
+        return BoundingBox.from_revit(box)
+
+    target = getattr(element, "_revit_element", element)
+    accessor = getattr(target, "get_BoundingBox", None)
+    if accessor is None:
+        return None
+
+    try:
+        return BoundingBox.from_revit(accessor(None))
+    except Exception:
+        return None
+
+
+def element_key(element: Any) -> Hashable:
+    """Get the key used to index an element (its integer ID when available)."""
+    element_id = getattr(element, "id", None)
+    if element_id is None:
+        element_id = getattr(element, "Id", None)
+    if element_id is None:
+        return id(element)
+
+    for attribute in ("value", "IntegerValue"):
+        if hasattr(element_id, attribute):
+            return getattr(element_id, attribute)
+    return element_id
+
+
+class _Node:
+    """R-tree node; leaves hold ``(box, key)`` entries, branches hold nodes."""
+
+    __slots__ = ("leaf", "entries", "box", "parent")
+
+    def __init__(self, leaf: bool, entries: list[Any] | None = None) -> None:
+        self.leaf = leaf
+        self.entries: list[Any] = entries or []
+        self.box: BoundingBox | None = None
+        self.parent: _Node | None = None
+
+        if not leaf:
+            for child in self.entries:
+                child.parent = self
+        self.recompute_box()
+
+    def entry_box(self, entry: Any) -> BoundingBox:
+        return entry[0] if self.leaf else entry.box
+
+    def recompute_box(self) -> None:
+        box = None
+        for entry in self.entries:
+            entry_box = self.entry_box(entry)
+            box = entry_box if box is None else box.union(entry_box)
+        self.box = box
+
+
+class SpatialIndex:
+    """
+    R-tree over element bounding boxes.
+
+    Keys are arbitrary hashable values (element IDs by default). Use
+    :meth:`bulk_load` to build a well-packed tree in one go, and
+    :meth:`insert`, :meth:`update` and :meth:`remove` to keep it in sync
+    as elements change. Keys updated without a box are remembered as
+    tracked, so callers can tell unseen elements from box-less ones.
+    """
+
+    def __init__(self, max_entries: int = 16) -> None:
+        if max_entries < 4:
+            raise ValueError("max_entries must be at least 4")
+
+        self._max_entries = max_entries
+        self._root = _Node(leaf=True)
+        self._boxes: dict[Hashable, BoundingBox] = {}
+        self._leaf_of: dict[Hashable, _Node] = {}
+        # Keys known to have no bounding box
+        self._unbounded: set[Hashable] = set()
+
+    @classmethod
+    def from_elements(
+        cls, elements: Iterable[Any], max_entries: int = 16
+    ) -> SpatialIndex:
+        """Bulk load an index from elements that carry bounding boxes."""
+        index = cls(max_entries)
+        entries = []
+        unbounded = set()
+        for element in elements:
+            box = bounding_box_of(element)
+            if box is None:
+                unbounded.add(element_key(element))
+            else:
+                entries.append((element_key(element), box))
+
+        index.bulk_load(entries)
+        index._unbounded = unbounded
+        return index
+
+    def __len__(self) -> int:
+        return len(self._boxes)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._boxes
+
+    @property
+    def bounds(self) -> BoundingBox | None:
+        """Get the box enclosing every indexed entry."""
+        return self._root.box
+
+    def get_box(self, key: Hashable) -> BoundingBox | None:
+        """Get the indexed box for a key."""
+        return self._boxes.get(key)
+
+    def is_tracked(self, key: Hashable) -> bool:
+        """Check whether a key is indexed or known to have no box."""
+        return key in self._boxes or key in self._unbounded
+
+    def bulk_load(self, entries: Iterable[tuple[Hashable, BoundingBox]]) -> None:
+        """Replace the index contents using Sort-Tile-Recursive packing."""
+        self._boxes = dict(entries)
+        self._leaf_of = {}
+        self._unbounded = set()
+
+        items = [(box, key) for key, box in self._boxes.items()]
+        if not items:
+            self._root = _Node(leaf=True)
+            return
+
+        nodes = [
+            _Node(leaf=True, entries=group)
+            for group in self._str_pack(items, lambda item: item[0])
+        ]
+        for leaf in nodes:
+            for _, key in leaf.entries:
+                self._leaf_of[key] = leaf
+
+        while len(nodes) > 1:
+            nodes = [
+                _Node(leaf=False, entries=group)
+                for group in self._str_pack(nodes, lambda node: node.box)
+            ]
+
+        self._root = nodes[0]
+        self._root.parent = None
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self.bulk_load(())
+
+    def insert(self, key: Hashable, box: BoundingBox) -> None:
+        """Insert or replace the box for a key."""
+        if key in self._boxes:
+            self.remove(key)
+
+        self._unbounded.discard(key)
+        self._boxes[key] = box
+        leaf = self._choose_leaf(box)
+        leaf.entries.append((box, key))
+        self._leaf_of[key] = leaf
+
+        if len(leaf.entries) > self._max_entries:
+            self._split(leaf)
+        else:
+            self._extend_upwards(leaf, box)
+
+    def update(self, key: Hashable, box: BoundingBox | None) -> None:
+        """Move an entry to a new box, marking it box-less if ``None``."""
+        if box is None:
+            self.remove(key)
+            self._unbounded.add(key)
+        elif self._boxes.get(key) != box:
+            self.insert(key, box)
+
+    def remove(self, key: Hashable) -> bool:
+        """Remove an entry. Returns ``False`` if the key was not indexed."""
+        self._unbounded.discard(key)
+        if key not in self._boxes:
+            return False
+
+        del self._boxes[key]
+        leaf = self._leaf_of.pop(key)
+        leaf.entries = [entry for entry in leaf.entries if entry[1] != key]
+        self._condense(leaf)
+        return True
+
+    def intersects(self, box: BoundingBox) -> list[Hashable]:
+        """Get keys whose boxes overlap the given box."""
+        return list(self._search(box.intersects, box.intersects))
+
+    def within(self, box: BoundingBox) -> list[Hashable]:
+        """Get keys whose boxes lie entirely inside the given box."""
+        return list(self._search(box.intersects, box.contains))
+
+    def containing(self, point: Any) -> list[Hashable]:
+        """Get keys whose boxes contain the given point."""
+        point = as_point(point)
+
+        def test(candidate: BoundingBox) -> bool:
+            return candidate.contains_point(point)
+
+        return list(self._search(test, test))
+
+    def nearest(
+        self,
+        point: Any,
+        count: int = 1,
+        predicate: Callable[[Hashable], bool] | None = None,
+    ) -> list[Hashable]:
+        """Get up to ``count`` keys ordered by distance from a point."""
+        results = []
+        for key in self.iter_nearest(point):
+            if predicate is None or predicate(key):
+                results.append(key)
+                if len(results) >= count:
+                    break
+        return results
+
+    def iter_nearest(self, point: Any) -> Iterator[Hashable]:
+        """Iterate over all keys in increasing distance from a point."""
+        if self._root.box is None:
+            return
+
+        point = as_point(point)
+        tiebreak = count()
+        heap: list[tuple[float, int, bool, Any]] = [
+            (self._root.box.distance_to_point(point), next(tiebreak), False, self._root)
+        ]
+
+        while heap:
+            _, _, is_key, item = heapq.heappop(heap)
+            if is_key:
+                yield item
+                continue
+
+            for entry in item.entries:
+                if item.leaf:
+                    entry_box, key = entry
+                    heapq.heappush(
+                        heap,
+                        (entry_box.distance_to_point(point), next(tiebreak), True, key),
+                    )
+                else:
+                    heapq.heappush(
+                        heap,
+                        (
+                            entry.box.distance_to_point(point),
+                            next(tiebreak),
+                            False,
+                            entry,
+                        ),
+                    )
+
+    # Internal helpers
+
+    def _search(
+        self,
+        node_test: Callable[[BoundingBox], bool],
+        entry_test: Callable[[BoundingBox], bool],
+    ) -> Iterator[Hashable]:
+        """Depth-first search pruning subtrees whose box fails ``node_test``."""
+        if self._root.box is None:
+            return
+
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node.box is None or not node_test(node.box):
+                continue
+
+            if node.leaf:
+                for entry_box, key in node.entries:
+                    if entry_test(entry_box):
+                        yield key
+            else:
+                stack.extend(node.entries)
+
+    def _str_pack(
+        self, items: list[Any], box_of: Callable[[Any], BoundingBox]
+    ) -> list[list[Any]]:
+        """Group items into nodes using Sort-Tile-Recursive tiling on x, y, z."""
+        capacity = self._max_entries
+        node_count = math.ceil(len(items) / capacity)
+        slices = max(1, math.ceil(node_count ** (1 / 3)))
+
+        def center(item: Any, axis: int) -> float:
+            return box_of(item).center[axis]
+
+        groups: list[list[Any]] = []
+        items = sorted(items, key=lambda item: center(item, 0))
+        x_size = math.ceil(len(items) / slices)
+        for x_start in range(0, len(items), x_size):
+            x_slab = sorted(
+                items[x_start : x_start + x_size], key=lambda item: center(item, 1)
+            )
+            y_size = math.ceil(len(x_slab) / slices)
+            for y_start in range(0, len(x_slab), y_size):
+                y_slab = sorted(
+                    x_slab[y_start : y_start + y_size],
+                    key=lambda item: center(item, 2),
+                )
+                for z_start in range(0, len(y_slab), capacity):
+                    groups.append(y_slab[z_start : z_start + capacity])
+
+        return groups
+
+    def _choose_leaf(self, box: BoundingBox) -> _Node:
+        """Descend to the leaf needing the least enlargement to fit ``box``."""
+        node = self._root
+        while not node.leaf:
+
+            def cost(child: _Node) -> tuple[float, float, float]:
+                enlarged = child.box.union(box)
+                return (
+                    enlarged.volume - child.box.volume,
+                    enlarged.margin - child.box.margin,
+                    child.box.volume,
+                )
+
+            node = min(node.entries, key=cost)
+        return node
+
+    def _extend_upwards(self, node: _Node | None, box: BoundingBox) -> None:
+        """Grow node boxes from ``node`` to the root to include ``box``."""
+        while node is not None:
+            node.box = box if node.box is None else node.box.union(box)
+            node = node.parent
+
+    def _split(self, node: _Node) -> None:
+        """Split an overflowing node along its widest axis of centers."""
+        while node is not None and len(node.entries) > self._max_entries:
+            boxes = [node.entry_box(entry) for entry in node.entries]
+            spreads = []
+            for axis in range(3):
+                centers = [box.center[axis] for box in boxes]
+                spreads.append(max(centers) - min(centers))
+            axis = spreads.index(max(spreads))
+
+            ordered = sorted(
+                node.entries, key=lambda entry: node.entry_box(entry).center[axis]
+            )
+            middle = len(ordered) // 2
+            sibling = _Node(leaf=node.leaf, entries=ordered[middle:])
+            node.entries = ordered[:middle]
+            node.recompute_box()
+
+            if node.leaf:
+                for _, key in sibling.entries:
+                    self._leaf_of[key] = sibling
+
+            parent = node.parent
+            if parent is None:
+                self._root = _Node(leaf=False, entries=[node, sibling])
+                return
+
+            sibling.parent = parent
+            parent.entries.append(sibling)
+            parent.recompute_box()
+            node = parent
+
+        if node is not None:
+            self._recompute_upwards(node)
+
+    def _condense(self, node: _Node) -> None:
+        """Drop empty nodes and tighten boxes from ``node`` up to the root."""
+        while node.parent is not None and not node.entries:
+            parent = node.parent
+            parent.entries.remove(node)
+            node = parent
+
+        self._recompute_upwards(node)
+
+        while not self._root.leaf and len(self._root.entries) == 1:
+            self._root = self._root.entries[0]
+            self._root.parent = None
+
+        if not self._root.entries and not self._root.leaf:
+            self._root = _Node(leaf=True)
+
+    def _recompute_upwards(self, node: _Node | None) -> None:
+        """Recompute node boxes from ``node`` up to the root."""
+        while node is not None:
+            node.recompute_box()
+            node = node.parent
+
+
+def spatial_test(kind: str, argument: Any) -> Callable[[BoundingBox], bool]:
+    """
+    Build the bounding box test of a spatial filter.
+
+    Args:
+        kind: ``"intersects"``, ``"within"`` or ``"contains_point"``
+        argument: Box or point the filter was given
+
+    Returns:
+        Function telling whether a box passes the filter
+    """
+    if kind == "intersects":
+        return argument.intersects
+    if kind == "within":
+        return argument.contains
+
+    point = as_point(argument)
+
+    def test(box: BoundingBox) -> bool:
+        return box.contains_point(point)
+
+    return test
+
+
+def search_index(index: SpatialIndex, kind: str, argument: Any) -> set[Hashable]:
+    """Get the keys an index has passing a spatial filter."""
+    if kind == "intersects":
+        return set(index.intersects(argument))
+    if kind == "within":
+        return set(index.within(argument))
+    return set(index.containing(argument))
+
+
+def confirm_spatial(
+    element: Any,
+    index: SpatialIndex,
+    candidates: set[Hashable],
+    tests: Iterable[Callable[[BoundingBox], bool]],
+) -> bool:
+    """
+    Decide whether an element passes spatial filters answered by an index.
+
+    Index candidates and elements the index has not seen yet are checked
+    against their live bounding box, correcting the index on the way, so
+    elements that moved away or were added since it was built are handled.
+    Other elements are trusted to be where the index has them.
+    """
+    key = element_key(element)
+    if key not in candidates and index.is_tracked(key):
+        return False
+
+    box = bounding_box_of(element)
+    index.update(key, box)
+    return box is not None and all(test(box) for test in tests)
+
+
+def nearest_elements(
+    index: SpatialIndex, elements: Iterable[Any], point: Any, count: int
+) -> list[Any]:
+    """
+    Get the ``count`` elements closest to a point using an index.
+
+    Elements the index has not seen are added first, and entries among the
+    results whose live box differs from the indexed one are corrected before
+    searching again, so moved elements are ranked by where they are now.
+    """
+    by_key = {element_key(element): element for element in elements}
+    for key, element in by_key.items():
+        if not index.is_tracked(key):
+            index.update(key, bounding_box_of(element))
+
+    while True:
+        keys = index.nearest(point, count, predicate=by_key.__contains__)
+        stale = [
+            (key, box)
+            for key in keys
+            if (box := bounding_box_of(by_key[key])) != index.get_box(key)
+        ]
+        if not stale:
+            return [by_key[key] for key in keys]
+        for key, box in stale:
+            index.update(key, box)
@@ -5,6 +5,7 @@ Transaction management with context managers and batch operations.
 from __future__ import annotations
 
 import asyncio
+import time
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator, Callable, Iterator
 from contextlib import asynccontextmanager, contextmanager
@@ -108,7 +109,7 @@ class Transaction:
         if self._start_time is None:
             return None
 
-        end_time = self._end_time or asyncio.get_event_loop().time()
+        end_time = self._end_time or time.monotonic()
         return end_time - self._start_time
 
     def add_operation(self, operation: Callable) -> None:
@@ -134,7 +135,7 @@ class Transaction:
             )
 
         try:
-            self._start_time = asyncio.get_event_loop().time()
+            self._start_time = time.monotonic()
             self._transaction = self._provider.start_transaction(self.name)
             self._status = TransactionStatus.STARTED
 
@@ -174,7 +175,7 @@ class Transaction:
                 )
 
             self._status = TransactionStatus.COMMITTED
-            self._end_time = asyncio.get_event_loop().time()
+            self._end_time = time.monotonic()
 
             # Execute commit handlers
             for handler in self._commit_handlers:
@@ -209,7 +210,7 @@ class Transaction:
                     logger.error(f"Provider failed to rollback transaction {self.name}")
 
             self._status = TransactionStatus.ROLLED_BACK
-            self._end_time = asyncio.get_event_loop().time()
+            self._end_time = time.monotonic()
 
             # Execute rollback handlers
             for handler in self._rollback_handlers:
@@ -404,6 +405,235 @@ class TransactionGroup:
         return False
 
 
+class ErrorIsolation(Enum):
+    """How a coalesced batch reacts to a failing write."""
+
+    ALL_OR_NOTHING = "all_or_nothing"
+    BISECT = "bisect"
+
+
+@dataclass
+class FailedWrite:
+    """A write that could not be applied by a coalescing transaction."""
+
+    operation: Callable[[], Any]
+    error: Exception
+
+
+class CoalescingTransaction:
+    """
+    Merge bursts of small writes into a few transactions.
+
+    Writes added with :meth:`add` are buffered and flushed together inside a
+    single transaction of a ``TransactionGroup`` once ``max_operations``
+    writes are pending or ``max_delay`` seconds have passed since the first
+    pending write. Revit therefore regenerates the document once per flush
+    instead of once per write.
+
+    When writes are added from a running event loop, an idle window is
+    flushed by a timer on that loop, on the same thread as the writes.
+    Without a loop the window is checked on the next :meth:`add` or
+    :meth:`flush_if_due`, so callers that may go idle should poll
+    :meth:`flush_if_due` or leave the scope.
+
+    With ``ErrorIsolation.BISECT`` a failing batch is split in halves and
+    retried until the failing writes are isolated; all other writes are
+    still committed and the failures are recorded in :attr:`failed_writes`.
+    """
+
+    def __init__(
+        self,
+        provider: ITransactionProvider,
+        name: str | None = None,
+        max_operations: int = 500,
+        max_delay: float | None = None,
+        isolation: ErrorIsolation = ErrorIsolation.ALL_OR_NOTHING,
+    ) -> None:
+        if max_operations < 1:
+            raise ValueError("max_operations must be at least 1")
+
+        self._provider = provider
+        self._name = name or f"CoalescedTransaction_{uuid4().hex[:8]}"
+        self._max_operations = max_operations
+        self._max_delay = max_delay
+        self._isolation = isolation
+        self._pending: list[Callable[[], Any]] = []
+        self._window_start: float | None = None
+        self._deadline: asyncio.TimerHandle | None = None
+        # Error of a timer flush, raised to the writer on its next call
+        self._deferred_error: Exception | None = None
+        self._failed_writes: list[FailedWrite] = []
+        self._flush_count = 0
+        self._committed_count = 0
+
+    @property
+    def name(self) -> str:
+        """Get coalescing transaction name."""
+        return self._name
+
+    @property
+    def pending_count(self) -> int:
+        """Number of buffered writes not yet flushed."""
+        return len(self._pending)
+
+    @property
+    def flush_count(self) -> int:
+        """Number of transaction groups committed so far."""
+        return self._flush_count
+
+    @property
+    def committed_count(self) -> int:
+        """Number of writes committed so far."""
+        return self._committed_count
+
+    @property
+    def failed_writes(self) -> list[FailedWrite]:
+        """Writes isolated as failing when bisecting."""
+        return self._failed_writes.copy()
+
+    def add(self, operation: Callable[[], Any]) -> None:
+        """Buffer a write, flushing if the count or time window is exhausted."""
+        self._raise_deferred_error()
+        if not self._pending:
+            self._window_start = time.monotonic()
+            self._schedule_deadline()
+
+        self._pending.append(operation)
+
+        if len(self._pending) >= self._max_operations or self._window_expired():
+            self.flush()
+
+    def flush(self) -> None:
+        """Commit all buffered writes."""
+        self._raise_deferred_error()
+        if not self._pending:
+            return
+
+        batch = self._pending
+        self._pending = []
+        self._reset_window()
+
+        if self._isolation == ErrorIsolation.BISECT:
+            self._commit_bisecting(batch)
+        else:
+            self._commit_batch(batch)
+
+    def discard(self) -> None:
+        """Drop buffered writes without applying them."""
+        if self._pending:
+            logger.debug(
+                f"Discarding {len(self._pending)} pending writes in {self.name}"
+            )
+        self._pending = []
+        self._reset_window()
+        self._deferred_error = None
+
+    def flush_if_due(self) -> bool:
+        """
+        Flush if the time window of the pending writes has elapsed.
+
+        Returns:
+            True if a flush happened
+        """
+        if not self._window_expired():
+            return False
+        self.flush()
+        return True
+
+    def _schedule_deadline(self) -> None:
+        """Arm a timer flushing the window, if called from an event loop."""
+        if self._max_delay is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._deadline = loop.call_later(self._max_delay, self._flush_on_deadline)
+
+    def _flush_on_deadline(self) -> None:
+        """Flush an idle window from the event loop timer."""
+        self._deadline = None
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"Timed flush of {self.name} failed: {e}")
+            self._deferred_error = e
+
+    def _raise_deferred_error(self) -> None:
+        """Raise the error of a failed timer flush to the writer."""
+        if self._deferred_error is not None:
+            error, self._deferred_error = self._deferred_error, None
+            raise error
+
+    def _reset_window(self) -> None:
+        """Forget the time window of the pending batch."""
+        self._window_start = None
+        if self._deadline is not None:
+            self._deadline.cancel()
+            self._deadline = None
+
+    def _window_expired(self) -> bool:
+        """Check whether the time window of the pending batch has elapsed."""
+        if self._max_delay is None or self._window_start is None:
+            return False
+        return time.monotonic() - self._window_start >= self._max_delay
+
+    def _commit_batch(self, batch: list[Callable[[], Any]]) -> None:
+        """Apply a batch of writes in one transaction of a group."""
+        group = TransactionGroup(self._provider, f"{self.name}_{self._flush_count + 1}")
+        trans = group.add_transaction(
+            TransactionOptions(name=f"{group.name}_writes", auto_commit=False)
+        )
+
+        group.start_all()
+        for operation in batch:
+            trans.add_operation(operation)
+        group.commit_all()
+
+        self._flush_count += 1
+        self._committed_count += len(batch)
+        logger.debug(f"Coalesced {len(batch)} writes into {group.name}")
+
+    def _commit_bisecting(self, batch: list[Callable[[], Any]]) -> None:
+        """Apply a batch, splitting it until failing writes are isolated."""
+        try:
+            self._commit_batch(batch)
+            return
+        except TransactionError as e:
+            if len(batch) == 1:
+                error: Exception = e
+                while isinstance(error, TransactionError) and error.cause:
+                    error = error.cause
+                self._failed_writes.append(FailedWrite(batch[0], error))
+                logger.warning(f"Isolated failing write in {self.name}: {error}")
+                return
+
+        middle = len(batch) // 2
+        self._commit_bisecting(batch[:middle])
+        self._commit_bisecting(batch[middle:])
+
+    def __enter__(self) -> CoalescingTransaction:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> bool:
+        """Context manager exit."""
+        if exc_type is None:
+            self.flush()
+        else:
+            self.discard()
+
+        return False
+
+    async def __aenter__(self) -> CoalescingTransaction:
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> bool:
+        """Async context manager exit."""
+        return self.__exit__(exc_type, exc_val, exc_tb)
+
+
 # Convenience functions for common transaction patterns
 
 
@@ -434,6 +664,15 @@ def transaction_scope(
         yield trans
 
 
+@contextmanager
+def coalescing_scope(
+    provider: ITransactionProvider, name: str | None = None, **kwargs
+) -> Iterator[CoalescingTransaction]:
+    """Context manager that coalesces writes issued within its scope."""
+    with CoalescingTransaction(provider, name, **kwargs) as coalescer:
+        yield coalescer
+
+
 @asynccontextmanager
 async def async_transaction_scope(
     provider: ITransactionProvider, name: str | None = None, **kwargs
@@ -465,8 +704,6 @@ def retry_transaction(
                 logger.warning(
                     f"Transaction attempt {attempt + 1} failed, retrying: {e}"
                 )
-                import time
-
                 time.sleep(delay)
             else:
                 logger.error(
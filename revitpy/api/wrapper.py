@@ -12,8 +12,11 @@ from loguru import logger
 
 from .element import Element, ElementSet, IRevitElement
 from .exceptions import ConnectionError, ElementNotFoundError, ModelError, RevitAPIError
+from .paging import ElementCursor, ElementPager
 from .query import IElementProvider, Query, QueryBuilder
+from .spatial import SpatialIndex, bounding_box_of, element_key
 from .transaction import (
+    CoalescingTransaction,
     ITransactionProvider,
     Transaction,
     TransactionGroup,
@@ -83,6 +86,7 @@ class RevitDocumentProvider(IElementProvider, ITransactionProvider):
         self._revit_document = revit_document
         self._element_cache: dict[int, Element] = {}
         self._transaction_stack: list[Any] = []
+        self._spatial_index: SpatialIndex | None = None
 
     @property
     def document(self) -> IRevitDocument:
@@ -99,6 +103,70 @@ class RevitDocumentProvider(IElementProvider, ITransactionProvider):
             logger.error(f"Failed to get all elements: {e}")
             raise RevitAPIError("Failed to retrieve elements", e) from e
 
+    def page_elements(
+        self, page_size: int = 500, cursor: ElementCursor | str | None = None
+    ) -> ElementPager:
+        """
+        Enumerate document elements in pages.
+
+        Unlike ``get_all_elements`` only one page of wrappers is built at a
+        time. Pass a cursor or position token from a previous pager to resume
+        where it stopped.
+        """
+        return ElementPager(
+            self._collect_elements, self._wrap_element, page_size, cursor
+        )
+
+    def _collect_elements(self) -> Any:
+        """Open the underlying element collector."""
+        try:
+            return self._revit_document.GetElements()
+        except Exception as e:
+            logger.error(f"Failed to collect elements: {e}")
+            raise RevitAPIError("Failed to retrieve elements", e) from e
+
+    @property
+    def spatial_index(self) -> SpatialIndex:
+        """Get the spatial index of element bounding boxes, built on first use."""
+        if self._spatial_index is None:
+            self._spatial_index = SpatialIndex.from_elements(self._collect_elements())
+            logger.debug(
+                f"Built spatial index over {len(self._spatial_index)} elements"
+            )
+        return self._spatial_index
+
+    def update_spatial_index(self, element: Element | IRevitElement) -> None:
+        """Refresh the indexed bounding box of a changed or added element."""
+        if self._spatial_index is not None:
+            self._spatial_index.update(element_key(element), bounding_box_of(element))
+
+    def handle_element_event(self, event: Any) -> None:
+        """
+        Keep the spatial index in step with an element event.
+
+        Register this for ELEMENT_CREATED, ELEMENT_MODIFIED and
+        ELEMENT_DELETED so elements moved by Revit or other add-ins are
+        re-indexed. Queries correct candidates that moved away and elements
+        added since the index was built by themselves, but only
+        notifications can reveal an element that moved into a queried box.
+
+        Example:
+            manager.register_function(
+                provider.handle_element_event,
+                [EventType.ELEMENT_CREATED, EventType.ELEMENT_MODIFIED,
+                 EventType.ELEMENT_DELETED],
+            )
+        """
+        element_id = getattr(event, "element_id", None)
+        if element_id is None or self._spatial_index is None:
+            return
+
+        revit_element = self._revit_document.GetElement(element_id)
+        if revit_element is None:
+            self._spatial_index.remove(getattr(element_id, "IntegerValue", element_id))
+        else:
+            self.update_spatial_index(revit_element)
+
     def get_elements_of_type(self, element_type: type[Element]) -> list[Element]:
         """Get elements of specific type."""
         # This would use Revit's filtered element collector
@@ -145,6 +213,10 @@ class RevitDocumentProvider(IElementProvider, ITransactionProvider):
             for elem_id in element_ids:
                 if isinstance(elem_id, int) and elem_id in self._element_cache:
                     del self._element_cache[elem_id]
+                if self._spatial_index is not None:
+                    self._spatial_index.remove(
+                        getattr(elem_id, "IntegerValue", elem_id)
+                    )
 
             logger.info(f"Deleted {len(element_ids)} elements")
 
@@ -152,14 +224,32 @@ class RevitDocumentProvider(IElementProvider, ITransactionProvider):
             logger.error(f"Failed to delete elements: {e}")
             raise RevitAPIError("Failed to delete elements", e) from e
 
+    def set_parameter_values(
+        self, parameter_name: str, updates: list[tuple[IRevitElement, Any]]
+    ) -> None:
+        """Write one parameter on many elements in a single run."""
+        try:
+            for revit_element, value in updates:
+                revit_element.SetParameterValue(parameter_name, value)
+
+            logger.debug(f"Set {parameter_name} on {len(updates)} elements")
+
+        except Exception as e:
+            logger.error(f"Failed to set parameter {parameter_name}: {e}")
+            raise RevitAPIError(f"Failed to set parameter {parameter_name}", e) from e
+
     def refresh_element_cache(self) -> None:
         """Refresh the element cache."""
         self._element_cache.clear()
+        self._spatial_index = None
         logger.debug("Element cache refreshed")
 
     def _wrap_element(self, revit_element: IRevitElement) -> Element:
         """Wrap a Revit element in our Element class."""
-        return Element(revit_element)
+        element = Element(revit_element)
+        # Parameter writes can move an element
+        element._write_listener = self.update_spatial_index
+        return element
 
     # ITransactionProvider implementation
 
@@ -414,6 +504,15 @@ class RevitAPI:
 
         return TransactionGroup(self.active_document, name)
 
+    def coalescing_transaction(
+        self, name: str | None = None, **kwargs
+    ) -> CoalescingTransaction:
+        """Create a transaction scope that coalesces bursts of writes."""
+        if not self.active_document:
+            raise ConnectionError("No active document")
+
+        return CoalescingTransaction(self.active_document, name, **kwargs)
+
     def get_element_by_id(self, element_id: Any) -> Element | None:
         """Get element by ID."""
         if not self.active_document:
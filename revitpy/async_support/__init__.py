@@ -7,7 +7,14 @@ from .cancellation import CancellationToken, CancellationTokenSource
 from .context_managers import async_element_scope, async_transaction
 from .decorators import async_revit_operation, background_task
 from .progress import ProgressCallback, ProgressReporter
-from .task_queue import Task, TaskQueue, TaskResult, TaskStatus
+from .task_queue import (
+    ExecutionLane,
+    Task,
+    TaskQueue,
+    TaskResult,
+    TaskStatus,
+    UpstreamFailure,
+)
 
 __all__ = [
     "AsyncRevit",
@@ -15,6 +22,8 @@ __all__ = [
     "Task",
     "TaskResult",
     "TaskStatus",
+    "ExecutionLane",
+    "UpstreamFailure",
     "async_transaction",
     "async_element_scope",
     "async_revit_operation",
@@ -12,6 +12,12 @@ from loguru import logger
 from ..api.element import Element, ElementSet
 from ..api.query import QueryBuilder
 from ..api.wrapper import IRevitApplication, RevitAPI
+from .batching import (
+    DEFAULT_MAX_IN_FLIGHT,
+    DEFAULT_TARGET_BATCH_LATENCY,
+    AdaptiveBatchSizer,
+    process_in_batches,
+)
 from .cancellation import CancellationToken
 from .context_managers import (
     async_element_scope,
@@ -514,6 +520,7 @@ class AsyncRevit:
         Returns:
             Async element scope context manager
         """
+        kwargs.setdefault("provider", self._revit_api.active_document)
         return async_element_scope(elements, **kwargs)
 
     def progress_scope(self, **kwargs):
@@ -535,23 +542,33 @@ class AsyncRevit:
         items: list[T],
         process_func: Callable[[T], Any],
         batch_size: int = 100,
-        delay_between_batches: timedelta = timedelta(milliseconds=100),
+        delay_between_batches: timedelta = timedelta(0),
         progress_reporter: ProgressReporter | None = None,
         cancellation_token: CancellationToken | None = None,
+        target_batch_latency: timedelta = DEFAULT_TARGET_BATCH_LATENCY,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        adaptive: bool = True,
     ) -> list[Any]:
         """
         Process items in batches asynchronously.
 
+        A small set of worker coroutines processes batches concurrently. With
+        ``adaptive`` the batch size starts at ``batch_size`` and is tuned so
+        each batch takes about ``target_batch_latency``.
+
         Args:
             items: Items to process
             process_func: Function to process each item
-            batch_size: Batch size
-            delay_between_batches: Delay between batches
+            batch_size: Initial (or, without adaptive, fixed) batch size
+            delay_between_batches: Optional pause per worker between batches
             progress_reporter: Optional progress reporter
             cancellation_token: Optional cancellation token
+            target_batch_latency: Target duration of one batch
+            max_in_flight: Maximum number of batches processed at once
+            adaptive: Whether to tune the batch size to the target latency
 
         Returns:
-            List of results
+            List of results; exceptions are returned in place of results
         """
         if not items:
             return []
@@ -560,46 +577,30 @@ class AsyncRevit:
             progress_reporter.set_total(len(items))
             progress_reporter.start("Batch processing...")
 
-        results = []
-
-        try:
-            for i in range(0, len(items), batch_size):
-                # Check cancellation
-                if cancellation_token and cancellation_token.is_cancelled:
-                    break
+        if adaptive:
+            sizer = AdaptiveBatchSizer(batch_size, target_batch_latency)
+        else:
+            sizer = AdaptiveBatchSizer.fixed(batch_size)
+        processed = 0
 
-                batch = items[i : i + batch_size]
-
-                # Process batch
-                batch_tasks = []
-                for item in batch:
-                    if asyncio.iscoroutinefunction(process_func):
-                        batch_tasks.append(asyncio.create_task(process_func(item)))
-                    else:
-                        batch_tasks.append(
-                            asyncio.create_task(
-                                asyncio.get_event_loop().run_in_executor(
-                                    None, process_func, item
-                                )
-                            )
-                        )
-
-                batch_results = await asyncio.gather(
-                    *batch_tasks, return_exceptions=True
+        async def on_batch(count: int) -> None:
+            nonlocal processed
+            processed += count
+            if progress_reporter:
+                await progress_reporter.async_increment(
+                    count, f"Processed {processed}/{len(items)} items"
                 )
-                results.extend(batch_results)
 
-                if progress_reporter:
-                    await progress_reporter.async_increment(
-                        len(batch), f"Processed {len(results)}/{len(items)} items"
-                    )
-
-                # Delay between batches
-                if (
-                    i + batch_size < len(items)
-                    and delay_between_batches.total_seconds() > 0
-                ):
-                    await asyncio.sleep(delay_between_batches.total_seconds())
+        try:
+            results = await process_in_batches(
+                items,
+                process_func,
+                sizer=sizer,
+                max_in_flight=max_in_flight,
+                on_batch=on_batch,
+                cancellation_token=cancellation_token,
+                delay_between_batches=delay_between_batches,
+            )
 
             if progress_reporter:
                 if cancellation_token and cancellation_token.is_cancelled:
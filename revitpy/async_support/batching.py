@@ -0,0 +1,208 @@
+"""
+Adaptive batch scheduling for bulk async operations.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from datetime import timedelta
+from typing import Any, TypeVar
+
+from .cancellation import CancellationToken
+
+T = TypeVar("T")
+
+DEFAULT_TARGET_BATCH_LATENCY = timedelta(milliseconds=100)
+# Number of batches processed concurrently
+DEFAULT_MAX_IN_FLIGHT = 8
+DEFAULT_MAX_BATCH_SIZE = 10_000
+# Limits on how far one measurement can move the batch size
+MAX_BATCH_GROWTH = 2.0
+MAX_BATCH_SHRINK = 0.5
+# Weight of the newest sample in the per-item latency average
+LATENCY_SMOOTHING = 0.3
+
+_PENDING = object()
+
+
+class AdaptiveBatchSizer:
+    """
+    Sizes batches so that each one takes about ``target_latency``.
+
+    The per-item latency of finished batches is tracked as a moving average
+    and the batch size is set to the number of items that fit in the target,
+    changing by at most a factor of two per batch so one outlier cannot swing
+    it. Setting ``min_size`` and ``max_size`` to the same value gives fixed
+    batches.
+    """
+
+    def __init__(
+        self,
+        initial_size: int = 100,
+        target_latency: timedelta = DEFAULT_TARGET_BATCH_LATENCY,
+        min_size: int = 1,
+        max_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ) -> None:
+        if not 1 <= min_size <= max_size:
+            raise ValueError("Batch size bounds must satisfy 1 <= min_size <= max_size")
+        if target_latency.total_seconds() <= 0:
+            raise ValueError("target_latency must be positive")
+
+        self.target_latency = target_latency
+        self.min_size = min_size
+        self.max_size = max_size
+        self._size = min(max(initial_size, min_size), max_size)
+        self._item_seconds: float | None = None
+
+    @classmethod
+    def fixed(cls, size: int) -> "AdaptiveBatchSizer":
+        """Create a sizer that always returns the same batch size."""
+        return cls(size, min_size=size, max_size=size)
+
+    @property
+    def batch_size(self) -> int:
+        """Get the size to use for the next batch."""
+        return self._size
+
+    @property
+    def item_latency(self) -> float | None:
+        """Get the average seconds per item, or None before any batch."""
+        return self._item_seconds
+
+    def record(self, size: int, elapsed: float) -> int:
+        """
+        Record a finished batch and adjust the batch size.
+
+        Args:
+            size: Number of items in the batch
+            elapsed: Seconds the batch took
+
+        Returns:
+            The new batch size
+        """
+        if size < 1:
+            return self._size
+
+        sample = max(elapsed, 0.0) / size
+        if self._item_seconds is None:
+            self._item_seconds = sample
+        else:
+            self._item_seconds += LATENCY_SMOOTHING * (sample - self._item_seconds)
+
+        if self._item_seconds > 0:
+            ideal = self.target_latency.total_seconds() / self._item_seconds
+        else:
+            ideal = float("inf")
+
+        ideal = min(
+            max(ideal, self._size * MAX_BATCH_SHRINK), self._size * MAX_BATCH_GROWTH
+        )
+        self._size = min(max(round(ideal), self.min_size), self.max_size)
+        return self._size
+
+
+async def call_batch(func: Callable[[T], Any], items: Sequence[T]) -> list[Any]:
+    """
+    Call a function on each item of a batch.
+
+    Async functions run concurrently across the batch. Sync functions run in
+    one executor call per batch rather than one per item. Exceptions are
+    returned in place of the item's result.
+
+    Args:
+        func: Function to call on each item
+        items: Batch of items
+
+    Returns:
+        Results in item order
+    """
+    if not items:
+        return []
+
+    if asyncio.iscoroutinefunction(func):
+        results = await asyncio.gather(
+            *(func(item) for item in items), return_exceptions=True
+        )
+        for result in results:
+            # Only errors from func itself are captured, not cancellation
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+        return results
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _call_sync_batch, func, items)
+
+
+def _call_sync_batch(func: Callable[[T], Any], items: Sequence[T]) -> list[Any]:
+    """Call a sync function on each item, capturing exceptions."""
+    results = []
+    for item in items:
+        try:
+            results.append(func(item))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+async def process_in_batches(
+    items: Sequence[T],
+    func: Callable[[T], Any],
+    sizer: AdaptiveBatchSizer | None = None,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    on_batch: Callable[[int], Awaitable[None]] | None = None,
+    cancellation_token: CancellationToken | None = None,
+    delay_between_batches: timedelta = timedelta(0),
+) -> list[Any]:
+    """
+    Process items with a fixed set of worker coroutines.
+
+    Each of up to ``max_in_flight`` workers repeatedly takes the next batch,
+    sized by ``sizer``, until the items run out or the token is cancelled.
+
+    Args:
+        items: Items to process
+        func: Function to call on each item
+        sizer: Batch sizer (adaptive with default settings if None)
+        max_in_flight: Maximum number of batches processed at once; the
+            items of an async batch run concurrently
+        on_batch: Awaited with the item count after each batch
+        cancellation_token: Stops workers from taking new batches
+        delay_between_batches: Optional pause per worker between batches
+
+    Returns:
+        Results in item order, for the items that were processed;
+        exceptions raised by func are returned in place of results
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+
+    sizer = sizer or AdaptiveBatchSizer()
+    results: list[Any] = [_PENDING] * len(items)
+    next_index = 0
+    delay = delay_between_batches.total_seconds()
+
+    async def worker() -> None:
+        nonlocal next_index
+        while next_index < len(items):
+            if cancellation_token and cancellation_token.is_cancelled:
+                return
+
+            # Claiming a range needs no lock; workers share one event loop
+            start = next_index
+            end = min(start + sizer.batch_size, len(items))
+            next_index = end
+
+            began = time.perf_counter()
+            results[start:end] = await call_batch(func, items[start:end])
+            sizer.record(end - start, time.perf_counter() - began)
+
+            if on_batch:
+                await on_batch(end - start)
+            if delay > 0 and next_index < len(items):
+                await asyncio.sleep(delay)
+
+    async with asyncio.TaskGroup() as group:
+        for _ in range(min(max_in_flight, len(items))):
+            group.create_task(worker())
+
+    return [result for result in results if result is not _PENDING]
@@ -3,14 +3,22 @@ Async context managers for RevitPy operations.
 """
 
 import asyncio
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import ExitStack, asynccontextmanager
 from datetime import timedelta
+from typing import Any
 
 from loguru import logger
 
-from ..api.element import Element
+from ..api.element import Element, save_elements
 from ..api.transaction import ITransactionProvider, Transaction, TransactionOptions
+from .batching import (
+    DEFAULT_MAX_IN_FLIGHT,
+    DEFAULT_TARGET_BATCH_LATENCY,
+    AdaptiveBatchSizer,
+    call_batch,
+)
 from .cancellation import CancellationToken, CancellationTokenContext
 from .progress import ProgressReporter, create_progress_reporter
 
@@ -76,15 +84,25 @@ async def async_transaction(
 
 @asynccontextmanager
 async def async_element_scope(
-    elements: list[Element], auto_save: bool = True, rollback_on_error: bool = True
+    elements: list[Element],
+    auto_save: bool = True,
+    rollback_on_error: bool = True,
+    provider: ITransactionProvider | None = None,
 ) -> AsyncIterator[list[Element]]:
     """
     Async context manager for managing element changes.
 
+    Changes to the elements are staged inside the scope and written together
+    on exit, in one transaction of ``provider``. The save runs on the calling
+    thread, since Revit only accepts writes from the thread that owns the
+    document.
+
     Args:
         elements: List of elements to manage
         auto_save: Whether to auto-save changes on exit
         rollback_on_error: Whether to rollback changes on error
+        provider: Transaction provider for the save (without one, the caller
+            is expected to have a transaction open already)
 
     Yields:
         List of elements
@@ -101,18 +119,16 @@ async def async_element_scope(
         original_states[element.id] = element.changes.copy()
 
     try:
-        yield elements
-
-        if auto_save:
-            # Save all changes
-            save_tasks = []
+        with ExitStack() as stack:
             for element in elements:
-                if element.is_dirty:
-                    save_tasks.append(asyncio.create_task(_async_save_element(element)))
+                stack.enter_context(element.deferred_changes())
+            yield elements
 
-            if save_tasks:
-                await asyncio.gather(*save_tasks)
-                logger.debug(f"Saved changes to {len(save_tasks)} elements")
+        if auto_save:
+            # Save all changes together in one pass
+            saved = save_elements(elements, provider)
+            if saved:
+                logger.debug(f"Saved changes to {saved} elements")
 
     except Exception as e:
         if rollback_on_error:
@@ -186,14 +202,20 @@ async def async_cancellation_scope(
 @asynccontextmanager
 async def async_batch_operations(
     batch_size: int = 100,
-    delay_between_batches: timedelta = timedelta(milliseconds=100),
+    delay_between_batches: timedelta = timedelta(0),
+    target_batch_latency: timedelta = DEFAULT_TARGET_BATCH_LATENCY,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    adaptive: bool = True,
 ) -> AsyncIterator["BatchOperationManager"]:
     """
     Async context manager for batch operations.
 
     Args:
-        batch_size: Number of operations per batch
-        delay_between_batches: Delay between batches
+        batch_size: Initial (or, without adaptive, fixed) operations per batch
+        delay_between_batches: Optional pause per worker between batches
+        target_batch_latency: Target duration of one batch
+        max_in_flight: Maximum number of batches executed at once
+        adaptive: Whether to tune the batch size to the target latency
 
     Yields:
         Batch operation manager
@@ -203,7 +225,13 @@ async def async_batch_operations(
             for element in elements:
                 await batch.add_operation(lambda: element.update_property())
     """
-    manager = BatchOperationManager(batch_size, delay_between_batches)
+    manager = BatchOperationManager(
+        batch_size,
+        delay_between_batches,
+        target_batch_latency=target_batch_latency,
+        max_in_flight=max_in_flight,
+        adaptive=adaptive,
+    )
 
     try:
         yield manager
@@ -213,6 +241,9 @@ async def async_batch_operations(
         logger.error(f"Error in batch operations: {e}")
         raise
 
+    finally:
+        await manager.close()
+
 
 @asynccontextmanager
 async def async_resource_scope(*resources) -> AsyncIterator[tuple]:
@@ -255,65 +286,122 @@ async def async_resource_scope(*resources) -> AsyncIterator[tuple]:
 
 
 class BatchOperationManager:
-    """Manager for batch operations."""
+    """
+    Manager for batch operations.
+
+    Added operations are executed by up to ``max_in_flight`` worker
+    coroutines, each taking whatever is queued up to the current batch size.
+    Sync operations in a batch share one executor call and async operations
+    in a batch run concurrently. ``add_operation``
+    waits while the queue is full, which bounds memory without fixed pauses.
+    """
 
     def __init__(
         self,
         batch_size: int = 100,
-        delay_between_batches: timedelta = timedelta(milliseconds=100),
+        delay_between_batches: timedelta = timedelta(0),
+        target_batch_latency: timedelta = DEFAULT_TARGET_BATCH_LATENCY,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        adaptive: bool = True,
     ) -> None:
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
         self.batch_size = batch_size
         self.delay_between_batches = delay_between_batches
-        self._operations = []
+        self.max_in_flight = max_in_flight
+        if adaptive:
+            self.sizer = AdaptiveBatchSizer(batch_size, target_batch_latency)
+        else:
+            self.sizer = AdaptiveBatchSizer.fixed(batch_size)
+
+        self._operations: asyncio.Queue | None = None
+        self._workers: list[asyncio.Task] = []
         self._executed_count = 0
+        self._failed_count = 0
 
-    async def add_operation(self, operation) -> None:
-        """Add an operation to the batch."""
-        self._operations.append(operation)
-
-        if len(self._operations) >= self.batch_size:
-            await self._execute_batch()
-
-    async def _execute_batch(self) -> None:
-        """Execute current batch of operations."""
-        if not self._operations:
-            return
-
-        current_batch = self._operations[: self.batch_size]
-        self._operations = self._operations[self.batch_size :]
-
-        # Execute batch
-        tasks = []
-        for operation in current_batch:
-            if asyncio.iscoroutinefunction(operation):
-                tasks.append(asyncio.create_task(operation()))
-            else:
-                # Run sync operation in executor
-                loop = asyncio.get_event_loop()
-                tasks.append(asyncio.create_task(loop.run_in_executor(None, operation)))
+    @property
+    def executed_count(self) -> int:
+        """Get number of operations executed."""
+        return self._executed_count
 
-        await asyncio.gather(*tasks, return_exceptions=True)
+    @property
+    def failed_count(self) -> int:
+        """Get number of operations that raised."""
+        return self._failed_count
 
-        self._executed_count += len(current_batch)
+    async def add_operation(self, operation) -> None:
+        """Add an operation, waiting while the queue is full."""
+        if self._operations is None:
+            self._operations = asyncio.Queue(
+                maxsize=self.max_in_flight * self.batch_size
+            )
+            self._workers = [
+                asyncio.create_task(self._worker()) for _ in range(self.max_in_flight)
+            ]
+
+        await self._operations.put(operation)
+
+    async def _worker(self) -> None:
+        """Execute batches of queued operations."""
+        delay = self.delay_between_batches.total_seconds()
+
+        while True:
+            batch = [await self._operations.get()]
+            while len(batch) < self.sizer.batch_size and not self._operations.empty():
+                batch.append(self._operations.get_nowait())
+
+            try:
+                await self._execute_batch(batch)
+            finally:
+                for _ in batch:
+                    self._operations.task_done()
+
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    async def _execute_batch(self, batch: list) -> None:
+        """Execute one batch of operations."""
+        began = time.perf_counter()
+
+        async_operations = [op for op in batch if asyncio.iscoroutinefunction(op)]
+        sync_operations = [op for op in batch if not asyncio.iscoroutinefunction(op)]
+        # Async operations run concurrently alongside the sync executor call
+        sync_results, async_results = await asyncio.gather(
+            call_batch(_invoke, sync_operations),
+            call_batch(_invoke_async, async_operations),
+        )
+        results = [*sync_results, *async_results]
 
-        logger.debug(f"Executed batch of {len(current_batch)} operations")
+        self.sizer.record(len(batch), time.perf_counter() - began)
+        self._executed_count += len(batch)
+        self._failed_count += sum(isinstance(result, Exception) for result in results)
 
-        # Delay before next batch
-        if self._operations and self.delay_between_batches.total_seconds() > 0:
-            await asyncio.sleep(self.delay_between_batches.total_seconds())
+        logger.debug(f"Executed batch of {len(batch)} operations")
 
     async def execute_remaining(self) -> None:
-        """Execute any remaining operations."""
-        while self._operations:
-            await self._execute_batch()
+        """Wait until every added operation has been executed."""
+        if self._operations is not None:
+            await self._operations.join()
 
         logger.debug(
             f"Completed all batch operations, total executed: {self._executed_count}"
         )
 
+    async def close(self) -> None:
+        """Stop the workers; operations still queued are discarded."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+        self._operations = None
+
+
+def _invoke(operation: Callable[[], Any]) -> Any:
+    """Call a zero-argument operation."""
+    return operation()
+
 
-async def _async_save_element(element: Element) -> None:
-    """Helper function to save element asynchronously."""
-    # Run save operation in executor to avoid blocking
-    loop = asyncio.get_event_loop()
-    await loop.run_in_executor(None, element.save_changes)
+async def _invoke_async(operation: Callable[[], Awaitable[Any]]) -> Any:
+    """Await a zero-argument async operation."""
+    return await operation()
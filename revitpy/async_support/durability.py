@@ -0,0 +1,271 @@
+"""
+SQLite persistence for durable task queues.
+"""
+
+import pickle
+import sqlite3
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from .task_queue import Task, TaskResult
+
+DEFAULT_CHECKPOINT_BATCH_SIZE = 500
+DEFAULT_CHECKPOINT_INTERVAL = timedelta(milliseconds=500)
+
+_PENDING = "pending"
+_FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id TEXT PRIMARY KEY,
+    idempotency_key TEXT UNIQUE,
+    name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    result BLOB,
+    error TEXT,
+    created_at REAL NOT NULL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, created_at);
+"""
+
+_INSERT = """
+INSERT INTO tasks (task_id, idempotency_key, name, status, payload, created_at)
+VALUES (?, ?, ?, 'pending', ?, ?)
+ON CONFLICT (idempotency_key) DO UPDATE SET
+    task_id = excluded.task_id,
+    name = excluded.name,
+    status = 'pending',
+    payload = excluded.payload,
+    result = NULL,
+    error = NULL,
+    created_at = excluded.created_at,
+    finished_at = NULL
+"""
+
+_FINISH = """
+UPDATE tasks SET status = ?, result = ?, error = ?, finished_at = ?
+WHERE task_id = ?
+"""
+
+
+def encode_task(task: "Task") -> bytes:
+    """
+    Serialize what is needed to recreate a task after a restart.
+
+    Cancellation tokens, progress reporters and callbacks are not persisted.
+
+    Raises:
+        TypeError: If the function or arguments cannot be pickled
+    """
+    descriptor = {
+        "func": task.func,
+        "args": task.args,
+        "kwargs": task.kwargs,
+        "options": {
+            "name": task.name,
+            "priority": task.priority,
+            "timeout": task.timeout,
+            "retry_count": task.retry_count,
+            "retry_delay": task.retry_delay,
+            "metadata": task.metadata,
+            "lane": task.lane,
+            "depends_on": sorted(task.depends_on),
+            "on_upstream_failure": task.on_upstream_failure,
+            "idempotency_key": task.idempotency_key,
+        },
+    }
+    try:
+        return pickle.dumps(descriptor)
+    except Exception as e:
+        raise TypeError(f"Task {task.name} cannot be persisted: {e}") from e
+
+
+def decode_task(task_id: str, payload: bytes) -> "Task":
+    """Recreate a persisted task with its original ID."""
+    from .task_queue import Task
+
+    descriptor = pickle.loads(payload)  # noqa: S301 - written by this process
+    task = Task(
+        descriptor["func"],
+        *descriptor["args"],
+        **descriptor["options"],
+        **descriptor["kwargs"],
+    )
+    task.id = task_id
+    return task
+
+
+def encode_result(value: Any) -> bytes:
+    """
+    Pickle a task result value.
+
+    Raises:
+        TypeError: If the value cannot be pickled
+    """
+    try:
+        return pickle.dumps(value)
+    except Exception as e:
+        raise TypeError(f"Result cannot be persisted: {e}") from e
+
+
+def decode_result(blob: bytes | None) -> Any:
+    """Unpickle a stored task result value."""
+    return pickle.loads(blob) if blob is not None else None  # noqa: S301
+
+
+class TaskStore:
+    """
+    SQLite file recording queued tasks and their completion state.
+
+    Writes are buffered and committed together by ``flush``, which also runs
+    automatically once ``batch_size`` writes are waiting. Work committed
+    before a crash survives it; tasks whose completion was not committed yet
+    run again on resume, so tasks should be idempotent or carry an
+    idempotency key.
+    """
+
+    def __init__(
+        self, path: str | Path, batch_size: int = DEFAULT_CHECKPOINT_BATCH_SIZE
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self._inserts: list[tuple] = []
+        self._finishes: list[tuple] = []
+
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        # WAL with NORMAL sync survives process crashes, which is what
+        # resuming after a host restart needs
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+    @property
+    def pending_writes(self) -> int:
+        """Get number of buffered writes not yet committed."""
+        return len(self._inserts) + len(self._finishes)
+
+    def record_queued(self, task: "Task", payload: bytes) -> None:
+        """Buffer the insertion of a newly queued task."""
+        self._inserts.append(
+            (task.id, task.idempotency_key, task.name, payload, time.time())
+        )
+        self._flush_if_full()
+
+    def record_finished(self, result: "TaskResult") -> None:
+        """
+        Buffer the final state of a task.
+
+        A result that cannot be pickled is recorded as failed, so neither
+        idempotency lookups nor resumed dependents mistake it for a success.
+        """
+        status = result.status.value
+        error = str(result.error) if result.error else None
+        try:
+            blob = encode_result(result.result)
+        except TypeError as e:
+            logger.warning(f"Task {result.task_id} finished, but {e}")
+            status, blob, error = _FAILED, None, str(e)
+
+        self._finishes.append((status, blob, error, time.time(), result.task_id))
+        self._flush_if_full()
+
+    def flush(self) -> None:
+        """Commit all buffered writes in one transaction."""
+        if not self._inserts and not self._finishes:
+            return
+
+        with self._connection:
+            # Inserts first, so a task queued and finished within one batch
+            # ends up finished
+            self._connection.executemany(_INSERT, self._inserts)
+            self._connection.executemany(_FINISH, self._finishes)
+        self._inserts.clear()
+        self._finishes.clear()
+
+    def load_unfinished(self) -> list[tuple[str, bytes]]:
+        """
+        Get the tasks that had not finished, oldest first.
+
+        Returns:
+            (task_id, payload) pairs
+        """
+        return self._connection.execute(
+            "SELECT task_id, payload FROM tasks WHERE status = ? ORDER BY created_at",
+            (_PENDING,),
+        ).fetchall()
+
+    def load_results(self, task_ids: list[str]) -> dict[str, tuple[str, Any, str]]:
+        """
+        Get the final state of finished tasks.
+
+        Returns:
+            Mapping of task ID to (status, result value, error message)
+        """
+        states = {}
+        for task_id in task_ids:
+            row = self._connection.execute(
+                "SELECT status, result, error FROM tasks "
+                "WHERE task_id = ? AND status != ?",
+                (task_id, _PENDING),
+            ).fetchone()
+            if row:
+                states[task_id] = (row[0], decode_result(row[1]), row[2])
+        return states
+
+    def find_completed(self, idempotency_key: str) -> tuple[str, Any] | None:
+        """
+        Look up a successfully completed task by idempotency key.
+
+        Only committed writes are searched.
+
+        Returns:
+            (task_id, result value), or None if no completed task has the key
+        """
+        row = self._connection.execute(
+            "SELECT task_id, result FROM tasks "
+            "WHERE idempotency_key = ? AND status = 'completed'",
+            (idempotency_key,),
+        ).fetchone()
+        return (row[0], decode_result(row[1])) if row else None
+
+    def prune(self, older_than: timedelta | None = None) -> int:
+        """
+        Delete finished tasks.
+
+        Args:
+            older_than: Only delete tasks that finished longer ago than this
+
+        Returns:
+            Number of tasks deleted
+        """
+        self.flush()
+        cutoff = time.time() - (older_than.total_seconds() if older_than else 0)
+        with self._connection:
+            cursor = self._connection.execute(
+                "DELETE FROM tasks WHERE status != ? AND finished_at <= ?",
+                (_PENDING, cutoff),
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Commit buffered writes and close the database."""
+        try:
+            self.flush()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to checkpoint task store {self.path}: {e}")
+        self._connection.close()
+
+    def _flush_if_full(self) -> None:
+        """Commit once enough writes are buffered."""
+        if self.pending_writes >= self.batch_size:
+            self.flush()
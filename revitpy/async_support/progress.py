@@ -3,6 +3,8 @@ Progress reporting system for long-running async operations.
 """
 
 import asyncio
+import threading
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from dataclasses import dataclass, field
@@ -13,6 +15,8 @@ from typing import Any
 from loguru import logger
 
 DEFAULT_PROGRESS_THROTTLE_MS = 100
+# Weight of the newest sample in the smoothed progress rate
+PROGRESS_RATE_SMOOTHING = 0.3
 
 
 class ProgressState(Enum):
@@ -35,6 +39,8 @@ class ProgressReport:
     state: ProgressState = ProgressState.IN_PROGRESS
     data: dict[str, Any] = field(default_factory=dict)
     timestamp: datetime = field(default_factory=datetime.now)
+    rate: float | None = None  # Smoothed items per second
+    eta: timedelta | None = None
 
     @property
     def percentage(self) -> float:
@@ -62,6 +68,8 @@ class ProgressReport:
             state=self.state,
             data=self.data.copy(),
             timestamp=datetime.now(),
+            rate=self.rate,
+            eta=self.eta,
         )
 
     def with_data(self, **data) -> "ProgressReport":
@@ -76,6 +84,8 @@ class ProgressReport:
             state=self.state,
             data=new_data,
             timestamp=datetime.now(),
+            rate=self.rate,
+            eta=self.eta,
         )
 
 
@@ -101,19 +111,41 @@ class IProgressReporter(ABC):
 class ProgressReporter(IProgressReporter):
     """
     Progress reporter that can notify multiple callbacks.
+
+    Increments may come from many threads or tasks at once; they are summed
+    under a lock, and callbacks only run when at least ``throttle_interval``
+    has passed and progress moved by ``min_percentage_step`` since the last
+    report, so callback overhead doesn't grow with the number of items.
+    Reaching the total and state changes are always reported.
     """
 
-    def __init__(self, total: int | None = None) -> None:
+    def __init__(
+        self,
+        total: int | None = None,
+        throttle_interval: timedelta = timedelta(
+            milliseconds=DEFAULT_PROGRESS_THROTTLE_MS
+        ),
+        min_percentage_step: float = 0.0,
+    ) -> None:
+        if min_percentage_step < 0:
+            raise ValueError("min_percentage_step must not be negative")
+
         self._callbacks: list[ProgressCallback] = []
         self._current = 0
         self._total = total or 0
         self._state = ProgressState.NOT_STARTED
         self._last_report: ProgressReport | None = None
         self._start_time: datetime | None = None
-        self._throttle_interval = timedelta(
-            milliseconds=DEFAULT_PROGRESS_THROTTLE_MS
-        )  # Throttle to 10 updates per second
-        self._last_report_time: datetime | None = None
+        self._throttle_interval = throttle_interval
+        self._min_percentage_step = min_percentage_step
+        self._lock = threading.Lock()
+
+        # Throttling and rate state, in time.monotonic() seconds
+        self._next_report_at = 0.0
+        self._reported_current = 0
+        self._rate_sample_time: float | None = None
+        self._rate_sample_current = 0
+        self._rate: float | None = None
 
     @property
     def current(self) -> int:
@@ -150,17 +182,28 @@ class ProgressReporter(IProgressReporter):
         return datetime.now() - self._start_time
 
     @property
-    def estimated_remaining(self) -> timedelta | None:
-        """Get estimated remaining time."""
+    def rate(self) -> float | None:
+        """Get the smoothed progress rate in items per second."""
+        if self._rate is not None:
+            return self._rate
+
+        # Fall back to the average rate until a smoothed sample exists
         elapsed = self.elapsed_time
-        if not elapsed or self._current <= 0 or self._total <= 0:
+        if not elapsed or self._current <= 0 or elapsed.total_seconds() <= 0:
+            return None
+        return self._current / elapsed.total_seconds()
+
+    @property
+    def estimated_remaining(self) -> timedelta | None:
+        """Get estimated remaining time from the smoothed rate."""
+        if self._current <= 0 or self._total <= 0:
             return None
 
         if self._current >= self._total:
             return timedelta(0)
 
-        rate = self._current / elapsed.total_seconds()
-        if rate <= 0:
+        rate = self.rate
+        if not rate or rate <= 0:
             return None
 
         remaining_items = self._total - self._current
@@ -179,14 +222,21 @@ class ProgressReporter(IProgressReporter):
 
     def set_total(self, total: int) -> None:
         """Set the total progress value."""
-        self._total = total
+        with self._lock:
+            self._total = total
         self._update_progress()
 
     def start(self, message: str | None = None) -> None:
         """Start progress reporting."""
-        self._state = ProgressState.IN_PROGRESS
-        self._start_time = datetime.now()
-        self._current = 0
+        with self._lock:
+            self._state = ProgressState.IN_PROGRESS
+            self._start_time = datetime.now()
+            self._current = 0
+            self._next_report_at = 0.0
+            self._reported_current = 0
+            self._rate_sample_time = time.monotonic()
+            self._rate_sample_current = 0
+            self._rate = None
 
         report = ProgressReport(
             current=self._current,
@@ -199,22 +249,29 @@ class ProgressReporter(IProgressReporter):
 
     def increment(self, amount: int = 1, message: str | None = None, **data) -> None:
         """Increment progress by amount."""
-        self._current = min(self._total, self._current + amount)
+        with self._lock:
+            self._current = self._clamp(self._current + amount)
         self._update_progress(message, **data)
 
     def set_progress(self, current: int, message: str | None = None, **data) -> None:
         """Set current progress value."""
-        self._current = max(0, min(self._total, current))
+        with self._lock:
+            self._current = max(0, self._clamp(current))
         self._update_progress(message, **data)
 
     def report_progress(
         self, current: int, total: int, message: str | None = None, **data
     ) -> None:
         """Report progress with current/total values."""
-        self._current = max(0, current)
-        self._total = max(0, total)
+        with self._lock:
+            self._current = max(0, current)
+            self._total = max(0, total)
         self._update_progress(message, **data)
 
+    def flush(self, message: str | None = None, **data) -> None:
+        """Report the current progress now, bypassing throttling."""
+        self._update_progress(message, force=True, **data)
+
     def report(self, progress: ProgressReport) -> None:
         """Report progress using a ProgressReport object."""
         self._current = progress.current
@@ -272,32 +329,77 @@ class ProgressReporter(IProgressReporter):
 
         self._notify_callbacks(report)
 
-    def _update_progress(self, message: str | None = None, **data) -> None:
-        """Update progress and notify callbacks."""
-        # Throttle updates to avoid overwhelming callbacks
-        now = datetime.now()
-        if (
-            self._last_report_time
-            and now - self._last_report_time < self._throttle_interval
-            and self._current < self._total
-        ):
-            return
+    def _clamp(self, current: int) -> int:
+        """Limit a progress value to the total, if one is set."""
+        return min(self._total, current) if self._total > 0 else current
+
+    def _update_progress(
+        self, message: str | None = None, force: bool = False, **data
+    ) -> bool:
+        """
+        Notify callbacks if the throttle allows it.
+
+        Returns:
+            Whether a report was sent
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            current, total = self._current, self._total
+            finished = total > 0 and current >= total
+
+            # Throttle updates to avoid overwhelming callbacks
+            if not (force or finished):
+                if now < self._next_report_at:
+                    return False
+                if (
+                    self._min_percentage_step
+                    and total > 0
+                    and (current - self._reported_current) * 100 / total
+                    < self._min_percentage_step
+                ):
+                    return False
+
+            self._next_report_at = now + self._throttle_interval.total_seconds()
+            self._reported_current = current
+            self._sample_rate(now, current)
+
+            # Auto-complete if we've reached the total
+            if finished and self._state == ProgressState.IN_PROGRESS:
+                self._state = ProgressState.COMPLETED
+
+            report = ProgressReport(
+                current=current,
+                total=total,
+                message=message,
+                state=self._state,
+                data=data,
+                rate=self.rate,
+                eta=self.estimated_remaining,
+            )
 
-        self._last_report_time = now
+        self._notify_callbacks(report)
+        return True
 
-        # Auto-complete if we've reached the total
-        if self._current >= self._total and self._state == ProgressState.IN_PROGRESS:
-            self._state = ProgressState.COMPLETED
+    def _sample_rate(self, now: float, current: int) -> None:
+        """Fold the progress made since the last report into the smoothed rate."""
+        if self._rate_sample_time is None:
+            self._rate_sample_time = now
+            self._rate_sample_current = current
+            return
 
-        report = ProgressReport(
-            current=self._current,
-            total=self._total,
-            message=message,
-            state=self._state,
-            data=data,
-        )
+        elapsed = now - self._rate_sample_time
+        if elapsed <= 0:
+            return
 
-        self._notify_callbacks(report)
+        sample = (current - self._rate_sample_current) / elapsed
+        if self._rate is None:
+            self._rate = sample
+        else:
+            self._rate += PROGRESS_RATE_SMOOTHING * (sample - self._rate)
+
+        self._rate_sample_time = now
+        self._rate_sample_current = current
 
     def _notify_callbacks(self, report: ProgressReport) -> None:
         """Notify all registered callbacks."""
@@ -313,8 +415,10 @@ class ProgressReporter(IProgressReporter):
 class ConsoleProgressReporter(ProgressReporter):
     """Progress reporter that prints to console."""
 
-    def __init__(self, total: int | None = None, show_percentage: bool = True) -> None:
-        super().__init__(total)
+    def __init__(
+        self, total: int | None = None, show_percentage: bool = True, **kwargs
+    ) -> None:
+        super().__init__(total, **kwargs)
         self._show_percentage = show_percentage
         self.add_callback(self._console_callback)
 
@@ -334,9 +438,8 @@ class ConsoleProgressReporter(ProgressReporter):
         # Add timing information if available
         if report.state == ProgressState.COMPLETED and self.elapsed_time:
             status += f" (completed in {self.elapsed_time.total_seconds():.1f}s)"
-        elif self.estimated_remaining and report.state == ProgressState.IN_PROGRESS:
-            remaining = self.estimated_remaining
-            status += f" (ETA: {remaining.total_seconds():.1f}s)"
+        elif report.eta and report.state == ProgressState.IN_PROGRESS:
+            status += f" (ETA: {report.eta.total_seconds():.1f}s)"
 
         print(status)
 
@@ -344,8 +447,8 @@ class ConsoleProgressReporter(ProgressReporter):
 class AsyncProgressReporter(ProgressReporter):
     """Async-aware progress reporter."""
 
-    def __init__(self, total: int | None = None) -> None:
-        super().__init__(total)
+    def __init__(self, total: int | None = None, **kwargs) -> None:
+        super().__init__(total, **kwargs)
         self._async_callbacks: list[Callable[[ProgressReport], Any]] = []
 
     def add_async_callback(self, callback: Callable[[ProgressReport], Any]) -> None:
@@ -376,8 +479,10 @@ class AsyncProgressReporter(ProgressReporter):
         self, amount: int = 1, message: str | None = None, **data
     ) -> None:
         """Async version of increment method."""
-        self.increment(amount, message, **data)
-        if self._last_report:
+        with self._lock:
+            self._current = self._clamp(self._current + amount)
+        # Async callbacks are throttled together with the sync ones
+        if self._update_progress(message, **data):
             await self._notify_async_callbacks(self._last_report)
 
     async def async_complete(self, message: str | None = None, **data) -> None:
@@ -394,4 +499,5 @@ def create_progress_reporter(
     if console_output:
         return ConsoleProgressReporter(total, **kwargs)
     else:
-        return AsyncProgressReporter(total)
+        kwargs.pop("show_percentage", None)
+        return AsyncProgressReporter(total, **kwargs)
@@ -0,0 +1,80 @@
+"""
+Fair-share scheduling for the task queue.
+"""
+
+import asyncio
+import heapq
+from collections.abc import Hashable
+from typing import Any
+
+
+class FairShareQueue:
+    """
+    Priority heaps per share, drained by smooth weighted round-robin.
+
+    Entries of one share come out in heap order. While several shares hold
+    entries, each gets a part of ``get`` proportional to its weight (1 unless
+    configured), so one busy owner cannot starve the others. With a single
+    share this is a plain priority queue. Provides the parts of the
+    asyncio.Queue interface that TaskQueue uses.
+    """
+
+    def __init__(self, weights: dict[Hashable, int] | None = None) -> None:
+        if weights and any(weight < 1 for weight in weights.values()):
+            raise ValueError("Share weights must be at least 1")
+
+        self._weights = dict(weights or {})
+        # Only shares with entries are kept, so owners can come and go freely
+        self._heaps: dict[Hashable, list] = {}
+        self._credits: dict[Hashable, int] = {}
+        self._size = 0
+        self._available = asyncio.Semaphore(0)
+
+    def qsize(self) -> int:
+        """Get number of queued entries."""
+        return self._size
+
+    def empty(self) -> bool:
+        """Check whether the queue is empty."""
+        return self._size == 0
+
+    def depths(self) -> dict[Hashable, int]:
+        """Get the number of entries queued for each share."""
+        return {share: len(heap) for share, heap in self._heaps.items()}
+
+    def put_nowait(self, entry: Any, share: Hashable = None) -> None:
+        """Add an entry to a share's heap."""
+        heap = self._heaps.get(share)
+        if heap is None:
+            heap = self._heaps[share] = []
+            self._credits[share] = 0
+
+        heapq.heappush(heap, entry)
+        self._size += 1
+        self._available.release()
+
+    async def put(self, entry: Any, share: Hashable = None) -> None:
+        """Add an entry to a share's heap."""
+        self.put_nowait(entry, share)
+
+    async def get(self) -> Any:
+        """Remove the next entry, waiting until one is available."""
+        await self._available.acquire()
+
+        chosen = None
+        total = 0
+        for share in self._heaps:
+            weight = self._weights.get(share, 1)
+            self._credits[share] += weight
+            total += weight
+            if chosen is None or self._credits[share] > self._credits[chosen]:
+                chosen = share
+
+        self._credits[chosen] -= total
+        heap = self._heaps[chosen]
+        entry = heapq.heappop(heap)
+        self._size -= 1
+        if not heap:
+            del self._heaps[chosen]
+            del self._credits[chosen]
+        return entry
@@ -3,24 +3,46 @@ Async task queue system for background processing.
 """
 
 import asyncio
-from collections.abc import Callable
+import contextlib
+import functools
+import multiprocessing
+import pickle
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Hashable, Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+from pathlib import Path
 from typing import Any, Generic, TypeVar
 from uuid import uuid4
 
 from loguru import logger
 
+from ..events.health import LatencyHistogram
 from .cancellation import CancellationToken, OperationCancelledError
+from .durability import (
+    DEFAULT_CHECKPOINT_BATCH_SIZE,
+    DEFAULT_CHECKPOINT_INTERVAL,
+    TaskStore,
+    decode_task,
+    encode_task,
+)
 from .progress import ProgressReport, ProgressReporter
+from .scheduling import FairShareQueue
 
 T = TypeVar("T")
 
-# Polling interval when waiting for a task to complete (seconds)
-TASK_POLL_INTERVAL_SECONDS = 0.1
 # Timeout for workers polling the pending-task queue (seconds)
 WORKER_QUEUE_TIMEOUT_SECONDS = 1.0
+# Upper bound on the interval between sweeps of expired results (seconds)
+RESULT_SWEEP_INTERVAL_SECONDS = 60.0
+# Default number of results buffered for each stream_results consumer
+DEFAULT_STREAM_BUFFER_SIZE = 1000
+# Idempotency keys of completed tasks remembered in memory
+MAX_COMPLETED_IDEMPOTENCY_KEYS = 100_000
 
 
 class TaskStatus(Enum):
@@ -33,6 +55,22 @@ class TaskStatus(Enum):
     CANCELLED = "cancelled"
 
 
+class ExecutionLane(Enum):
+    """Where a task's function runs."""
+
+    EVENT_LOOP = "event_loop"  # Called directly on the event loop thread
+    THREAD_POOL = "thread_pool"  # Sync functions in a thread pool (default)
+    PROCESS_POOL = "process_pool"  # CPU-bound sync functions in worker processes
+
+
+class UpstreamFailure(Enum):
+    """What a task does when one of its upstream tasks does not succeed."""
+
+    CANCEL = "cancel"  # Cancel the task, which propagates further downstream
+    SKIP = "skip"  # Complete without running, so downstream tasks still run
+    CONTINUE = "continue"  # Run anyway; outputs of failed upstreams are None
+
+
 class TaskPriority(Enum):
     """Task priority enumeration."""
 
@@ -52,6 +90,7 @@ class TaskResult(Generic[T]):
     error: Exception | None = None
     execution_time: timedelta | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
+    completed_at: datetime | None = None
 
     @property
     def is_successful(self) -> bool:
@@ -77,9 +116,30 @@ class TaskResult(Generic[T]):
         return self.result
 
 
+@dataclass(frozen=True)
+class TaskOutput:
+    """
+    Placeholder for the result of another task.
+
+    Passed as a task argument, it is replaced in memory with the upstream
+    task's result when the task is scheduled, and implies a dependency.
+    """
+
+    task_id: str
+
+
 class Task(Generic[T]):
     """
     Represents an async task that can be queued for execution.
+
+    A task can depend on other tasks through ``depends_on`` or by taking
+    their ``output()`` as arguments; a TaskQueue starts it once every
+    upstream task has finished.
+
+    Tasks sharing an ``idempotency_key`` run at most once successfully per
+    queue, or across restarts when the queue is durable. In memory the keys
+    of the most recent 100,000 completed tasks are remembered, whether or
+    not their results are kept.
     """
 
     def __init__(
@@ -94,8 +154,20 @@ class Task(Generic[T]):
         cancellation_token: CancellationToken | None = None,
         progress_reporter: ProgressReporter | None = None,
         metadata: dict[str, Any] | None = None,
+        lane: ExecutionLane | None = None,
+        depends_on: Iterable["str | Task"] | None = None,
+        on_upstream_failure: UpstreamFailure = UpstreamFailure.CANCEL,
+        idempotency_key: str | None = None,
         **kwargs,
     ) -> None:
+        is_coroutine = asyncio.iscoroutinefunction(func)
+        if lane is None:
+            lane = (
+                ExecutionLane.EVENT_LOOP if is_coroutine else ExecutionLane.THREAD_POOL
+            )
+        elif is_coroutine and lane != ExecutionLane.EVENT_LOOP:
+            raise ValueError("Coroutine functions can only run on the event loop lane")
+
         self.id = str(uuid4())
         self.name = name or f"Task_{self.id[:8]}"
         self.func = func
@@ -108,6 +180,29 @@ class Task(Generic[T]):
         self.cancellation_token = cancellation_token
         self.progress_reporter = progress_reporter
         self.metadata = metadata or {}
+        self.lane = lane
+        # Executor for the pool lanes, assigned by TaskQueue (None uses the
+        # event loop's default thread pool)
+        self.executor: Executor | None = None
+
+        # Dependencies, including those implied by TaskOutput arguments
+        self.depends_on = {
+            upstream.id if isinstance(upstream, Task) else upstream
+            for upstream in depends_on or ()
+        }
+        self.depends_on.update(
+            value.task_id
+            for value in (*args, *kwargs.values())
+            if isinstance(value, TaskOutput)
+        )
+        self.on_upstream_failure = on_upstream_failure
+        self.idempotency_key = idempotency_key
+        # Filled in by TaskQueue as upstream tasks finish
+        self.upstream_results: dict[str, TaskResult] = {}
+        # Longest chain of tasks waiting on this one, used for scheduling
+        self.critical_path = 0
+        # time.monotonic() when the task became ready to run
+        self.queued_at: float | None = None
 
         # Execution state
         self.status = TaskStatus.PENDING
@@ -269,14 +364,56 @@ class Task(Generic[T]):
         # If we get here, all retries failed
         raise last_error
 
+    def output(self) -> TaskOutput:
+        """Get a placeholder for this task's result, to pass to other tasks."""
+        return TaskOutput(self.id)
+
+    def resolve_outputs(self) -> None:
+        """Replace TaskOutput arguments with the results of upstream tasks."""
+
+        def resolve(value: Any) -> Any:
+            if not isinstance(value, TaskOutput):
+                return value
+            upstream = self.upstream_results.get(value.task_id)
+            return upstream.result if upstream else None
+
+        self.args = tuple(resolve(value) for value in self.args)
+        self.kwargs = {key: resolve(value) for key, value in self.kwargs.items()}
+
+    def ensure_picklable(self) -> None:
+        """
+        Check that the function and arguments can be sent to a worker process.
+
+        Raises:
+            TypeError: If they cannot be pickled
+        """
+        try:
+            pickle.dumps((self.func, self.args, self.kwargs))
+        except Exception as e:
+            raise TypeError(
+                f"Task {self.name} cannot run in a process pool: {e}"
+            ) from e
+
     async def _call_function(self) -> T:
         """Call the task function."""
         if asyncio.iscoroutinefunction(self.func):
             return await self.func(*self.args, **self.kwargs)
+
+        if self.lane == ExecutionLane.EVENT_LOOP:
+            return self._call_sync_function()
+
+        if self.lane == ExecutionLane.PROCESS_POOL:
+            if self.executor is None:
+                raise RuntimeError(
+                    f"Task {self.name} needs a process pool; run it on a TaskQueue"
+                )
+            # Only the function and its arguments are sent to the worker
+            call = functools.partial(self.func, *self.args, **self.kwargs)
         else:
-            # Run sync function in executor
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, self._call_sync_function)
+            call = self._call_sync_function
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, call)
 
     def _call_sync_function(self) -> T:
         """Call synchronous function."""
@@ -311,9 +448,151 @@ class Task(Generic[T]):
         return self.created_at < other.created_at
 
 
+class ResultStore:
+    """
+    LRU store for completed task results with optional size and idle limits.
+
+    Reading a result marks it as recently used. When ``max_size`` is reached
+    the least recently used result is evicted, and results that have not been
+    read for ``ttl`` are removed by ``sweep``.
+    """
+
+    def __init__(
+        self, max_size: int | None = None, ttl: timedelta | None = None
+    ) -> None:
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if ttl is not None and ttl.total_seconds() <= 0:
+            raise ValueError("ttl must be positive")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        # task_id -> (result, monotonic time of last access), oldest first
+        self._results: OrderedDict[str, tuple[TaskResult, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._results
+
+    def get(self, task_id: str) -> TaskResult | None:
+        """Get a result and mark it as recently used."""
+        entry = self._results.get(task_id)
+        if entry is None:
+            return None
+
+        self._results[task_id] = (entry[0], time.monotonic())
+        self._results.move_to_end(task_id)
+        return entry[0]
+
+    def peek(self, task_id: str) -> TaskResult | None:
+        """Get a result without marking it as used."""
+        entry = self._results.get(task_id)
+        return entry[0] if entry else None
+
+    def put(self, task_id: str, result: TaskResult) -> int:
+        """
+        Store a result, evicting old results as needed.
+
+        Returns:
+            Number of results evicted
+        """
+        self._results[task_id] = (result, time.monotonic())
+        self._results.move_to_end(task_id)
+
+        evicted = self.sweep()
+        if self.max_size is not None:
+            while len(self._results) > self.max_size:
+                self._results.popitem(last=False)
+                evicted += 1
+        return evicted
+
+    def pop(self, task_id: str) -> TaskResult | None:
+        """Remove and return a result."""
+        entry = self._results.pop(task_id, None)
+        return entry[0] if entry else None
+
+    def sweep(self) -> int:
+        """
+        Remove results that have not been used within the TTL.
+
+        Returns:
+            Number of results removed
+        """
+        if self.ttl is None:
+            return 0
+
+        cutoff = time.monotonic() - self.ttl.total_seconds()
+        removed = 0
+        # Entries are kept in access order, so expired ones are at the front
+        while self._results:
+            task_id, (_result, last_access) = next(iter(self._results.items()))
+            if last_access > cutoff:
+                break
+            del self._results[task_id]
+            removed += 1
+        return removed
+
+    def remove_completed_before(self, cutoff: datetime) -> int:
+        """
+        Remove results of tasks that completed before a point in time.
+
+        Returns:
+            Number of results removed
+        """
+        expired = [
+            task_id
+            for task_id, (result, _last_access) in self._results.items()
+            if result.completed_at is None or result.completed_at < cutoff
+        ]
+        for task_id in expired:
+            del self._results[task_id]
+        return len(expired)
+
+    def clear(self) -> int:
+        """
+        Remove every result.
+
+        Returns:
+            Number of results removed
+        """
+        count = len(self._results)
+        self._results.clear()
+        return count
+
+
 class TaskQueue:
     """
     Async task queue with priority support and concurrent execution.
+
+    Completed results are kept so they can be looked up later. In long-running
+    sessions bound that memory with ``max_completed_results`` and
+    ``result_ttl``, drop results as soon as they have been awaited with
+    ``drop_awaited_results``, or turn storage off with ``store_results=False``
+    and consume results through ``result_callback`` or ``stream_results``.
+
+    Sync task functions run in a thread pool unless the task picks another
+    ExecutionLane. CPU-bound work should use the process-pool lane, which
+    sidesteps the GIL; give the queue at least as many workers as processes
+    so the pool can be kept busy.
+
+    Tasks with dependencies wait until all their upstream tasks have finished.
+    Among ready tasks of equal priority, those with the longest chain of
+    dependents run first so the critical path of a workflow isn't delayed.
+
+    By default priorities are strict. With ``aging_interval`` a waiting task
+    gains one priority level per interval, so low-priority work cannot be
+    starved by a steady stream of urgent tasks. With ``share_key`` tasks are
+    grouped by owner or tag and the groups take turns by weighted
+    round-robin, e.g. ``share_key=lambda task: task.metadata.get("owner")``.
+
+    With ``durable_path`` queued tasks and their outcomes are checkpointed
+    to a SQLite file in batches, and the next queue started on that file
+    resumes the tasks that had not finished. Durable tasks must be picklable,
+    i.e. use module-level functions. A task that finished shortly before a
+    crash may run again, since its completion had not been checkpointed yet;
+    an ``idempotency_key`` keeps completed work from being repeated.
     """
 
     def __init__(
@@ -321,29 +600,129 @@ class TaskQueue:
         max_concurrent_tasks: int = 4,
         max_queue_size: int | None = None,
         name: str | None = None,
+        max_completed_results: int | None = None,
+        result_ttl: timedelta | None = None,
+        drop_awaited_results: bool = False,
+        store_results: bool = True,
+        result_callback: Callable[[TaskResult], None] | None = None,
+        process_workers: int | None = None,
+        max_tasks_per_child: int | None = None,
+        lane_limits: dict[ExecutionLane, int] | None = None,
+        aging_interval: timedelta | None = None,
+        share_key: Callable[["Task"], Hashable] | None = None,
+        share_weights: dict[Hashable, int] | None = None,
+        durable_path: str | Path | None = None,
+        checkpoint_interval: timedelta = DEFAULT_CHECKPOINT_INTERVAL,
+        checkpoint_batch_size: int = DEFAULT_CHECKPOINT_BATCH_SIZE,
     ) -> None:
+        """
+        Initialize the task queue.
+
+        Args:
+            max_concurrent_tasks: Number of worker coroutines
+            max_queue_size: Maximum number of pending tasks (unbounded if None)
+            name: Queue name
+            max_completed_results: Keep at most this many results, evicting
+                the least recently used
+            result_ttl: Discard results not read for this long
+            drop_awaited_results: Discard a result once a waiter received it
+            store_results: Keep completed results at all; when False, results
+                only reach waiters, result_callback and stream_results
+            result_callback: Called with every completed task result
+            process_workers: Size of the process pool (CPU count if None)
+            max_tasks_per_child: Replace a worker process after it has run
+                this many tasks, to bound its memory
+            lane_limits: Maximum number of tasks running at once per lane
+            aging_interval: Waiting time that raises a task by one priority
+                level (strict priorities if None)
+            share_key: Groups tasks into fair-share queues
+            share_weights: Round-robin weight per share (1 if not listed)
+            durable_path: SQLite file to checkpoint tasks to (in memory only
+                if None)
+            checkpoint_interval: Maximum time a write waits to be committed
+            checkpoint_batch_size: Commit as soon as this many writes wait
+        """
+        if aging_interval is not None and aging_interval.total_seconds() <= 0:
+            raise ValueError("aging_interval must be positive")
+        if process_workers is not None and process_workers < 1:
+            raise ValueError("process_workers must be at least 1")
+        if max_tasks_per_child is not None and max_tasks_per_child < 1:
+            raise ValueError("max_tasks_per_child must be at least 1")
+        if lane_limits and any(limit < 1 for limit in lane_limits.values()):
+            raise ValueError("Lane limits must be at least 1")
+        if checkpoint_interval.total_seconds() <= 0:
+            raise ValueError("checkpoint_interval must be positive")
+        if checkpoint_batch_size < 1:
+            raise ValueError("checkpoint_batch_size must be at least 1")
+
         self.max_concurrent_tasks = max_concurrent_tasks
         self.max_queue_size = max_queue_size
         self.name = name or f"TaskQueue_{uuid4().hex[:8]}"
+        self.drop_awaited_results = drop_awaited_results
+        self.store_results = store_results
+        self.result_callback = result_callback
+        self.process_workers = process_workers
+        self.max_tasks_per_child = max_tasks_per_child
+        self.aging_interval = aging_interval
+        self.share_key = share_key
+        self.durable_path = durable_path
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoint_batch_size = checkpoint_batch_size
 
         # Task storage
-        self._pending_queue: asyncio.PriorityQueue = asyncio.PriorityQueue(
-            maxsize=max_queue_size or 0
-        )
+        # Entries are (rank, -critical path, task), see _queue_task;
+        # max_queue_size is enforced on enqueue so tasks released by
+        # dependencies always fit
+        self._pending_queue = FairShareQueue(share_weights)
+        # Current entry per queued task; entries replaced when a task's
+        # critical path grows are skipped by the workers
+        self._queue_entries: dict[str, tuple] = {}
+        self._stale_entries = 0
+        self._pending_tasks: dict[str, Task] = {}
+        # Tasks waiting on upstream tasks, and the upstream IDs still unfinished
+        self._blocked: dict[str, set[str]] = {}
+        self._dependents: dict[str, list[Task]] = {}
         self._running_tasks: dict[str, Task] = {}
-        self._completed_tasks: dict[str, TaskResult] = {}
+        self._completed_tasks = ResultStore(max_completed_results, result_ttl)
+        self._result_streams: list[asyncio.Queue] = []
+        self._sweeper_task: asyncio.Task | None = None
+        # Task ID per idempotency key of unfinished tasks
+        self._idempotency_keys: dict[str, str] = {}
+        # Task ID per idempotency key of completed tasks, least recent first;
+        # kept apart from results so dropping a result doesn't allow a rerun
+        self._completed_keys: OrderedDict[str, str] = OrderedDict()
+
+        # Durable mode, opened on start
+        self._store: TaskStore | None = None
+        self._checkpointer_task: asyncio.Task | None = None
+
+        # Execution lanes
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._lane_semaphores = {
+            lane: asyncio.Semaphore(limit)
+            for lane, limit in (lane_limits or {}).items()
+        }
+        # Resolved with the TaskResult when a queued task finishes
+        self._futures: dict[str, asyncio.Future] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
 
         # Queue state
         self._is_running = False
         self._worker_tasks: list[asyncio.Task] = []
         self._shutdown_event = asyncio.Event()
 
+        # Time from becoming ready to starting, per priority
+        self._queue_wait = {priority: LatencyHistogram() for priority in TaskPriority}
+
         # Statistics
         self._stats = {
             "total_queued": 0,
             "total_completed": 0,
             "total_failed": 0,
             "total_cancelled": 0,
+            "results_evicted": 0,
+            "total_deduplicated": 0,
+            "total_resumed": 0,
         }
 
     @property
@@ -354,7 +733,12 @@ class TaskQueue:
     @property
     def pending_count(self) -> int:
         """Get number of pending tasks."""
-        return self._pending_queue.qsize()
+        return self._pending_queue.qsize() - self._stale_entries
+
+    @property
+    def blocked_count(self) -> int:
+        """Get number of tasks waiting on upstream tasks."""
+        return len(self._blocked)
 
     @property
     def running_count(self) -> int:
@@ -371,25 +755,34 @@ class TaskQueue:
         """Get queue statistics."""
         return self._stats.copy()
 
-    async def enqueue(self, task: Task[T]) -> str:
+    def queue_wait_metrics(self) -> dict[str, dict[str, float]]:
         """
-        Enqueue a task for execution.
+        Get how long tasks waited between becoming ready and starting.
 
         Returns:
-            Task ID
+            Count, mean, max and p50/p95/p99 wait in seconds, per priority
         """
-        if not self._is_running:
-            raise RuntimeError("Task queue is not running")
+        return {
+            priority.name.lower(): histogram.snapshot()
+            for priority, histogram in self._queue_wait.items()
+        }
 
-        # Check queue size limit
-        if self.max_queue_size and self._pending_queue.qsize() >= self.max_queue_size:
-            raise RuntimeError("Task queue is full")
+    async def enqueue(self, task: Task[T]) -> str:
+        """
+        Enqueue a task for execution.
 
-        await self._pending_queue.put((0, task))  # Priority handled by Task.__lt__
-        self._stats["total_queued"] += 1
+        Returns:
+            Task ID, or the ID of the earlier task with the same
+            idempotency key if that one is unfinished or completed; the
+            earlier result can only be awaited while it is retained
 
-        logger.debug(f"Enqueued task {task.name} ({task.id})")
-        return task.id
+        Raises:
+            KeyError: If an upstream task is unknown to this queue
+            TypeError: If the queue is durable and the task isn't picklable
+        """
+        task_id = self._add(task)
+        logger.debug(f"Enqueued task {task.name} ({task_id})")
+        return task_id
 
     def enqueue_sync(self, task: Task[T]) -> str:
         """
@@ -398,16 +791,9 @@ class TaskQueue:
         Returns:
             Task ID
         """
-        if not self._is_running:
-            raise RuntimeError("Task queue is not running")
-
-        try:
-            self._pending_queue.put_nowait((0, task))
-            self._stats["total_queued"] += 1
-            logger.debug(f"Enqueued task {task.name} ({task.id}) synchronously")
-            return task.id
-        except asyncio.QueueFull as e:
-            raise RuntimeError("Task queue is full") from e
+        task_id = self._add(task)
+        logger.debug(f"Enqueued task {task.name} ({task_id}) synchronously")
+        return task_id
 
     async def submit(self, func: Callable[..., T], *args, **kwargs) -> str:
         """
@@ -433,54 +819,116 @@ class TaskQueue:
             Task result
 
         Raises:
-            asyncio.TimeoutError: If timeout is reached
+            TimeoutError: If timeout is reached
             KeyError: If task ID not found
         """
-        start_time = asyncio.get_event_loop().time()
+        future = self._future_for(task_id)
+
+        try:
+            # Shield so a timed-out waiter doesn't cancel the shared future
+            result = await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+        except TimeoutError:
+            raise TimeoutError(f"Timeout waiting for task {task_id}") from None
 
-        while True:
-            # Check if task is completed
-            if task_id in self._completed_tasks:
-                return self._completed_tasks[task_id]
+        self._result_awaited(result)
+        return result
 
-            # Check timeout
-            if timeout and (asyncio.get_event_loop().time() - start_time) > timeout:
-                raise TimeoutError(f"Timeout waiting for task {task_id}")
+    async def wait_for_all(
+        self, task_ids: Iterable[str] | None = None, timeout: float | None = None
+    ) -> list[TaskResult]:
+        """
+        Wait for several tasks to complete.
 
-            # Check if task exists
-            if (
-                task_id not in self._running_tasks
-                and task_id not in self._completed_tasks
-            ):
-                # Search pending queue
-                found = False
-                temp_items = []
+        Args:
+            task_ids: IDs of the tasks to wait for (all unfinished tasks if None)
+            timeout: Optional timeout in seconds for the whole group
 
-                while not self._pending_queue.empty():
-                    try:
-                        priority, task = self._pending_queue.get_nowait()
-                        temp_items.append((priority, task))
-                        if task.id == task_id:
-                            found = True
-                    except asyncio.QueueEmpty:
-                        break
+        Returns:
+            Task results in the order of task_ids
 
-                # Put items back
-                for item in temp_items:
-                    await self._pending_queue.put(item)
+        Raises:
+            TimeoutError: If timeout is reached before every task completes
+            KeyError: If a task ID is not found
+        """
+        futures = self._futures_for(task_ids)
+        if not futures:
+            return []
+
+        _done, pending = await asyncio.wait(futures, timeout=timeout)
+        if pending:
+            raise TimeoutError(
+                f"Timeout waiting for {len(pending)} of {len(futures)} tasks"
+            )
+
+        results = [future.result() for future in futures]
+        for result in results:
+            self._result_awaited(result)
+        return results
+
+    async def as_completed(
+        self, task_ids: Iterable[str] | None = None, timeout: float | None = None
+    ) -> AsyncIterator[TaskResult]:
+        """
+        Yield task results as the tasks complete.
+
+        Args:
+            task_ids: IDs of the tasks to wait for (all unfinished tasks if None)
+            timeout: Optional timeout in seconds for the whole group
+
+        Yields:
+            Task results in completion order
+
+        Raises:
+            TimeoutError: If timeout is reached before every task completes
+            KeyError: If a task ID is not found
+        """
+        futures = self._futures_for(task_ids)
+
+        for next_done in asyncio.as_completed(futures, timeout=timeout):
+            result = await next_done
+            self._result_awaited(result)
+            yield result
 
-                if not found:
-                    raise KeyError(f"Task {task_id} not found")
+    async def stream_results(
+        self, buffer_size: int = DEFAULT_STREAM_BUFFER_SIZE
+    ) -> AsyncIterator[TaskResult]:
+        """
+        Yield the result of every task that completes from now on.
+
+        The stream ends when the queue stops. If the consumer falls more than
+        ``buffer_size`` results behind, the oldest buffered results are
+        dropped.
+
+        Args:
+            buffer_size: Maximum number of results buffered for this consumer
 
-            # Wait a bit before checking again
-            await asyncio.sleep(TASK_POLL_INTERVAL_SECONDS)
+        Yields:
+            Task results in completion order
+        """
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be at least 1")
+        if not self._is_running:
+            raise RuntimeError("Task queue is not running")
+
+        stream: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+        self._result_streams.append(stream)
+        try:
+            while True:
+                result = await stream.get()
+                if result is None:  # Queue stopped
+                    return
+                yield result
+        finally:
+            self._result_streams.remove(stream)
 
     def get_task_status(self, task_id: str) -> TaskStatus | None:
         """Get status of a task."""
         if task_id in self._completed_tasks:
-            return self._completed_tasks[task_id].status
+            return self._completed_tasks.peek(task_id).status
         elif task_id in self._running_tasks:
             return self._running_tasks[task_id].status
+        elif task_id in self._pending_tasks:
+            return self._pending_tasks[task_id].status
         else:
             return None
 
@@ -494,13 +942,21 @@ class TaskQueue:
             return
 
         self._is_running = True
+        self._loop = asyncio.get_running_loop()
         self._shutdown_event.clear()
 
+        if self.durable_path is not None:
+            self._store = TaskStore(self.durable_path, self.checkpoint_batch_size)
+            self._resume()
+            self._checkpointer_task = asyncio.create_task(self._checkpointer())
+
         # Start worker tasks
         self._worker_tasks = [
             asyncio.create_task(self._worker(i))
             for i in range(self.max_concurrent_tasks)
         ]
+        if self._completed_tasks.ttl is not None:
+            self._sweeper_task = asyncio.create_task(self._sweeper())
 
         logger.info(
             f"Started task queue {self.name} with {self.max_concurrent_tasks} workers"
@@ -517,6 +973,9 @@ class TaskQueue:
         # Cancel all worker tasks
         for task in self._worker_tasks:
             task.cancel()
+        if self._sweeper_task:
+            self._sweeper_task.cancel()
+            self._sweeper_task = None
 
         # Wait for workers to finish
         if self._worker_tasks:
@@ -535,6 +994,22 @@ class TaskQueue:
             if task.cancellation_token:
                 task.cancellation_token._cancel("Queue shutdown")
 
+        # Unfinished tasks stay pending in the store, to be resumed
+        if self._checkpointer_task:
+            self._checkpointer_task.cancel()
+            self._checkpointer_task = None
+        if self._store:
+            self._store.close()
+            self._store = None
+
+        if self._process_pool:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+
+        # End result streams
+        for stream in self._result_streams:
+            self._offer_to_stream(stream, None)
+
         logger.info(f"Stopped task queue {self.name}")
 
     async def _worker(self, worker_id: int) -> None:
@@ -546,44 +1021,56 @@ class TaskQueue:
                 try:
                     # Wait for task or shutdown
                     try:
-                        priority, task = await asyncio.wait_for(
+                        entry = await asyncio.wait_for(
                             self._pending_queue.get(),
                             timeout=WORKER_QUEUE_TIMEOUT_SECONDS,
                         )
                     except TimeoutError:
                         continue
+                    task = entry[-1]
+                    if self._queue_entries.get(task.id) is not entry:
+                        self._stale_entries -= 1
+                        continue
 
                     # Check if we should shutdown
                     if self._shutdown_event.is_set():
                         # Put task back
-                        await self._pending_queue.put((priority, task))
+                        await self._pending_queue.put(entry, self._share_of(task))
                         break
 
                     # Execute task
+                    self._queue_wait[task.priority].record(
+                        time.monotonic() - task.queued_at
+                    )
+                    self._queue_entries.pop(task.id, None)
+                    self._pending_tasks.pop(task.id, None)
                     self._running_tasks[task.id] = task
+                    result: TaskResult | None = None
 
                     try:
-                        result = await task.execute()
+                        if task.lane == ExecutionLane.PROCESS_POOL:
+                            task.executor = self._get_process_pool()
 
-                        # Store result
-                        self._completed_tasks[task.id] = result
-
-                        # Update statistics
-                        if result.status == TaskStatus.COMPLETED:
-                            self._stats["total_completed"] += 1
-                        elif result.status == TaskStatus.FAILED:
-                            self._stats["total_failed"] += 1
-                        elif result.status == TaskStatus.CANCELLED:
-                            self._stats["total_cancelled"] += 1
+                        limit = self._lane_semaphores.get(task.lane)
+                        async with limit or contextlib.nullcontext():
+                            result = await task.execute()
 
                         logger.debug(
                             f"Task {task.name} completed with status {result.status}"
                         )
 
                     finally:
-                        # Remove from running tasks
-                        if task.id in self._running_tasks:
-                            del self._running_tasks[task.id]
+                        if result is None:
+                            # Interrupted (e.g. worker cancelled at shutdown)
+                            result = TaskResult(
+                                task_id=task.id,
+                                status=TaskStatus.CANCELLED,
+                                error=OperationCancelledError(
+                                    f"Task {task.name} interrupted"
+                                ),
+                                metadata={**task.metadata, "interrupted": True},
+                            )
+                        self._finish(task, result)
 
                 except Exception as e:
                     logger.error(f"Worker {worker_id} error: {e}")
@@ -596,33 +1083,384 @@ class TaskQueue:
 
         logger.debug(f"Worker {worker_id} stopped for queue {self.name}")
 
+    def _add(self, task: Task, restored: bool = False) -> str:
+        """
+        Validate and index a new task, then queue or block it.
+
+        Args:
+            task: Task to add
+            restored: Whether the task is being resumed from the store
+
+        Returns:
+            ID of the task, or of the earlier task it duplicates
+        """
+        if not self._is_running:
+            raise RuntimeError("Task queue is not running")
+
+        key = task.idempotency_key
+        if key is not None and not restored:
+            duplicate = self._find_duplicate(key)
+            if duplicate is not None:
+                self._stats["total_deduplicated"] += 1
+                return duplicate
+
+        # Check queue size limit; resumed tasks were admitted before
+        if (
+            not restored
+            and self.max_queue_size
+            and len(self._pending_tasks) >= self.max_queue_size
+        ):
+            raise RuntimeError("Task queue is full")
+
+        if task.lane == ExecutionLane.PROCESS_POOL:
+            task.ensure_picklable()
+        # Encoded before outputs are resolved, so a resumed task waits on
+        # its upstream tasks again
+        payload = encode_task(task) if self._store and not restored else None
+
+        unfinished: set[str] = set()
+        for upstream_id in task.depends_on:
+            if upstream_id in self._futures:
+                unfinished.add(upstream_id)
+                continue
+            result = self._completed_tasks.peek(upstream_id)
+            if result is None:
+                raise KeyError(f"Upstream task {upstream_id} not found")
+            task.upstream_results[upstream_id] = result
+
+        self._track(task)
+        self._stats["total_queued"] += 1
+        if key is not None:
+            self._idempotency_keys[key] = task.id
+        if payload is not None:
+            self._store.record_queued(task, payload)
+
+        if not unfinished:
+            self._check_ready(task)
+            return task.id
+
+        self._blocked[task.id] = unfinished
+        for upstream_id in unfinished:
+            self._dependents.setdefault(upstream_id, []).append(task)
+        self._extend_critical_path(unfinished, task.critical_path + 1)
+        # An upstream that already failed may cancel the task right away
+        self._check_ready(task)
+        return task.id
+
+    def _find_duplicate(self, key: str) -> str | None:
+        """Get the ID of an unfinished or completed task with a key."""
+        existing = self._idempotency_keys.get(key)
+        if existing is not None:
+            return existing
+        existing = self._completed_keys.get(key)
+        if existing is not None:
+            self._completed_keys.move_to_end(key)
+            return existing
+
+        if self._store is None:
+            return None
+        completed = self._store.find_completed(key)
+        if completed is None:
+            return None
+
+        task_id, value = completed
+        self._remember_completed(key, task_id)
+        if self.store_results:
+            self._completed_tasks.put(
+                task_id,
+                TaskResult(task_id=task_id, status=TaskStatus.COMPLETED, result=value),
+            )
+        return task_id
+
+    def _remember_completed(self, key: str, task_id: str) -> None:
+        """Record the completed task for a key, forgetting the oldest keys."""
+        self._completed_keys[key] = task_id
+        self._completed_keys.move_to_end(key)
+        while len(self._completed_keys) > MAX_COMPLETED_IDEMPOTENCY_KEYS:
+            self._completed_keys.popitem(last=False)
+
+    def _resume(self) -> None:
+        """Re-add the tasks left unfinished in the store."""
+        tasks = []
+        for task_id, payload in self._store.load_unfinished():
+            try:
+                tasks.append(decode_task(task_id, payload))
+            except Exception as e:
+                logger.error(f"Cannot resume task {task_id}: {e}")
+                self._store.record_finished(
+                    TaskResult(task_id=task_id, status=TaskStatus.FAILED, error=e)
+                )
+
+        # Upstream tasks that finished before the restart
+        resumed = {task.id for task in tasks}
+        upstream_ids = [
+            upstream_id
+            for task in tasks
+            for upstream_id in task.depends_on
+            if upstream_id not in resumed
+        ]
+        for task_id, (status, value, error) in self._store.load_results(
+            upstream_ids
+        ).items():
+            self._completed_tasks.put(
+                task_id,
+                TaskResult(
+                    task_id=task_id,
+                    status=TaskStatus(status),
+                    result=value,
+                    error=RuntimeError(error) if error else None,
+                ),
+            )
+
+        # Stored oldest first, so upstream tasks are added before dependents
+        for task in tasks:
+            try:
+                self._add(task, restored=True)
+            except KeyError as e:
+                logger.error(f"Cannot resume task {task.name}: {e}")
+                self._store.record_finished(
+                    TaskResult(task_id=task.id, status=TaskStatus.FAILED, error=e)
+                )
+            else:
+                self._stats["total_resumed"] += 1
+
+        if tasks:
+            logger.info(f"Resumed {len(tasks)} tasks in queue {self.name}")
+
+    async def _checkpointer(self) -> None:
+        """Periodically commit buffered writes to the store."""
+        interval = self.checkpoint_interval.total_seconds()
+
+        while self._is_running:
+            await asyncio.sleep(interval)
+            try:
+                self._store.flush()
+            except Exception as e:
+                logger.error(f"Failed to checkpoint task queue {self.name}: {e}")
+
+    def _extend_critical_path(self, upstream_ids: Iterable[str], length: int) -> None:
+        """
+        Raise the critical path of unfinished upstream tasks, transitively.
+
+        An upstream task that is already queued is queued again at its new
+        position; its old entry is skipped when a worker reaches it.
+        """
+        stack = [(upstream_id, length) for upstream_id in upstream_ids]
+        while stack:
+            task_id, length = stack.pop()
+            upstream = self._pending_tasks.get(task_id) or self._running_tasks.get(
+                task_id
+            )
+            if upstream is None or upstream.critical_path >= length:
+                continue
+            upstream.critical_path = length
+            entry = self._queue_entries.get(task_id)
+            if entry is not None:
+                self._put_entry((entry[0], -length, upstream))
+                self._stale_entries += 1
+            stack.extend(
+                (parent, length + 1) for parent in self._blocked.get(task_id, ())
+            )
+
+    def _check_ready(self, task: Task) -> None:
+        """Queue, skip or cancel a task whose upstream tasks have changed."""
+        remaining = self._blocked.get(task.id, set())
+        failed = [
+            upstream_id
+            for upstream_id, result in task.upstream_results.items()
+            if result.status != TaskStatus.COMPLETED
+        ]
+
+        if failed and task.on_upstream_failure == UpstreamFailure.CANCEL:
+            self._blocked.pop(task.id, None)
+            self._pending_tasks.pop(task.id, None)
+            error = OperationCancelledError(
+                f"Task {task.name} cancelled: upstream task {failed[0]} "
+                f"{task.upstream_results[failed[0]].status.value}"
+            )
+            self._finish(
+                task,
+                TaskResult(
+                    task_id=task.id,
+                    status=TaskStatus.CANCELLED,
+                    error=error,
+                    metadata=task.metadata,
+                ),
+            )
+            return
+
+        if remaining:
+            return
+        self._blocked.pop(task.id, None)
+
+        if failed and task.on_upstream_failure == UpstreamFailure.SKIP:
+            self._pending_tasks.pop(task.id, None)
+            self._finish(
+                task,
+                TaskResult(
+                    task_id=task.id,
+                    status=TaskStatus.COMPLETED,
+                    metadata={**task.metadata, "skipped": True},
+                ),
+            )
+            return
+
+        task.resolve_outputs()
+        self._queue_task(task)
+
+    def _queue_task(self, task: Task) -> None:
+        """Put a ready task in the pending queue."""
+        task.queued_at = time.monotonic()
+
+        if self.aging_interval is None:
+            rank = -task.priority.value
+        else:
+            # Every task ages at the same rate, so ranking by a virtual start
+            # time (earlier per priority level) orders tasks by aged priority
+            # without ever re-sorting the heap
+            rank = task.queued_at - (
+                task.priority.value * self.aging_interval.total_seconds()
+            )
+
+        self._put_entry((rank, -task.critical_path, task))
+
+    def _put_entry(self, entry: tuple) -> None:
+        """Push a task's queue entry, replacing any earlier one."""
+        task = entry[-1]
+        self._queue_entries[task.id] = entry
+        self._pending_queue.put_nowait(entry, self._share_of(task))
+
+    def _share_of(self, task: Task) -> Hashable:
+        """Get the fair-share group of a task."""
+        return self.share_key(task) if self.share_key else None
+
+    def _track(self, task: Task) -> None:
+        """Index a queued task and create the future its waiters await."""
+        loop = self._loop or asyncio.get_running_loop()
+        self._pending_tasks[task.id] = task
+        self._futures[task.id] = loop.create_future()
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Get the process pool, creating it on first use."""
+        if self._process_pool is None:
+            # Spawned workers don't inherit this process's threads and locks,
+            # and spawn is required for max_tasks_per_child
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.process_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                max_tasks_per_child=self.max_tasks_per_child,
+            )
+        return self._process_pool
+
+    def _finish(self, task: Task, result: TaskResult) -> None:
+        """Record a task result and resolve the task's future."""
+        self._running_tasks.pop(task.id, None)
+        if isinstance(result.error, BrokenProcessPool) and self._process_pool:
+            # A worker process died; start a fresh pool for later tasks
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+        result.completed_at = datetime.now()
+        if self.store_results:
+            self._stats["results_evicted"] += self._completed_tasks.put(task.id, result)
+
+        key = task.idempotency_key
+        if key is not None and self._idempotency_keys.get(key) == task.id:
+            del self._idempotency_keys[key]
+            # Otherwise a later task with the key may try again
+            if result.status == TaskStatus.COMPLETED:
+                self._remember_completed(key, task.id)
+        if self._store and not result.metadata.get("interrupted"):
+            self._store.record_finished(result)
+
+        if result.status == TaskStatus.COMPLETED:
+            self._stats["total_completed"] += 1
+        elif result.status == TaskStatus.FAILED:
+            self._stats["total_failed"] += 1
+        elif result.status == TaskStatus.CANCELLED:
+            self._stats["total_cancelled"] += 1
+
+        future = self._futures.pop(task.id, None)
+        if future is not None and not future.done():
+            future.set_result(result)
+
+        if self.result_callback:
+            try:
+                self.result_callback(result)
+            except Exception as e:
+                logger.error(f"Error in task queue result callback: {e}")
+
+        for stream in self._result_streams:
+            self._offer_to_stream(stream, result)
+
+        for dependent in self._dependents.pop(task.id, ()):
+            if dependent.id not in self._blocked:
+                continue  # Already cancelled by another upstream task
+            dependent.upstream_results[task.id] = result
+            self._blocked[dependent.id].discard(task.id)
+            self._check_ready(dependent)
+
+    @staticmethod
+    def _offer_to_stream(stream: asyncio.Queue, item: TaskResult | None) -> None:
+        """Add an item to a result stream, dropping the oldest one if full."""
+        if stream.full():
+            stream.get_nowait()
+        stream.put_nowait(item)
+
+    def _result_awaited(self, result: TaskResult) -> None:
+        """Drop a result that a waiter received, if configured to."""
+        if self.drop_awaited_results:
+            self._completed_tasks.pop(result.task_id)
+
+    async def _sweeper(self) -> None:
+        """Periodically remove results that outlived the TTL."""
+        ttl_seconds = self._completed_tasks.ttl.total_seconds()
+        interval = min(ttl_seconds, RESULT_SWEEP_INTERVAL_SECONDS)
+
+        while self._is_running:
+            await asyncio.sleep(interval)
+            self._stats["results_evicted"] += self._completed_tasks.sweep()
+
+    def _future_for(self, task_id: str) -> asyncio.Future:
+        """
+        Get a future resolved with the result of a task.
+
+        Raises:
+            KeyError: If task ID not found
+        """
+        future = self._futures.get(task_id)
+        if future is not None:
+            return future
+
+        result = self._completed_tasks.get(task_id)
+        if result is None:
+            raise KeyError(f"Task {task_id} not found")
+
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(result)
+        return future
+
+    def _futures_for(self, task_ids: Iterable[str] | None) -> list[asyncio.Future]:
+        """Get futures for task IDs, or for every unfinished task if None."""
+        if task_ids is None:
+            return list(self._futures.values())
+        return [self._future_for(task_id) for task_id in task_ids]
+
     async def clear_completed(self, older_than: timedelta | None = None) -> int:
         """
         Clear completed tasks from memory.
 
         Args:
-            older_than: Only clear tasks older than this duration
+            older_than: Only clear tasks that completed longer ago than this
 
         Returns:
             Number of tasks cleared
         """
         if not older_than:
-            count = len(self._completed_tasks)
-            self._completed_tasks.clear()
-            return count
-
-        datetime.now() - older_than
-        to_remove = []
+            return self._completed_tasks.clear()
 
-        for task_id, _result in self._completed_tasks.items():
-            # Check if we have completion time info (would need to be added to TaskResult)
-            # For now, just clear all if older_than is specified
-            to_remove.append(task_id)
-
-        for task_id in to_remove:
-            del self._completed_tasks[task_id]
-
-        return len(to_remove)
+        return self._completed_tasks.remove_completed_before(
+            datetime.now() - older_than
+        )
 
     async def __aenter__(self) -> "TaskQueue":
         """Async context manager entry."""
@@ -2,10 +2,28 @@
 Event system for RevitPy with decorators and async handlers.
 """
 
-from .decorators import async_event_handler, event_filter, event_handler
+from .backpressure import BackpressurePolicy
+from .batching import EventBatcher
+from .bus import EventBusClient, EventBusServer
+from .coalescing import CoalesceMode, CoalesceStrategy, EventCoalescer
+from .decorators import (
+    async_event_handler,
+    batched_handler,
+    coalesced_handler,
+    event_filter,
+    event_handler,
+)
 from .dispatcher import EventDispatcher
 from .filters import ElementTypeFilter, EventFilter, ParameterChangeFilter
-from .handlers import AsyncEventHandler, BaseEventHandler
+from .handlers import (
+    AsyncEventHandler,
+    BaseEventHandler,
+    BatchingEventHandler,
+    CoalescingEventHandler,
+)
+from .health import CircuitBreaker, HandlerTimeoutError
+from .journal import EventJournal
+from .lanes import EventLane
 from .manager import EventManager
 from .types import EventData, EventPriority, EventResult, EventType
 
@@ -14,13 +32,28 @@ __all__ = [
     "event_handler",
     "async_event_handler",
     "event_filter",
+    "coalesced_handler",
+    "batched_handler",
     "EventType",
     "EventPriority",
     "EventData",
     "EventResult",
     "BaseEventHandler",
     "AsyncEventHandler",
+    "CoalescingEventHandler",
+    "EventCoalescer",
+    "CoalesceMode",
+    "CoalesceStrategy",
+    "BatchingEventHandler",
+    "EventBatcher",
     "EventDispatcher",
+    "BackpressurePolicy",
+    "EventLane",
+    "EventJournal",
+    "EventBusServer",
+    "EventBusClient",
+    "CircuitBreaker",
+    "HandlerTimeoutError",
     "EventFilter",
     "ElementTypeFilter",
     "ParameterChangeFilter",
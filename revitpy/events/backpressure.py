@@ -0,0 +1,154 @@
+"""
+Backpressure policies and overflow storage for the event queue.
+"""
+
+from __future__ import annotations
+
+import pickle
+import struct
+import tempfile
+import threading
+from enum import Enum
+from pathlib import Path
+from typing import BinaryIO
+
+from loguru import logger
+
+from .types import EventData
+
+_RECORD_HEADER = struct.Struct("<I")
+
+
+class BackpressurePolicy(Enum):
+    """What the dispatcher does when its event queue is full."""
+
+    BLOCK = "block"  # Block the producer up to a timeout, then drop the event
+    DROP_NEWEST = "drop_newest"  # Reject the incoming event
+    DROP_OLDEST = "drop_oldest"  # Evict the oldest queued event
+    SAMPLE = "sample"  # Above the high-water mark, admit every Nth event
+    SPILL = "spill"  # Write overflow to disk and drain it as pressure subsides
+
+
+class DiskSpillBuffer:
+    """
+    Append-only, disk-backed FIFO of events.
+
+    Records are length-prefixed pickles. The file is truncated whenever the
+    buffer drains completely, so it only grows while pressure persists.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        if path is None:
+            handle = tempfile.NamedTemporaryFile(
+                prefix="revitpy-events-", suffix=".spill", delete=False
+            )
+            handle.close()
+            path = handle.name
+
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: BinaryIO = open(self.path, "w+b")
+        self._lock = threading.Lock()
+        self._read_offset = 0
+        self._write_offset = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Get the number of events waiting on disk."""
+        return self._count
+
+    @property
+    def size_bytes(self) -> int:
+        """Get the number of bytes waiting on disk."""
+        return self._write_offset - self._read_offset
+
+    def append(self, event_data: EventData) -> bool:
+        """
+        Write an event to the end of the buffer.
+
+        Args:
+            event_data: Event to spill
+
+        Returns:
+            True if the event was written, False if it could not be serialized
+        """
+        try:
+            payload = pickle.dumps(event_data, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.warning(f"Cannot spill event {event_data.event_id}: {e}")
+            return False
+
+        with self._lock:
+            self._file.seek(self._write_offset)
+            self._file.write(_RECORD_HEADER.pack(len(payload)))
+            self._file.write(payload)
+            self._write_offset += _RECORD_HEADER.size + len(payload)
+            self._count += 1
+
+        return True
+
+    def pop_many(self, limit: int) -> list[EventData]:
+        """
+        Read up to ``limit`` events from the front of the buffer.
+
+        Args:
+            limit: Maximum number of events to read
+
+        Returns:
+            Events in the order they were spilled
+        """
+        events: list[EventData] = []
+
+        with self._lock:
+            self._file.flush()
+            self._file.seek(self._read_offset)
+
+            while self._count and len(events) < limit:
+                (length,) = _RECORD_HEADER.unpack(self._file.read(_RECORD_HEADER.size))
+                payload = self._file.read(length)
+                self._read_offset += _RECORD_HEADER.size + length
+                self._count -= 1
+
+                try:
+                    # Records were written by this process to a private file
+                    events.append(pickle.loads(payload))  # noqa: S301
+                except Exception as e:
+                    logger.error(f"Discarding unreadable spilled event: {e}")
+
+            if not self._count:
+                self._reset()
+
+        return events
+
+    def clear(self) -> int:
+        """
+        Discard every spilled event.
+
+        Returns:
+            Number of events discarded
+        """
+        with self._lock:
+            count = self._count
+            self._count = 0
+            self._reset()
+        return count
+
+    def close(self, delete: bool = True) -> None:
+        """
+        Close the buffer file.
+
+        Args:
+            delete: Whether to remove the file from disk
+        """
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+            if delete:
+                self.path.unlink(missing_ok=True)
+
+    def _reset(self) -> None:
+        """Truncate the file once it holds no pending records."""
+        self._file.seek(0)
+        self._file.truncate()
+        self._read_offset = 0
+        self._write_offset = 0
@@ -0,0 +1,324 @@
+"""
+Batched delivery of events to handlers that consume lists of events.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from loguru import logger
+
+from .types import EventData
+
+DEFAULT_MAX_BATCH_SIZE = 100
+DEFAULT_MAX_BATCH_LATENCY_SECONDS = 0.5
+
+
+@dataclass
+class BatchStats:
+    """Counters for an event batcher."""
+
+    events_received: int = 0
+    events_delivered: int = 0
+    batches_delivered: int = 0
+    batch_errors: int = 0
+    events_retried: int = 0
+    events_failed: int = 0
+
+    @property
+    def average_batch_size(self) -> float:
+        """Get the average number of events per delivered batch."""
+        if self.batches_delivered == 0:
+            return 0.0
+        return self.events_delivered / self.batches_delivered
+
+
+class EventBatcher:
+    """
+    Accumulates events and delivers them to a callback as lists.
+
+    A batch is delivered when it reaches ``max_batch_size`` (on the thread
+    that submitted the last event) or when its oldest event has waited
+    ``max_latency_seconds`` (on a background timer thread). Deliveries are
+    serialized, so batches arrive in submission order.
+
+    If the callback raises, the failure is reported once for the whole batch.
+    With ``retry_individually`` the events are then redelivered one per call,
+    so a single bad event does not lose the rest of the batch.
+
+    A coroutine callback runs on the event loop that submitted the events,
+    awaited from the timer thread. Batches that fill up on that loop are
+    handed to the timer thread, because the loop cannot wait on itself.
+    Without a running loop the coroutine runs with ``asyncio.run``.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[list[EventData]], Any],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_latency_seconds: float = DEFAULT_MAX_BATCH_LATENCY_SECONDS,
+        retry_individually: bool = False,
+        on_error: Callable[[list[EventData], Exception], Any] | None = None,
+        name: str = "EventBatcher",
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_latency_seconds <= 0:
+            raise ValueError("max_latency_seconds must be positive")
+
+        self.callback = callback
+        self.max_batch_size = max_batch_size
+        self.max_latency_seconds = max_latency_seconds
+        self.retry_individually = retry_individually
+        self.on_error = on_error
+        self.name = name
+
+        self._pending: list[EventData] = []
+        self._deadline: float | None = None
+        lock = threading.RLock()
+        self._condition = threading.Condition(lock)
+        # Batches are numbered as they are taken and delivered in that order,
+        # without holding the lock while the callback runs
+        self._turns = threading.Condition(lock)
+        self._next_turn = 0
+        self._current_turn = 0
+        # Set on threads running the callback, whose flushes are deferred
+        self._local = threading.local()
+        self._timer_thread: threading.Thread | None = None
+        self._closed = False
+        self._stats = BatchStats()
+        self._is_async = asyncio.iscoroutinefunction(callback)
+        # Loop that coroutine callbacks run on, set by submitters
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def stats(self) -> BatchStats:
+        """Get batching statistics."""
+        return self._stats
+
+    @property
+    def pending_count(self) -> int:
+        """Get the number of events waiting for delivery."""
+        with self._condition:
+            return len(self._pending)
+
+    def submit(self, event_data: EventData) -> None:
+        """
+        Add an event to the current batch.
+
+        Args:
+            event_data: Event to batch
+        """
+        hand_off = self._on_owner_loop()
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError(f"Batcher {self.name} is closed")
+
+            self._stats.events_received += 1
+            self._pending.append(event_data)
+
+            if len(self._pending) == 1:
+                self._deadline = time.monotonic() + self.max_latency_seconds
+                self._wake_timer()
+
+            full = len(self._pending) >= self.max_batch_size
+            if full and hand_off:
+                self._hand_off_to_timer()
+                full = False
+
+        if full:
+            self._deliver_pending()
+
+    def flush(self) -> int:
+        """
+        Deliver pending events immediately on the calling thread.
+
+        For a coroutine callback called from its event loop, or when called
+        from within the callback, the events are handed to the timer thread
+        instead and delivered shortly after.
+
+        Returns:
+            Number of events delivered or handed off
+        """
+        if self._on_owner_loop():
+            return self._defer_pending()
+
+        return self._deliver_pending()
+
+    def close(self, flush: bool = True, timeout: float = 1.0) -> None:
+        """
+        Stop the timer thread, optionally delivering pending events first.
+
+        Args:
+            flush: Whether to deliver pending events before closing
+            timeout: Timeout in seconds to wait for the timer thread
+        """
+        # The timer thread delivers what is left as it exits; a coroutine
+        # callback's loop must not block on it
+        on_loop = self._on_owner_loop()
+        if flush and not on_loop:
+            self.flush()
+
+        with self._condition:
+            self._closed = True
+            if not flush:
+                self._pending.clear()
+            self._deadline = None
+            if self._pending:
+                self._wake_timer()
+            self._condition.notify_all()
+            thread = self._timer_thread
+
+        if thread and not on_loop and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _on_owner_loop(self) -> bool:
+        """
+        Check whether a coroutine callback is being driven from its own loop.
+
+        Records the calling thread's running loop as the one to run the
+        callback on.
+        """
+        if not self._is_async:
+            return False
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+
+    def _defer_pending(self) -> int:
+        """Hand the pending events to the timer thread."""
+        with self._condition:
+            count = len(self._pending)
+            if count:
+                self._hand_off_to_timer()
+        return count
+
+    def _hand_off_to_timer(self) -> None:
+        """Make the timer thread deliver now (caller holds the lock)."""
+        self._deadline = time.monotonic()
+        self._wake_timer()
+
+    def _wake_timer(self) -> None:
+        """Start or wake the timer thread (caller holds the lock)."""
+        if self._timer_thread is None or not self._timer_thread.is_alive():
+            self._timer_thread = threading.Thread(
+                target=self._timer_loop, name=f"{self.name}-timer", daemon=True
+            )
+            self._timer_thread.start()
+        else:
+            self._condition.notify()
+
+    def _timer_loop(self) -> None:
+        """Deliver batches whose latency bound has passed (background thread)."""
+        while True:
+            with self._condition:
+                while not self._closed:
+                    now = time.monotonic()
+                    if self._deadline is None:
+                        self._condition.wait()
+                    elif self._deadline > now:
+                        self._condition.wait(self._deadline - now)
+                    else:
+                        break
+
+                closing = self._closed
+
+            self._deliver_pending()
+            if closing:
+                # Deliver what the callback submitted while closing too
+                with self._condition:
+                    if not self._pending:
+                        return
+
+    def _deliver_pending(self) -> int:
+        """Take the pending batch and deliver it."""
+        if getattr(self._local, "delivering", False):
+            # Called from the callback, which must finish before the next
+            # batch in line; let the timer thread deliver it afterwards
+            return self._defer_pending()
+
+        with self._condition:
+            batch = self._pending
+            if not batch:
+                return 0
+            self._pending = []
+            self._deadline = None
+            turn = self._next_turn
+            self._next_turn += 1
+            self._turns.wait_for(lambda: self._current_turn == turn)
+
+        self._local.delivering = True
+        try:
+            self._deliver(batch)
+        finally:
+            self._local.delivering = False
+            with self._condition:
+                self._current_turn += 1
+                self._turns.notify_all()
+
+        return len(batch)
+
+    def _deliver(self, batch: list[EventData]) -> None:
+        """Invoke the callback for a batch, retrying per event if configured."""
+        try:
+            self._call(batch)
+            with self._condition:
+                self._stats.batches_delivered += 1
+                self._stats.events_delivered += len(batch)
+            return
+        except Exception as e:
+            with self._condition:
+                self._stats.batch_errors += 1
+            logger.error(
+                f"Batch handler {self.name} failed for batch of {len(batch)} events: {e}"
+            )
+            self._report_error(batch, e)
+
+        if not self.retry_individually:
+            with self._condition:
+                self._stats.events_failed += len(batch)
+            return
+
+        for event_data in batch:
+            try:
+                self._call([event_data])
+                with self._condition:
+                    self._stats.events_retried += 1
+                    self._stats.batches_delivered += 1
+                    self._stats.events_delivered += 1
+            except Exception as e:
+                with self._condition:
+                    self._stats.events_retried += 1
+                    self._stats.events_failed += 1
+                logger.error(
+                    f"Batch handler {self.name} failed for event {event_data.event_id}: {e}"
+                )
+                self._report_error([event_data], e)
+
+    def _call(self, batch: list[EventData]) -> Any:
+        """Invoke the callback, running a coroutine callback to completion."""
+        if not self._is_async:
+            return self.callback(batch)
+
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            future = asyncio.run_coroutine_threadsafe(self.callback(batch), loop)
+            return future.result()
+        return asyncio.run(self.callback(batch))
+
+    def _report_error(self, batch: list[EventData], error: Exception) -> None:
+        """Pass a delivery failure to the error callback, if any."""
+        if self.on_error is None:
+            return
+        try:
+            self.on_error(batch, error)
+        except Exception as e:
+            logger.error(f"Error callback for {self.name} failed: {e}")
@@ -0,0 +1,667 @@
+"""
+Cross-process event bus over local sockets (Unix domain sockets or Windows
+named pipes).
+
+The server runs inside the Revit process and forwards dispatched events to
+subscriber processes. Each frame is one kind byte followed by its body;
+the transport adds a length prefix. Subscriptions travel as JSON and events
+in the binary encoding of the ``codec`` module, so neither side ever
+unpickles data from the other.
+
+By default the socket and a shared secret live in a per-user runtime
+directory that only the current user can access, and every connection must
+authenticate with that secret.
+"""
+
+from __future__ import annotations
+
+import getpass
+import json
+import os
+import socket
+import stat
+import struct
+import sys
+import tempfile
+import threading
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Any
+
+from loguru import logger
+
+from .codec import decode_event, encode_event
+from .dispatcher import EventDispatcher
+from .filters import CategoryFilter, ElementIdFilter, EventFilter, ParameterChangeFilter
+from .handlers import CallableEventHandler
+from .types import EventData, EventPriority, EventResult, EventType
+
+DEFAULT_SUBSCRIBER_BUFFER_SIZE = 1000
+DEFAULT_HANDSHAKE_TIMEOUT_SECONDS = 5.0
+DEFAULT_BUS_NAME = "revitpy-events"
+_MAX_SUBSCRIPTION_BYTES = 64 * 1024
+_AUTHKEY_BYTES = 32
+
+# Frame kinds
+_SUBSCRIBE = 1
+_ACK = 2
+_ERROR = 3
+_EVENT = 4
+_DROPPED = 5
+
+_COUNT = struct.Struct("<I")
+
+
+def default_bus_address(name: str = DEFAULT_BUS_NAME) -> str:
+    """
+    Get the platform's default address for a named event bus.
+
+    Args:
+        name: Bus name
+
+    Returns:
+        Named pipe path on Windows, socket path in the per-user runtime
+        directory elsewhere
+
+    Raises:
+        PermissionError: If the runtime directory is accessible to other users
+    """
+    if sys.platform == "win32":
+        return rf"\\.\pipe\{name}"
+    return os.path.join(_runtime_directory(), f"{name}.sock")
+
+
+def default_bus_authkey(name: str = DEFAULT_BUS_NAME, create: bool = False) -> bytes:
+    """
+    Get the shared secret for a named event bus.
+
+    The secret is kept in a file in the per-user runtime directory, so any
+    process of the same user can subscribe and no other user can.
+
+    Args:
+        name: Bus name
+        create: Whether to generate the secret if it does not exist yet
+
+    Returns:
+        Shared secret
+
+    Raises:
+        FileNotFoundError: If the secret does not exist and create is False
+        PermissionError: If the runtime directory is accessible to other users
+        OSError: If the secret file is incomplete
+    """
+    path = os.path.join(_runtime_directory(), f"{name}.key")
+    if create:
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            pass
+        else:
+            with os.fdopen(fd, "wb") as f:
+                f.write(os.urandom(_AUTHKEY_BYTES))
+
+    with open(path, "rb") as f:
+        authkey = f.read()
+    if len(authkey) != _AUTHKEY_BYTES:
+        raise OSError(f"Event bus secret {path} is incomplete")
+    return authkey
+
+
+@dataclass
+class EventBusStats:
+    """Counters for an event bus server."""
+
+    events_forwarded: int = 0
+    events_serialized: int = 0
+    events_dropped: int = 0
+    serialization_errors: int = 0
+    subscribers_connected: int = 0
+    subscribers_disconnected: int = 0
+
+
+@dataclass
+class Subscription:
+    """Server-side filter requested by a subscriber."""
+
+    event_types: frozenset[EventType] | None = None
+    categories: list[str] | None = None
+    element_ids: list[Any] | None = None
+    parameter_names: list[str] | None = None
+
+    def to_json(self) -> bytes:
+        """Encode the subscription for the wire."""
+        return json.dumps(
+            {
+                "event_types": [t.value for t in self.event_types]
+                if self.event_types is not None
+                else None,
+                "categories": self.categories,
+                "element_ids": self.element_ids,
+                "parameter_names": self.parameter_names,
+            }
+        ).encode("utf-8")
+
+    @classmethod
+    def from_json(cls, body: bytes) -> Subscription:
+        """
+        Decode a subscription sent by a client.
+
+        Raises:
+            ValueError: If the subscription is malformed
+        """
+        data = json.loads(body.decode("utf-8"))
+        if not isinstance(data, dict):
+            raise ValueError("Subscription must be a JSON object")
+
+        event_types = data.get("event_types")
+        return cls(
+            event_types=frozenset(EventType(value) for value in event_types)
+            if event_types is not None
+            else None,
+            categories=data.get("categories"),
+            element_ids=data.get("element_ids"),
+            parameter_names=data.get("parameter_names"),
+        )
+
+    def to_filter(self) -> EventFilter | None:
+        """Build the event filter for the non-type constraints."""
+        filters: list[EventFilter] = []
+        if self.categories:
+            filters.append(CategoryFilter(*self.categories))
+        if self.element_ids:
+            filters.append(ElementIdFilter(*self.element_ids))
+        if self.parameter_names:
+            filters.append(ParameterChangeFilter(*self.parameter_names))
+
+        if not filters:
+            return None
+        combined = filters[0]
+        for event_filter in filters[1:]:
+            combined = combined & event_filter
+        return combined
+
+
+class _Subscriber:
+    """Connected subscriber with a bounded outgoing buffer and sender thread."""
+
+    def __init__(
+        self, server: EventBusServer, connection: Connection, buffer_size: int
+    ) -> None:
+        self.server = server
+        self.connection = connection
+        self.event_types: frozenset[EventType] | None = None
+        self.matcher = None
+        self._buffer: deque[bytes] = deque()
+        self._buffer_size = buffer_size
+        self._condition = threading.Condition()
+        self._dropped = 0
+        self._closed = False
+        self.thread = threading.Thread(
+            target=self._run, name=f"{server.name}-subscriber", daemon=True
+        )
+
+    def accepts(self, event_data: EventData) -> bool:
+        """Check the subscription filter."""
+        if (
+            self.event_types is not None
+            and event_data.event_type not in self.event_types
+        ):
+            return False
+        return self.matcher is None or self.matcher(event_data)
+
+    def offer(self, frame: bytes) -> None:
+        """Buffer a frame without blocking, evicting the oldest when full."""
+        with self._condition:
+            if self._closed:
+                return
+            if len(self._buffer) >= self._buffer_size:
+                self._buffer.popleft()
+                self._dropped += 1
+                self.server._count_drop()
+            self._buffer.append(frame)
+            self._condition.notify()
+
+    def close(self) -> None:
+        """Stop the sender thread and close the connection."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+    def _handshake(self) -> bool:
+        """Read the subscription and acknowledge it."""
+        if not self.connection.poll(self.server.handshake_timeout):
+            return False
+
+        frame = self.connection.recv_bytes(_MAX_SUBSCRIPTION_BYTES)
+        if not frame or frame[0] != _SUBSCRIBE:
+            self.connection.send_bytes(bytes([_ERROR]) + b"Expected subscription")
+            return False
+
+        try:
+            subscription = Subscription.from_json(frame[1:])
+            event_filter = subscription.to_filter()
+        except (ValueError, TypeError) as e:
+            self.connection.send_bytes(bytes([_ERROR]) + str(e).encode("utf-8"))
+            return False
+
+        self.event_types = subscription.event_types
+        self.matcher = event_filter.compile() if event_filter is not None else None
+
+        # Forward from before the acknowledgement so the client misses nothing
+        self.server._add_subscriber(self)
+        self.connection.send_bytes(bytes([_ACK]))
+        return True
+
+    def _run(self) -> None:
+        """Handshake, then send buffered frames until closed (background thread)."""
+        try:
+            if not self._handshake():
+                return
+
+            while True:
+                with self._condition:
+                    while not self._buffer and not self._closed:
+                        self._condition.wait()
+                    # Send what is already buffered before closing
+                    if self._closed and not self._buffer:
+                        return
+
+                    frames = list(self._buffer)
+                    self._buffer.clear()
+                    dropped, self._dropped = self._dropped, 0
+
+                if dropped:
+                    self.connection.send_bytes(bytes([_DROPPED]) + _COUNT.pack(dropped))
+                for frame in frames:
+                    self.connection.send_bytes(frame)
+
+        except (OSError, EOFError) as e:
+            logger.debug(f"Event bus subscriber disconnected: {e}")
+        finally:
+            self.server._remove_subscriber(self)
+            self.connection.close()
+
+
+class EventBusServer:
+    """
+    Forwards dispatched events to subscriber processes.
+
+    Events are serialized only if at least one subscriber's filter matches,
+    and at most once. Each subscriber has a bounded buffer drained by its own
+    thread; when a slow subscriber falls behind, its oldest events are
+    dropped and it is told how many, so dispatch never blocks on a consumer.
+
+    Events are sent in the ``codec`` encoding, which drops ``source``;
+    events that cannot be encoded are not forwarded. Subscribers must
+    authenticate with ``authkey``, which defaults to the per-user secret
+    from ``default_bus_authkey``.
+    """
+
+    def __init__(
+        self,
+        dispatcher: EventDispatcher,
+        address: str | None = None,
+        authkey: bytes | None = None,
+        buffer_size: int = DEFAULT_SUBSCRIBER_BUFFER_SIZE,
+        event_types: list[EventType] | None = None,
+        priority: EventPriority = EventPriority.HIGHEST,
+        handshake_timeout: float = DEFAULT_HANDSHAKE_TIMEOUT_SECONDS,
+        name: str = "EventBusServer",
+    ) -> None:
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be at least 1")
+
+        self.dispatcher = dispatcher
+        self.address = address or default_bus_address()
+        self.authkey = authkey
+        self.buffer_size = buffer_size
+        self.event_types = event_types
+        self.handshake_timeout = handshake_timeout
+        self.name = name
+
+        self._handler = CallableEventHandler(
+            self._forward, name=name, priority=priority
+        )
+        self._listener: Listener | None = None
+        self._accept_thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        # Replaced wholesale on (dis)connect, so forwarding never locks
+        self._subscribers: tuple[_Subscriber, ...] = ()
+        self._pending: set[_Subscriber] = set()
+        self._running = False
+        self._stats = EventBusStats()
+
+    @property
+    def stats(self) -> EventBusStats:
+        """Get forwarding statistics."""
+        return self._stats
+
+    @property
+    def subscriber_count(self) -> int:
+        """Get the number of subscribed processes."""
+        return len(self._subscribers)
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the server is accepting subscribers."""
+        return self._running
+
+    def start(self) -> None:
+        """Start listening and forwarding events."""
+        if self._running:
+            return
+
+        if self.authkey is None:
+            self.authkey = default_bus_authkey(create=True)
+        if sys.platform != "win32":
+            _remove_stale_socket(self.address)
+
+        self._listener = Listener(self.address, authkey=self.authkey)
+        if sys.platform != "win32":
+            os.chmod(self.address, 0o600)
+
+        self._running = True
+        self._accept_thread = threading.Thread(
+            target=self._accept_loop, name=f"{self.name}-accept", daemon=True
+        )
+        self._accept_thread.start()
+        self.dispatcher.register_handler(self._handler, self.event_types)
+        logger.info(f"Event bus listening on {self.address}")
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """
+        Stop forwarding and disconnect all subscribers.
+
+        Args:
+            timeout: Timeout in seconds to wait for each thread
+        """
+        if not self._running:
+            return
+
+        self._running = False
+        self.dispatcher.unregister_handler(self._handler, self.event_types)
+
+        # Closing the listener does not interrupt accept() everywhere, so
+        # connect once to wake the accept thread. The connection skips
+        # authentication, which would block if the thread had already exited.
+        try:
+            Client(self.address).close()
+        except Exception as e:
+            logger.debug(f"Could not wake event bus accept thread: {e}")
+        if self._accept_thread is not None:
+            self._accept_thread.join(timeout)
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+
+        with self._lock:
+            subscribers = [*self._subscribers, *self._pending]
+        for subscriber in subscribers:
+            subscriber.close()
+        for subscriber in subscribers:
+            subscriber.thread.join(timeout)
+
+        logger.info(f"Event bus on {self.address} stopped")
+
+    def _accept_loop(self) -> None:
+        """Accept subscriber connections (runs in background thread)."""
+        listener = self._listener
+        while self._running and listener is not None:
+            try:
+                connection = listener.accept()
+            except (ConnectionError, EOFError) as e:
+                # The peer went away during the authentication handshake
+                logger.warning(f"Rejected event bus connection: {e}")
+                continue
+            except OSError as e:
+                if self._running:
+                    logger.error(f"Event bus accept failed: {e}")
+                return
+            except Exception as e:
+                # Typically an authentication failure; keep serving others
+                logger.warning(f"Rejected event bus connection: {e}")
+                continue
+
+            if not self._running:
+                connection.close()
+                return
+
+            subscriber = _Subscriber(self, connection, self.buffer_size)
+            with self._lock:
+                self._pending.add(subscriber)
+            subscriber.thread.start()
+
+    def _add_subscriber(self, subscriber: _Subscriber) -> None:
+        """Start forwarding to a subscriber that completed its handshake."""
+        with self._lock:
+            self._pending.discard(subscriber)
+            self._subscribers = (*self._subscribers, subscriber)
+            self._stats.subscribers_connected += 1
+
+    def _remove_subscriber(self, subscriber: _Subscriber) -> None:
+        """Stop forwarding to a subscriber."""
+        with self._lock:
+            self._pending.discard(subscriber)
+            if subscriber in self._subscribers:
+                self._subscribers = tuple(
+                    s for s in self._subscribers if s is not subscriber
+                )
+                self._stats.subscribers_disconnected += 1
+
+    def _count_drop(self) -> None:
+        """Count an event evicted from a subscriber buffer."""
+        self._stats.events_dropped += 1
+
+    def _forward(self, event_data: EventData) -> EventResult:
+        """Offer an event to every subscriber whose filter matches it."""
+        frame = None
+        for subscriber in self._subscribers:
+            if not subscriber.accepts(event_data):
+                continue
+
+            if frame is None:
+                frame = self._encode(event_data)
+                if frame is None:
+                    break
+
+            subscriber.offer(frame)
+            self._stats.events_forwarded += 1
+
+        return EventResult.CONTINUE
+
+    def _encode(self, event_data: EventData) -> bytes | None:
+        """Serialize an event frame, or None if it cannot be encoded."""
+        try:
+            payload = encode_event(event_data)
+        except TypeError as e:
+            self._stats.serialization_errors += 1
+            logger.warning(f"Cannot forward event {event_data.event_id}: {e}")
+            return None
+
+        self._stats.events_serialized += 1
+        return bytes([_EVENT]) + payload
+
+    def __enter__(self) -> EventBusServer:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.stop()
+
+
+class EventBusClient:
+    """
+    Receives events from an event bus server in another process.
+
+    ``authkey`` defaults to the per-user secret from ``default_bus_authkey``.
+
+    Example:
+        with EventBusClient(event_types=[EventType.ELEMENT_MODIFIED]) as bus:
+            for event_data in bus:
+                analyse(event_data)
+    """
+
+    def __init__(
+        self,
+        address: str | None = None,
+        event_types: list[EventType] | None = None,
+        categories: list[str] | None = None,
+        element_ids: list[Any] | None = None,
+        parameter_names: list[str] | None = None,
+        authkey: bytes | None = None,
+        connect_timeout: float = DEFAULT_HANDSHAKE_TIMEOUT_SECONDS,
+    ) -> None:
+        self.address = address or default_bus_address()
+        self.subscription = Subscription(
+            event_types=frozenset(event_types) if event_types is not None else None,
+            categories=categories,
+            element_ids=element_ids,
+            parameter_names=parameter_names,
+        )
+        self.authkey = authkey
+        self.connect_timeout = connect_timeout
+        self.events_dropped = 0
+        self._connection: Connection | None = None
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if the client is connected."""
+        return self._connection is not None
+
+    def connect(self) -> None:
+        """
+        Connect and subscribe.
+
+        Raises:
+            ConnectionError: If the server rejects the subscription
+            FileNotFoundError: If no authkey was given and no server has
+                created the default secret
+        """
+        if self._connection is not None:
+            return
+
+        if self.authkey is None:
+            self.authkey = default_bus_authkey()
+        connection = Client(self.address, authkey=self.authkey)
+        try:
+            connection.send_bytes(bytes([_SUBSCRIBE]) + self.subscription.to_json())
+            if not connection.poll(self.connect_timeout):
+                raise ConnectionError("Event bus did not acknowledge subscription")
+
+            reply = connection.recv_bytes()
+            if reply[:1] != bytes([_ACK]):
+                message = reply[1:].decode("utf-8", errors="replace")
+                raise ConnectionError(f"Event bus rejected subscription: {message}")
+        except BaseException:
+            connection.close()
+            raise
+
+        self._connection = connection
+
+    def receive(self, timeout: float | None = None) -> EventData | None:
+        """
+        Wait for the next event.
+
+        Args:
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            Next event, or None if the timeout expired
+
+        Raises:
+            ConnectionError: If the connection was closed
+        """
+        if self._connection is None:
+            self.connect()
+        connection = self._connection
+
+        try:
+            while connection.poll(timeout):
+                frame = connection.recv_bytes()
+                kind, body = frame[0], frame[1:]
+
+                if kind == _EVENT:
+                    try:
+                        return decode_event(body)
+                    except ValueError as e:
+                        logger.warning(f"Skipping undecodable event bus frame: {e}")
+                if kind == _DROPPED:
+                    (count,) = _COUNT.unpack(body)
+                    self.events_dropped += count
+                    logger.warning(f"Event bus dropped {count} events for this client")
+        except (EOFError, OSError) as e:
+            self.close()
+            raise ConnectionError("Event bus connection closed") from e
+
+        return None
+
+    def __iter__(self) -> Iterator[EventData]:
+        """Yield events until the server disconnects."""
+        while True:
+            try:
+                event_data = self.receive()
+            except ConnectionError:
+                return
+            if event_data is not None:
+                yield event_data
+
+    def close(self) -> None:
+        """Close the connection."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __enter__(self) -> EventBusClient:
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+
+def _runtime_directory() -> str:
+    """
+    Get a directory only the current user can access, creating it if needed.
+
+    Raises:
+        PermissionError: If the directory is accessible to other users
+    """
+    directory = os.environ.get("XDG_RUNTIME_DIR")
+    if not directory or not os.path.isdir(directory):
+        user = os.getuid() if hasattr(os, "getuid") else getpass.getuser()
+        directory = os.path.join(tempfile.gettempdir(), f"revitpy-{user}")
+        try:
+            os.mkdir(directory, 0o700)
+        except FileExistsError:
+            pass
+
+    # Another user may have created the directory first; Windows temp
+    # directories are already per-user
+    if hasattr(os, "getuid"):
+        info = os.lstat(directory)
+        if (
+            not stat.S_ISDIR(info.st_mode)
+            or info.st_uid != os.getuid()
+            or info.st_mode & 0o077
+        ):
+            raise PermissionError(f"{directory} is not private to the current user")
+    return directory
+
+
+def _remove_stale_socket(address: str) -> None:
+    """Remove a socket file left behind by a server that is no longer running."""
+    if not os.path.exists(address):
+        return
+
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(address)
+    except (ConnectionRefusedError, FileNotFoundError):
+        os.unlink(address)
+        return
+    finally:
+        probe.close()
+
+    raise OSError(f"Event bus address {address} is already in use")
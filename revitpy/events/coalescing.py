@@ -0,0 +1,423 @@
+"""
+Event coalescing, debouncing and throttling for high-frequency events.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import threading
+import time
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, replace
+from enum import Enum
+from typing import Any
+
+from loguru import logger
+
+from .types import EventData
+
+DEFAULT_COALESCE_WINDOW_SECONDS = 0.1
+# Size of the per-key delivery times below which they are not pruned
+MIN_DELIVERY_PRUNE_SIZE = 64
+
+
+class CoalesceMode(Enum):
+    """When a burst of coalesced events is delivered."""
+
+    WINDOW = "window"  # Fixed window starting at the first event of a burst
+    DEBOUNCE = "debounce"  # Once events stop arriving for the window
+    THROTTLE = "throttle"  # First event immediately, then at most once per window
+
+
+class CoalesceStrategy(Enum):
+    """How the events of a burst are collapsed."""
+
+    LATEST = "latest"  # Deliver the most recent event
+    MERGE = "merge"  # Deliver a copy with the payloads of the burst merged
+
+
+def default_coalesce_key(event_data: EventData) -> Hashable:
+    """Coalesce by event type and element ID (if the event has one)."""
+    return (event_data.event_type, getattr(event_data, "element_id", None))
+
+
+def merge_event_data(older: EventData, newer: EventData) -> EventData:
+    """
+    Merge two events of a burst into a new event.
+
+    The newer event wins for scalar fields and data keys. Changed parameter
+    names are combined, and the earliest old values are kept.
+
+    Args:
+        older: Earlier event (or the result of a previous merge)
+        newer: Later event
+
+    Returns:
+        Merged copy; neither input is modified
+    """
+    merged = replace(newer, data={**older.data, **newer.data})
+
+    if hasattr(newer, "parameters_changed"):
+        merged.parameters_changed = list(
+            dict.fromkeys([*older.parameters_changed, *newer.parameters_changed])
+        )
+        merged.old_values = {**newer.old_values, **older.old_values}
+        merged.new_values = {**older.new_values, **newer.new_values}
+
+    if hasattr(newer, "old_value") and hasattr(older, "old_value"):
+        merged.old_value = older.old_value
+
+    return merged
+
+
+@dataclass
+class CoalescerStats:
+    """Counters for an event coalescer."""
+
+    events_received: int = 0
+    deliveries: int = 0
+    delivery_errors: int = 0
+
+    @property
+    def events_coalesced(self) -> int:
+        """Get the number of events absorbed into another delivery."""
+        return max(0, self.events_received - self.deliveries)
+
+
+@dataclass
+class _PendingBurst:
+    """Events collected for one key that have not been delivered yet."""
+
+    event: EventData
+    count: int
+    first_seen: float
+    deadline: float
+
+
+class EventCoalescer:
+    """
+    Collapses bursts of events by key and delivers them on a background timer.
+
+    Events with the same key that arrive close together are reduced to one
+    delivery. The key defaults to (event type, element ID). Use a constant
+    key to run once per burst regardless of which elements changed.
+
+    A coroutine callback runs on the event loop that submitted the events,
+    awaited from the timer thread. Deliveries that would otherwise run on
+    that loop's thread are handed to the timer thread, because the loop
+    cannot wait on itself. Without a running loop the coroutine runs with
+    ``asyncio.run``.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[EventData], Any],
+        window_seconds: float = DEFAULT_COALESCE_WINDOW_SECONDS,
+        mode: CoalesceMode = CoalesceMode.DEBOUNCE,
+        strategy: CoalesceStrategy = CoalesceStrategy.LATEST,
+        key: Callable[[EventData], Hashable] | None = None,
+        max_wait_seconds: float | None = None,
+        name: str = "EventCoalescer",
+    ) -> None:
+        if window_seconds <= 0:
+            raise ValueError("window_seconds must be positive")
+        if max_wait_seconds is not None and max_wait_seconds <= 0:
+            raise ValueError("max_wait_seconds must be positive")
+
+        self.callback = callback
+        self.window_seconds = window_seconds
+        self.mode = mode
+        self.strategy = strategy
+        self.key = key or default_coalesce_key
+        self.max_wait_seconds = max_wait_seconds
+        self.name = name
+
+        self._pending: dict[Hashable, _PendingBurst] = {}
+        # (event, count) pairs for the timer thread to deliver right away
+        self._handed_off: list[tuple[EventData, int]] = []
+        self._deadlines: list[tuple[float, int, Hashable]] = []
+        self._sequence = 0
+        # Last delivery per key, only kept in THROTTLE mode
+        self._last_delivery: dict[Hashable, float] = {}
+        self._prune_at = MIN_DELIVERY_PRUNE_SIZE
+        self._condition = threading.Condition()
+        self._timer_thread: threading.Thread | None = None
+        self._closed = False
+        self._stats = CoalescerStats()
+        self._is_async = asyncio.iscoroutinefunction(callback)
+        # Loop that coroutine callbacks run on, set by submitters
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def stats(self) -> CoalescerStats:
+        """Get coalescing statistics."""
+        return self._stats
+
+    @property
+    def pending_count(self) -> int:
+        """Get the number of keys waiting to be delivered."""
+        with self._condition:
+            return len(self._pending)
+
+    def submit(self, event_data: EventData) -> None:
+        """
+        Add an event to its burst.
+
+        In THROTTLE mode the first event for a key is delivered immediately
+        on the calling thread (or handed to the timer thread for a coroutine
+        callback called from its loop); all other deliveries happen on the
+        timer thread.
+
+        Args:
+            event_data: Event to coalesce
+        """
+        key = self.key(event_data)
+        now = time.monotonic()
+        deliver_now = False
+        hand_off = self._on_owner_loop()
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError(f"Coalescer {self.name} is closed")
+
+            self._stats.events_received += 1
+            burst = self._pending.get(key)
+
+            if burst is None:
+                last = self._last_delivery.get(key)
+                if self.mode == CoalesceMode.THROTTLE and (
+                    last is None or now - last >= self.window_seconds
+                ):
+                    self._record_delivery(key, now)
+                    if hand_off:
+                        self._hand_off([(event_data, 1)])
+                    else:
+                        deliver_now = True
+                else:
+                    burst = _PendingBurst(
+                        event=event_data,
+                        count=1,
+                        first_seen=now,
+                        deadline=self._first_deadline(now, last),
+                    )
+                    self._pending[key] = burst
+                    self._schedule(key, burst.deadline)
+            else:
+                burst.count += 1
+                if self.strategy == CoalesceStrategy.MERGE:
+                    burst.event = merge_event_data(burst.event, event_data)
+                else:
+                    burst.event = event_data
+
+                if self.mode == CoalesceMode.DEBOUNCE:
+                    burst.deadline = self._debounce_deadline(now, burst.first_seen)
+                    self._schedule(key, burst.deadline)
+
+        if deliver_now:
+            self._deliver(event_data, 1)
+
+    def flush(self) -> int:
+        """
+        Deliver every pending burst immediately on the calling thread.
+
+        For a coroutine callback called from its event loop the bursts are
+        handed to the timer thread instead and delivered shortly after.
+
+        Returns:
+            Number of deliveries made or handed off
+        """
+        hand_off = self._on_owner_loop()
+
+        with self._condition:
+            bursts = list(self._pending.items())
+            self._pending.clear()
+            self._deadlines.clear()
+            now = time.monotonic()
+            for key, _burst in bursts:
+                self._record_delivery(key, now)
+            if hand_off:
+                self._hand_off([(burst.event, burst.count) for _, burst in bursts])
+                return len(bursts)
+
+        for _key, burst in bursts:
+            self._deliver(burst.event, burst.count)
+
+        return len(bursts)
+
+    def cancel(self) -> int:
+        """
+        Drop all pending bursts without delivering them.
+
+        Returns:
+            Number of bursts dropped
+        """
+        with self._condition:
+            count = len(self._pending)
+            self._pending.clear()
+            self._deadlines.clear()
+            self._condition.notify_all()
+        return count
+
+    def close(self, flush: bool = True, timeout: float = 1.0) -> None:
+        """
+        Stop the timer thread, optionally delivering pending bursts first.
+
+        Args:
+            flush: Whether to deliver pending bursts before closing
+            timeout: Timeout in seconds to wait for the timer thread
+        """
+        if flush:
+            self.flush()
+        else:
+            self.cancel()
+
+        with self._condition:
+            self._closed = True
+            if not flush:
+                self._handed_off.clear()
+            self._condition.notify_all()
+            thread = self._timer_thread
+
+        # The timer thread delivers what was handed off as it exits; a
+        # coroutine callback's loop must not block on it
+        on_loop = self._on_owner_loop()
+        if thread and not on_loop and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _on_owner_loop(self) -> bool:
+        """
+        Check whether a coroutine callback is being driven from its own loop.
+
+        Records the calling thread's running loop as the one to run the
+        callback on.
+        """
+        if not self._is_async:
+            return False
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+
+    def _hand_off(self, deliveries: list[tuple[EventData, int]]) -> None:
+        """Queue deliveries for the timer thread (caller holds the lock)."""
+        if deliveries:
+            self._handed_off.extend(deliveries)
+            self._wake_timer()
+
+    def _first_deadline(self, now: float, last_delivery: float | None) -> float:
+        """Get the delivery deadline for the first event of a burst."""
+        if self.mode == CoalesceMode.THROTTLE:
+            # Trailing delivery one window after the last one
+            return (last_delivery or now) + self.window_seconds
+        if self.mode == CoalesceMode.DEBOUNCE:
+            return self._debounce_deadline(now, now)
+        return now + self.window_seconds
+
+    def _debounce_deadline(self, now: float, first_seen: float) -> float:
+        """Get the debounce deadline, bounded by max_wait_seconds."""
+        deadline = now + self.window_seconds
+        if self.max_wait_seconds is not None:
+            deadline = min(deadline, first_seen + self.max_wait_seconds)
+        return deadline
+
+    def _schedule(self, key: Hashable, deadline: float) -> None:
+        """Push a deadline and wake the timer thread (caller holds the lock)."""
+        self._sequence += 1
+        heapq.heappush(self._deadlines, (deadline, self._sequence, key))
+        self._wake_timer()
+
+    def _wake_timer(self) -> None:
+        """Start or wake the timer thread (caller holds the lock)."""
+        if self._timer_thread is None or not self._timer_thread.is_alive():
+            self._timer_thread = threading.Thread(
+                target=self._timer_loop, name=f"{self.name}-timer", daemon=True
+            )
+            self._timer_thread.start()
+        else:
+            self._condition.notify()
+
+    def _pop_due(self, now: float) -> list[_PendingBurst]:
+        """Remove and return bursts whose deadline has passed."""
+        due = []
+        while self._deadlines and self._deadlines[0][0] <= now:
+            deadline, _, key = heapq.heappop(self._deadlines)
+            burst = self._pending.get(key)
+            # Debounced bursts leave stale heap entries behind; skip them
+            if burst is None or burst.deadline != deadline:
+                continue
+            del self._pending[key]
+            self._record_delivery(key, now)
+            due.append(burst)
+
+        return due
+
+    def _record_delivery(self, key: Hashable, now: float) -> None:
+        """Remember a delivery time for throttling (caller holds the lock)."""
+        if self.mode != CoalesceMode.THROTTLE:
+            return
+
+        self._last_delivery[key] = now
+        if len(self._last_delivery) < self._prune_at:
+            return
+
+        # Throttle bookkeeping only matters within one window; pruning when
+        # the map doubles keeps the cost amortized constant per delivery
+        horizon = now - self.window_seconds
+        self._last_delivery = {
+            key: last
+            for key, last in self._last_delivery.items()
+            if last > horizon or key in self._pending
+        }
+        self._prune_at = max(2 * len(self._last_delivery), MIN_DELIVERY_PRUNE_SIZE)
+
+    def _timer_loop(self) -> None:
+        """Deliver bursts as their deadlines pass (runs in background thread)."""
+        while True:
+            with self._condition:
+                while not self._closed and not self._handed_off:
+                    now = time.monotonic()
+                    if not self._deadlines:
+                        self._condition.wait()
+                    elif self._deadlines[0][0] > now:
+                        self._condition.wait(self._deadlines[0][0] - now)
+                    else:
+                        break
+
+                closing = self._closed
+                due = self._handed_off
+                self._handed_off = []
+                if not closing:
+                    due.extend(
+                        (burst.event, burst.count)
+                        for burst in self._pop_due(time.monotonic())
+                    )
+
+            for event_data, count in due:
+                self._deliver(event_data, count)
+            if closing:
+                return
+
+    def _deliver(self, event_data: EventData, count: int) -> None:
+        """Invoke the callback for a collapsed burst."""
+        if self.strategy == CoalesceStrategy.MERGE and count > 1:
+            event_data.set_data("coalesced_count", count)
+
+        try:
+            self._call(event_data)
+            self._stats.deliveries += 1
+        except Exception as e:
+            self._stats.delivery_errors += 1
+            logger.error(f"Coalesced delivery in {self.name} failed: {e}")
+
+    def _call(self, event_data: EventData) -> Any:
+        """Invoke the callback, running a coroutine callback to completion."""
+        if not self._is_async:
+            return self.callback(event_data)
+
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            future = asyncio.run_coroutine_threadsafe(self.callback(event_data), loop)
+            return future.result()
+        return asyncio.run(self.callback(event_data))
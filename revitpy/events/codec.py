@@ -0,0 +1,185 @@
+"""
+Compact binary encoding of events for journals and the event bus.
+
+An encoded event is a fixed header followed by the event ID and a JSON
+object holding the remaining fields. Decoding never executes code from the
+data, so events can be read from files or sockets other processes can write.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from dataclasses import fields
+from datetime import datetime
+from typing import Any
+
+from .types import (
+    DocumentEventData,
+    ElementEventData,
+    EventData,
+    EventType,
+    ParameterEventData,
+    SelectionEventData,
+    TransactionEventData,
+    ViewEventData,
+)
+
+# Layout: format version, event type code, event class code, flags,
+# timestamp, event ID length
+_HEADER = struct.Struct("<BBBBdH")
+_FORMAT_VERSION = 1
+
+_CANCELLABLE = 0x01
+_CANCELLED = 0x02
+
+# Codes are positions in these tuples; only ever append to them
+_EVENT_TYPES: tuple[EventType, ...] = (
+    EventType.DOCUMENT_OPENED,
+    EventType.DOCUMENT_CLOSED,
+    EventType.DOCUMENT_SAVED,
+    EventType.DOCUMENT_SYNCHRONIZED,
+    EventType.ELEMENT_CREATED,
+    EventType.ELEMENT_MODIFIED,
+    EventType.ELEMENT_DELETED,
+    EventType.ELEMENT_TYPE_CHANGED,
+    EventType.TRANSACTION_STARTED,
+    EventType.TRANSACTION_COMMITTED,
+    EventType.TRANSACTION_ROLLED_BACK,
+    EventType.PARAMETER_CHANGED,
+    EventType.PARAMETER_ADDED,
+    EventType.PARAMETER_REMOVED,
+    EventType.VIEW_ACTIVATED,
+    EventType.VIEW_DEACTIVATED,
+    EventType.VIEW_CREATED,
+    EventType.SELECTION_CHANGED,
+    EventType.APPLICATION_INITIALIZED,
+    EventType.APPLICATION_CLOSING,
+    EventType.CUSTOM,
+)
+_EVENT_CLASSES: tuple[type[EventData], ...] = (
+    EventData,
+    DocumentEventData,
+    ElementEventData,
+    TransactionEventData,
+    ParameterEventData,
+    ViewEventData,
+    SelectionEventData,
+)
+
+_TYPE_CODES = {event_type: code for code, event_type in enumerate(_EVENT_TYPES)}
+_CLASS_CODES = {cls: code for code, cls in enumerate(_EVENT_CLASSES)}
+# Fields carried in the header; source holds live objects and is dropped
+_HEADER_FIELDS = frozenset(
+    {"event_type", "event_id", "timestamp", "source", "cancellable", "cancelled"}
+)
+
+
+def encode_event(event_data: EventData) -> bytes:
+    """
+    Encode an event.
+
+    The event's ``source`` is not encoded.
+
+    Args:
+        event_data: Event to encode
+
+    Returns:
+        Encoded event
+
+    Raises:
+        TypeError: If the event class is unknown or a field value is not
+            JSON serializable
+    """
+    class_code = _CLASS_CODES.get(type(event_data))
+    type_code = _TYPE_CODES.get(event_data.event_type)
+    if class_code is None or type_code is None:
+        raise TypeError(
+            f"Cannot encode {type(event_data).__name__} of {event_data.event_type}"
+        )
+
+    values = {
+        field.name: getattr(event_data, field.name)
+        for field in fields(event_data)
+        if field.name not in _HEADER_FIELDS
+    }
+    try:
+        body = json.dumps(values, separators=(",", ":")).encode()
+    except (TypeError, ValueError) as e:
+        raise TypeError(f"Cannot encode event {event_data.event_id}: {e}") from e
+
+    event_id = event_data.event_id.encode()
+    flags = (_CANCELLABLE if event_data.cancellable else 0) | (
+        _CANCELLED if event_data.cancelled else 0
+    )
+    header = _HEADER.pack(
+        _FORMAT_VERSION,
+        type_code,
+        class_code,
+        flags,
+        event_data.timestamp.timestamp(),
+        len(event_id),
+    )
+    return header + event_id + body
+
+
+def peek_event(data: bytes | memoryview) -> tuple[EventType, float]:
+    """
+    Read the type and timestamp of an encoded event without decoding it.
+
+    Raises:
+        ValueError: If the data is not an encoded event
+    """
+    _, type_code, _, _, timestamp, _ = _unpack_header(data)
+    return _EVENT_TYPES[type_code], timestamp
+
+
+def decode_event(data: bytes | memoryview) -> EventData:
+    """
+    Decode an event encoded by encode_event.
+
+    Fields unknown to the event class are ignored.
+
+    Raises:
+        ValueError: If the data is not a valid encoded event
+    """
+    _, type_code, class_code, flags, timestamp, id_length = _unpack_header(data)
+    if class_code >= len(_EVENT_CLASSES):
+        raise ValueError(f"Unknown event class code {class_code}")
+
+    id_end = _HEADER.size + id_length
+    try:
+        event_id = bytes(data[_HEADER.size : id_end]).decode()
+        values = json.loads(bytes(data[id_end:]))
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"Malformed encoded event: {e}") from e
+    if not isinstance(values, dict):
+        raise ValueError("Malformed encoded event: fields are not an object")
+
+    cls = _EVENT_CLASSES[class_code]
+    known = {field.name for field in fields(cls)} - _HEADER_FIELDS
+    kwargs: dict[str, Any] = {
+        name: value for name, value in values.items() if name in known
+    }
+    return cls(
+        event_type=_EVENT_TYPES[type_code],
+        event_id=event_id,
+        timestamp=datetime.fromtimestamp(timestamp),
+        cancellable=bool(flags & _CANCELLABLE),
+        cancelled=bool(flags & _CANCELLED),
+        **kwargs,
+    )
+
+
+def _unpack_header(data: bytes | memoryview) -> tuple[int, int, int, int, float, int]:
+    """Unpack and validate the header of an encoded event."""
+    if len(data) < _HEADER.size:
+        raise ValueError("Encoded event is too short")
+
+    header = _HEADER.unpack_from(data)
+    version, type_code = header[0], header[1]
+    if version != _FORMAT_VERSION:
+        raise ValueError(f"Unsupported event encoding version {version}")
+    if type_code >= len(_EVENT_TYPES):
+        raise ValueError(f"Unknown event type code {type_code}")
+    return header
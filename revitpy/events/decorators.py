@@ -4,11 +4,22 @@ Decorators for event handling in RevitPy.
 
 import asyncio
 import functools
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 from typing import Any, TypeVar, cast
 
 from loguru import logger
 
+from .batching import (
+    DEFAULT_MAX_BATCH_LATENCY_SECONDS,
+    DEFAULT_MAX_BATCH_SIZE,
+    EventBatcher,
+)
+from .coalescing import (
+    DEFAULT_COALESCE_WINDOW_SECONDS,
+    CoalesceMode,
+    CoalesceStrategy,
+    EventCoalescer,
+)
 from .filters import EventFilter
 from .handlers import AsyncCallableEventHandler, CallableEventHandler
 from .types import EventData, EventPriority, EventResult, EventType
@@ -21,12 +32,20 @@ DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY_SECONDS = 1.0
 
 
+def _copy_handler_metadata(func: Callable, wrapper: Callable) -> None:
+    """Carry event handler metadata from a decorated function to its wrapper."""
+    for attr in ("_event_handler", "_event_types", "_is_event_handler"):
+        if hasattr(func, attr):
+            setattr(wrapper, attr, getattr(func, attr))
+
+
 def event_handler(
     event_types: list[EventType] | None = None,
     priority: EventPriority = EventPriority.NORMAL,
     event_filter: EventFilter | None = None,
     max_errors: int = DEFAULT_HANDLER_MAX_ERRORS,
     enabled: bool = True,
+    timeout: float | None = None,
 ) -> Callable[[F], F]:
     """
     Decorator to register a function as an event handler.
@@ -37,6 +56,7 @@ def event_handler(
         event_filter: Optional event filter
         max_errors: Maximum errors before disabling
         enabled: Whether handler starts enabled
+        timeout: Execution timeout in seconds (enforced by the dispatcher)
 
     Returns:
         Decorated function
@@ -57,6 +77,7 @@ def event_handler(
                 priority=priority,
                 event_filter=event_filter,
                 max_errors=max_errors,
+                timeout=timeout,
             )
         else:
             handler = CallableEventHandler(
@@ -65,6 +86,7 @@ def event_handler(
                 priority=priority,
                 event_filter=event_filter,
                 max_errors=max_errors,
+                timeout=timeout,
             )
 
         # Store handler metadata on function
@@ -88,6 +110,7 @@ def async_event_handler(
     event_filter: EventFilter | None = None,
     max_errors: int = DEFAULT_HANDLER_MAX_ERRORS,
     enabled: bool = True,
+    timeout: float | None = None,
 ) -> Callable[[F], F]:
     """
     Decorator to register an async function as an event handler.
@@ -98,6 +121,7 @@ def async_event_handler(
         event_filter: Optional event filter
         max_errors: Maximum errors before disabling
         enabled: Whether handler starts enabled
+        timeout: Execution timeout in seconds (enforced by the dispatcher)
 
     Returns:
         Decorated async function
@@ -121,6 +145,7 @@ def async_event_handler(
             priority=priority,
             event_filter=event_filter,
             max_errors=max_errors,
+            timeout=timeout,
         )
 
         # Store handler metadata on function
@@ -234,13 +259,136 @@ def throttled_handler(
         else:
             wrapper = throttled_wrapper
 
-        # Preserve event handler metadata
-        if hasattr(func, "_event_handler"):
-            wrapper._event_handler = func._event_handler
-        if hasattr(func, "_event_types"):
-            wrapper._event_types = func._event_types
-        if hasattr(func, "_is_event_handler"):
-            wrapper._is_event_handler = func._is_event_handler
+        _copy_handler_metadata(func, wrapper)
+
+        return cast(F, wrapper)
+
+    return decorator
+
+
+def coalesced_handler(
+    window_seconds: float = DEFAULT_COALESCE_WINDOW_SECONDS,
+    mode: CoalesceMode = CoalesceMode.DEBOUNCE,
+    strategy: CoalesceStrategy = CoalesceStrategy.LATEST,
+    key: Callable[[EventData], Hashable] | None = None,
+    max_wait_seconds: float | None = None,
+) -> Callable[[F], F]:
+    """
+    Decorator to coalesce bursts of events before running a handler.
+
+    Args:
+        window_seconds: Coalescing window
+        mode: When a burst is delivered (window, debounce or throttle)
+        strategy: Keep the latest event or merge the burst's payloads
+        key: Function mapping an event to its coalescing key
+            (defaults to event type and element ID)
+        max_wait_seconds: Upper bound on how long a debounced burst can wait
+
+    Returns:
+        Decorated function
+
+    Example:
+        @event_handler([EventType.ELEMENT_MODIFIED])
+        @coalesced_handler(0.2, key=lambda event: "all", max_wait_seconds=1.0)
+        def rebuild_cache(event_data: EventData) -> EventResult:
+            # Runs once per burst of modifications
+            return EventResult.CONTINUE
+    """
+
+    def decorator(func: F) -> F:
+        coalescer = EventCoalescer(
+            func,
+            window_seconds=window_seconds,
+            mode=mode,
+            strategy=strategy,
+            key=key,
+            max_wait_seconds=max_wait_seconds,
+            name=func.__name__,
+        )
+
+        @functools.wraps(func)
+        def coalesced_wrapper(event_data: EventData) -> Any:
+            coalescer.submit(event_data)
+            return EventResult.CONTINUE
+
+        @functools.wraps(func)
+        async def async_coalesced_wrapper(event_data: EventData) -> Any:
+            coalescer.submit(event_data)
+            return EventResult.CONTINUE
+
+        # Return appropriate wrapper based on function type
+        if asyncio.iscoroutinefunction(func):
+            wrapper = async_coalesced_wrapper
+        else:
+            wrapper = coalesced_wrapper
+
+        wrapper._coalescer = coalescer
+
+        _copy_handler_metadata(func, wrapper)
+
+        return cast(F, wrapper)
+
+    return decorator
+
+
+def batched_handler(
+    max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    max_latency_seconds: float = DEFAULT_MAX_BATCH_LATENCY_SECONDS,
+    retry_individually: bool = False,
+    on_error: Callable[[list[EventData], Exception], Any] | None = None,
+) -> Callable[[F], F]:
+    """
+    Decorator to deliver events to a handler in batches.
+
+    The decorated function receives a list of events. A batch is delivered
+    when it reaches ``max_batch_size`` or its oldest event has waited
+    ``max_latency_seconds``, whichever comes first.
+
+    Args:
+        max_batch_size: Maximum number of events per call
+        max_latency_seconds: Maximum time an event waits for its batch
+        retry_individually: Redeliver events one at a time if a batch fails
+        on_error: Called with the failed events and the exception
+
+    Returns:
+        Decorated function
+
+    Example:
+        @event_handler([EventType.ELEMENT_MODIFIED])
+        @batched_handler(max_batch_size=500, max_latency_seconds=1.0)
+        def upload_telemetry(events: list[EventData]) -> None:
+            client.send([event.data for event in events])
+    """
+
+    def decorator(func: F) -> F:
+        batcher = EventBatcher(
+            func,
+            max_batch_size=max_batch_size,
+            max_latency_seconds=max_latency_seconds,
+            retry_individually=retry_individually,
+            on_error=on_error,
+            name=func.__name__,
+        )
+
+        @functools.wraps(func)
+        def batched_wrapper(event_data: EventData) -> Any:
+            batcher.submit(event_data)
+            return EventResult.CONTINUE
+
+        @functools.wraps(func)
+        async def async_batched_wrapper(event_data: EventData) -> Any:
+            batcher.submit(event_data)
+            return EventResult.CONTINUE
+
+        # Return appropriate wrapper based on function type
+        if asyncio.iscoroutinefunction(func):
+            wrapper = async_batched_wrapper
+        else:
+            wrapper = batched_wrapper
+
+        wrapper._batcher = batcher
+
+        _copy_handler_metadata(func, wrapper)
 
         return cast(F, wrapper)
 
@@ -293,13 +441,7 @@ def conditional_handler(condition: Callable[[EventData], bool]) -> Callable[[F],
         else:
             wrapper = conditional_wrapper
 
-        # Preserve event handler metadata
-        if hasattr(func, "_event_handler"):
-            wrapper._event_handler = func._event_handler
-        if hasattr(func, "_event_types"):
-            wrapper._event_types = func._event_types
-        if hasattr(func, "_is_event_handler"):
-            wrapper._is_event_handler = func._is_event_handler
+        _copy_handler_metadata(func, wrapper)
 
         return cast(F, wrapper)
 
@@ -384,13 +526,7 @@ def retry_on_error(
         else:
             wrapper = retry_wrapper
 
-        # Preserve event handler metadata
-        if hasattr(func, "_event_handler"):
-            wrapper._event_handler = func._event_handler
-        if hasattr(func, "_event_types"):
-            wrapper._event_types = func._event_types
-        if hasattr(func, "_is_event_handler"):
-            wrapper._is_event_handler = func._is_event_handler
+        _copy_handler_metadata(func, wrapper)
 
         return cast(F, wrapper)
 
@@ -466,13 +602,7 @@ def log_events(log_level: str = "DEBUG") -> Callable[[F], F]:
         else:
             wrapper = logging_wrapper
 
-        # Preserve event handler metadata
-        if hasattr(func, "_event_handler"):
-            wrapper._event_handler = func._event_handler
-        if hasattr(func, "_event_types"):
-            wrapper._event_types = func._event_types
-        if hasattr(func, "_is_event_handler"):
-            wrapper._is_event_handler = func._is_event_handler
+        _copy_handler_metadata(func, wrapper)
 
         return cast(F, wrapper)
 
@@ -0,0 +1,279 @@
+"""
+Static discovery of decorated event handlers with a persistent manifest.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from .types import EventType
+
+HANDLER_MANIFEST_NAME = ".revitpy_handlers.json"
+MANIFEST_VERSION = 1
+
+# Decorators that take the handled event types as their first argument
+_TYPED_DECORATORS = {"event_handler", "async_event_handler"}
+
+# Convenience decorators that imply their event type
+_IMPLIED_EVENT_TYPES = {
+    "on_element_created": EventType.ELEMENT_CREATED.name,
+    "on_element_modified": EventType.ELEMENT_MODIFIED.name,
+    "on_element_deleted": EventType.ELEMENT_DELETED.name,
+    "on_parameter_changed": EventType.PARAMETER_CHANGED.name,
+    "on_document_opened": EventType.DOCUMENT_OPENED.name,
+    "on_document_saved": EventType.DOCUMENT_SAVED.name,
+}
+
+
+@dataclass
+class DiscoveredHandler:
+    """A decorated handler function found in a source file."""
+
+    name: str
+    # EventType member names, or None if they cannot be determined statically
+    event_types: list[str] | None
+
+    def resolve_event_types(self) -> list[EventType] | None:
+        """Get the handled event types, or None if any are unknown."""
+        if self.event_types is None:
+            return None
+        try:
+            return [EventType[name] for name in self.event_types]
+        except KeyError:
+            return None
+
+
+@dataclass
+class ManifestEntry:
+    """Cached scan result for one source file."""
+
+    module_name: str
+    mtime_ns: int
+    size: int
+    sha256: str
+    handlers: list[DiscoveredHandler] = field(default_factory=list)
+
+    @property
+    def is_lazy_loadable(self) -> bool:
+        """Check if every handler's event types are statically known."""
+        return all(h.resolve_event_types() is not None for h in self.handlers)
+
+    def event_types(self) -> set[EventType]:
+        """Get the union of event types handled in this file."""
+        types: set[EventType] = set()
+        for handler in self.handlers:
+            types.update(handler.resolve_event_types() or ())
+        return types
+
+
+def _decorator_name(node: ast.expr) -> str | None:
+    """Get the bare name of a decorator expression."""
+    if isinstance(node, ast.Call):
+        node = node.func
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _event_type_names(node: ast.expr | None) -> list[str] | None:
+    """Extract EventType member names from a literal list or tuple."""
+    if node is None or (isinstance(node, ast.Constant) and node.value is None):
+        return []
+    if not isinstance(node, ast.List | ast.Tuple):
+        return None
+
+    names = []
+    for element in node.elts:
+        if (
+            isinstance(element, ast.Attribute)
+            and _decorator_name(element.value) == "EventType"
+        ):
+            names.append(element.attr)
+        else:
+            return None
+    return names
+
+
+def _handler_from_decorator(name: str, decorator: ast.expr) -> DiscoveredHandler | None:
+    """Build a discovered handler from a recognised decorator."""
+    decorator_name = _decorator_name(decorator)
+
+    if decorator_name in _IMPLIED_EVENT_TYPES:
+        return DiscoveredHandler(name, [_IMPLIED_EVENT_TYPES[decorator_name]])
+
+    if decorator_name in _TYPED_DECORATORS:
+        argument = None
+        if isinstance(decorator, ast.Call):
+            if decorator.args:
+                argument = decorator.args[0]
+            for keyword in decorator.keywords:
+                if keyword.arg == "event_types":
+                    argument = keyword.value
+        return DiscoveredHandler(name, _event_type_names(argument))
+
+    return None
+
+
+def scan_source(
+    source: str | bytes, filename: str = "<source>"
+) -> list[DiscoveredHandler]:
+    """
+    Find decorated module-level handler functions without importing.
+
+    Args:
+        source: Python source code
+        filename: File name used in syntax errors
+
+    Returns:
+        Handlers found in the source
+    """
+    tree = ast.parse(source, filename=filename)
+    handlers = []
+
+    for node in tree.body:
+        if not isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+            continue
+        for decorator in node.decorator_list:
+            handler = _handler_from_decorator(node.name, decorator)
+            if handler is not None:
+                handlers.append(handler)
+                break
+
+    return handlers
+
+
+class HandlerManifest:
+    """
+    Persistent cache of handler scans keyed by file path, mtime and hash.
+
+    A file whose mtime and size are unchanged is not read at all; a file
+    that was touched but has the same content hash is not re-parsed.
+    """
+
+    def __init__(self, path: Path, entries: dict[str, ManifestEntry] | None = None):
+        self.path = path
+        self.entries: dict[str, ManifestEntry] = entries or {}
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: Path) -> HandlerManifest:
+        """
+        Load a manifest, returning an empty one if it is missing or invalid.
+
+        Args:
+            path: Manifest file path
+        """
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return cls(path)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable handler manifest {path}: {e}")
+            return cls(path)
+
+        if raw.get("version") != MANIFEST_VERSION:
+            return cls(path)
+
+        entries = {}
+        for relative_path, data in raw.get("files", {}).items():
+            try:
+                handlers = [DiscoveredHandler(**h) for h in data.pop("handlers", [])]
+                entries[relative_path] = ManifestEntry(**data, handlers=handlers)
+            except TypeError:
+                continue
+
+        return cls(path, entries)
+
+    @property
+    def is_dirty(self) -> bool:
+        """Check if the manifest changed since it was loaded."""
+        return self._dirty
+
+    def scan(
+        self, relative_path: str, file_path: Path, module_name: str
+    ) -> ManifestEntry:
+        """
+        Get the scan result for a file, using the cache where possible.
+
+        Args:
+            relative_path: Path relative to the discovery root (manifest key)
+            file_path: Absolute file path
+            module_name: Module name to import the file as
+
+        Returns:
+            Manifest entry for the file
+        """
+        stat = file_path.stat()
+        entry = self.entries.get(relative_path)
+
+        if (
+            entry is not None
+            and entry.mtime_ns == stat.st_mtime_ns
+            and entry.size == stat.st_size
+        ):
+            return entry
+
+        source = file_path.read_bytes()
+        digest = hashlib.sha256(source).hexdigest()
+
+        if entry is not None and entry.sha256 == digest:
+            entry.mtime_ns = stat.st_mtime_ns
+            entry.size = stat.st_size
+        else:
+            try:
+                handlers = scan_source(source, str(file_path))
+            except (SyntaxError, ValueError) as e:
+                logger.warning(f"Failed to scan {file_path} for handlers: {e}")
+                handlers = []
+
+            entry = ManifestEntry(
+                module_name=module_name,
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                sha256=digest,
+                handlers=handlers,
+            )
+
+        self.entries[relative_path] = entry
+        self._dirty = True
+        return entry
+
+    def retain(self, relative_paths: set[str]) -> None:
+        """Drop entries for files that no longer exist."""
+        stale = set(self.entries) - relative_paths
+        for relative_path in stale:
+            del self.entries[relative_path]
+        if stale:
+            self._dirty = True
+
+    def save(self) -> bool:
+        """
+        Write the manifest if it changed.
+
+        Returns:
+            True if the manifest is up to date on disk
+        """
+        if not self._dirty:
+            return True
+
+        data: dict[str, Any] = {
+            "version": MANIFEST_VERSION,
+            "files": {key: asdict(entry) for key, entry in self.entries.items()},
+        }
+        try:
+            self.path.write_text(json.dumps(data, indent=1), encoding="utf-8")
+        except OSError as e:
+            logger.debug(f"Could not write handler manifest {self.path}: {e}")
+            return False
+
+        self._dirty = False
+        return True
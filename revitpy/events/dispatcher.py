@@ -5,17 +5,36 @@ Event dispatcher for managing event propagation and handler execution.
 import asyncio
 import threading
 import time
-from collections import defaultdict, deque
-from collections.abc import Callable
+from collections import defaultdict
+from collections.abc import Callable, Hashable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
-from ..async_support.task_queue import TaskQueue
+from .backpressure import BackpressurePolicy, DiskSpillBuffer
+from .filters import EventFilter, RoutingDimension, routing_values
 from .handlers import AsyncEventHandler, BaseEventHandler
+from .health import (
+    DEFAULT_RECOVERY_TIMEOUT_SECONDS,
+    CircuitBreaker,
+    HandlerTimeoutError,
+    LatencyHistogram,
+)
+from .journal import EventJournal
+from .lanes import (
+    DEFAULT_LANE_ASSIGNMENTS,
+    DEFAULT_LANE_WEIGHTS,
+    EventLane,
+    LaneQueue,
+)
 from .types import EventData, EventResult, EventType
 
+if TYPE_CHECKING:
+    from ..async_support.task_queue import TaskQueue
+
 
 @dataclass
 class EventDispatchResult:
@@ -43,6 +62,27 @@ class EventStats:
     total_execution_time: float = 0.0
     average_execution_time: float = 0.0
     peak_queue_size: int = 0
+    worker_queue_depths: list[int] = field(default_factory=list)
+    worker_peak_queue_depths: list[int] = field(default_factory=list)
+    events_by_worker: list[int] = field(default_factory=list)
+    dropped_events: int = 0
+    spilled_events: int = 0
+    spill_queue_depth: int = 0
+    blocked_enqueues: int = 0
+    high_water_warnings: int = 0
+    handler_timeouts: int = 0
+    handlers_short_circuited: int = 0
+    # Time from entering a worker queue to processing; events spilled to
+    # disk are timed from when they are read back into memory
+    queue_wait: LatencyHistogram = field(default_factory=LatencyHistogram)
+    lane_queue_wait: dict[EventLane, LatencyHistogram] = field(
+        default_factory=lambda: defaultdict(LatencyHistogram)
+    )
+    events_by_lane: dict[EventLane, int] = field(
+        default_factory=lambda: defaultdict(int)
+    )
+    lane_queue_depths: dict[EventLane, int] = field(default_factory=dict)
+    lane_preemptions: int = 0
 
     def update_from_result(self, result: EventDispatchResult) -> None:
         """Update statistics from dispatch result."""
@@ -55,9 +95,104 @@ class EventStats:
             self.average_execution_time = self.total_execution_time / self.total_events
 
 
+def default_partition_key(event_data: EventData) -> Hashable:
+    """Partition queued events by element ID, falling back to the event type."""
+    element_id = getattr(event_data, "element_id", None)
+    return event_data.event_type if element_id is None else element_id
+
+
+class _RoutingTable:
+    """
+    Priority-ordered handlers with an index over their decomposable filters.
+
+    Each handler whose filter constrains a routing dimension is indexed under
+    the most selective one, so an event is only offered to handlers that could
+    match it. The full filter is still evaluated by the handler afterwards.
+    """
+
+    __slots__ = ("handlers", "_index", "_unindexed", "_unindexed_handlers")
+
+    def __init__(
+        self,
+        handlers: tuple[BaseEventHandler, ...],
+        event_type: EventType | None = None,
+    ) -> None:
+        self.handlers = handlers
+        unindexed: list[int] = []
+        index: dict[RoutingDimension, dict[Any, list[int]]] = {}
+
+        for position, handler in enumerate(handlers):
+            event_filter = handler.event_filter
+            constraints = event_filter.routing_constraints() if event_filter else {}
+
+            if event_type is not None:
+                allowed_types = constraints.pop(RoutingDimension.EVENT_TYPE, None)
+                if allowed_types is not None and event_type not in allowed_types:
+                    continue  # Can never match events of this table's type
+
+            if not constraints:
+                unindexed.append(position)
+                continue
+
+            dimension, values = min(constraints.items(), key=lambda item: len(item[1]))
+            buckets = index.setdefault(dimension, {})
+            for value in values:
+                buckets.setdefault(value, []).append(position)
+
+        self._index = {
+            dimension: {value: tuple(p) for value, p in buckets.items()}
+            for dimension, buckets in index.items()
+        }
+        self._unindexed = tuple(unindexed)
+        self._unindexed_handlers = tuple(handlers[p] for p in unindexed)
+
+    def route(self, event_data: EventData) -> tuple[BaseEventHandler, ...]:
+        """Get candidate handlers for an event in priority order."""
+        if not self._index:
+            return self._unindexed_handlers
+
+        positions: list[int] = []
+        for dimension, buckets in self._index.items():
+            for value in routing_values(event_data, dimension):
+                try:
+                    positions.extend(buckets.get(value, ()))
+                except TypeError:
+                    continue  # Unhashable values cannot match an indexed set
+
+        if not positions:
+            return self._unindexed_handlers
+
+        positions.extend(self._unindexed)
+        handlers = self.handlers
+        return tuple(handlers[p] for p in sorted(set(positions)))
+
+
 class EventDispatcher:
     """
     Manages event dispatching, handler execution, and event queuing.
+
+    Queued events are processed by ``num_workers`` worker threads. Events are
+    assigned to a worker by ``partition_key`` (element ID by default), so
+    events sharing a key are handled in order while different keys proceed
+    in parallel.
+
+    Each worker queue is split into priority lanes (see ``EventLane``). Lanes
+    are drained by weighted round-robin using ``lane_weights``, so a lane
+    with waiting events always gets its share of throughput, and a worker
+    interrupts a batch as soon as an event arrives in the top lane. Events
+    are assigned to lanes by event type (``lane_assignments``, merged over
+    the defaults) or by filter via ``assign_lane``. Ordering by partition
+    key holds within a lane.
+
+    When the queue holds ``max_queue_size`` events, ``backpressure`` decides
+    whether the producer blocks, the newest or oldest event is dropped, only
+    a sample is kept, or overflow is spilled to disk.
+
+    Handlers without their own timeout get ``handler_timeout``. Setting
+    ``failure_threshold`` gives every handler without one a circuit breaker,
+    so a handler that keeps failing, timing out or (with
+    ``slow_call_threshold``) running slowly is skipped until
+    ``recovery_timeout`` has passed and a probe call succeeds.
     """
 
     def __init__(
@@ -65,30 +200,111 @@ class EventDispatcher:
         max_queue_size: int = 10000,
         batch_size: int = 100,
         max_concurrent_async_handlers: int = 10,
+        num_workers: int = 1,
+        partition_key: Callable[[EventData], Hashable] | None = None,
+        backpressure: BackpressurePolicy = BackpressurePolicy.DROP_OLDEST,
+        block_timeout: float = 1.0,
+        sample_every: int = 10,
+        high_water_ratio: float = 0.8,
+        spill_path: str | Path | None = None,
+        journal: EventJournal | None = None,
+        handler_timeout: float | None = None,
+        failure_threshold: int | None = None,
+        recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT_SECONDS,
+        slow_call_threshold: float | None = None,
+        lane_weights: dict[EventLane, int] | None = None,
+        lane_assignments: dict[EventType, EventLane] | None = None,
     ) -> None:
+        if num_workers < 1:
+            raise ValueError("num_workers must be at least 1")
+        if sample_every < 1:
+            raise ValueError("sample_every must be at least 1")
+        if not 0 < high_water_ratio <= 1:
+            raise ValueError("high_water_ratio must be in (0, 1]")
+        if handler_timeout is not None and handler_timeout <= 0:
+            raise ValueError("handler_timeout must be positive")
+        if failure_threshold is not None and failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+
         self.max_queue_size = max_queue_size
         self.batch_size = batch_size
+        self.num_workers = num_workers
+        self.partition_key = partition_key or default_partition_key
+
+        # Backpressure
+        self.backpressure = backpressure
+        self.block_timeout = block_timeout
+        self.sample_every = sample_every
+        self.spill_path = spill_path
+        self._high_water = max(1, int(max_queue_size * high_water_ratio))
+        self._low_water = self._high_water // 2
+        self._above_high_water = False
+        self._sample_counter = 0
+        self._spill: DiskSpillBuffer | None = None
+
+        # Optional append-only record of dispatched events
+        self.journal = journal
+
+        # Called with each event type before it is routed, so handlers can be
+        # registered on first use (see EventManager's lazy discovery)
+        self.handler_loader: Callable[[EventType], None] | None = None
+
+        # Handler health defaults, applied at registration
+        self.handler_timeout = handler_timeout
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.slow_call_threshold = slow_call_threshold
+        # Runs sync handlers that have a timeout, so the caller can give up
+        self._timeout_executor: ThreadPoolExecutor | None = None
+
+        # Priority lanes
+        self.lane_weights = dict(lane_weights or DEFAULT_LANE_WEIGHTS)
+        self._lane_by_type = {**DEFAULT_LANE_ASSIGNMENTS, **(lane_assignments or {})}
+        self._lane_rules: list[tuple[Callable[[EventData], bool], EventLane]] = []
+        self._default_lane = (
+            EventLane.NORMAL
+            if EventLane.NORMAL in self.lane_weights
+            else min(self.lane_weights, key=self.lane_weights.__getitem__)
+        )
 
         # Handler storage
         self._handlers: dict[EventType, list[BaseEventHandler]] = defaultdict(list)
         self._global_handlers: list[BaseEventHandler] = []
+        self._registry_lock = threading.Lock()
+
+        # Precomputed, priority-ordered handlers per event type. Both are
+        # replaced wholesale on (un)registration, so readers never lock.
+        self._dispatch_tables: dict[EventType, _RoutingTable] = {}
+        self._global_dispatch_table = _RoutingTable(())
 
-        # Event queue
-        self._event_queue: deque = deque()
+        # Event queues, one per worker. They share one lock, and each worker
+        # waits on its own condition so an enqueue only wakes its owner.
         self._queue_lock = threading.RLock()
+        self._worker_queues = [LaneQueue(self.lane_weights) for _ in range(num_workers)]
+        self._worker_conditions = [
+            threading.Condition(self._queue_lock) for _ in range(num_workers)
+        ]
+        # Signalled when workers take events, for producers blocked on a full queue
+        self._queue_not_full = threading.Condition(self._queue_lock)
 
         # Async processing
         self._task_queue: TaskQueue | None = None
+        self._max_concurrent_async_handlers = max_concurrent_async_handlers
         self._async_handlers_semaphore = asyncio.Semaphore(
             max_concurrent_async_handlers
         )
+        # Event loop used by workers for coroutine handlers
+        self._worker_loop: asyncio.AbstractEventLoop | None = None
+        self._worker_loop_thread: threading.Thread | None = None
+        self._worker_loop_semaphore: asyncio.Semaphore | None = None
 
         # Statistics
-        self._stats = EventStats()
+        self._stats_lock = threading.Lock()
+        self._stats = self._new_stats()
 
         # Processing state
         self._is_processing = False
-        self._processing_thread: threading.Thread | None = None
+        self._worker_threads: list[threading.Thread | None] = [None] * num_workers
         self._shutdown_event = threading.Event()
 
         # Event filtering
@@ -106,7 +322,75 @@ class EventDispatcher:
     def queue_size(self) -> int:
         """Get current queue size."""
         with self._queue_lock:
-            return len(self._event_queue)
+            return sum(len(queue) for queue in self._worker_queues)
+
+    def _new_stats(self) -> EventStats:
+        """Create statistics sized for the worker pool."""
+        return EventStats(
+            worker_queue_depths=[0] * self.num_workers,
+            worker_peak_queue_depths=[0] * self.num_workers,
+            events_by_worker=[0] * self.num_workers,
+            lane_queue_depths=dict.fromkeys(self.lane_weights, 0),
+            lane_queue_wait=defaultdict(
+                LatencyHistogram,
+                {lane: LatencyHistogram() for lane in self.lane_weights},
+            ),
+        )
+
+    def _record_result(
+        self, event_data: EventData, result: EventDispatchResult
+    ) -> None:
+        """Fold a dispatch result into the statistics."""
+        with self._stats_lock:
+            self._stats.update_from_result(result)
+            self._stats.events_by_type[event_data.event_type] += 1
+
+    def _partition_for(self, event_data: EventData) -> int:
+        """Get the worker index that owns an event's partition key."""
+        if self.num_workers == 1:
+            return 0
+
+        key = self.partition_key(event_data)
+        try:
+            return hash(key) % self.num_workers
+        except TypeError:
+            return hash(repr(key)) % self.num_workers
+
+    def assign_lane(
+        self,
+        lane: EventLane,
+        event_types: list[EventType] | None = None,
+        event_filter: EventFilter | None = None,
+    ) -> None:
+        """
+        Route queued events to a priority lane.
+
+        Filter rules are checked in the order they were added, before the
+        per-type assignments.
+
+        Args:
+            lane: Lane to assign
+            event_types: Event types to assign to the lane
+            event_filter: Filter selecting events for the lane
+        """
+        if lane not in self.lane_weights:
+            raise ValueError(f"Lane {lane.value} has no weight configured")
+        if event_types is None and event_filter is None:
+            raise ValueError("Provide event_types or event_filter")
+
+        for event_type in event_types or ():
+            self._lane_by_type[event_type] = lane
+        if event_filter is not None:
+            self._lane_rules.append((event_filter.compile(), lane))
+
+    def _lane_for(self, event_data: EventData) -> EventLane:
+        """Get the priority lane for a queued event."""
+        for matcher, lane in self._lane_rules:
+            if matcher(event_data):
+                return lane
+
+        lane = self._lane_by_type.get(event_data.event_type, self._default_lane)
+        return lane if lane in self.lane_weights else self._default_lane
 
     @property
     def is_processing(self) -> bool:
@@ -147,22 +431,40 @@ class EventDispatcher:
             handler: Event handler to register
             event_types: List of event types to handle (None for all events)
         """
-        if event_types is None:
-            # Global handler for all events
-            self._global_handlers.append(handler)
-            self._global_handlers.sort(key=lambda h: h.priority.value, reverse=True)
-            logger.debug(f"Registered global handler: {handler.name}")
-        else:
-            # Type-specific handlers
-            for event_type in event_types:
-                self._handlers[event_type].append(handler)
-                self._handlers[event_type].sort(
-                    key=lambda h: h.priority.value, reverse=True
-                )
+        self._apply_handler_defaults(handler)
+
+        with self._registry_lock:
+            if event_types is None:
+                # Global handler for all events
+                self._global_handlers.append(handler)
+                self._global_handlers.sort(key=lambda h: h.priority.value, reverse=True)
+                logger.debug(f"Registered global handler: {handler.name}")
+            else:
+                # Type-specific handlers
+                for event_type in event_types:
+                    self._handlers[event_type].append(handler)
+                    self._handlers[event_type].sort(
+                        key=lambda h: h.priority.value, reverse=True
+                    )
 
-                logger.debug(
-                    f"Registered handler {handler.name} for event type {event_type.value}"
-                )
+                    logger.debug(
+                        f"Registered handler {handler.name} for event type {event_type.value}"
+                    )
+
+            self._rebuild_dispatch_tables()
+
+    def _apply_handler_defaults(self, handler: BaseEventHandler) -> None:
+        """Give a handler the dispatcher's timeout and circuit breaker."""
+        if handler.timeout is None:
+            handler.timeout = self.handler_timeout
+
+        if self.failure_threshold is not None and handler.circuit_breaker is None:
+            handler.circuit_breaker = CircuitBreaker(
+                failure_threshold=self.failure_threshold,
+                recovery_timeout=self.recovery_timeout,
+                slow_call_threshold=self.slow_call_threshold,
+                name=handler.name,
+            )
 
     def unregister_handler(
         self, handler: BaseEventHandler, event_types: list[EventType] | None = None
@@ -174,24 +476,66 @@ class EventDispatcher:
             handler: Event handler to unregister
             event_types: List of event types to unregister from (None for all)
         """
-        if event_types is None:
-            # Remove from global handlers
-            if handler in self._global_handlers:
-                self._global_handlers.remove(handler)
-                logger.debug(f"Unregistered global handler: {handler.name}")
-
-            # Remove from all type-specific handlers
-            for event_type_handlers in self._handlers.values():
-                if handler in event_type_handlers:
-                    event_type_handlers.remove(handler)
-        else:
-            # Remove from specific event types
-            for event_type in event_types:
-                if handler in self._handlers[event_type]:
-                    self._handlers[event_type].remove(handler)
-                    logger.debug(
-                        f"Unregistered handler {handler.name} from event type {event_type.value}"
-                    )
+        with self._registry_lock:
+            if event_types is None:
+                # Remove from global handlers
+                if handler in self._global_handlers:
+                    self._global_handlers.remove(handler)
+                    logger.debug(f"Unregistered global handler: {handler.name}")
+
+                # Remove from all type-specific handlers
+                for event_type_handlers in self._handlers.values():
+                    if handler in event_type_handlers:
+                        event_type_handlers.remove(handler)
+            else:
+                # Remove from specific event types
+                for event_type in event_types:
+                    if handler in self._handlers.get(event_type, []):
+                        self._handlers[event_type].remove(handler)
+                        logger.debug(
+                            f"Unregistered handler {handler.name} from event type {event_type.value}"
+                        )
+
+            self._rebuild_dispatch_tables()
+
+    def rebuild_dispatch_tables(self) -> None:
+        """
+        Rebuild the precomputed dispatch tables.
+
+        Registration keeps the tables current; call this only after changing
+        the priority or event filter of an already registered handler.
+        """
+        with self._registry_lock:
+            self._rebuild_dispatch_tables()
+
+    def _rebuild_dispatch_tables(self) -> None:
+        """Recompute dispatch tables (caller must hold the registry lock)."""
+
+        def priority_key(handler: BaseEventHandler) -> int:
+            return handler.priority.value
+
+        global_handlers = tuple(
+            sorted(self._global_handlers, key=priority_key, reverse=True)
+        )
+
+        tables: dict[EventType, _RoutingTable] = {}
+        for event_type, handlers in self._handlers.items():
+            if handlers:
+                # Stable sort keeps type-specific handlers ahead of global
+                # handlers of the same priority.
+                ordered = sorted(
+                    [*handlers, *global_handlers], key=priority_key, reverse=True
+                )
+                tables[event_type] = _RoutingTable(tuple(ordered), event_type)
+
+        # Publish new tables by reference swap; in-flight dispatches keep
+        # iterating the snapshot they already hold.
+        self._dispatch_tables = tables
+        self._global_dispatch_table = _RoutingTable(global_handlers)
+
+    def _dispatch_table_for(self, event_type: EventType) -> _RoutingTable:
+        """Get the precomputed routing table for an event type without locking."""
+        return self._dispatch_tables.get(event_type, self._global_dispatch_table)
 
     def get_handlers_for_event(self, event_type: EventType) -> list[BaseEventHandler]:
         """
@@ -203,21 +547,10 @@ class EventDispatcher:
         Returns:
             List of handlers sorted by priority
         """
-        handlers = []
-
-        # Add type-specific handlers
-        handlers.extend(self._handlers.get(event_type, []))
-
-        # Add global handlers
-        handlers.extend(self._global_handlers)
-
-        # Sort by priority (highest first)
-        handlers.sort(key=lambda h: h.priority.value, reverse=True)
-
-        return handlers
+        return list(self._dispatch_table_for(event_type).handlers)
 
     def dispatch_event(
-        self, event_data: EventData, immediate: bool = False
+        self, event_data: EventData, immediate: bool = False, record: bool = True
     ) -> EventDispatchResult:
         """
         Dispatch an event to registered handlers.
@@ -225,6 +558,7 @@ class EventDispatcher:
         Args:
             event_data: Event data to dispatch
             immediate: Whether to process immediately or queue
+            record: Whether to write the event to the journal (if any)
 
         Returns:
             Dispatch result
@@ -234,6 +568,9 @@ class EventDispatcher:
                 f"Dispatching event: {event_data.event_type.value} (ID: {event_data.event_id})"
             )
 
+        if self.handler_loader is not None:
+            self.handler_loader(event_data.event_type)
+
         # Apply global filters
         for filter_func in self._event_filters:
             if not filter_func(event_data):
@@ -243,6 +580,9 @@ class EventDispatcher:
                     event_id=event_data.event_id, final_result=EventResult.CONTINUE
                 )
 
+        if record and self.journal is not None:
+            self.journal.record(event_data)
+
         if immediate:
             return self._process_event_immediate(event_data)
         else:
@@ -250,44 +590,181 @@ class EventDispatcher:
 
     def _queue_event(self, event_data: EventData) -> EventDispatchResult:
         """Queue an event for processing."""
+        worker = self._partition_for(event_data)
+        result = EventDispatchResult(
+            event_id=event_data.event_id, final_result=EventResult.CONTINUE
+        )
+
         with self._queue_lock:
-            if len(self._event_queue) >= self.max_queue_size:
-                # Queue is full, drop oldest event
-                dropped_event = self._event_queue.popleft()
-                logger.warning(
-                    f"Event queue full, dropped event: {dropped_event.event_id}"
-                )
+            if self._spill is not None and len(self._spill):
+                # Nothing may overtake events already spilled to disk
+                self._drain_spill()
+                if len(self._spill):
+                    self._spill_event(event_data)
+                    return result
+
+            if not self._admit(event_data, worker):
+                return result
+
+            self._worker_queues[worker].append(
+                self._lane_for(event_data), (time.perf_counter(), event_data)
+            )
+            self._update_queue_depths(worker)
 
-            self._event_queue.append(event_data)
+            # Start processing if not already running, otherwise wake the worker
+            if not self._is_processing:
+                self._start_processing()
+            else:
+                self._worker_conditions[worker].notify()
 
-            # Update peak queue size
-            if len(self._event_queue) > self._stats.peak_queue_size:
-                self._stats.peak_queue_size = len(self._event_queue)
+        return result
 
-        # Start processing if not already running
-        if not self._is_processing:
-            self._start_processing()
+    def _admit(self, event_data: EventData, worker: int) -> bool:
+        """
+        Apply the backpressure policy (caller must hold the queue lock).
 
-        return EventDispatchResult(
-            event_id=event_data.event_id, final_result=EventResult.CONTINUE
-        )
+        Returns:
+            True if the event may be appended to its worker queue
+        """
+        policy = self.backpressure
+
+        if policy == BackpressurePolicy.SAMPLE and self.queue_size >= self._high_water:
+            self._sample_counter += 1
+            if self._sample_counter % self.sample_every:
+                self._record_drop(event_data)
+                return False
+
+        if self.queue_size < self.max_queue_size:
+            return True
+
+        if policy == BackpressurePolicy.BLOCK:
+            self._stats.blocked_enqueues += 1
+            if not self._is_processing:
+                self._start_processing()
+
+            deadline = time.monotonic() + self.block_timeout
+            while self.queue_size >= self.max_queue_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._queue_not_full.wait(remaining)
+
+            if self.queue_size < self.max_queue_size:
+                return True
+
+            self._record_drop(event_data)
+            return False
+
+        if policy == BackpressurePolicy.DROP_NEWEST:
+            self._record_drop(event_data)
+            return False
+
+        if policy == BackpressurePolicy.SPILL:
+            self._spill_event(event_data)
+            return False
+
+        # DROP_OLDEST (and admitted samples) evict the oldest event in the
+        # lowest lane of this worker, or of the deepest worker if this one is empty
+        victim = self._worker_queues[worker] or max(self._worker_queues, key=len)
+        self._record_drop(victim.pop_lowest()[1])
+        self._update_queue_depths()
+        return True
+
+    def _record_drop(self, event_data: EventData) -> None:
+        """Count a dropped event and warn periodically."""
+        self._stats.dropped_events += 1
+        dropped = self._stats.dropped_events
+
+        if dropped == 1 or dropped % 1000 == 0:
+            logger.warning(
+                f"Event queue under pressure ({self.backpressure.value}), dropped event "
+                f"{event_data.event_id}; {dropped} dropped so far"
+            )
 
-    def _process_event_immediate(self, event_data: EventData) -> EventDispatchResult:
+    def _spill_event(self, event_data: EventData) -> None:
+        """Write an event to the disk overflow buffer."""
+        if self._spill is None:
+            self._spill = DiskSpillBuffer(self.spill_path)
+            logger.warning(f"Event queue full, spilling events to {self._spill.path}")
+
+        if self._spill.append(event_data):
+            self._stats.spilled_events += 1
+            self._stats.spill_queue_depth = len(self._spill)
+        else:
+            self._record_drop(event_data)
+
+    def _drain_spill(self) -> None:
+        """Move spilled events back into memory once below the low-water mark."""
+        spill = self._spill
+        if spill is None or not len(spill) or self.queue_size > self._low_water:
+            return
+
+        now = time.perf_counter()
+        for event_data in spill.pop_many(self._high_water - self.queue_size):
+            worker = self._partition_for(event_data)
+            self._worker_queues[worker].append(
+                self._lane_for(event_data), (now, event_data)
+            )
+            self._worker_conditions[worker].notify()
+
+        self._stats.spill_queue_depth = len(spill)
+        self._update_queue_depths()
+
+    def _update_queue_depths(self, worker: int | None = None) -> None:
+        """Refresh queue depth statistics (caller must hold the queue lock)."""
+        stats = self._stats
+        workers = range(self.num_workers) if worker is None else (worker,)
+        for index in workers:
+            depth = len(self._worker_queues[index])
+            stats.worker_queue_depths[index] = depth
+            if depth > stats.worker_peak_queue_depths[index]:
+                stats.worker_peak_queue_depths[index] = depth
+
+        lane_depths = dict.fromkeys(self.lane_weights, 0)
+        for queue in self._worker_queues:
+            for lane, depth in queue.depths().items():
+                lane_depths[lane] += depth
+        stats.lane_queue_depths = lane_depths
+
+        total = sum(stats.worker_queue_depths)
+        if total > stats.peak_queue_size:
+            stats.peak_queue_size = total
+
+        if total >= self._high_water:
+            if not self._above_high_water:
+                self._above_high_water = True
+                stats.high_water_warnings += 1
+                logger.warning(
+                    f"Event queue above high-water mark: "
+                    f"{total}/{self.max_queue_size} events queued"
+                )
+        elif total <= self._low_water:
+            self._above_high_water = False
+
+    def _process_event_immediate(
+        self,
+        event_data: EventData,
+        handlers: tuple[BaseEventHandler, ...] | None = None,
+    ) -> EventDispatchResult:
         """Process an event immediately (synchronously)."""
         start_time = time.perf_counter()
         result = EventDispatchResult(event_id=event_data.event_id)
 
         try:
             # Get handlers for this event
-            handlers = self.get_handlers_for_event(event_data.event_type)
+            if handlers is None:
+                table = self._dispatch_table_for(event_data.event_type)
+                handlers = table.route(event_data)
 
             # Process handlers
             for handler in handlers:
                 if not handler.should_handle(event_data):
                     continue
+                if not self._circuit_allows(handler):
+                    continue
 
                 try:
-                    handler_result = handler.handle_event_safely(event_data)
+                    handler_result = self._call_handler(handler, event_data)
                     result.handlers_executed += 1
 
                     if handler_result == EventResult.CANCEL and event_data.cancellable:
@@ -306,17 +783,73 @@ class EventDispatcher:
 
         finally:
             result.execution_time = time.perf_counter() - start_time
-            self._stats.update_from_result(result)
-            self._stats.events_by_type[event_data.event_type] += 1
+            self._record_result(event_data, result)
 
         return result
 
-    async def dispatch_event_async(self, event_data: EventData) -> EventDispatchResult:
+    def _circuit_allows(self, handler: BaseEventHandler) -> bool:
+        """Check the handler's circuit breaker, counting rejected calls."""
+        breaker = handler.circuit_breaker
+        if breaker is None or breaker.allow():
+            return True
+
+        with self._stats_lock:
+            self._stats.handlers_short_circuited += 1
+        return False
+
+    def _call_handler(
+        self, handler: BaseEventHandler, event_data: EventData
+    ) -> EventResult:
+        """
+        Run a sync handler, enforcing its timeout.
+
+        A timed-out call cannot be interrupted; it keeps running on the
+        timeout pool while dispatch moves on to the next handler.
+        """
+        timeout = handler.timeout
+        if timeout is None:
+            return handler.handle_event_safely(event_data)
+
+        future = self._get_timeout_executor().submit(
+            handler.handle_event_safely, event_data
+        )
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            raise self._handler_timed_out(handler, timeout) from None
+
+    def _get_timeout_executor(self) -> ThreadPoolExecutor:
+        """Get the pool for handlers with timeouts, creating it if necessary."""
+        with self._registry_lock:
+            if self._timeout_executor is None:
+                self._timeout_executor = ThreadPoolExecutor(
+                    max_workers=max(4, self.num_workers * 2),
+                    thread_name_prefix="EventHandlerTimeout",
+                )
+            return self._timeout_executor
+
+    def _handler_timed_out(
+        self, handler: BaseEventHandler, timeout: float
+    ) -> HandlerTimeoutError:
+        """Record a handler timeout and build the error to report."""
+        handler.metadata.timeout_count += 1
+        if handler.circuit_breaker is not None:
+            handler.circuit_breaker.record_failure()
+
+        with self._stats_lock:
+            self._stats.handler_timeouts += 1
+
+        return HandlerTimeoutError(handler.name, timeout)
+
+    async def dispatch_event_async(
+        self, event_data: EventData, record: bool = True
+    ) -> EventDispatchResult:
         """
         Dispatch an event asynchronously.
 
         Args:
             event_data: Event data to dispatch
+            record: Whether to write the event to the journal (if any)
 
         Returns:
             Dispatch result
@@ -326,6 +859,9 @@ class EventDispatcher:
                 f"Dispatching event async: {event_data.event_type.value} (ID: {event_data.event_id})"
             )
 
+        if self.handler_loader is not None:
+            self.handler_loader(event_data.event_type)
+
         # Apply global filters
         for filter_func in self._event_filters:
             if not filter_func(event_data):
@@ -335,16 +871,27 @@ class EventDispatcher:
                     event_id=event_data.event_id, final_result=EventResult.CONTINUE
                 )
 
+        if record and self.journal is not None:
+            self.journal.record(event_data)
+
         return await self._process_event_async(event_data)
 
-    async def _process_event_async(self, event_data: EventData) -> EventDispatchResult:
+    async def _process_event_async(
+        self,
+        event_data: EventData,
+        handlers: tuple[BaseEventHandler, ...] | None = None,
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> EventDispatchResult:
         """Process an event asynchronously."""
         start_time = time.perf_counter()
         result = EventDispatchResult(event_id=event_data.event_id)
+        semaphore = semaphore or self._async_handlers_semaphore
 
         try:
             # Get handlers for this event
-            handlers = self.get_handlers_for_event(event_data.event_type)
+            if handlers is None:
+                table = self._dispatch_table_for(event_data.event_type)
+                handlers = table.route(event_data)
 
             # Separate sync and async handlers
             sync_handlers = [
@@ -356,12 +903,17 @@ class EventDispatcher:
             for handler in sync_handlers:
                 if not handler.should_handle(event_data):
                     continue
+                if not self._circuit_allows(handler):
+                    continue
 
                 try:
                     # Run sync handler in executor to avoid blocking
                     loop = asyncio.get_event_loop()
-                    handler_result = await loop.run_in_executor(
-                        None, handler.handle_event_safely, event_data
+                    handler_result = await self._with_timeout(
+                        handler,
+                        loop.run_in_executor(
+                            None, handler.handle_event_safely, event_data
+                        ),
                     )
 
                     result.handlers_executed += 1
@@ -387,13 +939,17 @@ class EventDispatcher:
                 for handler in async_handlers:
                     if not handler.should_handle(event_data):
                         continue
+                    if not self._circuit_allows(handler):
+                        continue
 
                     # Create async task with semaphore for rate limiting
                     async def process_async_handler(
                         h: AsyncEventHandler,
                     ) -> EventResult:
-                        async with self._async_handlers_semaphore:
-                            return await h.handle_event_safely_async(event_data)
+                        async with semaphore:
+                            return await self._with_timeout(
+                                h, h.handle_event_safely_async(event_data)
+                            )
 
                     async_tasks.append(process_async_handler(handler))
 
@@ -423,62 +979,164 @@ class EventDispatcher:
 
         finally:
             result.execution_time = time.perf_counter() - start_time
-            self._stats.update_from_result(result)
-            self._stats.events_by_type[event_data.event_type] += 1
+            self._record_result(event_data, result)
 
         return result
 
+    async def _with_timeout(self, handler: BaseEventHandler, awaitable: Any) -> Any:
+        """Await a handler call, enforcing the handler's timeout."""
+        timeout = handler.timeout
+        if timeout is None:
+            return await awaitable
+
+        try:
+            return await asyncio.wait_for(awaitable, timeout)
+        except TimeoutError:
+            raise self._handler_timed_out(handler, timeout) from None
+
     def _start_processing(self) -> None:
-        """Start the event processing thread."""
-        if self._is_processing:
-            return
+        """Start the event processing worker threads."""
+        with self._queue_lock:
+            self._is_processing = True
+            self._shutdown_event.clear()
 
-        self._is_processing = True
-        self._shutdown_event.clear()
+            for worker, thread in enumerate(self._worker_threads):
+                if thread is not None and thread.is_alive():
+                    continue
 
-        self._processing_thread = threading.Thread(
-            target=self._process_events_loop, name="EventDispatcherThread", daemon=True
-        )
-        self._processing_thread.start()
+                thread = threading.Thread(
+                    target=self._process_events_loop,
+                    args=(worker,),
+                    name=f"EventDispatcherThread-{worker}",
+                    daemon=True,
+                )
+                self._worker_threads[worker] = thread
+                thread.start()
+
+        logger.debug(f"Started {self.num_workers} event processing thread(s)")
 
-        logger.debug("Started event processing thread")
+    def _process_events_loop(self, worker: int = 0) -> None:
+        """Event processing loop for one worker (runs in background thread)."""
+        queue = self._worker_queues[worker]
+        condition = self._worker_conditions[worker]
+        top_lane = queue.top_lane
 
-    def _process_events_loop(self) -> None:
-        """Main event processing loop (runs in background thread)."""
         try:
-            while self._is_processing and not self._shutdown_event.is_set():
-                # Process batch of events
-                batch = []
-
-                with self._queue_lock:
-                    # Get batch of events
-                    for _ in range(min(self.batch_size, len(self._event_queue))):
-                        if self._event_queue:
-                            batch.append(self._event_queue.popleft())
-
-                if not batch:
-                    # No events to process, sleep briefly
-                    time.sleep(0.01)
-                    continue
+            while True:
+                with condition:
+                    # Sleep until events arrive or shutdown is requested
+                    while not queue and not self._shutdown_event.is_set():
+                        condition.wait()
+
+                    if self._shutdown_event.is_set():
+                        break
+
+                    # Get batch of events, interleaving lanes by weight
+                    batch = queue.take(self.batch_size)
+                    self._update_queue_depths(worker)
+
+                    self._queue_not_full.notify_all()
+                    self._drain_spill()
 
                 # Process batch
-                for event_data in batch:
+                processed = 0
+                for lane, (enqueued_at, event_data) in batch:
                     if self._shutdown_event.is_set():
                         break
 
+                    # Let newly arrived top-lane events overtake the rest. At
+                    # least one event is processed per batch, so a busy top
+                    # lane cannot starve the others.
+                    if (
+                        processed
+                        and lane is not top_lane
+                        and queue.has_pending(top_lane)
+                    ):
+                        with condition:
+                            queue.requeue(batch[processed:])
+                            self._update_queue_depths(worker)
+                            self._stats.lane_preemptions += 1
+                        break
+
+                    wait = time.perf_counter() - enqueued_at
+                    self._stats.queue_wait.record(wait)
+                    self._stats.lane_queue_wait[lane].record(wait)
+                    processed += 1
                     try:
-                        self._process_event_immediate(event_data)
+                        self._process_queued_event(event_data)
                     except Exception as e:
                         logger.error(
                             f"Error processing event {event_data.event_id}: {e}"
                         )
 
+                with self._stats_lock:
+                    self._stats.events_by_worker[worker] += processed
+                    for lane, _entry in batch[:processed]:
+                        self._stats.events_by_lane[lane] += 1
+
         except Exception as e:
             logger.error(f"Event processing loop failed: {e}")
 
+            # Let the next enqueue restart the failed worker
+            with self._queue_lock:
+                if not self._shutdown_event.is_set():
+                    self._is_processing = False
+
         finally:
-            self._is_processing = False
-            logger.debug("Event processing thread stopped")
+            logger.debug(f"Event processing thread {worker} stopped")
+
+    def _process_queued_event(self, event_data: EventData) -> EventDispatchResult:
+        """Process a queued event on a worker thread."""
+        handlers = self._dispatch_table_for(event_data.event_type).route(event_data)
+
+        if not any(isinstance(handler, AsyncEventHandler) for handler in handlers):
+            return self._process_event_immediate(event_data, handlers)
+
+        # Coroutine handlers run on the shared worker loop, bounded by its
+        # semaphore; the worker waits so per-key ordering is preserved.
+        loop = self._ensure_worker_loop()
+        future = asyncio.run_coroutine_threadsafe(
+            self._process_event_async(
+                event_data, handlers, self._worker_loop_semaphore
+            ),
+            loop,
+        )
+        return future.result()
+
+    def _ensure_worker_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the worker event loop, starting it if necessary."""
+        with self._queue_lock:
+            if self._worker_loop is None or self._worker_loop.is_closed():
+                loop = asyncio.new_event_loop()
+                self._worker_loop_semaphore = asyncio.Semaphore(
+                    self._max_concurrent_async_handlers
+                )
+                self._worker_loop_thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="EventDispatcherLoop",
+                    daemon=True,
+                )
+                self._worker_loop = loop
+                self._worker_loop_thread.start()
+
+            return self._worker_loop
+
+    def _stop_worker_loop(self, timeout: float) -> None:
+        """Stop the worker event loop if it is running."""
+        loop, thread = self._worker_loop, self._worker_loop_thread
+        if loop is None or loop.is_closed():
+            return
+
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout)
+            if thread.is_alive():
+                logger.warning("Event dispatcher loop did not stop within timeout")
+                return
+
+        loop.close()
+        self._worker_loop = None
+        self._worker_loop_thread = None
 
     def stop_processing(self, timeout: float = 5.0) -> None:
         """
@@ -492,16 +1150,24 @@ class EventDispatcher:
 
         logger.info("Stopping event processing...")
 
-        self._shutdown_event.set()
-
-        if self._processing_thread and self._processing_thread.is_alive():
-            self._processing_thread.join(timeout)
-
-            if self._processing_thread.is_alive():
-                logger.warning("Event processing thread did not stop within timeout")
-            else:
-                logger.info("Event processing stopped")
+        with self._queue_lock:
+            self._shutdown_event.set()
+            for condition in self._worker_conditions:
+                condition.notify_all()
+
+        deadline = time.monotonic() + timeout
+        stopped = True
+        for thread in self._worker_threads:
+            if thread is not None and thread.is_alive():
+                thread.join(max(0.0, deadline - time.monotonic()))
+                stopped = stopped and not thread.is_alive()
+
+        if stopped:
+            logger.info("Event processing stopped")
+        else:
+            logger.warning("Event processing thread did not stop within timeout")
 
+        self._stop_worker_loop(max(0.0, deadline - time.monotonic()))
         self._is_processing = False
 
     def clear_queue(self) -> int:
@@ -512,8 +1178,13 @@ class EventDispatcher:
             Number of events cleared
         """
         with self._queue_lock:
-            count = len(self._event_queue)
-            self._event_queue.clear()
+            count = sum(len(queue) for queue in self._worker_queues)
+            for queue in self._worker_queues:
+                queue.clear()
+            if self._spill is not None:
+                count += self._spill.clear()
+                self._stats.spill_queue_depth = 0
+            self._update_queue_depths()
 
         logger.info(f"Cleared {count} events from queue")
         return count
@@ -538,13 +1209,19 @@ class EventDispatcher:
                 "last_error": str(handler.metadata.last_error)
                 if handler.metadata.last_error
                 else None,
+                "latency": handler.metadata.latency.snapshot(),
+                "timeout_count": handler.metadata.timeout_count,
+                "circuit": handler.circuit_breaker.snapshot()
+                if handler.circuit_breaker
+                else None,
             }
 
         return stats
 
     def reset_stats(self) -> None:
         """Reset all statistics."""
-        self._stats = EventStats()
+        with self._stats_lock:
+            self._stats = self._new_stats()
 
         # Reset handler stats
         all_handlers = self._global_handlers.copy()
@@ -556,10 +1233,20 @@ class EventDispatcher:
             handler.metadata.error_count = 0
             handler.metadata.total_execution_time = 0.0
             handler.metadata.last_error = None
+            handler.metadata.timeout_count = 0
+            handler.metadata.latency.reset()
 
         logger.info("Reset event dispatcher statistics")
 
     def __del__(self) -> None:
         """Cleanup on destruction."""
-        if self._is_processing:
+        if getattr(self, "_is_processing", False):
             self.stop_processing()
+
+        spill = getattr(self, "_spill", None)
+        if spill is not None:
+            spill.close()
+
+        executor = getattr(self, "_timeout_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
@@ -7,11 +7,53 @@ from __future__ import annotations
 import re
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from enum import Enum
 from typing import Any
 
 from .types import ElementEventData, EventData, EventType, ParameterEventData
 
 
+class RoutingDimension(Enum):
+    """Event attributes that filters can be indexed on."""
+
+    EVENT_TYPE = "event_type"
+    ELEMENT_ID = "element_id"
+    CATEGORY = "category"
+    PARAMETER_NAME = "parameter_name"
+
+
+RoutingConstraints = dict[RoutingDimension, frozenset]
+
+
+def routing_values(event_data: EventData, dimension: RoutingDimension) -> tuple:
+    """
+    Get the values an event exposes for a routing dimension.
+
+    Args:
+        event_data: Event data
+        dimension: Routing dimension
+
+    Returns:
+        Values a filter constrained on the dimension could match
+    """
+    if dimension == RoutingDimension.EVENT_TYPE:
+        return (event_data.event_type,)
+
+    if dimension == RoutingDimension.ELEMENT_ID:
+        if isinstance(event_data, ElementEventData | ParameterEventData):
+            return (event_data.element_id,)
+    elif dimension == RoutingDimension.CATEGORY:
+        if isinstance(event_data, ElementEventData):
+            return (event_data.category,)
+    elif dimension == RoutingDimension.PARAMETER_NAME:
+        if isinstance(event_data, ParameterEventData):
+            return (event_data.parameter_name,)
+        if isinstance(event_data, ElementEventData):
+            return tuple(event_data.parameters_changed)
+
+    return ()
+
+
 class EventFilter(ABC):
     """Abstract base class for event filters."""
 
@@ -28,6 +70,20 @@ class EventFilter(ABC):
         """
         pass
 
+    def routing_constraints(self) -> RoutingConstraints:
+        """
+        Get the values this filter requires per routing dimension.
+
+        An event can only match if, for every returned dimension, it exposes
+        one of the listed values. Filters that cannot be decomposed return
+        an empty dict.
+        """
+        return {}
+
+    def compile(self) -> Callable[[EventData], bool]:
+        """Get a predicate equivalent to matches() for repeated evaluation."""
+        return self.matches
+
     def __and__(self, other: EventFilter) -> EventFilter:
         """Combine filters with AND logic."""
         return AndFilter(self, other)
@@ -50,6 +106,9 @@ class EventTypeFilter(EventFilter):
     def matches(self, event_data: EventData) -> bool:
         return event_data.event_type in self.event_types
 
+    def routing_constraints(self) -> RoutingConstraints:
+        return {RoutingDimension.EVENT_TYPE: frozenset(self.event_types)}
+
 
 class ElementTypeFilter(EventFilter):
     """Filter element events by element type."""
@@ -76,6 +135,9 @@ class CategoryFilter(EventFilter):
 
         return event_data.category in self.categories
 
+    def routing_constraints(self) -> RoutingConstraints:
+        return {RoutingDimension.CATEGORY: frozenset(self.categories)}
+
 
 class ParameterChangeFilter(EventFilter):
     """Filter parameter change events by parameter name."""
@@ -83,6 +145,10 @@ class ParameterChangeFilter(EventFilter):
     def __init__(self, *parameter_names: str, use_regex: bool = False) -> None:
         if use_regex:
             self.patterns = [re.compile(name) for name in parameter_names]
+            # One alternation searches every pattern in a single pass
+            self._combined_pattern = re.compile(
+                "|".join(f"(?:{pattern.pattern})" for pattern in self.patterns)
+            )
             self.use_regex = True
         else:
             self.parameter_names = set(parameter_names)
@@ -91,25 +157,32 @@ class ParameterChangeFilter(EventFilter):
     def matches(self, event_data: EventData) -> bool:
         if isinstance(event_data, ParameterEventData):
             if self.use_regex:
-                return any(
-                    pattern.search(event_data.parameter_name)
-                    for pattern in self.patterns
+                return (
+                    bool(self.patterns)
+                    and self._combined_pattern.search(event_data.parameter_name)
+                    is not None
                 )
             else:
                 return event_data.parameter_name in self.parameter_names
 
         elif isinstance(event_data, ElementEventData):
             if self.use_regex:
-                return any(
-                    pattern.search(param_name)
+                return bool(self.patterns) and any(
+                    self._combined_pattern.search(param_name)
                     for param_name in event_data.parameters_changed
-                    for pattern in self.patterns
                 )
             else:
-                return bool(set(event_data.parameters_changed) & self.parameter_names)
+                return not self.parameter_names.isdisjoint(
+                    event_data.parameters_changed
+                )
 
         return False
 
+    def routing_constraints(self) -> RoutingConstraints:
+        if self.use_regex:
+            return {}
+        return {RoutingDimension.PARAMETER_NAME: frozenset(self.parameter_names)}
+
 
 class ElementIdFilter(EventFilter):
     """Filter events by specific element IDs."""
@@ -125,6 +198,9 @@ class ElementIdFilter(EventFilter):
 
         return False
 
+    def routing_constraints(self) -> RoutingConstraints:
+        return {RoutingDimension.ELEMENT_ID: frozenset(self.element_ids)}
+
 
 class SourceFilter(EventFilter):
     """Filter events by source object."""
@@ -201,6 +277,9 @@ class CustomFilter(EventFilter):
     def matches(self, event_data: EventData) -> bool:
         return self.predicate(event_data)
 
+    def compile(self) -> Callable[[EventData], bool]:
+        return self.predicate
+
 
 class AndFilter(EventFilter):
     """Combines multiple filters with AND logic."""
@@ -211,6 +290,23 @@ class AndFilter(EventFilter):
     def matches(self, event_data: EventData) -> bool:
         return all(f.matches(event_data) for f in self.filters)
 
+    def routing_constraints(self) -> RoutingConstraints:
+        constraints: RoutingConstraints = {}
+        for child in self.filters:
+            for dimension, values in child.routing_constraints().items():
+                if dimension in constraints:
+                    constraints[dimension] = constraints[dimension] & values
+                else:
+                    constraints[dimension] = values
+        return constraints
+
+    def compile(self) -> Callable[[EventData], bool]:
+        matchers = tuple(f.compile() for f in self.filters)
+        if len(matchers) == 2:
+            first, second = matchers
+            return lambda event_data: first(event_data) and second(event_data)
+        return lambda event_data: all(m(event_data) for m in matchers)
+
 
 class OrFilter(EventFilter):
     """Combines multiple filters with OR logic."""
@@ -221,6 +317,21 @@ class OrFilter(EventFilter):
     def matches(self, event_data: EventData) -> bool:
         return any(f.matches(event_data) for f in self.filters)
 
+    def routing_constraints(self) -> RoutingConstraints:
+        # A dimension is only required if every branch constrains it
+        branches = [f.routing_constraints() for f in self.filters]
+        if not branches:
+            return {}
+        shared = set(branches[0]).intersection(*branches[1:])
+        return {
+            dimension: frozenset().union(*(branch[dimension] for branch in branches))
+            for dimension in shared
+        }
+
+    def compile(self) -> Callable[[EventData], bool]:
+        matchers = tuple(f.compile() for f in self.filters)
+        return lambda event_data: any(m(event_data) for m in matchers)
+
 
 class NotFilter(EventFilter):
     """Inverts another filter."""
@@ -231,6 +342,10 @@ class NotFilter(EventFilter):
     def matches(self, event_data: EventData) -> bool:
         return not self.filter_to_invert.matches(event_data)
 
+    def compile(self) -> Callable[[EventData], bool]:
+        matcher = self.filter_to_invert.compile()
+        return lambda event_data: not matcher(event_data)
+
 
 # Convenience factory functions
 
@@ -4,13 +4,25 @@ Event handler base classes and implementations.
 
 import asyncio
 from abc import ABC, abstractmethod
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
 from typing import Any
 
 from loguru import logger
 
+from .batching import (
+    DEFAULT_MAX_BATCH_LATENCY_SECONDS,
+    DEFAULT_MAX_BATCH_SIZE,
+    EventBatcher,
+)
+from .coalescing import (
+    DEFAULT_COALESCE_WINDOW_SECONDS,
+    CoalesceMode,
+    CoalesceStrategy,
+    EventCoalescer,
+)
 from .filters import EventFilter
+from .health import CircuitBreaker, LatencyHistogram
 from .types import EventData, EventPriority, EventResult
 
 
@@ -26,6 +38,8 @@ class HandlerMetadata:
     last_error: Exception | None = None
     execution_count: int = 0
     total_execution_time: float = 0.0
+    timeout_count: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
 
     @property
     def average_execution_time(self) -> float:
@@ -49,13 +63,32 @@ class BaseEventHandler(ABC):
         priority: EventPriority = EventPriority.NORMAL,
         event_filter: EventFilter | None = None,
         max_errors: int = 10,
+        timeout: float | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
     ) -> None:
+        if timeout is not None and timeout <= 0:
+            raise ValueError("timeout must be positive")
+
         self.metadata = HandlerMetadata(
             name=name or self.__class__.__name__,
             priority=priority,
             max_errors=max_errors,
         )
         self.event_filter = event_filter
+        # Execution timeout in seconds, enforced by the dispatcher
+        self.timeout = timeout
+        self.circuit_breaker = circuit_breaker
+
+    @property
+    def event_filter(self) -> EventFilter | None:
+        """Get the handler's event filter."""
+        return self._event_filter
+
+    @event_filter.setter
+    def event_filter(self, value: EventFilter | None) -> None:
+        """Set the event filter and compile its matcher."""
+        self._event_filter = value
+        self._filter_matcher = value.compile() if value is not None else None
 
     @property
     def name(self) -> str:
@@ -85,6 +118,21 @@ class BaseEventHandler(ABC):
         self.metadata.error_count = 0
         self.metadata.last_error = None
 
+    def _record_outcome(self, execution_time: float, failed: bool = False) -> None:
+        """Record an execution's latency and report it to the circuit breaker."""
+        self.metadata.latency.record(execution_time)
+
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return
+        if self.timeout is not None and execution_time > self.timeout:
+            return  # Already reported as a timeout by the dispatcher
+
+        if failed:
+            breaker.record_failure()
+        else:
+            breaker.record_success(execution_time)
+
     def should_handle(self, event_data: EventData) -> bool:
         """
         Check if this handler should handle the event.
@@ -98,7 +146,7 @@ class BaseEventHandler(ABC):
         if not self.is_enabled:
             return False
 
-        if self.event_filter and not self.event_filter.matches(event_data):
+        if self._filter_matcher is not None and not self._filter_matcher(event_data):
             return False
 
         return True
@@ -127,6 +175,7 @@ class BaseEventHandler(ABC):
             execution_time = time.perf_counter() - start_time
             self.metadata.execution_count += 1
             self.metadata.total_execution_time += execution_time
+            self._record_outcome(execution_time)
 
             logger.debug(
                 f"Handler {self.name} processed event {event_data.event_type.value} "
@@ -137,6 +186,7 @@ class BaseEventHandler(ABC):
 
         except Exception as e:
             # Update error metrics
+            self._record_outcome(time.perf_counter() - start_time, failed=True)
             self.metadata.error_count += 1
             self.metadata.last_error = e
 
@@ -193,6 +243,7 @@ class AsyncEventHandler(BaseEventHandler):
             execution_time = time.perf_counter() - start_time
             self.metadata.execution_count += 1
             self.metadata.total_execution_time += execution_time
+            self._record_outcome(execution_time)
 
             logger.debug(
                 f"Async handler {self.name} processed event {event_data.event_type.value} "
@@ -203,6 +254,7 @@ class AsyncEventHandler(BaseEventHandler):
 
         except Exception as e:
             # Update error metrics
+            self._record_outcome(time.perf_counter() - start_time, failed=True)
             self.metadata.error_count += 1
             self.metadata.last_error = e
 
@@ -253,12 +305,14 @@ class CallableEventHandler(BaseEventHandler):
         priority: EventPriority = EventPriority.NORMAL,
         event_filter: EventFilter | None = None,
         max_errors: int = 10,
+        timeout: float | None = None,
     ) -> None:
         super().__init__(
             name=name or callback.__name__,
             priority=priority,
             event_filter=event_filter,
             max_errors=max_errors,
+            timeout=timeout,
         )
         self.callback = callback
 
@@ -285,12 +339,14 @@ class AsyncCallableEventHandler(AsyncEventHandler):
         priority: EventPriority = EventPriority.NORMAL,
         event_filter: EventFilter | None = None,
         max_errors: int = 10,
+        timeout: float | None = None,
     ) -> None:
         super().__init__(
             name=name or callback.__name__,
             priority=priority,
             event_filter=event_filter,
             max_errors=max_errors,
+            timeout=timeout,
         )
         self.callback = callback
 
@@ -425,3 +481,105 @@ class ThrottledEventHandler(BaseEventHandler):
 
         self.last_execution_time = time.perf_counter()
         return self.handler.handle_event_safely(event_data)
+
+
+class CoalescingEventHandler(BaseEventHandler):
+    """Event handler that collapses bursts of events before delegating."""
+
+    def __init__(
+        self,
+        handler: BaseEventHandler,
+        window_seconds: float = DEFAULT_COALESCE_WINDOW_SECONDS,
+        mode: CoalesceMode = CoalesceMode.DEBOUNCE,
+        strategy: CoalesceStrategy = CoalesceStrategy.LATEST,
+        key: Callable[[EventData], Hashable] | None = None,
+        max_wait_seconds: float | None = None,
+        name: str | None = None,
+    ) -> None:
+        super().__init__(
+            name=name or f"Coalescing_{handler.name}",
+            priority=handler.priority,
+            event_filter=handler.event_filter,
+        )
+        self.handler = handler
+        self.coalescer = EventCoalescer(
+            self.handler.handle_event_safely,
+            window_seconds=window_seconds,
+            mode=mode,
+            strategy=strategy,
+            key=key,
+            max_wait_seconds=max_wait_seconds,
+            name=self.name,
+        )
+
+    def should_handle(self, event_data: EventData) -> bool:
+        """Check if handler should handle event including the wrapped handler."""
+        return super().should_handle(event_data) and self.handler.should_handle(
+            event_data
+        )
+
+    def handle_event(self, event_data: EventData) -> EventResult:
+        """
+        Queue event into its burst.
+
+        Delivery is deferred, so results returned by the wrapped handler
+        cannot stop or cancel the original dispatch.
+        """
+        self.coalescer.submit(event_data)
+        return EventResult.CONTINUE
+
+    def flush(self) -> int:
+        """Deliver pending bursts immediately."""
+        return self.coalescer.flush()
+
+    def close(self, flush: bool = True) -> None:
+        """Stop coalescing, optionally delivering pending bursts."""
+        self.coalescer.close(flush=flush)
+
+
+class BatchingEventHandler(BaseEventHandler):
+    """Event handler that delivers events to a callback in batches."""
+
+    def __init__(
+        self,
+        callback: Callable[[list[EventData]], Any],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_latency_seconds: float = DEFAULT_MAX_BATCH_LATENCY_SECONDS,
+        retry_individually: bool = False,
+        on_error: Callable[[list[EventData], Exception], Any] | None = None,
+        name: str | None = None,
+        priority: EventPriority = EventPriority.NORMAL,
+        event_filter: EventFilter | None = None,
+    ) -> None:
+        super().__init__(
+            name=name or getattr(callback, "__name__", "BatchingEventHandler"),
+            priority=priority,
+            event_filter=event_filter,
+        )
+        self.callback = callback
+        self.batcher = EventBatcher(
+            callback,
+            max_batch_size=max_batch_size,
+            max_latency_seconds=max_latency_seconds,
+            retry_individually=retry_individually,
+            on_error=on_error,
+            name=self.name,
+        )
+
+    def handle_event(self, event_data: EventData) -> EventResult:
+        """
+        Add event to the current batch.
+
+        Filters and priority apply per event before batching. Delivery is
+        deferred, so the callback cannot stop or cancel the original dispatch.
+        """
+        self.batcher.submit(event_data)
+        return EventResult.CONTINUE
+
+    def flush(self) -> int:
+        """Deliver the pending batch immediately."""
+        return self.batcher.flush()
+
+    def close(self, flush: bool = True) -> None:
+        """Stop batching, optionally delivering the pending batch."""
+        self.batcher.close(flush=flush)
@@ -0,0 +1,299 @@
+"""
+Latency histograms and circuit breakers for event handlers.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from loguru import logger
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RECOVERY_TIMEOUT_SECONDS = 30.0
+
+
+class HandlerTimeoutError(TimeoutError):
+    """Raised when a handler exceeds its execution timeout."""
+
+    def __init__(self, handler_name: str, timeout: float) -> None:
+        super().__init__(f"Handler {handler_name} timed out after {timeout:.3f}s")
+        self.handler_name = handler_name
+        self.timeout = timeout
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram with constant memory.
+
+    Values are counted in buckets that grow geometrically from ``min_value``
+    to ``max_value``, so percentiles are accurate to within one bucket
+    (about 12% with the default resolution) regardless of sample count.
+    """
+
+    def __init__(
+        self,
+        min_value: float = 1e-6,
+        max_value: float = 100.0,
+        buckets_per_decade: int = 20,
+    ) -> None:
+        if not 0 < min_value < max_value:
+            raise ValueError("Histogram bounds must satisfy 0 < min_value < max_value")
+        if buckets_per_decade < 1:
+            raise ValueError("buckets_per_decade must be at least 1")
+
+        self.min_value = min_value
+        self.max_value = max_value
+        self._scale = buckets_per_decade / math.log(10)
+        self._counts = [0] * (self._bucket_for(max_value) + 1)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def _bucket_for(self, value: float) -> int:
+        """Get the bucket index for a value."""
+        if value <= self.min_value:
+            return 0
+        return math.ceil(math.log(value / self.min_value) * self._scale)
+
+    def _bucket_upper_bound(self, index: int) -> float:
+        """Get the largest value counted in a bucket."""
+        return self.min_value * math.exp(index / self._scale)
+
+    @property
+    def mean(self) -> float:
+        """Get the mean recorded value."""
+        return self.total / self.count if self.count else 0.0
+
+    def record(self, value: float) -> None:
+        """
+        Record one value.
+
+        Args:
+            value: Latency in seconds
+        """
+        index = min(self._bucket_for(value), len(self._counts) - 1)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.total += value
+            if value > self.max:
+                self.max = value
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Get an approximate percentile.
+
+        Args:
+            percentile: Percentile in [0, 100]
+
+        Returns:
+            Upper bound of the bucket holding the percentile (0.0 if empty)
+        """
+        if not 0 <= percentile <= 100:
+            raise ValueError("percentile must be in [0, 100]")
+
+        with self._lock:
+            if not self.count:
+                return 0.0
+
+            rank = max(1, math.ceil(self.count * percentile / 100))
+            last = len(self._counts) - 1
+            seen = 0
+            for index, bucket_count in enumerate(self._counts):
+                seen += bucket_count
+                if seen >= rank:
+                    if index == last:
+                        break  # The last bucket also holds values above max_value
+                    return min(self._bucket_upper_bound(index), self.max)
+
+            return self.max
+
+    def snapshot(self) -> dict[str, float]:
+        """Get count, mean, max and the p50/p95/p99 latencies."""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+    def reset(self) -> None:
+        """Discard all recorded values."""
+        with self._lock:
+            self._counts = [0] * len(self._counts)
+            self.count = 0
+            self.total = 0.0
+            self.max = 0.0
+
+
+class CircuitState(Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"  # Calls flow normally
+    OPEN = "open"  # Calls are rejected until the recovery timeout passes
+    HALF_OPEN = "half_open"  # A limited number of probe calls are allowed
+
+
+@dataclass
+class CircuitBreakerStats:
+    """Counters for a circuit breaker."""
+
+    times_opened: int = 0
+    rejected_calls: int = 0
+    slow_calls: int = 0
+
+
+class CircuitBreaker:
+    """
+    Stops calling a handler that keeps failing or running slowly.
+
+    After ``failure_threshold`` consecutive failures (errors, timeouts, or
+    calls slower than ``slow_call_threshold``) the circuit opens and calls are
+    rejected. Once ``recovery_timeout`` has passed the circuit is half-open:
+    up to ``half_open_max_calls`` probe calls are let through, and the first
+    result closes the circuit again or reopens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT_SECONDS,
+        slow_call_threshold: float | None = None,
+        half_open_max_calls: int = 1,
+        name: str = "CircuitBreaker",
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if recovery_timeout < 0:
+            raise ValueError("recovery_timeout must not be negative")
+        if half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls must be at least 1")
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.slow_call_threshold = slow_call_threshold
+        self.half_open_max_calls = half_open_max_calls
+        self.name = name
+
+        self._state = CircuitState.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._lock = threading.Lock()
+        self._stats = CircuitBreakerStats()
+
+    @property
+    def stats(self) -> CircuitBreakerStats:
+        """Get circuit breaker statistics."""
+        return self._stats
+
+    @property
+    def state(self) -> CircuitState:
+        """Get the current state, moving from open to half-open when due."""
+        with self._lock:
+            self._check_recovery()
+            return self._state
+
+    def allow(self) -> bool:
+        """
+        Check whether a call may proceed.
+
+        In the half-open state this reserves a probe slot, so every allowed
+        call must be followed by record_success or record_failure.
+        """
+        with self._lock:
+            self._check_recovery()
+
+            if self._state == CircuitState.CLOSED:
+                return True
+
+            if (
+                self._state == CircuitState.HALF_OPEN
+                and self._probes_in_flight < self.half_open_max_calls
+            ):
+                self._probes_in_flight += 1
+                return True
+
+            self._stats.rejected_calls += 1
+            return False
+
+    def record_success(self, duration: float | None = None) -> None:
+        """
+        Record a completed call.
+
+        Args:
+            duration: Call duration in seconds; calls slower than the
+                slow-call threshold count as failures
+        """
+        if (
+            duration is not None
+            and self.slow_call_threshold is not None
+            and duration > self.slow_call_threshold
+        ):
+            with self._lock:
+                self._stats.slow_calls += 1
+            self.record_failure()
+            return
+
+        with self._lock:
+            self._consecutive_failures = 0
+            if self._state == CircuitState.HALF_OPEN:
+                self._state = CircuitState.CLOSED
+                self._probes_in_flight = 0
+                logger.info(f"Circuit for {self.name} closed after successful probe")
+
+    def record_failure(self) -> None:
+        """Record a failed, timed-out or slow call."""
+        with self._lock:
+            self._consecutive_failures += 1
+
+            if self._state == CircuitState.HALF_OPEN or (
+                self._state == CircuitState.CLOSED
+                and self._consecutive_failures >= self.failure_threshold
+            ):
+                self._open()
+
+    def reset(self) -> None:
+        """Close the circuit and clear failure counts."""
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._consecutive_failures = 0
+            self._probes_in_flight = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get the state and counters."""
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self._consecutive_failures,
+            "times_opened": self._stats.times_opened,
+            "rejected_calls": self._stats.rejected_calls,
+            "slow_calls": self._stats.slow_calls,
+        }
+
+    def _open(self) -> None:
+        """Open the circuit (caller holds the lock)."""
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._probes_in_flight = 0
+        self._stats.times_opened += 1
+        logger.warning(
+            f"Circuit for {self.name} opened after {self._consecutive_failures} "
+            f"consecutive failures; retrying in {self.recovery_timeout:.1f}s"
+        )
+
+    def _check_recovery(self) -> None:
+        """Move to half-open once the recovery timeout has passed."""
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.recovery_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probes_in_flight = 0
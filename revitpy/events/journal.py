@@ -0,0 +1,480 @@
+"""
+Append-only, memory-mapped event journal with replay.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from collections import deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from .codec import decode_event, encode_event, peek_event
+from .types import EventData, EventType
+
+if TYPE_CHECKING:
+    from .dispatcher import EventDispatcher
+
+# Record layout: payload length, CRC32 of the payload; the payload is an
+# event encoded by events.codec
+_RECORD_HEADER = struct.Struct("<II")
+_SEGMENT_PREFIX = "events-"
+_SEGMENT_SUFFIX = ".seg"
+
+DEFAULT_SEGMENT_SIZE = 16 * 1024 * 1024
+
+
+@dataclass
+class JournalStats:
+    """Counters for an event journal."""
+
+    records_enqueued: int = 0
+    records_written: int = 0
+    records_dropped: int = 0
+    bytes_written: int = 0
+    syncs: int = 0
+    segments_created: int = 0
+    segments_deleted: int = 0
+
+
+@dataclass(frozen=True)
+class JournalRecord:
+    """A journaled event as read back from disk."""
+
+    timestamp: float
+    event_type: EventType
+    payload: bytes
+
+    def to_event(self) -> EventData:
+        """Decode the recorded event."""
+        return decode_event(self.payload)
+
+
+class _Segment:
+    """One memory-mapped, pre-allocated segment file being written."""
+
+    def __init__(self, path: Path, size: int) -> None:
+        self.path = path
+        self.size = size
+        self.position = 0
+        self._file = open(path, "w+b")
+        self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), size)
+
+    def remaining(self) -> int:
+        return self.size - self.position
+
+    def write(self, data: bytes) -> None:
+        end = self.position + len(data)
+        self._map[self.position : end] = data
+        self.position = end
+
+    def sync(self) -> None:
+        self._map.flush()
+
+    def close(self) -> None:
+        """Sync, unmap and trim the file to the bytes actually written."""
+        self._map.flush()
+        self._map.close()
+        self._file.truncate(self.position)
+        self._file.close()
+
+
+class EventJournal:
+    """
+    Opt-in, append-only journal of dispatched events.
+
+    Recording encodes the event and enqueues it; a background writer appends
+    batches to memory-mapped segment files and syncs them to disk every
+    ``sync_interval`` seconds or ``sync_every`` records, whichever comes first.
+    Old segments are deleted once the journal exceeds ``max_bytes`` or they
+    are older than ``max_age_seconds``.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        segment_size: int = DEFAULT_SEGMENT_SIZE,
+        sync_interval: float = 1.0,
+        sync_every: int = 1000,
+        max_bytes: int | None = None,
+        max_age_seconds: float | None = None,
+    ) -> None:
+        if segment_size <= _RECORD_HEADER.size:
+            raise ValueError("segment_size is too small")
+
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_size = segment_size
+        self.sync_interval = sync_interval
+        self.sync_every = sync_every
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+
+        # Encoded events waiting for the writer
+        self._pending: deque[bytes] = deque()
+        self._condition = threading.Condition()
+        self._enqueued = 0
+        self._processed = 0
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._sync_requested = False
+        self._closed = False
+        self._stats = JournalStats()
+
+        existing = self.segment_paths()
+        self._next_sequence = self._sequence_of(existing[-1]) + 1 if existing else 0
+        self._segment: _Segment | None = None
+
+        self._apply_retention()
+
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="EventJournalWriter", daemon=True
+        )
+        self._writer.start()
+
+    @property
+    def stats(self) -> JournalStats:
+        """Get journal statistics."""
+        return self._stats
+
+    def record(self, event_data: EventData) -> None:
+        """
+        Enqueue an event for journaling.
+
+        The event is encoded right away, so handlers changing it afterwards
+        do not affect the record. Event sources are live objects and are
+        never journaled; events whose data is not JSON serializable are
+        dropped with a warning.
+
+        Args:
+            event_data: Event to record
+        """
+        try:
+            payload = encode_event(event_data)
+        except TypeError as e:
+            with self._condition:
+                self._stats.records_dropped += 1
+            logger.warning(f"Cannot journal event {event_data.event_id}: {e}")
+            return
+
+        with self._condition:
+            if self._closed:
+                return
+            self._pending.append(payload)
+            self._enqueued += 1
+            self._stats.records_enqueued += 1
+            self._condition.notify()
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """
+        Wait until every recorded event is written and synced to disk.
+
+        Args:
+            timeout: Timeout in seconds (None to wait indefinitely)
+
+        Returns:
+            True if the journal caught up within the timeout
+        """
+        with self._condition:
+            target = self._enqueued
+            self._sync_requested = True
+            self._condition.notify_all()
+            return self._condition.wait_for(
+                lambda: self._processed >= target and not self._sync_requested,
+                timeout,
+            )
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Write outstanding events and stop the writer thread.
+
+        Args:
+            timeout: Timeout in seconds to wait for the writer
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+
+        self._writer.join(timeout)
+        if self._writer.is_alive():
+            logger.warning("Event journal writer did not stop within timeout")
+
+    def segment_paths(self) -> list[Path]:
+        """Get the journal's segment files, oldest first."""
+        return sorted(
+            self.directory.glob(f"{_SEGMENT_PREFIX}*{_SEGMENT_SUFFIX}"),
+            key=self._sequence_of,
+        )
+
+    def iter_records(
+        self,
+        start: datetime | float | None = None,
+        end: datetime | float | None = None,
+        event_types: Iterable[EventType] | None = None,
+    ) -> Iterator[JournalRecord]:
+        """
+        Stream journaled records in write order without decoding them.
+
+        Args:
+            start: Earliest timestamp to include
+            end: Latest timestamp to include
+            event_types: Event types to include (None for all)
+
+        Yields:
+            Matching journal records
+        """
+        start_ts = _as_timestamp(start)
+        end_ts = _as_timestamp(end)
+        wanted = set(event_types) if event_types is not None else None
+
+        for path in self.segment_paths():
+            for payload in _read_segment(path):
+                try:
+                    event_type, timestamp = peek_event(payload)
+                except ValueError as e:
+                    logger.warning(f"Skipping unreadable record in {path}: {e}")
+                    continue
+
+                if start_ts is not None and timestamp < start_ts:
+                    continue
+                if end_ts is not None and timestamp > end_ts:
+                    continue
+                if wanted is not None and event_type not in wanted:
+                    continue
+
+                yield JournalRecord(timestamp, event_type, payload)
+
+    def iter_events(
+        self,
+        start: datetime | float | None = None,
+        end: datetime | float | None = None,
+        event_types: Iterable[EventType] | None = None,
+    ) -> Iterator[EventData]:
+        """Stream journaled events in write order (see iter_records)."""
+        for record in self.iter_records(start, end, event_types):
+            try:
+                yield record.to_event()
+            except Exception as e:
+                logger.error(f"Skipping unreadable journal record: {e}")
+
+    def replay(
+        self,
+        dispatcher: EventDispatcher,
+        start: datetime | float | None = None,
+        end: datetime | float | None = None,
+        event_types: Iterable[EventType] | None = None,
+        rate: float | None = None,
+        immediate: bool = True,
+    ) -> int:
+        """
+        Dispatch journaled events into a dispatcher.
+
+        Replayed events are not journaled again.
+
+        Args:
+            dispatcher: Dispatcher to replay into
+            start: Earliest timestamp to replay
+            end: Latest timestamp to replay
+            event_types: Event types to replay (None for all)
+            rate: Maximum events per second (None for full speed)
+            immediate: Whether to process each event immediately or queue it
+
+        Returns:
+            Number of events replayed
+        """
+        interval = 1.0 / rate if rate else 0.0
+        next_due = time.monotonic()
+        count = 0
+
+        for event_data in self.iter_events(start, end, event_types):
+            if interval:
+                delay = next_due - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                next_due = max(next_due, time.monotonic()) + interval
+
+            dispatcher.dispatch_event(event_data, immediate=immediate, record=False)
+            count += 1
+
+        logger.info(f"Replayed {count} events from journal {self.directory}")
+        return count
+
+    @staticmethod
+    def _sequence_of(path: Path) -> int:
+        """Get a segment's sequence number from its file name."""
+        return int(path.name[len(_SEGMENT_PREFIX) : -len(_SEGMENT_SUFFIX)])
+
+    def _writer_loop(self) -> None:
+        """Write batches of encoded events (runs in background thread)."""
+        while True:
+            with self._condition:
+                while (
+                    not self._pending and not self._closed and not self._sync_requested
+                ):
+                    if self._unsynced:
+                        remaining = self.sync_interval - (
+                            time.monotonic() - self._last_sync
+                        )
+                        if remaining <= 0:
+                            break
+                        self._condition.wait(remaining)
+                    else:
+                        self._condition.wait()
+
+                batch = list(self._pending)
+                self._pending.clear()
+                closing = self._closed
+
+            for payload in batch:
+                self._write_record(payload)
+
+            with self._condition:
+                self._processed += len(batch)
+                self._unsynced += len(batch)
+
+                if (
+                    self._sync_requested
+                    or closing
+                    or self._unsynced >= self.sync_every
+                    or time.monotonic() - self._last_sync >= self.sync_interval
+                ):
+                    self._sync()
+                    self._sync_requested = False
+
+                self._condition.notify_all()
+
+                if closing and not self._pending:
+                    break
+
+        if self._segment is not None:
+            self._segment.close()
+            self._segment = None
+
+    def _write_record(self, payload: bytes) -> None:
+        """Append one record to the active segment."""
+        header = _RECORD_HEADER.pack(len(payload), zlib.crc32(payload))
+        record_size = len(header) + len(payload)
+
+        segment = self._segment
+        # Leave room for the zero length that terminates a segment
+        if segment is None or segment.remaining() < record_size + _RECORD_HEADER.size:
+            segment = self._rotate(record_size + _RECORD_HEADER.size)
+
+        segment.write(header + payload)
+        self._stats.records_written += 1
+        self._stats.bytes_written += record_size
+
+    def _rotate(self, min_size: int) -> _Segment:
+        """Close the active segment and open the next one."""
+        if self._segment is not None:
+            self._segment.close()
+
+        path = self.directory / (
+            f"{_SEGMENT_PREFIX}{self._next_sequence:08d}{_SEGMENT_SUFFIX}"
+        )
+        self._next_sequence += 1
+        self._segment = _Segment(path, max(self.segment_size, min_size))
+        self._stats.segments_created += 1
+        self._stats.syncs += 1
+
+        self._apply_retention()
+        return self._segment
+
+    def _sync(self) -> None:
+        """Flush the active segment's dirty pages to disk."""
+        if self._segment is not None and self._unsynced:
+            self._segment.sync()
+            self._stats.syncs += 1
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _apply_retention(self) -> None:
+        """Delete closed segments beyond the size or age limits."""
+        if self.max_bytes is None and self.max_age_seconds is None:
+            return
+
+        active = self._segment.path if self._segment is not None else None
+        closed = [path for path in self.segment_paths() if path != active]
+        sizes = {path: path.stat().st_size for path in closed}
+        total = sum(sizes.values())
+        if self._segment is not None:
+            total += self._segment.position
+
+        cutoff = (
+            time.time() - self.max_age_seconds
+            if self.max_age_seconds is not None
+            else None
+        )
+
+        for path in closed:
+            too_big = self.max_bytes is not None and total > self.max_bytes
+            too_old = cutoff is not None and path.stat().st_mtime < cutoff
+            if not (too_big or too_old):
+                continue
+
+            try:
+                path.unlink()
+            except OSError as e:
+                logger.warning(f"Failed to delete journal segment {path}: {e}")
+                continue
+
+            total -= sizes[path]
+            self._stats.segments_deleted += 1
+
+    def __enter__(self) -> EventJournal:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
+
+
+def _as_timestamp(value: datetime | float | None) -> float | None:
+    """Convert a datetime or epoch seconds to epoch seconds."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
+
+
+def _read_segment(path: Path) -> Iterator[bytes]:
+    """Yield the payload of each intact record."""
+    with open(path, "rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if size == 0:
+            return
+
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            position = 0
+            while position + _RECORD_HEADER.size <= size:
+                length, checksum = _RECORD_HEADER.unpack_from(view, position)
+                if length == 0:
+                    break  # Zero-filled tail of a pre-allocated segment
+
+                body_start = position + _RECORD_HEADER.size
+                body_end = body_start + length
+                if body_end > size:
+                    break
+
+                payload = view[body_start:body_end]
+                if zlib.crc32(payload) != checksum:
+                    logger.warning(f"Corrupt journal record in {path} at {position}")
+                    break
+
+                yield payload
+                position = body_end
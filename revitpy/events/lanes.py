@@ -0,0 +1,135 @@
+"""
+Priority lanes with weighted fair scheduling for queued events.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from enum import Enum
+from typing import Any
+
+from .types import EventType
+
+
+class EventLane(Enum):
+    """Priority class of a queued event."""
+
+    CRITICAL = "critical"  # UI-facing events that must stay responsive
+    NORMAL = "normal"  # Default lane
+    BACKGROUND = "background"  # Bulk work that may lag under load
+
+
+DEFAULT_LANE_WEIGHTS = {
+    EventLane.CRITICAL: 8,
+    EventLane.NORMAL: 4,
+    EventLane.BACKGROUND: 1,
+}
+
+DEFAULT_LANE_ASSIGNMENTS = {
+    EventType.SELECTION_CHANGED: EventLane.CRITICAL,
+    EventType.VIEW_ACTIVATED: EventLane.CRITICAL,
+    EventType.VIEW_DEACTIVATED: EventLane.CRITICAL,
+}
+
+
+class LaneQueue:
+    """
+    FIFO queues per lane, drained by smooth weighted round-robin.
+
+    While several lanes hold events, each lane receives a share of ``take``
+    proportional to its weight, so lower lanes are slowed down but never
+    starved. Order is preserved within a lane.
+    """
+
+    def __init__(self, weights: dict[EventLane, int]) -> None:
+        if not weights:
+            raise ValueError("At least one lane weight is required")
+        if any(weight < 1 for weight in weights.values()):
+            raise ValueError("Lane weights must be at least 1")
+
+        ordered = sorted(weights, key=lambda lane: weights[lane], reverse=True)
+        self._weights = dict(weights)
+        self._lanes: dict[EventLane, deque] = {lane: deque() for lane in ordered}
+        self._credits = dict.fromkeys(ordered, 0)
+        self._size = 0
+        self.top_lane = ordered[0]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def has_lane(self, lane: EventLane) -> bool:
+        """Check whether a lane is configured."""
+        return lane in self._lanes
+
+    def has_pending(self, lane: EventLane) -> bool:
+        """Check whether a lane holds events."""
+        return bool(self._lanes[lane])
+
+    def depths(self) -> dict[EventLane, int]:
+        """Get the number of events queued in each lane."""
+        return {lane: len(queue) for lane, queue in self._lanes.items()}
+
+    def append(self, lane: EventLane, item: Any) -> None:
+        """Add an item to the back of a lane."""
+        self._lanes[lane].append(item)
+        self._size += 1
+
+    def requeue(self, entries: list[tuple[EventLane, Any]]) -> None:
+        """Put taken entries back at the front of their lanes, in order."""
+        for lane, item in reversed(entries):
+            self._lanes[lane].appendleft(item)
+        self._size += len(entries)
+
+    def take(self, limit: int) -> list[tuple[EventLane, Any]]:
+        """
+        Remove up to ``limit`` items in weighted round-robin order.
+
+        Returns:
+            (lane, item) pairs in the order they should be processed
+        """
+        taken: list[tuple[EventLane, Any]] = []
+        lanes, weights, credits = self._lanes, self._weights, self._credits
+
+        while len(taken) < limit and self._size:
+            chosen = None
+            total = 0
+            for lane, queue in lanes.items():
+                if queue:
+                    credits[lane] += weights[lane]
+                    total += weights[lane]
+                    if chosen is None or credits[lane] > credits[chosen]:
+                        chosen = lane
+
+            credits[chosen] -= total
+            queue = lanes[chosen]
+            taken.append((chosen, queue.popleft()))
+            self._size -= 1
+            if not queue:
+                credits[chosen] = 0  # Don't carry credit into the next burst
+
+        return taken
+
+    def pop_lowest(self) -> Any:
+        """Remove the oldest item of the lowest-priority non-empty lane."""
+        for queue in reversed(self._lanes.values()):
+            if queue:
+                self._size -= 1
+                return queue.popleft()
+        raise IndexError("pop from an empty LaneQueue")
+
+    def clear(self) -> int:
+        """
+        Remove every item.
+
+        Returns:
+            Number of items removed
+        """
+        count = self._size
+        for lane, queue in self._lanes.items():
+            queue.clear()
+            self._credits[lane] = 0
+        self._size = 0
+        return count
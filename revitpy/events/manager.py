@@ -13,6 +13,7 @@ from typing import Any, Optional
 
 from loguru import logger
 
+from .discovery import HANDLER_MANIFEST_NAME, HandlerManifest
 from .dispatcher import EventDispatcher, EventDispatchResult
 from .filters import EventFilter
 from .handlers import (
@@ -50,8 +51,13 @@ class EventManager:
             return
 
         self._dispatcher = EventDispatcher()
+        # Every dispatch path loads lazily discovered handlers first
+        self._dispatcher.handler_loader = self._ensure_handlers_loaded
         self._registered_modules: set[str] = set()
         self._auto_discovery_paths: list[Path] = []
+        # Discovered modules not imported yet, keyed by the event types they handle
+        self._lazy_modules: dict[EventType, list[tuple[str, Path]]] = {}
+        self._lazy_lock = threading.RLock()
         self._event_listeners: dict[EventType, list[Callable]] = defaultdict(list)
         self._is_running = False
 
@@ -84,6 +90,9 @@ class EventManager:
             "handler_stats": self._dispatcher.get_handler_stats(),
             "registered_modules": list(self._registered_modules),
             "auto_discovery_paths": [str(p) for p in self._auto_discovery_paths],
+            "pending_lazy_modules": sorted(
+                {name for modules in self._lazy_modules.values() for name, _ in modules}
+            ),
             "event_listeners_count": {
                 event_type.value: len(listeners)
                 for event_type, listeners in self._event_listeners.items()
@@ -322,12 +331,23 @@ class EventManager:
             self._auto_discovery_paths.append(path)
             logger.debug(f"Added discovery path: {path}")
 
-    def discover_handlers(self, paths: list[Path] | None = None) -> int:
+    def discover_handlers(
+        self, paths: list[Path] | None = None, lazy: bool = True
+    ) -> int:
         """
         Discover and register event handlers from specified paths.
 
+        Sources are scanned statically for handler decorators and the results
+        cached in a manifest (``.revitpy_handlers.json``) in each path, so
+        unchanged files are not re-read. With ``lazy`` enabled, a module is
+        only imported when an event type one of its handlers handles is first
+        dispatched; modules whose event types cannot be determined statically
+        are imported immediately. Modules without decorated handlers are not
+        imported at all unless ``lazy`` is disabled.
+
         Args:
             paths: Paths to scan (uses registered discovery paths if None)
+            lazy: Whether to defer importing modules until they are needed
 
         Returns:
             Number of handlers discovered
@@ -337,7 +357,7 @@ class EventManager:
 
         for path in scan_paths:
             try:
-                discovered = self._discover_handlers_in_path(path)
+                discovered = self._discover_handlers_in_path(path, lazy)
                 total_discovered += discovered
                 logger.debug(f"Discovered {discovered} handlers in {path}")
             except Exception as e:
@@ -346,12 +366,14 @@ class EventManager:
         logger.info(f"Discovery complete: {total_discovered} handlers found")
         return total_discovered
 
-    def _discover_handlers_in_path(self, path: Path) -> int:
+    def _discover_handlers_in_path(self, path: Path, lazy: bool = True) -> int:
         """Discover handlers in a specific path."""
         if not path.exists() or not path.is_dir():
             return 0
 
         discovered_count = 0
+        manifest = HandlerManifest.load(path / HANDLER_MANIFEST_NAME)
+        seen: set[str] = set()
 
         # Walk through Python files
         for py_file in path.rglob("*.py"):
@@ -367,27 +389,66 @@ class EventManager:
                     .replace("\\", ".")
                 )
 
+                seen.add(relative_path.as_posix())
+                entry = manifest.scan(relative_path.as_posix(), py_file, module_name)
+
                 if module_name in self._registered_modules:
                     continue  # Already processed
 
-                # Import module
-                spec = importlib.util.spec_from_file_location(module_name, py_file)
-                if spec is None or spec.loader is None:
-                    continue
-
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-
-                # Scan for decorated functions and classes
-                discovered_count += self._scan_module_for_handlers(module)
-
-                self._registered_modules.add(module_name)
+                if not lazy:
+                    discovered_count += self._load_handler_module(module_name, py_file)
+                elif not entry.handlers:
+                    continue  # Nothing to register
+                elif entry.is_lazy_loadable:
+                    with self._lazy_lock:
+                        for event_type in entry.event_types():
+                            modules = self._lazy_modules.setdefault(event_type, [])
+                            if (module_name, py_file) not in modules:
+                                modules.append((module_name, py_file))
+                    discovered_count += len(entry.handlers)
+                else:
+                    discovered_count += self._load_handler_module(module_name, py_file)
 
             except Exception as e:
                 logger.warning(f"Failed to process module {py_file}: {e}")
 
+        manifest.retain(seen)
+        manifest.save()
+
         return discovered_count
 
+    def _load_handler_module(self, module_name: str, py_file: Path) -> int:
+        """Import a discovered module and register its handlers."""
+        if module_name in self._registered_modules:
+            return 0
+
+        spec = importlib.util.spec_from_file_location(module_name, py_file)
+        if spec is None or spec.loader is None:
+            return 0
+
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        self._registered_modules.add(module_name)
+
+        # Scan for decorated functions and classes
+        return self._scan_module_for_handlers(module)
+
+    def _ensure_handlers_loaded(self, event_type: EventType) -> None:
+        """Import lazily discovered modules that handle an event type."""
+        if event_type not in self._lazy_modules:
+            return
+
+        with self._lazy_lock:
+            pending = self._lazy_modules.pop(event_type, [])
+            for module_name, py_file in pending:
+                try:
+                    count = self._load_handler_module(module_name, py_file)
+                    logger.debug(
+                        f"Loaded {count} handlers from {module_name} for {event_type.value}"
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to process module {py_file}: {e}")
+
     def _scan_module_for_handlers(self, module: Any) -> int:
         """Scan a module for event handlers."""
         discovered_count = 0
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
+import heapq
 import itertools
 import json
 from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
@@ -26,6 +27,15 @@ from loguru import logger
 if TYPE_CHECKING:
     from ..api.element import Element
 
+from ..api.spatial import (
+    BoundingBox,
+    SpatialIndex,
+    bounding_box_of,
+    confirm_spatial,
+    nearest_elements,
+    search_index,
+    spatial_test,
+)
 from .cache import CacheManager
 from .exceptions import QueryError
 from .types import (
@@ -249,6 +259,15 @@ class LazyQueryExecutor(Generic[T]):
             key_selector = details
             return self._distinct_generator(elements, key_selector)
 
+        elif operation == "spatial":
+            kind, argument = details
+            return self._spatial_generator(elements, kind, argument)
+
+        elif operation == "nearest":
+            # Like order_by, ranking by distance must see every element.
+            point, count = details
+            return self._nearest_elements(elements, point, count)
+
         else:
             logger.warning(f"Unknown query operation: {operation}")
             return elements
@@ -277,6 +296,49 @@ class LazyQueryExecutor(Generic[T]):
                     seen.add(key)
                     yield elem
 
+    def _spatial_index(self) -> SpatialIndex | None:
+        """Get the provider's spatial index, if it maintains one."""
+        index = getattr(self._provider, "spatial_index", None)
+        return index if isinstance(index, SpatialIndex) else None
+
+    def _spatial_generator(
+        self, elements: Iterable[T], kind: str, argument: Any
+    ) -> Iterator[T]:
+        """Yield elements satisfying a spatial predicate.
+
+        Uses the provider's spatial index when available, confirming its
+        candidates against live bounding boxes; otherwise each element's
+        bounding box is tested.
+        """
+        test = spatial_test(kind, argument)
+        index = self._spatial_index()
+        if index is not None:
+            keys = search_index(index, kind, argument)
+            return (
+                elem for elem in elements if confirm_spatial(elem, index, keys, (test,))
+            )
+
+        return (
+            elem
+            for elem in elements
+            if (box := bounding_box_of(elem)) is not None and test(box)
+        )
+
+    def _nearest_elements(
+        self, elements: Iterable[T], point: Any, count: int
+    ) -> list[T]:
+        """Return the ``count`` elements closest to ``point``, nearest first."""
+        index = self._spatial_index()
+        if index is not None:
+            return nearest_elements(index, elements, point, count)
+
+        ranked = (
+            (box.distance_to_point(point), position, elem)
+            for position, elem in enumerate(elements)
+            if (box := bounding_box_of(elem)) is not None
+        )
+        return [elem for _, _, elem in heapq.nsmallest(count, ranked)]
+
 
 class QueryBuilder(Generic[T], IQueryable[T], IAsyncQueryable[T]):
     """
@@ -361,6 +423,35 @@ class QueryBuilder(Generic[T], IQueryable[T], IAsyncQueryable[T]):
         new_builder._query_plan.add_operation("distinct", key_selector, cost=2.5)
         return new_builder
 
+    def intersects(self, box: BoundingBox) -> QueryBuilder[T]:
+        """Filter elements whose bounding box overlaps ``box``."""
+        new_builder = self._clone()
+        new_builder._query_plan.add_operation("spatial", ("intersects", box), cost=0.5)
+        return new_builder
+
+    def within(self, box: BoundingBox) -> QueryBuilder[T]:
+        """Filter elements whose bounding box lies entirely inside ``box``."""
+        new_builder = self._clone()
+        new_builder._query_plan.add_operation("spatial", ("within", box), cost=0.5)
+        return new_builder
+
+    def contains_point(self, point: Any) -> QueryBuilder[T]:
+        """Filter elements whose bounding box contains ``point``."""
+        new_builder = self._clone()
+        new_builder._query_plan.add_operation(
+            "spatial", ("contains_point", point), cost=0.5
+        )
+        return new_builder
+
+    def nearest(self, point: Any, count: int = 1) -> QueryBuilder[T]:
+        """Keep the ``count`` elements closest to ``point``, nearest first."""
+        if count <= 0:
+            raise ValueError("Nearest count must be positive")
+
+        new_builder = self._clone()
+        new_builder._query_plan.add_operation("nearest", (point, count), cost=1.0)
+        return new_builder
+
     # Terminal operations (synchronous)
 
     def first(self, predicate: QueryPredicate[T] | None = None) -> T:
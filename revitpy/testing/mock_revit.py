@@ -41,6 +41,42 @@ class MockParameter:
         return self.AsString()
 
 
+class MockXYZ:
+    """Mock Revit XYZ point."""
+
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0) -> None:
+        self.X = x
+        self.Y = y
+        self.Z = z
+
+    def __repr__(self) -> str:
+        return f"<MockXYZ ({self.X}, {self.Y}, {self.Z})>"
+
+
+class MockBoundingBoxXYZ:
+    """Mock Revit axis-aligned bounding box."""
+
+    def __init__(self, minimum: MockXYZ, maximum: MockXYZ) -> None:
+        self.Min = minimum
+        self.Max = maximum
+
+    @classmethod
+    def from_tuples(
+        cls,
+        minimum: tuple[float, float, float],
+        maximum: tuple[float, float, float],
+    ) -> "MockBoundingBoxXYZ":
+        """Create a bounding box from two coordinate tuples."""
+        return cls(MockXYZ(*minimum), MockXYZ(*maximum))
+
+    def to_tuples(self) -> list[list[float]]:
+        """Convert the bounding box to nested coordinate lists."""
+        return [
+            [self.Min.X, self.Min.Y, self.Min.Z],
+            [self.Max.X, self.Max.Y, self.Max.Z],
+        ]
+
+
 class MockElementId:
     """Mock Revit element ID."""
 
@@ -68,11 +104,13 @@ class MockElement:
         name: str = "MockElement",
         category: str = "Generic",
         element_type: str = "Element",
+        bounding_box: MockBoundingBoxXYZ | None = None,
     ) -> None:
         self.Id = MockElementId(element_id or self._generate_id())
         self.Name = name
         self.Category = category
         self.ElementType = element_type
+        self.BoundingBox = bounding_box
         self._parameters: dict[str, MockParameter] = {}
         self._properties: dict[str, Any] = {}
 
@@ -108,6 +146,10 @@ class MockElement:
             # Create new parameter
             self._parameters[parameter_name] = MockParameter(parameter_name, value)
 
+    def get_BoundingBox(self, view: Any = None) -> MockBoundingBoxXYZ | None:
+        """Get the element bounding box (the view is ignored)."""
+        return self.BoundingBox
+
     def GetParameter(self, parameter_name: str) -> MockParameter | None:
         """Get parameter object."""
         return self._parameters.get(parameter_name)
@@ -144,6 +186,7 @@ class MockElement:
                 for name, param in self._parameters.items()
             },
             "properties": self._properties.copy(),
+            "bounding_box": self.BoundingBox.to_tuples() if self.BoundingBox else None,
         }
 
     @classmethod
@@ -156,6 +199,9 @@ class MockElement:
             element_type=data["element_type"],
         )
 
+        if data.get("bounding_box"):
+            element.BoundingBox = MockBoundingBoxXYZ.from_tuples(*data["bounding_box"])
+
         # Set parameters
         for name, param_data in data.get("parameters", {}).items():
             element.SetParameterValue(name, param_data["value"])
@@ -408,10 +454,15 @@ class MockRevit:
         category: str = "Generic",
         element_type: str = "Element",
         parameters: dict[str, Any] | None = None,
+        bounding_box: tuple[tuple[float, float, float], tuple[float, float, float]]
+        | None = None,
     ) -> MockElement:
-        """Create a test element."""
+        """Create a test element, optionally with a ``(min, max)`` bounding box."""
         element = MockElement(name=name, category=category, element_type=element_type)
 
+        if bounding_box:
+            element.BoundingBox = MockBoundingBoxXYZ.from_tuples(*bounding_box)
+
         if parameters:
             for param_name, value in parameters.items():
                 element.SetParameterValue(param_name, value)
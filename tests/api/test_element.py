@@ -0,0 +1,203 @@
+"""
+Tests for element change tracking and incremental saving.
+"""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from revitpy.api.element import Element, ElementSet, save_elements
+from revitpy.api.exceptions import TransactionError
+from revitpy.api.wrapper import RevitDocumentProvider
+from revitpy.async_support.context_managers import async_element_scope
+from revitpy.testing import MockDocument
+
+
+@pytest.fixture
+def document() -> MockDocument:
+    """Provide a mock document with a few elements."""
+    doc = MockDocument()
+    for i in range(3):
+        doc.CreateElement(name=f"Wall_{i}")
+    return doc
+
+
+@pytest.fixture
+def provider(document) -> RevitDocumentProvider:
+    """Provide a document provider for the mock document."""
+    return RevitDocumentProvider(document)
+
+
+@pytest.fixture
+def elements(provider) -> list[Element]:
+    """Provide wrapped elements of the mock document."""
+    return provider.get_all_elements()
+
+
+class TestDirtyTracking:
+    """Tests for per-parameter dirty tracking."""
+
+    def test_changes_are_written_immediately_by_default(self, elements):
+        element = elements[0]
+        element.name = "Renamed"
+        element.set_parameter_value("Mark", "A1")
+
+        assert element.is_dirty
+        assert element.dirty_parameters == []
+        assert element._revit_element.GetParameter("Mark").value == "A1"
+        assert element._revit_element.GetParameter("Name").value == "Renamed"
+
+    def test_deferred_changes_are_staged_until_saved(self, elements):
+        element = elements[0]
+        with element.deferred_changes():
+            element.set_parameter_value("Mark", "A1")
+        element.set_parameter_value("Comments", "now")
+
+        assert element.dirty_parameters == ["Mark"]
+        assert element.get_parameter_value("Mark") == "A1"
+        assert element._revit_element.GetParameter("Mark").value == ""
+        assert element._revit_element.GetParameter("Comments").value == "now"
+
+    def test_reverting_value_clears_dirty_state(self, elements):
+        element = elements[0]
+        with element.deferred_changes():
+            element.set_parameter_value("Mark", "A1")
+            element.set_parameter_value("Mark", "")
+
+        assert not element.is_dirty
+        assert element.changes == {}
+
+    def test_repeated_changes_keep_original_value(self, elements):
+        element = elements[0]
+        element.set_parameter_value("Comments", "first")
+        element.set_parameter_value("Comments", "second")
+
+        assert element.changes["Comments"] == {"old": "", "new": "second"}
+
+    def test_untracked_change_is_written_immediately(self, elements):
+        element = elements[0]
+        element.set_parameter_value("Mark", "B2", track_changes=False)
+
+        assert not element.is_dirty
+        assert element._revit_element.GetParameter("Mark").value == "B2"
+
+    def test_deferred_revert_of_written_change_stays_pending(self, elements):
+        element = elements[0]
+        element.set_parameter_value("Mark", "A1")
+        with element.deferred_changes():
+            element.set_parameter_value("Mark", "")
+
+        assert element.dirty_parameters == ["Mark"]
+        assert element._revit_element.GetParameter("Mark").value == "A1"
+
+    def test_discard_changes_restores_value(self, elements):
+        element = elements[0]
+        with element.deferred_changes():
+            element.set_parameter_value("Mark", "A1")
+        element.discard_changes()
+
+        assert not element.is_dirty
+        assert element.get_parameter_value("Mark") == ""
+
+
+class TestSaveChanges:
+    """Tests for saving tracked changes."""
+
+    def test_save_changes_writes_only_dirty_parameters(self, elements, provider):
+        element = elements[0]
+        with element.deferred_changes():
+            element.set_parameter_value("Mark", "A1")
+        element.save_changes(provider)
+
+        assert not element.is_dirty
+        assert element._revit_element.GetParameter("Mark").value == "A1"
+        assert not provider.is_in_transaction()
+
+    def test_save_elements_groups_by_parameter(self, elements, provider):
+        calls: list[tuple[str, int]] = []
+        original = provider.set_parameter_values
+
+        def recording(parameter_name, updates):
+            calls.append((parameter_name, len(updates)))
+            original(parameter_name, updates)
+
+        provider.set_parameter_values = recording
+
+        for i, element in enumerate(elements):
+            with element.deferred_changes():
+                element.set_parameter_value("Mark", f"M{i}")
+        with elements[0].deferred_changes():
+            elements[0].set_parameter_value("Comments", "note")
+
+        saved = ElementSet(elements).save_changes(provider)
+
+        assert saved == 3
+        assert sorted(calls) == [("Comments", 1), ("Mark", 3)]
+        assert [e._revit_element.GetParameter("Mark").value for e in elements] == [
+            "M0",
+            "M1",
+            "M2",
+        ]
+
+    def test_failed_save_keeps_changes_pending(self, elements, provider):
+        def failing(parameter_name, updates):
+            raise RuntimeError("native failure")
+
+        provider.set_parameter_values = failing
+        with elements[0].deferred_changes():
+            elements[0].set_parameter_value("Mark", "A1")
+
+        with pytest.raises(TransactionError):
+            save_elements(elements, provider)
+
+        assert elements[0].is_dirty
+
+    def test_save_without_changes_is_noop(self, elements, provider):
+        assert save_elements(elements, provider) == 0
+
+    def test_saving_written_changes_needs_no_transaction(self, elements, provider):
+        elements[0].set_parameter_value("Mark", "A1")
+        provider.start_transaction = lambda name: pytest.fail("transaction started")
+
+        assert save_elements(elements, provider) == 1
+        assert not elements[0].is_dirty
+
+
+@pytest.mark.asyncio
+class TestAsyncElementScope:
+    """Tests for saving element changes from an async scope."""
+
+    async def test_scope_saves_in_one_transaction_on_calling_thread(
+        self, elements, provider
+    ):
+        threads: list[int] = []
+        transactions: list[bool] = []
+        original = provider.set_parameter_values
+
+        def recording(parameter_name, updates):
+            threads.append(threading.get_ident())
+            transactions.append(provider.is_in_transaction())
+            original(parameter_name, updates)
+
+        provider.set_parameter_values = recording
+
+        async with async_element_scope(elements, provider=provider) as scoped:
+            for i, element in enumerate(scoped):
+                element.set_parameter_value("Mark", f"M{i}")
+            assert elements[0]._revit_element.GetParameter("Mark").value == ""
+
+        assert threads == [threading.get_ident()]
+        assert transactions == [True]
+        assert not any(element.is_dirty for element in elements)
+        assert elements[2]._revit_element.GetParameter("Mark").value == "M2"
+
+    async def test_scope_error_drops_staged_changes(self, elements, provider):
+        with pytest.raises(RuntimeError):
+            async with async_element_scope(elements, provider=provider) as scoped:
+                scoped[0].set_parameter_value("Mark", "A1")
+                raise RuntimeError("boom")
+
+        assert not elements[0].is_dirty
+        assert elements[0]._revit_element.GetParameter("Mark").value == ""
@@ -0,0 +1,85 @@
+"""
+Tests for cursor-based paged element enumeration.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from revitpy.api.paging import ElementCursor
+from revitpy.api.wrapper import RevitDocumentProvider
+from revitpy.testing import MockDocument
+
+
+@pytest.fixture
+def document() -> MockDocument:
+    """Provide a mock document with ten elements."""
+    doc = MockDocument()
+    for i in range(10):
+        doc.CreateElement(name=f"Element_{i}")
+    return doc
+
+
+@pytest.fixture
+def provider(document) -> RevitDocumentProvider:
+    """Provide a document provider for the mock document."""
+    return RevitDocumentProvider(document)
+
+
+class TestElementCursor:
+    """Tests for ElementCursor tokens."""
+
+    def test_token_round_trip(self):
+        cursor = ElementCursor(offset=42, last_element_id=1042)
+        assert ElementCursor.from_token(cursor.to_token()) == cursor
+
+    def test_token_without_last_id(self):
+        assert ElementCursor.from_token("0:") == ElementCursor()
+
+    def test_invalid_token(self):
+        with pytest.raises(ValueError):
+            ElementCursor.from_token("abc")
+
+
+class TestElementPager:
+    """Tests for RevitDocumentProvider.page_elements."""
+
+    def test_pages_cover_all_elements(self, provider):
+        pages = list(provider.page_elements(page_size=4))
+
+        assert [len(page) for page in pages] == [4, 4, 2]
+        assert [page.has_more for page in pages] == [True, True, False]
+        names = [element.name for page in pages for element in page]
+        assert names == [f"Element_{i}" for i in range(10)]
+
+    def test_exact_multiple_has_no_empty_page(self, provider):
+        pages = list(provider.page_elements(page_size=5))
+        assert [len(page) for page in pages] == [5, 5]
+        assert pages[-1].has_more is False
+
+    def test_resume_from_token(self, provider):
+        pager = provider.page_elements(page_size=3)
+        first = next(pager)
+        token = pager.position_token
+
+        resumed = provider.page_elements(page_size=3, cursor=token)
+        names = [element.name for element in resumed.iter_elements()]
+
+        assert [element.name for element in first] == [
+            "Element_0",
+            "Element_1",
+            "Element_2",
+        ]
+        assert names == [f"Element_{i}" for i in range(3, 10)]
+
+    def test_cursor_tracks_last_element(self, provider, document):
+        pager = provider.page_elements(page_size=4)
+        page = next(pager)
+
+        assert page.cursor.offset == 4
+        assert page.cursor.last_element_id == page.elements[-1].id.value
+        assert pager.cursor == page.cursor
+
+    def test_invalid_page_size(self, provider):
+        with pytest.raises(ValueError):
+            provider.page_elements(page_size=0)
@@ -0,0 +1,141 @@
+"""
+Tests for the API-level LINQ-style QueryBuilder.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from revitpy.api.element import Element
+from revitpy.api.query import (
+    FilterCriteria,
+    FilterOperator,
+    Query,
+    SortDirection,
+)
+from revitpy.testing import MockElement
+
+
+def _make(element_id: int, name: str, mark: str, comments: str = "") -> Element:
+    mock = MockElement(element_id=element_id, name=name)
+    mock.SetParameterValue("Mark", mark)
+    mock.SetParameterValue("Comments", comments)
+    return Element(mock)
+
+
+@pytest.fixture
+def elements() -> list[Element]:
+    """Provide a small set of wrapped mock elements."""
+    return [
+        _make(1, "Wall-B", "2", "ext"),
+        _make(2, "Wall-A", "1", "int"),
+        _make(3, "Door-A", "3", "ext"),
+        _make(4, "Wall-C", "1", "ext"),
+        _make(5, "Door-B", "2", "int"),
+    ]
+
+
+class TestFilterCriteria:
+    """Tests for FilterCriteria compilation."""
+
+    def test_compiled_predicate_matches_apply(self, elements):
+        """compile() and apply() should agree for every operator."""
+        criteria = [
+            FilterCriteria("Name", FilterOperator.EQUALS, "Wall-A"),
+            FilterCriteria("Name", FilterOperator.STARTS_WITH, "wall", False),
+            FilterCriteria("Name", FilterOperator.CONTAINS, "A"),
+            FilterCriteria("Mark", FilterOperator.IN, ["1", "3"]),
+            FilterCriteria("Name", FilterOperator.REGEX, "^door", False),
+        ]
+        for item in criteria:
+            predicate = item.compile()
+            for element in elements:
+                assert predicate(element) == item.apply(element)
+
+    def test_invalid_regex_matches_nothing(self, elements):
+        """An invalid pattern should not raise."""
+        predicate = FilterCriteria("Name", FilterOperator.REGEX, "(").compile()
+        assert not any(predicate(element) for element in elements)
+
+    def test_missing_parameter_does_not_match(self, elements):
+        """Unreadable parameters should fail the predicate."""
+        predicate = FilterCriteria("Missing", FilterOperator.IS_NULL).compile()
+        assert not predicate(elements[0])
+
+
+class TestQueryExecution:
+    """Tests for QueryBuilder.execute."""
+
+    def test_filters_combine(self, elements):
+        """All filters must hold for an element to be returned."""
+        result = (
+            Query.from_elements(elements)
+            .starts_with("Name", "Wall")
+            .equals("Comments", "ext")
+            .to_list()
+        )
+        assert [e.id.value for e in result] == [1, 4]
+
+    def test_multi_key_sort_with_mixed_directions(self, elements):
+        """Each sort key should honour its own direction."""
+        result = (
+            Query.from_elements(elements)
+            .order_by("Comments", SortDirection.ASCENDING)
+            .order_by("Name", SortDirection.DESCENDING)
+            .to_list()
+        )
+        assert [e.name for e in result] == [
+            "Wall-C",
+            "Wall-B",
+            "Door-A",
+            "Wall-A",
+            "Door-B",
+        ]
+
+    def test_descending_string_sort_is_lexicographic(self, elements):
+        """Descending string sorts must not compare reversed strings."""
+        result = Query.from_elements(elements).order_by_descending("Name").to_list()
+        assert [e.name for e in result] == sorted(
+            (e.name for e in elements), reverse=True
+        )
+
+    def test_sort_is_stable(self, elements):
+        """Elements with equal keys keep their source order."""
+        result = Query.from_elements(elements).order_by_descending("Comments")
+        assert [e.id.value for e in result.to_list()] == [2, 5, 1, 3, 4]
+
+    def test_skip_and_take_with_sort(self, elements):
+        """skip/take apply after ordering."""
+        result = (
+            Query.from_elements(elements).order_by("Name").skip(1).take(2).to_list()
+        )
+        assert [e.name for e in result] == ["Door-B", "Wall-A"]
+
+    def test_take_stops_iteration_without_sort(self, elements):
+        """Unsorted queries should stop reading once take is satisfied."""
+        reads: list[int] = []
+
+        class TrackingElement(Element):
+            def get_parameter_value(self, parameter_name, use_cache=True):
+                reads.append(self.id.value)
+                return super().get_parameter_value(parameter_name, use_cache)
+
+        tracked = [TrackingElement(e._revit_element) for e in elements]
+        result = Query.from_elements(tracked).is_not_null("Name").take(2).to_list()
+
+        assert len(result) == 2
+        assert reads == [1, 2]
+
+    def test_distinct_applies_before_sort(self, elements):
+        """distinct keeps the first element in source order for each value."""
+        result = (
+            Query.from_elements(elements).distinct("Mark").order_by("Mark").to_list()
+        )
+        assert [e.id.value for e in result] == [2, 1, 3]
+
+    def test_any_and_first(self, elements):
+        """Terminal helpers should work with the single-pass pipeline."""
+        query = Query.from_elements(elements).contains("Name", "Door")
+        assert query.any()
+        assert query.first().id.value == 3
+        assert Query.from_elements(elements).equals("Name", "None").count() == 0
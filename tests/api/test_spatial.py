@@ -0,0 +1,235 @@
+"""
+Tests for the bounding box spatial index and spatial query predicates.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from revitpy.api.query import Query
+from revitpy.api.spatial import BoundingBox, SpatialIndex, as_point
+from revitpy.api.wrapper import RevitDocumentProvider
+from revitpy.events.types import ElementEventData, EventType
+from revitpy.testing import MockRevit
+from revitpy.testing.mock_revit import MockBoundingBoxXYZ
+
+
+def _random_boxes(count: int, seed: int = 7) -> dict[int, BoundingBox]:
+    rng = random.Random(seed)  # noqa: S311
+    boxes = {}
+    for key in range(count):
+        x, y, z = rng.uniform(0, 100), rng.uniform(0, 100), rng.uniform(0, 10)
+        boxes[key] = BoundingBox(
+            x, y, z, x + rng.uniform(0, 5), y + rng.uniform(0, 5), z + 1
+        )
+    return boxes
+
+
+@pytest.fixture
+def boxes() -> dict[int, BoundingBox]:
+    """Provide a deterministic set of random boxes."""
+    return _random_boxes(500)
+
+
+@pytest.fixture
+def index(boxes) -> SpatialIndex:
+    """Provide an STR bulk-loaded index over the random boxes."""
+    spatial_index = SpatialIndex(max_entries=8)
+    spatial_index.bulk_load(boxes.items())
+    return spatial_index
+
+
+class TestBoundingBox:
+    """Tests for BoundingBox geometry helpers."""
+
+    def test_invalid_box(self):
+        with pytest.raises(ValueError):
+            BoundingBox(1, 0, 0, 0, 1, 1)
+
+    def test_distance_to_point(self):
+        box = BoundingBox(0, 0, 0, 1, 1, 1)
+        assert box.distance_to_point((0.5, 0.5, 0.5)) == 0
+        assert box.distance_to_point((4, 1, 1)) == pytest.approx(3)
+
+    def test_as_point_accepts_2d(self):
+        assert as_point((1, 2)) == (1.0, 2.0, 0.0)
+
+
+class TestSpatialIndex:
+    """Tests for SpatialIndex queries and updates."""
+
+    def test_intersects_matches_brute_force(self, index, boxes):
+        query = BoundingBox(20, 20, 0, 40, 35, 10)
+        expected = {key for key, box in boxes.items() if box.intersects(query)}
+        assert set(index.intersects(query)) == expected
+
+    def test_within_matches_brute_force(self, index, boxes):
+        query = BoundingBox(10, 10, 0, 60, 60, 11)
+        expected = {key for key, box in boxes.items() if query.contains(box)}
+        assert set(index.within(query)) == expected
+
+    def test_containing_point(self, index, boxes):
+        point = (50, 50, 5)
+        expected = {key for key, box in boxes.items() if box.contains_point(point)}
+        assert set(index.containing(point)) == expected
+
+    def test_nearest_matches_brute_force(self, index, boxes):
+        point = (33, 66, 2)
+        distances = sorted(box.distance_to_point(point) for box in boxes.values())
+        result = index.nearest(point, count=5)
+        assert [boxes[key].distance_to_point(point) for key in result] == (
+            distances[:5]
+        )
+
+    def test_nearest_with_predicate(self, index, boxes):
+        result = index.nearest((0, 0, 0), count=3, predicate=lambda k: k % 2 == 0)
+        assert len(result) == 3
+        assert all(key % 2 == 0 for key in result)
+
+    def test_incremental_insert_and_remove(self, boxes):
+        spatial_index = SpatialIndex(max_entries=4)
+        for key, box in boxes.items():
+            spatial_index.insert(key, box)
+
+        for key in range(0, 500, 3):
+            assert spatial_index.remove(key)
+        assert not spatial_index.remove(0)
+
+        remaining = {k: b for k, b in boxes.items() if k % 3 != 0}
+        query = BoundingBox(0, 0, 0, 50, 50, 10)
+        expected = {key for key, box in remaining.items() if box.intersects(query)}
+
+        assert len(spatial_index) == len(remaining)
+        assert set(spatial_index.intersects(query)) == expected
+
+    def test_update_moves_entry(self, index):
+        far = BoundingBox(1000, 1000, 0, 1001, 1001, 1)
+        index.update(0, far)
+
+        assert index.intersects(far) == [0]
+        assert index.get_box(0) == far
+
+        index.update(0, None)
+        assert 0 not in index
+
+    def test_remove_all_entries(self, boxes):
+        spatial_index = SpatialIndex()
+        spatial_index.bulk_load(list(boxes.items())[:20])
+        for key in list(boxes)[:20]:
+            spatial_index.remove(key)
+
+        assert len(spatial_index) == 0
+        assert spatial_index.bounds is None
+        assert spatial_index.nearest((0, 0, 0)) == []
+
+
+@pytest.fixture
+def mock_revit() -> MockRevit:
+    """Provide a mock Revit environment with a row of columns."""
+    revit = MockRevit()
+    revit.create_document()
+    for i in range(10):
+        revit.create_element(
+            name=f"Column_{i}",
+            category="Columns",
+            bounding_box=((i * 10, 0, 0), (i * 10 + 1, 1, 3)),
+        )
+    revit.create_element(name="Untracked")
+    return revit
+
+
+class TestSpatialQueries:
+    """Tests for spatial predicates on the API query builder."""
+
+    @pytest.mark.parametrize("use_index", [True, False])
+    def test_intersects(self, mock_revit, use_index):
+        provider = RevitDocumentProvider(mock_revit.active_document)
+        source = (
+            Query.from_provider(provider)
+            if use_index
+            else Query.from_elements(provider.get_all_elements())
+        )
+
+        result = source.intersects(BoundingBox(15, 0, 0, 35, 1, 1)).to_list()
+        assert sorted(e.name for e in result) == ["Column_2", "Column_3"]
+
+    @pytest.mark.parametrize("use_index", [True, False])
+    def test_nearest(self, mock_revit, use_index):
+        provider = RevitDocumentProvider(mock_revit.active_document)
+        source = (
+            Query.from_provider(provider)
+            if use_index
+            else Query.from_elements(provider.get_all_elements())
+        )
+
+        result = source.not_equals("Name", "Column_4").nearest((42, 0, 0), 2)
+        assert [e.name for e in result.to_list()] == ["Column_5", "Column_3"]
+
+    def test_contains_point_and_within(self, mock_revit):
+        provider = RevitDocumentProvider(mock_revit.active_document)
+
+        inside = Query.from_provider(provider).contains_point((70.5, 0.5, 1))
+        within = Query.from_provider(provider).within(BoundingBox(0, 0, 0, 25, 5, 5))
+
+        assert [e.name for e in inside.to_list()] == ["Column_7"]
+        assert sorted(e.name for e in within.to_list()) == [
+            "Column_0",
+            "Column_1",
+            "Column_2",
+        ]
+
+    def test_provider_index_tracks_changes(self, mock_revit):
+        document = mock_revit.active_document
+        provider = RevitDocumentProvider(document)
+        assert len(provider.spatial_index) == 10
+
+        moved = document.GetElementsByCategory("Columns")[0]
+        moved.BoundingBox = None
+        provider.update_spatial_index(moved)
+        provider.delete_elements([document.GetElementsByCategory("Columns")[1].Id])
+
+        assert len(provider.spatial_index) == 8
+
+    def test_query_handles_moves_and_additions(self, mock_revit):
+        document = mock_revit.active_document
+        provider = RevitDocumentProvider(document)
+        box = BoundingBox(15, 0, 0, 35, 1, 1)
+        assert len(Query.from_provider(provider).intersects(box).to_list()) == 2
+
+        columns = document.GetElementsByCategory("Columns")
+        columns[2].BoundingBox = MockBoundingBoxXYZ.from_tuples((90, 5, 0), (91, 6, 3))
+        mock_revit.create_element(name="Added", bounding_box=((16, 0, 0), (17, 1, 3)))
+
+        result = Query.from_provider(provider).intersects(box).to_list()
+        nearest = Query.from_provider(provider).nearest((90, 5, 0), 1).to_list()
+
+        assert sorted(e.name for e in result) == ["Added", "Column_3"]
+        assert [e.name for e in nearest] == ["Column_2"]
+
+    def test_element_moved_into_box_is_found_after_notification(self, mock_revit):
+        document = mock_revit.active_document
+        provider = RevitDocumentProvider(document)
+        box = BoundingBox(15, 0, 0, 35, 1, 1)
+        assert len(Query.from_provider(provider).intersects(box).to_list()) == 2
+
+        columns = document.GetElementsByCategory("Columns")
+        columns[8].BoundingBox = MockBoundingBoxXYZ.from_tuples((20, 0, 0), (21, 1, 3))
+        provider.handle_element_event(
+            ElementEventData(
+                event_type=EventType.ELEMENT_MODIFIED, element_id=columns[8].Id
+            )
+        )
+        columns[9].BoundingBox = MockBoundingBoxXYZ.from_tuples((30, 0, 0), (31, 1, 3))
+        wrapped = provider.get_element_by_id(columns[9].Id.IntegerValue)
+        wrapped.set_parameter_value("Comments", "moved")
+
+        result = Query.from_provider(provider).intersects(box).to_list()
+
+        assert sorted(e.name for e in result) == [
+            "Column_2",
+            "Column_3",
+            "Column_8",
+            "Column_9",
+        ]
@@ -0,0 +1,189 @@
+"""
+Tests for transaction coalescing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from revitpy.api.exceptions import TransactionError
+from revitpy.api.transaction import (
+    CoalescingTransaction,
+    ErrorIsolation,
+    ITransactionProvider,
+    coalescing_scope,
+)
+
+
+class RecordingProvider(ITransactionProvider):
+    """Transaction provider that records commits and rollbacks."""
+
+    def __init__(self) -> None:
+        self.started: list[str] = []
+        self.committed = 0
+        self.rolled_back = 0
+        self._active: list[str] = []
+
+    def start_transaction(self, name: str) -> str:
+        self.started.append(name)
+        self._active.append(name)
+        return name
+
+    def commit_transaction(self, transaction: str) -> bool:
+        self._active.remove(transaction)
+        self.committed += 1
+        return True
+
+    def rollback_transaction(self, transaction: str) -> bool:
+        self._active.remove(transaction)
+        self.rolled_back += 1
+        return True
+
+    def is_in_transaction(self) -> bool:
+        return bool(self._active)
+
+
+@pytest.fixture
+def provider() -> RecordingProvider:
+    """Provide a recording transaction provider."""
+    return RecordingProvider()
+
+
+class TestCoalescingTransaction:
+    """Tests for CoalescingTransaction."""
+
+    def test_writes_are_merged_by_count(self, provider):
+        """Writes should be committed in batches of max_operations."""
+        applied: list[int] = []
+
+        with coalescing_scope(provider, max_operations=4) as coalescer:
+            for i in range(10):
+                coalescer.add(lambda i=i: applied.append(i))
+
+        assert applied == list(range(10))
+        assert coalescer.flush_count == 3
+        assert coalescer.committed_count == 10
+        assert provider.committed == 3
+
+    def test_time_window_triggers_flush(self, provider):
+        """An expired time window should flush on the next write."""
+        coalescer = CoalescingTransaction(provider, max_operations=1000, max_delay=0.01)
+        coalescer.add(lambda: None)
+        time.sleep(0.02)
+        coalescer.add(lambda: None)
+
+        assert coalescer.pending_count == 0
+        assert coalescer.flush_count == 1
+
+    def test_idle_window_flushes_when_polled(self, provider):
+        """An expired window should flush without another write."""
+        coalescer = CoalescingTransaction(provider, max_operations=1000, max_delay=0.01)
+        coalescer.add(lambda: None)
+
+        assert not coalescer.flush_if_due()
+        time.sleep(0.02)
+
+        assert coalescer.flush_if_due()
+        assert coalescer.committed_count == 1
+
+    @pytest.mark.asyncio
+    async def test_idle_window_flushes_on_timer(self, provider):
+        """An idle window should flush on the event loop without polling."""
+        applied: list[int] = []
+
+        async with CoalescingTransaction(
+            provider, max_operations=1000, max_delay=0.01
+        ) as coalescer:
+            coalescer.add(lambda: applied.append(1))
+            await asyncio.sleep(0.05)
+
+            assert applied == [1]
+            assert coalescer.pending_count == 0
+            assert provider.committed == 1
+
+    @pytest.mark.asyncio
+    async def test_timer_flush_error_reaches_writer(self, provider):
+        """A failed timer flush should be raised on the next call."""
+
+        def fail() -> None:
+            raise ValueError("bad write")
+
+        coalescer = CoalescingTransaction(provider, max_operations=1000, max_delay=0.01)
+        coalescer.add(fail)
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(TransactionError):
+            coalescer.add(lambda: None)
+
+    def test_exception_in_scope_discards_pending(self, provider):
+        """Pending writes should not be applied if the scope fails."""
+        applied: list[int] = []
+
+        with pytest.raises(RuntimeError):
+            with coalescing_scope(provider, max_operations=100) as coalescer:
+                coalescer.add(lambda: applied.append(1))
+                raise RuntimeError("boom")
+
+        assert applied == []
+        assert provider.started == []
+
+    def test_all_or_nothing_raises(self, provider):
+        """A failing write should fail the whole batch by default."""
+
+        def fail() -> None:
+            raise ValueError("bad write")
+
+        coalescer = CoalescingTransaction(provider, max_operations=100)
+        coalescer.add(lambda: None)
+        coalescer.add(fail)
+
+        with pytest.raises(TransactionError):
+            coalescer.flush()
+
+        assert provider.committed == 0
+
+    def test_bisect_isolates_failing_write(self, provider):
+        """Bisecting should commit every write except the failing one."""
+        committed: set[int] = set()
+        pending: list[int] = []
+
+        def make(i: int):
+            def write() -> None:
+                if i == 5:
+                    raise ValueError("bad write")
+                pending.append(i)
+
+            return write
+
+        provider_commit = provider.commit_transaction
+
+        def commit(transaction: str) -> bool:
+            committed.update(pending)
+            pending.clear()
+            return provider_commit(transaction)
+
+        def rollback(transaction: str) -> bool:
+            pending.clear()
+            return True
+
+        provider.commit_transaction = commit
+        provider.rollback_transaction = rollback
+
+        coalescer = CoalescingTransaction(
+            provider, max_operations=100, isolation=ErrorIsolation.BISECT
+        )
+        for i in range(8):
+            coalescer.add(make(i))
+        coalescer.flush()
+
+        assert committed == {0, 1, 2, 3, 4, 6, 7}
+        assert len(coalescer.failed_writes) == 1
+        assert isinstance(coalescer.failed_writes[0].error, ValueError)
+
+    def test_invalid_max_operations(self, provider):
+        """max_operations must be positive."""
+        with pytest.raises(ValueError):
+            CoalescingTransaction(provider, max_operations=0)
@@ -0,0 +1,225 @@
+"""
+Tests for adaptive batch scheduling.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from datetime import timedelta
+
+import pytest
+
+from revitpy.async_support.async_revit import AsyncRevit
+from revitpy.async_support.batching import (
+    AdaptiveBatchSizer,
+    call_batch,
+    process_in_batches,
+)
+from revitpy.async_support.cancellation import CancellationTokenSource
+from revitpy.async_support.context_managers import (
+    BatchOperationManager,
+    async_batch_operations,
+)
+
+
+def double(value: int) -> int:
+    """Double a value, rejecting negatives."""
+    if value < 0:
+        raise ValueError(value)
+    return value * 2
+
+
+class TestAdaptiveBatchSizer:
+    """Tests for latency-driven batch sizing."""
+
+    def test_grows_when_batches_are_fast(self):
+        sizer = AdaptiveBatchSizer(10, target_latency=timedelta(milliseconds=100))
+
+        sizer.record(10, 0.001)
+        sizer.record(20, 0.002)
+
+        assert sizer.batch_size == 40
+
+    def test_converges_on_target(self):
+        sizer = AdaptiveBatchSizer(1000, target_latency=timedelta(milliseconds=100))
+
+        for _ in range(20):
+            sizer.record(sizer.batch_size, sizer.batch_size * 0.001)
+
+        assert sizer.batch_size == 100
+        assert sizer.item_latency == pytest.approx(0.001)
+
+    def test_respects_bounds_and_fixed_size(self):
+        sizer = AdaptiveBatchSizer(4, min_size=2, max_size=8)
+        sizer.record(4, 0.0)
+        sizer.record(8, 0.0)
+        assert sizer.batch_size == 8
+
+        fixed = AdaptiveBatchSizer.fixed(5)
+        fixed.record(5, 10.0)
+        assert fixed.batch_size == 5
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            AdaptiveBatchSizer(min_size=0)
+        with pytest.raises(ValueError):
+            AdaptiveBatchSizer(target_latency=timedelta(0))
+
+
+@pytest.mark.asyncio
+class TestProcessInBatches:
+    """Tests for the worker-based batch scheduler."""
+
+    async def test_keeps_order_and_captures_errors(self):
+        results = await process_in_batches(
+            [1, -1, 3], double, sizer=AdaptiveBatchSizer.fixed(2)
+        )
+
+        assert results[0] == 2
+        assert isinstance(results[1], ValueError)
+        assert results[2] == 6
+
+    async def test_sync_batch_uses_one_executor_call(self):
+        threads: set[int] = set()
+
+        def record(value: int) -> int:
+            threads.add(threading.get_ident())
+            return value
+
+        assert await call_batch(record, list(range(50))) == list(range(50))
+        assert len(threads) == 1
+
+    async def test_in_flight_window_is_bounded(self):
+        running = 0
+        peak = 0
+
+        async def track(value: int) -> int:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return value
+
+        results = await process_in_batches(
+            list(range(100)), track, sizer=AdaptiveBatchSizer.fixed(5), max_in_flight=3
+        )
+
+        assert results == list(range(100))
+        assert peak == 15
+
+    async def test_async_items_run_concurrently(self):
+        async def fetch(value: int) -> int:
+            await asyncio.sleep(0.05)
+            return value
+
+        began = time.perf_counter()
+        results = await process_in_batches(
+            list(range(200)), fetch, sizer=AdaptiveBatchSizer.fixed(50), max_in_flight=2
+        )
+
+        # Sequential awaits within each batch would take 5 seconds
+        assert results == list(range(200))
+        assert time.perf_counter() - began < 1.0
+
+    async def test_cancellation_stops_new_batches(self):
+        source = CancellationTokenSource()
+        batches = 0
+
+        async def on_batch(count: int) -> None:
+            nonlocal batches
+            batches += 1
+            source.cancel()
+
+        results = await process_in_batches(
+            list(range(100)),
+            double,
+            sizer=AdaptiveBatchSizer.fixed(10),
+            max_in_flight=1,
+            on_batch=on_batch,
+            cancellation_token=source.token,
+        )
+
+        assert batches == 1
+        assert results == [value * 2 for value in range(10)]
+
+    async def test_batch_process_adapts(self):
+        revit = AsyncRevit()
+        results = await revit.batch_process(
+            list(range(2000)),
+            double,
+            batch_size=10,
+            target_batch_latency=timedelta(milliseconds=50),
+        )
+
+        assert results == [value * 2 for value in range(2000)]
+
+
+@pytest.mark.asyncio
+class TestBatchOperationManager:
+    """Tests for the queued batch operation manager."""
+
+    async def test_executes_all_operations(self):
+        done: list[int] = []
+
+        async def async_op() -> None:
+            done.append(1)
+
+        async with async_batch_operations(batch_size=4, max_in_flight=2) as batch:
+            for n in range(10):
+                await batch.add_operation(lambda n=n: done.append(n))
+                await batch.add_operation(async_op)
+
+        assert len(done) == 20
+        assert batch.executed_count == 20
+
+    async def test_add_operation_applies_backpressure(self):
+        release = threading.Event()
+        manager = BatchOperationManager(batch_size=2, max_in_flight=1, adaptive=False)
+
+        await manager.add_operation(lambda: release.wait(1.0))
+        await asyncio.sleep(0.01)  # The worker picks up the first operation
+        await manager.add_operation(lambda: None)
+        await manager.add_operation(lambda: None)
+        blocked = asyncio.create_task(manager.add_operation(lambda: None))
+        await asyncio.sleep(0.01)
+
+        assert not blocked.done()
+        release.set()
+        await asyncio.wait_for(blocked, timeout=1.0)
+        await manager.execute_remaining()
+        await manager.close()
+
+        assert manager.executed_count == 4
+
+    async def test_async_operations_in_a_batch_run_concurrently(self):
+        running = 0
+        peak = 0
+
+        async def async_op() -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+
+        began = time.perf_counter()
+        async with async_batch_operations(batch_size=100, max_in_flight=2) as batch:
+            for _ in range(100):
+                await batch.add_operation(async_op)
+
+        assert batch.executed_count == 100
+        assert peak > 2
+        assert time.perf_counter() - began < 1.0
+
+    async def test_failures_are_counted(self):
+        def broken() -> None:
+            raise RuntimeError("boom")
+
+        async with async_batch_operations(batch_size=2) as batch:
+            await batch.add_operation(broken)
+            await batch.add_operation(lambda: time.sleep(0))
+
+        assert batch.failed_count == 1
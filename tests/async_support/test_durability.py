@@ -0,0 +1,235 @@
+"""
+Tests for durable task queues.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+
+import pytest
+
+from revitpy.async_support.durability import TaskStore
+from revitpy.async_support.task_queue import (
+    Task,
+    TaskPriority,
+    TaskQueue,
+    TaskStatus,
+)
+
+# Values passed to record(), across queues in one test
+RUNS: list[int] = []
+
+
+@pytest.fixture(autouse=True)
+def clear_runs():
+    """Reset the run log."""
+    RUNS.clear()
+    yield
+    RUNS.clear()
+
+
+def record(value: int) -> int:
+    """Log a run and return twice the value."""
+    RUNS.append(value)
+    return value * 2
+
+
+def fail_once(value: int) -> int:
+    """Fail on the first run of a value."""
+    RUNS.append(value)
+    if RUNS.count(value) == 1:
+        raise ValueError("first attempt")
+    return value
+
+
+def unpicklable(value: int) -> threading.Lock:
+    """Log a run and return a value that cannot be pickled."""
+    RUNS.append(value)
+    return threading.Lock()
+
+
+async def sleeper(value: int, delay: float) -> int:
+    """Return a value after a delay."""
+    await asyncio.sleep(delay)
+    return value
+
+
+class TestTaskStore:
+    """Tests for batched checkpoint writes."""
+
+    def test_writes_are_committed_in_batches(self, tmp_path):
+        path = tmp_path / "tasks.db"
+        store = TaskStore(path, batch_size=2)
+
+        def committed() -> int:
+            with sqlite3.connect(path) as connection:
+                return connection.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+        store.record_queued(Task(record, 1), b"payload")
+        assert store.pending_writes == 1
+        assert committed() == 0
+
+        store.record_queued(Task(record, 2), b"payload")
+        assert store.pending_writes == 0
+        assert committed() == 2
+
+        store.close()
+
+    def test_invalid_batch_size(self, tmp_path):
+        with pytest.raises(ValueError):
+            TaskStore(tmp_path / "tasks.db", batch_size=0)
+
+
+@pytest.mark.asyncio
+class TestDurableQueue:
+    """Tests for checkpoint and resume."""
+
+    async def test_unfinished_tasks_resume(self, tmp_path):
+        path = tmp_path / "tasks.db"
+        async with TaskQueue(max_concurrent_tasks=1, durable_path=path) as queue:
+            blocker = await queue.enqueue(
+                Task(sleeper, 0, 10.0, priority=TaskPriority.HIGH)
+            )
+            await asyncio.sleep(0.05)
+            waiting = [await queue.submit(record, n) for n in range(3)]
+
+        assert RUNS == []
+
+        async with TaskQueue(max_concurrent_tasks=2, durable_path=path) as queue:
+            assert queue.stats["total_resumed"] == 4
+            results = await queue.wait_for_all(waiting, timeout=2.0)
+
+            assert [result.result for result in results] == [0, 2, 4]
+            assert queue.get_task_status(blocker) == TaskStatus.RUNNING
+
+    async def test_finished_tasks_are_not_resumed(self, tmp_path):
+        path = tmp_path / "tasks.db"
+        async with TaskQueue(durable_path=path) as queue:
+            task_id = await queue.submit(record, 1)
+            await queue.wait_for_task(task_id, timeout=1.0)
+
+        async with TaskQueue(durable_path=path) as queue:
+            assert queue.stats["total_resumed"] == 0
+            assert queue.pending_count == 0
+
+        assert RUNS == [1]
+
+    async def test_resumed_task_gets_upstream_output(self, tmp_path):
+        path = tmp_path / "tasks.db"
+        async with TaskQueue(max_concurrent_tasks=1, durable_path=path) as queue:
+            upstream = Task(record, 3)
+            await queue.enqueue(upstream)
+            await queue.wait_for_task(upstream.id, timeout=1.0)
+            await queue.enqueue(Task(sleeper, 0, 10.0, priority=TaskPriority.HIGH))
+            await asyncio.sleep(0.05)
+            dependent = await queue.enqueue(Task(record, upstream.output()))
+
+        async with TaskQueue(max_concurrent_tasks=2, durable_path=path) as queue:
+            result = await queue.wait_for_task(dependent, timeout=2.0)
+
+        assert result.result == 12
+        assert RUNS == [3, 6]
+
+    async def test_idempotency_key_survives_restart(self, tmp_path):
+        path = tmp_path / "tasks.db"
+        async with TaskQueue(durable_path=path) as queue:
+            first = await queue.enqueue(Task(record, 5, idempotency_key="job-5"))
+            await queue.wait_for_task(first, timeout=1.0)
+
+        async with TaskQueue(durable_path=path) as queue:
+            second = await queue.enqueue(Task(record, 5, idempotency_key="job-5"))
+            result = await queue.wait_for_task(second, timeout=1.0)
+
+            assert second == first
+            assert result.result == 10
+            assert queue.stats["total_deduplicated"] == 1
+
+        assert RUNS == [5]
+
+    async def test_unpicklable_result_is_not_a_success(self, tmp_path):
+        path = tmp_path / "tasks.db"
+        async with TaskQueue(durable_path=path) as queue:
+            first = await queue.enqueue(Task(unpicklable, 1, idempotency_key="job"))
+            assert (await queue.wait_for_task(first, timeout=1.0)).is_successful
+
+        with sqlite3.connect(path) as connection:
+            row = connection.execute(
+                "SELECT status, error FROM tasks WHERE task_id = ?", (first,)
+            ).fetchone()
+        assert row[0] == "failed"
+        assert "cannot be persisted" in row[1]
+
+        async with TaskQueue(durable_path=path) as queue:
+            second = await queue.enqueue(Task(unpicklable, 1, idempotency_key="job"))
+            await queue.wait_for_task(second, timeout=1.0)
+
+        assert second != first
+        assert RUNS == [1, 1]
+
+    async def test_unpicklable_task_is_rejected(self, tmp_path):
+        async with TaskQueue(durable_path=tmp_path / "tasks.db") as queue:
+            with pytest.raises(TypeError):
+                await queue.submit(lambda: 1)
+
+            assert queue.pending_count == 0
+
+
+@pytest.mark.asyncio
+class TestIdempotency:
+    """Tests for idempotency keys within one session."""
+
+    async def test_unfinished_duplicate_returns_original(self):
+        async with TaskQueue() as queue:
+            first = await queue.enqueue(Task(sleeper, 1, 0.05, idempotency_key="job"))
+            second = await queue.enqueue(Task(sleeper, 2, 0.05, idempotency_key="job"))
+
+            result = await queue.wait_for_task(second, timeout=1.0)
+
+        assert second == first
+        assert result.result == 1
+
+    async def test_failed_task_can_be_retried(self):
+        async with TaskQueue() as queue:
+            first = await queue.enqueue(Task(fail_once, 7, idempotency_key="job"))
+            assert (await queue.wait_for_task(first, timeout=1.0)).is_failed
+
+            second = await queue.enqueue(Task(fail_once, 7, idempotency_key="job"))
+            result = await queue.wait_for_task(second, timeout=1.0)
+
+        assert second != first
+        assert result.result == 7
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"store_results": False},
+            {"drop_awaited_results": True},
+            {"max_completed_results": 1},
+        ],
+    )
+    async def test_completed_key_outlives_result(self, options):
+        async with TaskQueue(**options) as queue:
+            first = await queue.enqueue(Task(record, 5, idempotency_key="job"))
+            await queue.wait_for_task(first, timeout=1.0)
+            other = await queue.submit(record, 6)
+            await queue.wait_for_task(other, timeout=1.0)
+
+            second = await queue.enqueue(Task(record, 5, idempotency_key="job"))
+
+            assert second == first
+            assert queue.stats["total_deduplicated"] == 1
+
+        assert RUNS == [5, 6]
+
+    async def test_unfinished_keys_are_released(self):
+        async with TaskQueue() as queue:
+            task_ids = [
+                await queue.enqueue(Task(record, n, idempotency_key=f"job-{n}"))
+                for n in range(10)
+            ]
+            await queue.wait_for_all(task_ids, timeout=1.0)
+
+            assert queue._idempotency_keys == {}
+            assert len(queue._completed_keys) == 10
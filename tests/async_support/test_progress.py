@@ -0,0 +1,137 @@
+"""
+Tests for throttled progress reporting.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import timedelta
+
+import pytest
+
+from revitpy.async_support.progress import (
+    AsyncProgressReporter,
+    ProgressReport,
+    ProgressReporter,
+    ProgressState,
+)
+
+
+def recording(reporter: ProgressReporter) -> list[ProgressReport]:
+    """Attach a callback that records every report."""
+    reports: list[ProgressReport] = []
+    reporter.add_callback(reports.append)
+    return reports
+
+
+class TestThrottling:
+    """Tests for time- and percentage-based throttling."""
+
+    def test_callbacks_do_not_scale_with_items(self):
+        reporter = ProgressReporter(total=200_000)
+        reports = recording(reporter)
+        reporter.start()
+
+        for _ in range(200_000):
+            reporter.increment()
+
+        assert len(reports) < 50
+        assert reports[-1].current == 200_000
+        assert reports[-1].state == ProgressState.COMPLETED
+
+    def test_percentage_step(self):
+        reporter = ProgressReporter(
+            total=1000, throttle_interval=timedelta(0), min_percentage_step=10.0
+        )
+        reports = recording(reporter)
+        reporter.start()
+
+        for _ in range(1000):
+            reporter.increment()
+
+        # Start report plus one per 10%
+        assert len(reports) == 11
+        assert [report.current for report in reports[1:4]] == [100, 200, 300]
+
+    def test_flush_bypasses_throttle(self):
+        reporter = ProgressReporter(total=10, throttle_interval=timedelta(hours=1))
+        reports = recording(reporter)
+        reporter.start()
+        reporter.increment()
+        reporter.increment()
+
+        reporter.flush("checkpoint")
+
+        assert reports[-1].current == 2
+        assert reports[-1].message == "checkpoint"
+
+    def test_invalid_step(self):
+        with pytest.raises(ValueError):
+            ProgressReporter(min_percentage_step=-1)
+
+
+class TestAggregation:
+    """Tests for concurrent increments and rate estimates."""
+
+    def test_concurrent_increments_are_not_lost(self):
+        reporter = ProgressReporter(total=80_000)
+        reporter.start()
+
+        def work() -> None:
+            for _ in range(10_000):
+                reporter.increment()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert reporter.current == 80_000
+        assert reporter.state == ProgressState.COMPLETED
+
+    def test_smoothed_rate_and_eta(self):
+        reporter = ProgressReporter(total=1000, throttle_interval=timedelta(0))
+        reports = recording(reporter)
+        reporter.start()
+
+        for _ in range(5):
+            time.sleep(0.01)
+            reporter.increment(10)
+
+        # Sleeps only ever run long, so the rate can only fall below 1000/s
+        assert 0 < reporter.rate <= 1100
+        assert reports[-1].rate is not None
+        assert reports[-1].eta > timedelta(0)
+
+    def test_indeterminate_total_keeps_counting(self):
+        reporter = ProgressReporter(throttle_interval=timedelta(0))
+        reports = recording(reporter)
+        reporter.start()
+
+        reporter.increment(5)
+
+        assert reporter.current == 5
+        assert reports[-1].state == ProgressState.IN_PROGRESS
+
+
+@pytest.mark.asyncio
+class TestAsyncProgressReporter:
+    """Tests for async callbacks."""
+
+    async def test_async_callbacks_are_throttled(self):
+        reporter = AsyncProgressReporter(total=10_000)
+        reports: list[ProgressReport] = []
+
+        async def callback(report: ProgressReport) -> None:
+            reports.append(report)
+
+        reporter.add_async_callback(callback)
+        reporter.start()
+
+        for _ in range(10_000):
+            await reporter.async_increment()
+
+        assert len(reports) < 20
+        assert reports[-1].current == 10_000
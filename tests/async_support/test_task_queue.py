@@ -0,0 +1,573 @@
+"""
+Tests for the async task queue.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from datetime import timedelta
+
+import pytest
+
+from revitpy.async_support.scheduling import FairShareQueue
+from revitpy.async_support.task_queue import (
+    ExecutionLane,
+    ResultStore,
+    Task,
+    TaskPriority,
+    TaskQueue,
+    TaskResult,
+    TaskStatus,
+    UpstreamFailure,
+)
+
+
+async def sleeper(value: int, delay: float = 0.0) -> int:
+    """Return a value after a delay."""
+    await asyncio.sleep(delay)
+    return value
+
+
+async def failing() -> None:
+    """Raise an error."""
+    raise ValueError("boom")
+
+
+def square(value: int) -> int:
+    """Square a value (runs in worker processes)."""
+    return value * value
+
+
+def worker_pid(_index: int) -> int:
+    """Get the id of the process running the call."""
+    return os.getpid()
+
+
+@pytest.mark.asyncio
+class TestWaitForTask:
+    """Tests for future-based waiting."""
+
+    async def test_waits_for_result(self):
+        async with TaskQueue(max_concurrent_tasks=2) as queue:
+            task_id = await queue.submit(sleeper, 7, 0.01)
+
+            result = await queue.wait_for_task(task_id, timeout=1.0)
+
+            assert result.is_successful
+            assert result.result == 7
+            assert queue.get_task_status(task_id) == TaskStatus.COMPLETED
+
+    async def test_finished_task_returns_stored_result(self):
+        async with TaskQueue(max_concurrent_tasks=2) as queue:
+            task_id = await queue.submit(failing)
+            await queue.wait_for_task(task_id, timeout=1.0)
+
+            result = await queue.wait_for_task(task_id)
+
+            assert result.status == TaskStatus.FAILED
+            assert isinstance(result.error, ValueError)
+
+    async def test_timeout_does_not_cancel_task(self):
+        async with TaskQueue(max_concurrent_tasks=2) as queue:
+            task_id = await queue.submit(sleeper, 1, 0.2)
+
+            with pytest.raises(TimeoutError):
+                await queue.wait_for_task(task_id, timeout=0.01)
+
+            result = await queue.wait_for_task(task_id, timeout=1.0)
+            assert result.result == 1
+
+    async def test_unknown_task(self):
+        async with TaskQueue(max_concurrent_tasks=2) as queue:
+            with pytest.raises(KeyError):
+                await queue.wait_for_task("missing")
+
+    async def test_pending_task_is_indexed_without_reordering(self):
+        order: list[int] = []
+
+        async def record(n: int) -> None:
+            order.append(n)
+            await asyncio.sleep(0.01)
+
+        async with TaskQueue(max_concurrent_tasks=1) as queue:
+            ids = [await queue.enqueue(Task(record, n)) for n in range(4)]
+
+            assert queue.get_task_status(ids[-1]) == TaskStatus.PENDING
+            await queue.wait_for_task(ids[-1], timeout=1.0)
+            assert order == [0, 1, 2, 3]
+
+
+@pytest.mark.asyncio
+class TestWaitForMany:
+    """Tests for wait_for_all and as_completed."""
+
+    async def test_wait_for_all_keeps_order(self):
+        async with TaskQueue(max_concurrent_tasks=2) as queue:
+            ids = [
+                await queue.submit(sleeper, 1, 0.05),
+                await queue.submit(sleeper, 2, 0.0),
+            ]
+
+            results = await queue.wait_for_all(ids, timeout=1.0)
+
+            assert [result.result for result in results] == [1, 2]
+
+    async def test_wait_for_all_defaults_to_unfinished_tasks(self):
+        async with TaskQueue(max_concurrent_tasks=2) as queue:
+            for n in range(3):
+                await queue.submit(sleeper, n)
+
+            results = await queue.wait_for_all(timeout=1.0)
+
+            assert sorted(result.result for result in results) == [0, 1, 2]
+            assert await queue.wait_for_all() == []
+
+    async def test_wait_for_all_timeout(self):
+        async with TaskQueue(max_concurrent_tasks=2) as queue:
+            task_id = await queue.submit(sleeper, 1, 0.5)
+
+            with pytest.raises(TimeoutError):
+                await queue.wait_for_all([task_id], timeout=0.01)
+
+    async def test_as_completed_yields_in_completion_order(self):
+        async with TaskQueue(max_concurrent_tasks=2) as queue:
+            ids = [
+                await queue.submit(sleeper, 1, 0.1),
+                await queue.submit(sleeper, 2, 0.0),
+            ]
+
+            results = [result.result async for result in queue.as_completed(ids)]
+
+            assert results == [2, 1]
+
+    async def test_as_completed_timeout(self):
+        async with TaskQueue(max_concurrent_tasks=2) as queue:
+            task_id = await queue.submit(sleeper, 1, 0.5)
+
+            with pytest.raises(TimeoutError):
+                async for _result in queue.as_completed([task_id], timeout=0.01):
+                    pass
+
+
+class TestResultStore:
+    """Tests for the LRU result store."""
+
+    def result(self, task_id: str) -> TaskResult:
+        return TaskResult(task_id=task_id, status=TaskStatus.COMPLETED)
+
+    def test_evicts_least_recently_used(self):
+        store = ResultStore(max_size=2)
+        store.put("a", self.result("a"))
+        store.put("b", self.result("b"))
+        store.get("a")
+
+        evicted = store.put("c", self.result("c"))
+
+        assert evicted == 1
+        assert "a" in store and "c" in store
+        assert "b" not in store
+
+    def test_sweep_removes_idle_results(self):
+        store = ResultStore(ttl=timedelta(milliseconds=20))
+        store.put("a", self.result("a"))
+        time.sleep(0.03)
+        store.put("b", self.result("b"))
+
+        assert "a" not in store
+        assert store.sweep() == 0
+        assert len(store) == 1
+
+    def test_invalid_limits(self):
+        with pytest.raises(ValueError):
+            ResultStore(max_size=0)
+        with pytest.raises(ValueError):
+            ResultStore(ttl=timedelta(0))
+
+
+@pytest.mark.asyncio
+class TestResultRetention:
+    """Tests for bounded retention of completed results."""
+
+    async def test_memory_stays_bounded(self):
+        async with TaskQueue(max_concurrent_tasks=4, max_completed_results=10) as queue:
+            for n in range(500):
+                await queue.submit(sleeper, n)
+            await queue.wait_for_all(timeout=5.0)
+
+            assert queue.completed_count == 10
+            assert queue.stats["results_evicted"] == 490
+            assert not queue._futures
+            assert not queue._pending_tasks
+
+    async def test_drop_awaited_results(self):
+        async with TaskQueue(drop_awaited_results=True) as queue:
+            task_id = await queue.submit(sleeper, 1)
+
+            result = await queue.wait_for_task(task_id, timeout=1.0)
+
+            assert result.result == 1
+            assert queue.completed_count == 0
+            with pytest.raises(KeyError):
+                await queue.wait_for_task(task_id)
+
+    async def test_ttl_sweeper(self, monkeypatch):
+        monkeypatch.setattr(
+            "revitpy.async_support.task_queue.RESULT_SWEEP_INTERVAL_SECONDS", 0.01
+        )
+        async with TaskQueue(result_ttl=timedelta(milliseconds=20)) as queue:
+            task_id = await queue.submit(sleeper, 1)
+            await queue.wait_for_task(task_id, timeout=1.0)
+            assert queue.completed_count == 1
+
+            await asyncio.sleep(0.1)
+
+            assert queue.completed_count == 0
+            assert queue.get_task_result(task_id) is None
+
+    async def test_clear_completed_older_than(self):
+        async with TaskQueue() as queue:
+            task_id = await queue.submit(sleeper, 1)
+            await queue.wait_for_task(task_id, timeout=1.0)
+
+            assert await queue.clear_completed(older_than=timedelta(hours=1)) == 0
+            assert await queue.clear_completed() == 1
+
+    async def test_stream_results_without_storing(self):
+        seen: list[int] = []
+        async with TaskQueue(
+            store_results=False, result_callback=lambda r: seen.append(r.result)
+        ) as queue:
+            stream = queue.stream_results()
+            consumer = asyncio.create_task(
+                asyncio.wait_for(
+                    _collect(stream, 3),
+                    timeout=1.0,
+                )
+            )
+            await asyncio.sleep(0)
+            for n in range(3):
+                await queue.submit(sleeper, n)
+
+            streamed = await consumer
+
+            assert sorted(streamed) == [0, 1, 2]
+            assert sorted(seen) == [0, 1, 2]
+            assert queue.completed_count == 0
+
+    async def test_stream_ends_when_queue_stops(self):
+        queue = TaskQueue()
+        await queue.start()
+        consumer = asyncio.create_task(_collect(queue.stream_results(), 10))
+        await asyncio.sleep(0)
+
+        await queue.stop(timeout=1.0)
+
+        assert await asyncio.wait_for(consumer, timeout=1.0) == []
+
+
+@pytest.mark.asyncio
+class TestExecutionLanes:
+    """Tests for event-loop, thread-pool and process-pool lanes."""
+
+    async def test_default_lanes(self):
+        assert Task(sleeper, 1).lane == ExecutionLane.EVENT_LOOP
+        assert Task(square, 1).lane == ExecutionLane.THREAD_POOL
+
+        with pytest.raises(ValueError):
+            Task(sleeper, 1, lane=ExecutionLane.PROCESS_POOL)
+
+    async def test_event_loop_lane_runs_on_loop_thread(self):
+        async with TaskQueue() as queue:
+            task_id = await queue.enqueue(
+                Task(threading.get_ident, lane=ExecutionLane.EVENT_LOOP)
+            )
+
+            result = await queue.wait_for_task(task_id, timeout=1.0)
+
+            assert result.result == threading.get_ident()
+
+    async def test_process_pool_lane(self):
+        async with TaskQueue(max_concurrent_tasks=4, process_workers=2) as queue:
+            ids = [
+                await queue.enqueue(Task(square, n, lane=ExecutionLane.PROCESS_POOL))
+                for n in range(4)
+            ]
+            pid_id = await queue.enqueue(
+                Task(worker_pid, 0, lane=ExecutionLane.PROCESS_POOL)
+            )
+
+            results = await queue.wait_for_all(ids, timeout=30.0)
+            pid = await queue.wait_for_task(pid_id, timeout=30.0)
+
+            assert [result.result for result in results] == [0, 1, 4, 9]
+            assert pid.result != os.getpid()
+
+    async def test_workers_are_recycled(self):
+        async with TaskQueue(
+            max_concurrent_tasks=1, process_workers=1, max_tasks_per_child=1
+        ) as queue:
+            ids = [
+                await queue.enqueue(
+                    Task(worker_pid, n, lane=ExecutionLane.PROCESS_POOL)
+                )
+                for n in range(3)
+            ]
+
+            results = await queue.wait_for_all(ids, timeout=30.0)
+
+            assert len({result.result for result in results}) == 3
+
+    async def test_unpicklable_task_is_rejected(self):
+        async with TaskQueue() as queue:
+            task = Task(lambda: 1, lane=ExecutionLane.PROCESS_POOL)
+
+            with pytest.raises(TypeError):
+                await queue.enqueue(task)
+            with pytest.raises(TypeError):
+                queue.enqueue_sync(task)
+
+    async def test_lane_limit(self):
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def track() -> None:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+
+        async with TaskQueue(
+            max_concurrent_tasks=4, lane_limits={ExecutionLane.THREAD_POOL: 1}
+        ) as queue:
+            for _ in range(4):
+                await queue.submit(track)
+            await queue.wait_for_all(timeout=2.0)
+
+        assert peak == 1
+
+
+@pytest.mark.asyncio
+class TestDependencies:
+    """Tests for task dependency graphs."""
+
+    async def test_diamond_passes_results(self):
+        order: list[str] = []
+
+        async def step(label: str, *inputs: int) -> int:
+            order.append(label)
+            await asyncio.sleep(0.01)
+            return sum(inputs) + 1
+
+        async with TaskQueue(max_concurrent_tasks=4) as queue:
+            extract = Task(step, "extract")
+            left = Task(step, "left", extract.output())
+            right = Task(step, "right", extract.output())
+            merge = Task(step, "merge", left.output(), right.output())
+            for task in (extract, left, right, merge):
+                await queue.enqueue(task)
+
+            assert queue.blocked_count == 3
+            result = await queue.wait_for_task(merge.id, timeout=1.0)
+
+            assert result.result == 5
+            assert order[0] == "extract"
+            assert order[-1] == "merge"
+
+    async def test_failure_modes(self):
+        async with TaskQueue() as queue:
+            broken = Task(failing)
+            cancelled = Task(sleeper, 1, depends_on=[broken])
+            downstream = Task(sleeper, 2, depends_on=[cancelled])
+            skipped = Task(
+                sleeper,
+                3,
+                depends_on=[broken],
+                on_upstream_failure=UpstreamFailure.SKIP,
+            )
+            after_skip = Task(sleeper, 4, depends_on=[skipped])
+            continued = Task(
+                lambda value: value,
+                broken.output(),
+                on_upstream_failure=UpstreamFailure.CONTINUE,
+            )
+            for task in (broken, cancelled, downstream, skipped, after_skip, continued):
+                await queue.enqueue(task)
+
+            results = await queue.wait_for_all(
+                [cancelled.id, downstream.id, skipped.id, after_skip.id, continued.id],
+                timeout=1.0,
+            )
+
+            statuses = [result.status for result in results]
+            assert statuses == [
+                TaskStatus.CANCELLED,
+                TaskStatus.CANCELLED,
+                TaskStatus.COMPLETED,
+                TaskStatus.COMPLETED,
+                TaskStatus.COMPLETED,
+            ]
+            assert results[2].metadata["skipped"] is True
+            assert results[3].result == 4
+            assert results[4].result is None
+            assert queue.blocked_count == 0
+
+    async def test_depends_on_finished_task(self):
+        async with TaskQueue() as queue:
+            first = Task(sleeper, 2)
+            await queue.enqueue(first)
+            await queue.wait_for_task(first.id, timeout=1.0)
+
+            second = Task(square, first.output())
+            await queue.enqueue(second)
+
+            assert (await queue.wait_for_task(second.id, timeout=1.0)).result == 4
+
+    async def test_unknown_upstream(self):
+        async with TaskQueue() as queue:
+            with pytest.raises(KeyError):
+                await queue.enqueue(Task(sleeper, 1, depends_on=["missing"]))
+
+    async def test_critical_path_runs_first(self):
+        gate = asyncio.Event()
+        order: list[str] = []
+
+        async def record(label: str) -> None:
+            order.append(label)
+
+        async with TaskQueue(max_concurrent_tasks=1) as queue:
+            blocker = Task(gate.wait)
+            await queue.enqueue(blocker)
+            await asyncio.sleep(0)
+            leaf = Task(record, "leaf", depends_on=[blocker])
+            root = Task(record, "root", depends_on=[blocker])
+            await queue.enqueue(leaf)
+            await queue.enqueue(root)
+            chain = root
+            for n in range(3):
+                chain = Task(record, f"chain{n}", depends_on=[chain])
+                await queue.enqueue(chain)
+
+            assert root.critical_path == 3
+            gate.set()
+            await queue.wait_for_all(timeout=1.0)
+
+            assert order[0] == "root"
+            assert order.index("leaf") > 0
+
+    async def test_queued_root_moves_up_when_dependents_arrive(self):
+        order: list[str] = []
+
+        async def record(label: str) -> None:
+            order.append(label)
+
+        async with TaskQueue(max_concurrent_tasks=1) as queue:
+            # Nothing here yields, so the worker has not taken a task yet
+            await queue.enqueue(Task(record, "other"))
+            root = Task(record, "root")
+            await queue.enqueue(root)
+            chain = root
+            for n in range(3):
+                chain = Task(record, f"chain{n}", depends_on=[chain])
+                await queue.enqueue(chain)
+
+            assert queue.pending_count == 2
+            await queue.wait_for_all(timeout=1.0)
+
+            assert order[:3] == ["root", "chain0", "chain1"]
+            assert queue.pending_count == 0
+
+
+@pytest.mark.asyncio
+class TestFairScheduling:
+    """Tests for priority aging and fair-share queues."""
+
+    async def test_fair_share_queue_interleaves_by_weight(self):
+        queue = FairShareQueue({"ui": 3})
+        for n in range(8):
+            queue.put_nowait((n, "bulk"), "bulk")
+            queue.put_nowait((n, "ui"), "ui")
+
+        taken = [await queue.get() for _ in range(8)]
+
+        assert [share for _, share in taken].count("ui") == 6
+        assert [n for n, share in taken if share == "ui"] == list(range(6))
+        assert queue.depths() == {"bulk": 6, "ui": 2}
+        with pytest.raises(ValueError):
+            FairShareQueue({"ui": 0})
+
+    async def _run_order(self, queue: TaskQueue, submit) -> list[str]:
+        """Hold the only worker, queue tasks, then release and collect order."""
+        gate = asyncio.Event()
+        order: list[str] = []
+
+        async def record(label: str) -> None:
+            order.append(label)
+
+        await queue.enqueue(Task(gate.wait))
+        await asyncio.sleep(0)
+        await submit(record)
+        gate.set()
+        await queue.wait_for_all(timeout=2.0)
+        return order
+
+    async def test_aging_lets_waiting_low_priority_task_through(self):
+        async def submit(record) -> None:
+            await queue.enqueue(Task(record, "low", priority=TaskPriority.LOW))
+            await asyncio.sleep(0.2)
+            for n in range(3):
+                await queue.enqueue(
+                    Task(record, f"high{n}", priority=TaskPriority.HIGH)
+                )
+
+        async with TaskQueue(
+            max_concurrent_tasks=1, aging_interval=timedelta(milliseconds=50)
+        ) as queue:
+            assert (await self._run_order(queue, submit))[0] == "low"
+
+        async with TaskQueue(max_concurrent_tasks=1) as queue:
+            assert (await self._run_order(queue, submit))[-1] == "low"
+
+    async def test_fair_share_by_owner(self):
+        async def submit(record) -> None:
+            for n in range(10):
+                await queue.enqueue(
+                    Task(record, f"bulk{n}", metadata={"owner": "bulk"})
+                )
+            await queue.enqueue(Task(record, "ui", metadata={"owner": "ui"}))
+
+        async with TaskQueue(
+            max_concurrent_tasks=1, share_key=lambda task: task.metadata.get("owner")
+        ) as queue:
+            order = await self._run_order(queue, submit)
+
+        assert order.index("ui") <= 1
+
+    async def test_queue_wait_metrics(self):
+        async with TaskQueue() as queue:
+            await queue.enqueue(Task(sleeper, 1, priority=TaskPriority.LOW))
+            await queue.enqueue(Task(sleeper, 2, priority=TaskPriority.HIGH))
+            await queue.wait_for_all(timeout=1.0)
+
+            metrics = queue.queue_wait_metrics()
+
+        assert metrics["low"]["count"] == 1
+        assert metrics["high"]["count"] == 1
+        assert metrics["critical"]["count"] == 0
+        assert metrics["low"]["max"] >= 0
+
+
+async def _collect(stream, limit: int) -> list:
+    """Collect up to limit results from a stream."""
+    results = []
+    async for result in stream:
+        results.append(result.result)
+        if len(results) == limit:
+            break
+    return results
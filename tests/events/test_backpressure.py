@@ -0,0 +1,234 @@
+"""
+Tests for event queue backpressure policies.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from revitpy.events.backpressure import BackpressurePolicy, DiskSpillBuffer
+from revitpy.events.dispatcher import EventDispatcher
+from revitpy.events.handlers import CallableEventHandler
+from revitpy.events.types import EventData, EventResult, EventType
+
+
+class GatedHandler:
+    """Handler callback that blocks until released and records event order."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.seen: list[int] = []
+
+    def __call__(self, event_data: EventData) -> EventResult:
+        self.started.set()
+        self.release.wait(5.0)
+        self.seen.append(event_data.data["n"])
+        return EventResult.CONTINUE
+
+
+def numbered(n: int) -> EventData:
+    """Create a custom event carrying a sequence number."""
+    return EventData(EventType.CUSTOM, data={"n": n})
+
+
+def wait_for(condition, timeout: float = 2.0) -> bool:
+    """Poll until condition() is true or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.005)
+    return condition()
+
+
+@pytest.fixture
+def gate() -> GatedHandler:
+    """Provide a gated handler callback."""
+    instance = GatedHandler()
+    yield instance
+    instance.release.set()
+
+
+def make_dispatcher(gate: GatedHandler, **kwargs) -> EventDispatcher:
+    """Create a dispatcher whose worker is held by the gate after one event."""
+    dispatcher = EventDispatcher(max_queue_size=4, **kwargs)
+    dispatcher.register_handler(
+        CallableEventHandler(gate, name="gate"), [EventType.CUSTOM]
+    )
+    dispatcher.dispatch_event(numbered(0))
+    assert gate.started.wait(1.0)
+    return dispatcher
+
+
+class TestBackpressurePolicies:
+    """Tests for each overflow policy."""
+
+    def test_drop_oldest_is_default(self, gate):
+        dispatcher = make_dispatcher(gate)
+        for n in range(1, 7):
+            dispatcher.dispatch_event(numbered(n))
+
+        gate.release.set()
+
+        assert wait_for(lambda: len(gate.seen) == 5)
+        assert gate.seen == [0, 3, 4, 5, 6]
+        assert dispatcher.stats.dropped_events == 2
+        dispatcher.stop_processing(timeout=1.0)
+
+    def test_drop_newest(self, gate):
+        dispatcher = make_dispatcher(gate, backpressure=BackpressurePolicy.DROP_NEWEST)
+        for n in range(1, 7):
+            dispatcher.dispatch_event(numbered(n))
+
+        gate.release.set()
+
+        assert wait_for(lambda: len(gate.seen) == 5)
+        assert gate.seen == [0, 1, 2, 3, 4]
+        assert dispatcher.stats.dropped_events == 2
+        dispatcher.stop_processing(timeout=1.0)
+
+    def test_block_times_out_and_drops(self, gate):
+        dispatcher = make_dispatcher(
+            gate, backpressure=BackpressurePolicy.BLOCK, block_timeout=0.05
+        )
+        for n in range(1, 5):
+            dispatcher.dispatch_event(numbered(n))
+
+        start = time.monotonic()
+        dispatcher.dispatch_event(numbered(5))
+
+        assert time.monotonic() - start >= 0.04
+        assert dispatcher.stats.blocked_enqueues == 1
+        assert dispatcher.stats.dropped_events == 1
+        dispatcher.stop_processing(timeout=0.1)
+
+    def test_block_admits_when_space_frees(self, gate):
+        dispatcher = make_dispatcher(
+            gate, backpressure=BackpressurePolicy.BLOCK, block_timeout=2.0
+        )
+        for n in range(1, 5):
+            dispatcher.dispatch_event(numbered(n))
+
+        threading.Timer(0.05, gate.release.set).start()
+        dispatcher.dispatch_event(numbered(5))
+
+        assert wait_for(lambda: len(gate.seen) == 6)
+        assert gate.seen == list(range(6))
+        assert dispatcher.stats.dropped_events == 0
+        dispatcher.stop_processing(timeout=1.0)
+
+    def test_sample_above_high_water(self, gate):
+        dispatcher = make_dispatcher(
+            gate,
+            backpressure=BackpressurePolicy.SAMPLE,
+            sample_every=2,
+            high_water_ratio=0.5,
+        )
+        for n in range(1, 9):
+            dispatcher.dispatch_event(numbered(n))
+
+        # Above two queued events only every second one is admitted, and at
+        # capacity an admitted sample evicts the oldest queued event
+        assert dispatcher.stats.dropped_events == 4
+        gate.release.set()
+        assert wait_for(lambda: len(gate.seen) == 5)
+        assert gate.seen == [0, 2, 4, 6, 8]
+        dispatcher.stop_processing(timeout=1.0)
+
+    def test_spill_preserves_every_event_in_order(self, gate, tmp_path):
+        spill_file = tmp_path / "overflow.spill"
+        dispatcher = make_dispatcher(
+            gate, backpressure=BackpressurePolicy.SPILL, spill_path=spill_file
+        )
+        for n in range(1, 21):
+            dispatcher.dispatch_event(numbered(n))
+
+        assert dispatcher.stats.spilled_events == 16
+        assert dispatcher.stats.spill_queue_depth == 16
+        assert spill_file.stat().st_size > 0
+
+        gate.release.set()
+
+        assert wait_for(lambda: len(gate.seen) == 21)
+        assert gate.seen == list(range(21))
+        assert dispatcher.stats.dropped_events == 0
+        assert dispatcher.stats.spill_queue_depth == 0
+        assert spill_file.stat().st_size == 0
+        dispatcher.stop_processing(timeout=1.0)
+
+    def test_clear_queue_discards_spill(self, gate, tmp_path):
+        dispatcher = make_dispatcher(
+            gate,
+            backpressure=BackpressurePolicy.SPILL,
+            spill_path=tmp_path / "overflow.spill",
+        )
+        for n in range(1, 11):
+            dispatcher.dispatch_event(numbered(n))
+
+        assert dispatcher.clear_queue() == 10
+        gate.release.set()
+        dispatcher.stop_processing(timeout=1.0)
+
+    def test_high_water_warning_rearms(self, gate):
+        dispatcher = make_dispatcher(gate, high_water_ratio=0.5)
+        for n in range(1, 4):
+            dispatcher.dispatch_event(numbered(n))
+
+        assert dispatcher.stats.high_water_warnings == 1
+
+        gate.release.set()
+        assert wait_for(lambda: len(gate.seen) == 4)
+        gate.release.clear()
+        gate.started.clear()
+
+        dispatcher.dispatch_event(numbered(10))
+        assert gate.started.wait(1.0)
+        for n in range(11, 14):
+            dispatcher.dispatch_event(numbered(n))
+
+        assert dispatcher.stats.high_water_warnings == 2
+        gate.release.set()
+        dispatcher.stop_processing(timeout=1.0)
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            EventDispatcher(sample_every=0)
+        with pytest.raises(ValueError):
+            EventDispatcher(high_water_ratio=1.5)
+
+
+class TestDiskSpillBuffer:
+    """Tests for DiskSpillBuffer."""
+
+    def test_round_trip(self, tmp_path):
+        buffer = DiskSpillBuffer(tmp_path / "buffer.spill")
+        for n in range(5):
+            assert buffer.append(numbered(n))
+
+        assert len(buffer) == 5
+        assert [e.data["n"] for e in buffer.pop_many(3)] == [0, 1, 2]
+        assert [e.data["n"] for e in buffer.pop_many(10)] == [3, 4]
+        assert len(buffer) == 0
+        assert buffer.size_bytes == 0
+        buffer.close()
+        assert not (tmp_path / "buffer.spill").exists()
+
+    def test_unpicklable_event_is_rejected(self, tmp_path):
+        buffer = DiskSpillBuffer(tmp_path / "buffer.spill")
+        event = EventData(EventType.CUSTOM, source=threading.Lock())
+
+        assert not buffer.append(event)
+        assert len(buffer) == 0
+        buffer.close()
+
+    def test_temporary_file(self):
+        buffer = DiskSpillBuffer()
+        buffer.append(numbered(1))
+
+        assert buffer.path.exists()
+        buffer.close()
+        assert not buffer.path.exists()
@@ -0,0 +1,240 @@
+"""
+Tests for batched event delivery.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from revitpy.events.batching import EventBatcher
+from revitpy.events.decorators import batched_handler, event_handler
+from revitpy.events.dispatcher import EventDispatcher
+from revitpy.events.filters import ElementIdFilter
+from revitpy.events.handlers import BatchingEventHandler
+from revitpy.events.types import ElementEventData, EventData, EventType
+
+
+def modified(element_id: int, **kwargs) -> ElementEventData:
+    """Create an element-modified event."""
+    return ElementEventData(
+        event_type=EventType.ELEMENT_MODIFIED, element_id=element_id, **kwargs
+    )
+
+
+class BatchRecorder:
+    """Callable that records delivered batches."""
+
+    def __init__(self, fail_on: set[int] | None = None) -> None:
+        self.batches: list[list[EventData]] = []
+        self.fail_on = fail_on or set()
+        self.delivered = threading.Event()
+
+    def __call__(self, batch: list[EventData]) -> None:
+        if any(event.element_id in self.fail_on for event in batch):
+            raise RuntimeError("bad event")
+        self.batches.append(batch)
+        self.delivered.set()
+
+    @property
+    def element_ids(self) -> list[list[int]]:
+        return [[event.element_id for event in batch] for batch in self.batches]
+
+
+@pytest.fixture
+def recorder() -> BatchRecorder:
+    """Provide a batch recorder."""
+    return BatchRecorder()
+
+
+class TestEventBatcher:
+    """Tests for EventBatcher."""
+
+    def test_invalid_arguments(self, recorder):
+        with pytest.raises(ValueError):
+            EventBatcher(recorder, max_batch_size=0)
+        with pytest.raises(ValueError):
+            EventBatcher(recorder, max_latency_seconds=0)
+
+    def test_delivers_full_batches_in_order(self, recorder):
+        batcher = EventBatcher(recorder, max_batch_size=4, max_latency_seconds=10)
+
+        for element_id in range(10):
+            batcher.submit(modified(element_id))
+
+        assert recorder.element_ids == [[0, 1, 2, 3], [4, 5, 6, 7]]
+        assert batcher.pending_count == 2
+
+        batcher.close()
+        assert recorder.element_ids[-1] == [8, 9]
+        assert batcher.stats.batches_delivered == 3
+        assert batcher.stats.average_batch_size == pytest.approx(10 / 3)
+
+    def test_delivers_partial_batch_after_latency(self, recorder):
+        batcher = EventBatcher(recorder, max_batch_size=100, max_latency_seconds=0.05)
+
+        batcher.submit(modified(1))
+        batcher.submit(modified(2))
+
+        assert recorder.delivered.wait(2.0)
+        assert recorder.element_ids == [[1, 2]]
+        batcher.close()
+
+    def test_batch_error_is_reported_once(self):
+        recorder = BatchRecorder(fail_on={2})
+        errors = []
+        batcher = EventBatcher(
+            recorder,
+            max_batch_size=3,
+            max_latency_seconds=10,
+            on_error=lambda batch, e: errors.append(len(batch)),
+        )
+
+        for element_id in range(3):
+            batcher.submit(modified(element_id))
+
+        assert errors == [3]
+        assert recorder.batches == []
+        assert batcher.stats.batch_errors == 1
+        assert batcher.stats.events_failed == 3
+        batcher.close()
+
+    def test_retry_individually_isolates_bad_events(self):
+        recorder = BatchRecorder(fail_on={2})
+        errors = []
+        batcher = EventBatcher(
+            recorder,
+            max_batch_size=4,
+            max_latency_seconds=10,
+            retry_individually=True,
+            on_error=lambda batch, e: errors.append([ev.element_id for ev in batch]),
+        )
+
+        for element_id in range(4):
+            batcher.submit(modified(element_id))
+
+        assert recorder.element_ids == [[0], [1], [3]]
+        assert errors == [[0, 1, 2, 3], [2]]
+        assert batcher.stats.events_retried == 4
+        assert batcher.stats.events_failed == 1
+        batcher.close()
+
+    def test_callback_can_submit_full_batch(self, recorder):
+        def callback(batch: list[EventData]) -> None:
+            recorder(batch)
+            if batch[0].element_id == 0:
+                batcher.submit(modified(10))
+                batcher.submit(modified(11))
+
+        batcher = EventBatcher(callback, max_batch_size=2, max_latency_seconds=10)
+        submitter = threading.Thread(
+            target=lambda: [batcher.submit(modified(i)) for i in range(2)],
+            daemon=True,
+        )
+        submitter.start()
+        submitter.join(2.0)
+
+        assert not submitter.is_alive()
+        batcher.close()
+        assert recorder.element_ids == [[0, 1], [10, 11]]
+        assert batcher.stats.batches_delivered == 2
+
+    def test_submit_after_close(self, recorder):
+        batcher = EventBatcher(recorder)
+        batcher.close()
+
+        with pytest.raises(RuntimeError):
+            batcher.submit(modified(1))
+
+
+class TestBatchingEventHandler:
+    """Tests for the handler and decorator."""
+
+    def test_filters_apply_per_event(self, recorder):
+        handler = BatchingEventHandler(
+            recorder,
+            max_batch_size=100,
+            max_latency_seconds=10,
+            event_filter=ElementIdFilter(1, 3, 5),
+        )
+        dispatcher = EventDispatcher()
+        dispatcher.register_handler(handler, [EventType.ELEMENT_MODIFIED])
+
+        for element_id in range(6):
+            dispatcher.dispatch_event(modified(element_id), immediate=True)
+
+        assert recorder.batches == []
+        assert handler.flush() == 3
+        assert recorder.element_ids == [[1, 3, 5]]
+        handler.close()
+
+    def test_decorator(self, recorder):
+        @event_handler([EventType.ELEMENT_MODIFIED])
+        @batched_handler(max_batch_size=5, max_latency_seconds=10)
+        def upload(events: list[EventData]) -> None:
+            recorder(events)
+
+        dispatcher = EventDispatcher()
+        dispatcher.register_handler(upload._event_handler, upload._event_types)
+        for element_id in range(12):
+            dispatcher.dispatch_event(modified(element_id), immediate=True)
+
+        assert len(recorder.batches) == 2
+        assert upload._batcher.flush() == 2
+        upload._batcher.close()
+
+    def test_async_decorator(self, recorder):
+        @batched_handler(max_batch_size=2, max_latency_seconds=10)
+        async def upload(events: list[EventData]) -> None:
+            recorder(events)
+
+        upload._batcher.submit(modified(1))
+        upload._batcher.submit(modified(2))
+
+        assert recorder.element_ids == [[1, 2]]
+        upload._batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_async_decorator_on_running_loop(self, recorder):
+        loop = asyncio.get_running_loop()
+        threads: list[bool] = []
+
+        @batched_handler(max_batch_size=2, max_latency_seconds=10)
+        async def upload(events: list[EventData]) -> None:
+            threads.append(asyncio.get_running_loop() is loop)
+            recorder(events)
+
+        await upload(modified(0))
+        await upload(modified(1))
+        for _ in range(100):
+            if recorder.batches:
+                break
+            await asyncio.sleep(0.01)
+
+        assert recorder.element_ids == [[0, 1]]
+        assert threads == [True]
+        await upload(modified(2))
+        assert upload._batcher.flush() == 1
+        await asyncio.sleep(0.05)
+
+        assert recorder.element_ids == [[0, 1], [2]]
+        assert upload._batcher.stats.events_failed == 0
+        upload._batcher.close()
+
+    @pytest.mark.asyncio
+    async def test_async_callback_handler(self, recorder):
+        async def upload(events: list[EventData]) -> None:
+            recorder(events)
+
+        handler = BatchingEventHandler(
+            upload, max_batch_size=10, max_latency_seconds=0.01
+        )
+        handler.handle_event(modified(1))
+        handler.handle_event(modified(2))
+        await asyncio.sleep(0.1)
+
+        assert recorder.element_ids == [[1, 2]]
+        assert handler.batcher.stats.batches_delivered == 1
+        handler.close()
@@ -0,0 +1,225 @@
+"""
+Tests for the cross-process event bus.
+"""
+
+from __future__ import annotations
+
+import socket
+import sys
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client
+
+import pytest
+
+from revitpy.events.bus import (
+    EventBusClient,
+    EventBusServer,
+    Subscription,
+    _Subscriber,
+    default_bus_address,
+    default_bus_authkey,
+)
+from revitpy.events.dispatcher import EventDispatcher
+from revitpy.events.types import ElementEventData, EventData, EventType
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="Tests use Unix domain socket paths"
+)
+
+
+def modified(element_id: int, category: str = "Walls") -> ElementEventData:
+    """Create an element-modified event."""
+    return ElementEventData(
+        event_type=EventType.ELEMENT_MODIFIED,
+        element_id=element_id,
+        category=category,
+    )
+
+
+@pytest.fixture(autouse=True)
+def runtime_dir(tmp_path, monkeypatch):
+    """Keep default bus sockets and secrets in a private test directory."""
+    directory = tmp_path / "run"
+    directory.mkdir(mode=0o700)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(directory))
+    return directory
+
+
+@pytest.fixture
+def dispatcher() -> EventDispatcher:
+    """Provide a dispatcher."""
+    instance = EventDispatcher()
+    yield instance
+    instance.stop_processing(timeout=1.0)
+
+
+@pytest.fixture
+def server(dispatcher, tmp_path) -> EventBusServer:
+    """Provide a running event bus server."""
+    instance = EventBusServer(dispatcher, address=str(tmp_path / "bus.sock"))
+    instance.start()
+    yield instance
+    instance.stop()
+
+
+class TestSubscription:
+    """Tests for subscription encoding."""
+
+    def test_round_trip(self):
+        subscription = Subscription(
+            event_types=frozenset({EventType.ELEMENT_MODIFIED}),
+            categories=["Walls"],
+            element_ids=[1, 2],
+        )
+
+        decoded = Subscription.from_json(subscription.to_json())
+
+        assert decoded == subscription
+        assert decoded.to_filter().matches(modified(1))
+        assert not decoded.to_filter().matches(modified(3))
+
+    def test_invalid_subscription(self):
+        with pytest.raises(ValueError):
+            Subscription.from_json(b'{"event_types": ["bogus"]}')
+        with pytest.raises(ValueError):
+            Subscription.from_json(b"[]")
+
+
+class TestDefaults:
+    """Tests for the per-user default address and secret."""
+
+    def test_defaults_live_in_runtime_directory(self, runtime_dir):
+        assert default_bus_address() == str(runtime_dir / "revitpy-events.sock")
+
+        with pytest.raises(FileNotFoundError):
+            default_bus_authkey()
+        authkey = default_bus_authkey(create=True)
+
+        assert default_bus_authkey() == authkey
+        assert default_bus_authkey(create=True) == authkey
+        assert (runtime_dir / "revitpy-events.key").stat().st_mode & 0o777 == 0o600
+
+    def test_shared_runtime_directory_is_rejected(self, runtime_dir):
+        runtime_dir.chmod(0o755)
+
+        with pytest.raises(PermissionError):
+            default_bus_address()
+        with pytest.raises(PermissionError):
+            default_bus_authkey(create=True)
+
+
+class TestEventBus:
+    """End-to-end tests over a local socket."""
+
+    def test_forwards_matching_events(self, dispatcher, server):
+        with EventBusClient(
+            server.address,
+            event_types=[EventType.ELEMENT_MODIFIED],
+            element_ids=[2],
+        ) as client:
+            assert server.subscriber_count == 1
+
+            dispatcher.dispatch_event(modified(1), immediate=True)
+            dispatcher.dispatch_event(modified(2), immediate=True)
+            dispatcher.dispatch_event(EventData(EventType.CUSTOM), immediate=True)
+
+            received = client.receive(timeout=2.0)
+
+            assert received.element_id == 2
+            assert received.source is None
+            assert client.receive(timeout=0.1) is None
+
+        # Unwanted events are never serialized
+        assert server.stats.events_serialized == 1
+        assert server.stats.events_forwarded == 1
+
+    def test_each_event_is_serialized_once(self, dispatcher, server):
+        clients = [EventBusClient(server.address) for _ in range(3)]
+        for client in clients:
+            client.connect()
+
+        dispatcher.dispatch_event(modified(1), immediate=True)
+
+        for client in clients:
+            assert client.receive(timeout=2.0).element_id == 1
+            client.close()
+        assert server.stats.events_serialized == 1
+        assert server.stats.events_forwarded == 3
+
+    def test_server_rejects_bad_subscription(self, server):
+        connection = Client(server.address, authkey=server.authkey)
+        connection.send_bytes(bytes([1]) + b'{"event_types": ["bogus"]}')
+
+        assert connection.poll(2.0)
+        reply = connection.recv_bytes()
+        connection.close()
+
+        assert reply[0] == 3
+        assert server.subscriber_count == 0
+
+    def test_client_iteration_ends_when_server_stops(self, dispatcher, server):
+        client = EventBusClient(server.address)
+        client.connect()
+        dispatcher.dispatch_event(modified(1), immediate=True)
+        server.stop()
+
+        events = list(client)
+
+        assert [event.element_id for event in events] == [1]
+        assert not client.is_connected
+
+    def test_unencodable_event_is_not_forwarded(self, dispatcher, server):
+        with EventBusClient(server.address) as client:
+            dispatcher.dispatch_event(
+                EventData(EventType.CUSTOM, data={"model": object()}), immediate=True
+            )
+            dispatcher.dispatch_event(modified(1), immediate=True)
+
+            assert client.receive(timeout=2.0).element_id == 1
+        assert server.stats.serialization_errors == 1
+
+    def test_default_authkey_is_required(self, dispatcher, server):
+        with pytest.raises(AuthenticationError):
+            EventBusClient(server.address, authkey=b"guess").connect()
+
+        with EventBusClient(server.address) as client:
+            assert client.is_connected
+
+    def test_authkey_is_required(self, dispatcher, tmp_path):
+        address = str(tmp_path / "auth.sock")
+        with EventBusServer(dispatcher, address=address, authkey=b"secret"):
+            with pytest.raises(AuthenticationError):
+                EventBusClient(address, authkey=b"wrong").connect()
+
+            with EventBusClient(address, authkey=b"secret") as client:
+                assert client.is_connected
+
+    def test_stale_socket_is_replaced(self, dispatcher, tmp_path):
+        address = str(tmp_path / "stale.sock")
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(address)
+        stale.close()
+
+        with EventBusServer(dispatcher, address=address) as server:
+            assert server.is_running
+
+    def test_live_address_is_not_stolen(self, dispatcher, server):
+        other = EventBusServer(dispatcher, address=server.address)
+
+        with pytest.raises(OSError):
+            other.start()
+
+
+class TestSubscriberBuffer:
+    """Tests for the bounded per-subscriber buffer."""
+
+    def test_slow_subscriber_drops_oldest(self, dispatcher):
+        server = EventBusServer(dispatcher, address="unused", buffer_size=2)
+        subscriber = _Subscriber(server, connection=None, buffer_size=2)
+
+        for n in range(5):
+            subscriber.offer(bytes([n]))
+
+        assert list(subscriber._buffer) == [bytes([3]), bytes([4])]
+        assert subscriber._dropped == 3
+        assert server.stats.events_dropped == 3
@@ -0,0 +1,295 @@
+"""
+Tests for event coalescing, debouncing and throttling.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from revitpy.events.coalescing import (
+    CoalesceMode,
+    CoalesceStrategy,
+    EventCoalescer,
+    merge_event_data,
+)
+from revitpy.events.decorators import coalesced_handler, event_handler
+from revitpy.events.dispatcher import EventDispatcher
+from revitpy.events.handlers import CallableEventHandler, CoalescingEventHandler
+from revitpy.events.types import (
+    ElementEventData,
+    EventData,
+    EventResult,
+    EventType,
+    ParameterEventData,
+)
+
+
+def modified(element_id: int, **kwargs) -> ElementEventData:
+    """Create an element-modified event."""
+    return ElementEventData(
+        event_type=EventType.ELEMENT_MODIFIED, element_id=element_id, **kwargs
+    )
+
+
+class Recorder:
+    """Callable that records delivered events."""
+
+    def __init__(self) -> None:
+        self.events: list[EventData] = []
+        self.delivered = threading.Event()
+
+    def __call__(self, event_data: EventData) -> EventResult:
+        self.events.append(event_data)
+        self.delivered.set()
+        return EventResult.CONTINUE
+
+
+@pytest.fixture
+def recorder() -> Recorder:
+    """Provide a delivery recorder."""
+    return Recorder()
+
+
+class TestEventCoalescer:
+    """Tests for EventCoalescer."""
+
+    def test_invalid_window(self, recorder):
+        with pytest.raises(ValueError):
+            EventCoalescer(recorder, window_seconds=0)
+
+    def test_collapses_by_element_and_keeps_latest(self, recorder):
+        coalescer = EventCoalescer(recorder, window_seconds=10)
+        events = [modified(1), modified(2), modified(1), modified(1)]
+        for event in events:
+            coalescer.submit(event)
+
+        assert coalescer.pending_count == 2
+        assert coalescer.flush() == 2
+
+        assert recorder.events == [events[3], events[1]]
+        assert coalescer.stats.events_received == 4
+        assert coalescer.stats.events_coalesced == 2
+        coalescer.close()
+
+    def test_constant_key_runs_once_per_burst(self, recorder):
+        coalescer = EventCoalescer(recorder, window_seconds=10, key=lambda e: None)
+        for element_id in range(100):
+            coalescer.submit(modified(element_id))
+
+        coalescer.flush()
+
+        assert len(recorder.events) == 1
+        assert recorder.events[0].element_id == 99
+        coalescer.close()
+
+    def test_merge_strategy(self, recorder):
+        coalescer = EventCoalescer(
+            recorder, window_seconds=10, strategy=CoalesceStrategy.MERGE
+        )
+        first = modified(
+            1,
+            parameters_changed=["Height"],
+            old_values={"Height": 1},
+            new_values={"Height": 2},
+            data={"source": "move"},
+        )
+        second = modified(
+            1,
+            parameters_changed=["Height", "Width"],
+            old_values={"Height": 2, "Width": 5},
+            new_values={"Height": 3, "Width": 6},
+        )
+        coalescer.submit(first)
+        coalescer.submit(second)
+        coalescer.flush()
+
+        merged = recorder.events[0]
+        assert merged.parameters_changed == ["Height", "Width"]
+        assert merged.old_values == {"Height": 1, "Width": 5}
+        assert merged.new_values == {"Height": 3, "Width": 6}
+        assert merged.data == {"source": "move", "coalesced_count": 2}
+        assert first.data == {"source": "move"}
+        coalescer.close()
+
+    def test_debounce_delivers_after_quiet_period(self, recorder):
+        coalescer = EventCoalescer(recorder, window_seconds=0.05)
+        for _ in range(5):
+            coalescer.submit(modified(1))
+            time.sleep(0.01)
+
+        assert recorder.events == []
+        assert recorder.delivered.wait(1.0)
+        assert len(recorder.events) == 1
+        coalescer.close()
+
+    def test_debounce_max_wait_bounds_delay(self, recorder):
+        coalescer = EventCoalescer(recorder, window_seconds=0.05, max_wait_seconds=0.1)
+        start = time.monotonic()
+        while not recorder.delivered.is_set() and time.monotonic() - start < 1.0:
+            coalescer.submit(modified(1))
+            time.sleep(0.01)
+
+        assert recorder.delivered.is_set()
+        assert time.monotonic() - start < 0.5
+        coalescer.close(flush=False)
+
+    def test_throttle_delivers_leading_and_trailing(self, recorder):
+        coalescer = EventCoalescer(
+            recorder, window_seconds=0.05, mode=CoalesceMode.THROTTLE
+        )
+        events = [modified(1) for _ in range(3)]
+        for event in events:
+            coalescer.submit(event)
+
+        assert recorder.events == [events[0]]
+
+        deadline = time.monotonic() + 1.0
+        while len(recorder.events) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert recorder.events == [events[0], events[2]]
+        coalescer.close()
+
+    def test_window_mode_is_not_extended(self, recorder):
+        coalescer = EventCoalescer(
+            recorder, window_seconds=0.05, mode=CoalesceMode.WINDOW
+        )
+        start = time.monotonic()
+        while not recorder.delivered.is_set() and time.monotonic() - start < 1.0:
+            coalescer.submit(modified(1))
+            time.sleep(0.005)
+
+        assert recorder.delivered.is_set()
+        assert time.monotonic() - start < 0.5
+        coalescer.close(flush=False)
+
+    def test_delivery_times_stay_bounded(self, recorder):
+        debouncer = EventCoalescer(recorder, window_seconds=10)
+        for element_id in range(500):
+            debouncer.submit(modified(element_id))
+        debouncer.flush()
+
+        throttler = EventCoalescer(
+            recorder, window_seconds=0.001, mode=CoalesceMode.THROTTLE
+        )
+        for element_id in range(500):
+            throttler.submit(modified(element_id))
+            time.sleep(0.0001)
+        time.sleep(0.002)
+        throttler.submit(modified(-1))
+
+        assert debouncer._last_delivery == {}
+        assert len(throttler._last_delivery) < 500
+        debouncer.close()
+        throttler.close()
+
+    def test_callback_errors_are_counted(self):
+        def failing(event_data: EventData) -> None:
+            raise RuntimeError("boom")
+
+        coalescer = EventCoalescer(failing, window_seconds=10)
+        coalescer.submit(modified(1))
+        coalescer.flush()
+
+        assert coalescer.stats.delivery_errors == 1
+        coalescer.close()
+
+    def test_submit_after_close(self, recorder):
+        coalescer = EventCoalescer(recorder)
+        coalescer.close()
+
+        with pytest.raises(RuntimeError):
+            coalescer.submit(modified(1))
+
+
+class TestMergeEventData:
+    """Tests for merge_event_data."""
+
+    def test_parameter_event_keeps_first_old_value(self):
+        older = ParameterEventData(
+            event_type=EventType.PARAMETER_CHANGED, old_value=1, new_value=2
+        )
+        newer = ParameterEventData(
+            event_type=EventType.PARAMETER_CHANGED, old_value=2, new_value=3
+        )
+
+        merged = merge_event_data(older, newer)
+
+        assert (merged.old_value, merged.new_value) == (1, 3)
+
+
+class TestCoalescingEventHandler:
+    """Tests for the handler wrapper and decorator."""
+
+    def test_dispatch_burst_runs_handler_once(self, recorder):
+        handler = CoalescingEventHandler(
+            CallableEventHandler(recorder, name="cache"),
+            window_seconds=10,
+            key=lambda e: "all",
+        )
+        dispatcher = EventDispatcher()
+        dispatcher.register_handler(handler, [EventType.ELEMENT_MODIFIED])
+
+        for element_id in range(50):
+            dispatcher.dispatch_event(modified(element_id), immediate=True)
+
+        assert recorder.events == []
+        handler.close()
+        assert len(recorder.events) == 1
+        assert handler.handler.metadata.execution_count == 1
+
+    def test_decorator(self, recorder):
+        @event_handler([EventType.ELEMENT_MODIFIED])
+        @coalesced_handler(window_seconds=10, key=lambda e: "all")
+        def on_modified(event_data: EventData) -> EventResult:
+            return recorder(event_data)
+
+        dispatcher = EventDispatcher()
+        dispatcher.register_handler(
+            on_modified._event_handler, on_modified._event_types
+        )
+        for element_id in range(10):
+            dispatcher.dispatch_event(modified(element_id), immediate=True)
+
+        assert on_modified._coalescer.flush() == 1
+        assert len(recorder.events) == 1
+        on_modified._coalescer.close()
+
+    def test_async_decorator(self, recorder):
+        @coalesced_handler(window_seconds=10)
+        async def on_modified(event_data: EventData) -> EventResult:
+            return recorder(event_data)
+
+        assert on_modified._coalescer.pending_count == 0
+        on_modified._coalescer.submit(modified(1))
+        on_modified._coalescer.flush()
+
+        assert len(recorder.events) == 1
+        on_modified._coalescer.close()
+
+    @pytest.mark.asyncio
+    async def test_async_throttle_on_running_loop(self, recorder):
+        loop = asyncio.get_running_loop()
+        loops: list[bool] = []
+
+        @coalesced_handler(window_seconds=0.05, mode=CoalesceMode.THROTTLE)
+        async def on_modified(event_data: EventData) -> EventResult:
+            loops.append(asyncio.get_running_loop() is loop)
+            return recorder(event_data)
+
+        events = [modified(1) for _ in range(3)]
+        for event in events:
+            await on_modified(event)
+        for _ in range(100):
+            if len(recorder.events) == 2:
+                break
+            await asyncio.sleep(0.01)
+
+        assert recorder.events == [events[0], events[2]]
+        assert loops == [True, True]
+        assert on_modified._coalescer.stats.delivery_errors == 0
+        on_modified._coalescer.close()
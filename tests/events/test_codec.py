@@ -0,0 +1,67 @@
+"""
+Tests for the binary event encoding.
+"""
+
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+from revitpy.events.codec import decode_event, encode_event, peek_event
+from revitpy.events.types import (
+    ElementEventData,
+    EventData,
+    EventType,
+    ParameterEventData,
+    SelectionEventData,
+)
+
+
+class TestEventCodec:
+    """Tests for encode_event and decode_event."""
+
+    @pytest.mark.parametrize(
+        "event",
+        [
+            EventData(EventType.CUSTOM, data={"n": 1}, cancellable=True),
+            ElementEventData(
+                EventType.ELEMENT_MODIFIED,
+                element_id=42,
+                parameters_changed=["Height"],
+                new_values={"Height": 3.5},
+            ),
+            ParameterEventData(
+                EventType.PARAMETER_CHANGED, parameter_name="Mark", old_value="A"
+            ),
+            SelectionEventData(EventType.SELECTION_CHANGED, selected_elements=[1, 2]),
+        ],
+    )
+    def test_round_trip(self, event):
+        restored = decode_event(encode_event(event))
+
+        assert type(restored) is type(event)
+        assert restored == event
+
+    def test_source_is_dropped(self):
+        event = EventData(EventType.CUSTOM, source=object())
+        assert decode_event(encode_event(event)).source is None
+
+    def test_peek_reads_header_only(self):
+        event = ElementEventData(EventType.ELEMENT_DELETED, element_id=7)
+        encoded = encode_event(event)
+
+        assert peek_event(encoded) == (
+            EventType.ELEMENT_DELETED,
+            event.timestamp.timestamp(),
+        )
+
+    def test_unserializable_data_is_rejected(self):
+        with pytest.raises(TypeError):
+            encode_event(EventData(EventType.CUSTOM, data={"fn": lambda: None}))
+
+    def test_foreign_data_is_rejected(self):
+        with pytest.raises(ValueError):
+            decode_event(pickle.dumps(EventData(EventType.CUSTOM)))
+        with pytest.raises(ValueError):
+            decode_event(b"\x01")
@@ -0,0 +1,202 @@
+"""
+Tests for static handler discovery and lazy module loading.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+
+import pytest
+
+from revitpy.events.discovery import (
+    HANDLER_MANIFEST_NAME,
+    HandlerManifest,
+    scan_source,
+)
+from revitpy.events.manager import EventManager
+from revitpy.events.types import ElementEventData, EventType
+
+HANDLER_MODULE = """
+from revitpy.events.decorators import event_handler, on_document_saved
+from revitpy.events.types import EventType
+
+CALLS = []
+
+@event_handler([EventType.ELEMENT_MODIFIED, EventType.ELEMENT_CREATED])
+def on_element(event_data):
+    CALLS.append(event_data.event_type)
+
+@on_document_saved()
+def on_saved(event_data):
+    CALLS.append(event_data.event_type)
+"""
+
+DYNAMIC_MODULE = """
+from revitpy.events.decorators import event_handler
+from revitpy.events.types import EventType
+
+TYPES = [EventType.VIEW_ACTIVATED]
+
+@event_handler(TYPES)
+def on_view(event_data):
+    pass
+"""
+
+
+@pytest.fixture
+def manager():
+    """Provide a fresh event manager instead of the shared singleton."""
+    previous = EventManager._instance
+    EventManager._instance = None
+    instance = EventManager()
+    yield instance
+    instance.stop(timeout=1.0)
+    EventManager._instance = previous
+
+
+@pytest.fixture
+def extensions(tmp_path):
+    """Provide an extension folder with handler and plain modules."""
+    (tmp_path / "handlers.py").write_text(HANDLER_MODULE)
+    (tmp_path / "helpers.py").write_text("raise RuntimeError('not a handler module')\n")
+    return tmp_path
+
+
+class TestScanSource:
+    """Tests for the AST scanner."""
+
+    def test_typed_and_implied_decorators(self):
+        handlers = {h.name: h for h in scan_source(HANDLER_MODULE)}
+
+        assert handlers["on_element"].event_types == [
+            "ELEMENT_MODIFIED",
+            "ELEMENT_CREATED",
+        ]
+        assert handlers["on_saved"].event_types == ["DOCUMENT_SAVED"]
+
+    def test_keyword_and_stacked_decorators(self):
+        source = (
+            "@throttled_handler(0.5)\n"
+            "@events.async_event_handler(event_types=(EventType.SELECTION_CHANGED,))\n"
+            "async def tick(event_data):\n"
+            "    pass\n"
+        )
+
+        [handler] = scan_source(source)
+
+        assert handler.name == "tick"
+        assert handler.resolve_event_types() == [EventType.SELECTION_CHANGED]
+
+    def test_dynamic_event_types_are_unknown(self):
+        [handler] = scan_source(DYNAMIC_MODULE)
+
+        assert handler.event_types is None
+        assert handler.resolve_event_types() is None
+
+    def test_undecorated_functions_are_ignored(self):
+        assert scan_source("def helper(event_data):\n    pass\n") == []
+
+
+class TestHandlerManifest:
+    """Tests for the persistent scan cache."""
+
+    def test_manifest_round_trip(self, extensions):
+        manifest_path = extensions / HANDLER_MANIFEST_NAME
+        manifest = HandlerManifest.load(manifest_path)
+        manifest.scan("handlers.py", extensions / "handlers.py", "handlers")
+        assert manifest.save()
+
+        reloaded = HandlerManifest.load(manifest_path)
+        entry = reloaded.entries["handlers.py"]
+
+        assert not reloaded.is_dirty
+        assert entry.event_types() == {
+            EventType.ELEMENT_MODIFIED,
+            EventType.ELEMENT_CREATED,
+            EventType.DOCUMENT_SAVED,
+        }
+
+    def test_unchanged_file_is_not_reparsed(self, extensions, monkeypatch):
+        manifest = HandlerManifest(extensions / HANDLER_MANIFEST_NAME)
+        manifest.scan("handlers.py", extensions / "handlers.py", "handlers")
+        manifest.save()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("file was re-parsed")
+
+        monkeypatch.setattr("revitpy.events.discovery.scan_source", fail)
+
+        # Same content with a new mtime is detected by hash
+        stat = (extensions / "handlers.py").stat()
+        os.utime(
+            extensions / "handlers.py", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9)
+        )
+        manifest.scan("handlers.py", extensions / "handlers.py", "handlers")
+
+        assert manifest.entries["handlers.py"].mtime_ns == stat.st_mtime_ns + 10**9
+
+    def test_corrupt_manifest_is_ignored(self, tmp_path):
+        path = tmp_path / HANDLER_MANIFEST_NAME
+        path.write_text("{not json")
+
+        assert HandlerManifest.load(path).entries == {}
+
+
+class TestLazyDiscovery:
+    """Tests for lazy handler loading in the event manager."""
+
+    def test_modules_load_on_first_matching_event(self, manager, extensions):
+        discovered = manager.discover_handlers([extensions])
+
+        assert discovered == 2
+        assert "handlers" not in manager._registered_modules
+        assert (extensions / HANDLER_MANIFEST_NAME).exists()
+
+        # Unrelated events do not import anything
+        manager.dispatch_event(EventType.VIEW_ACTIVATED, immediate=True)
+        assert "handlers" not in manager._registered_modules
+
+        manager.dispatch_event(EventType.DOCUMENT_SAVED, immediate=True)
+        assert "handlers" in manager._registered_modules
+        assert (
+            len(manager.dispatcher.get_handlers_for_event(EventType.ELEMENT_MODIFIED))
+            == 1
+        )
+
+        # The module is imported once even though it handles several types
+        result = manager.dispatch_event(
+            EventType.ELEMENT_MODIFIED, immediate=True, element_id=1
+        )
+        assert result.handlers_executed == 1
+
+    def test_direct_dispatcher_dispatch_loads_modules(self, manager, extensions):
+        manager.discover_handlers([extensions])
+
+        event = ElementEventData(EventType.ELEMENT_CREATED, element_id=1)
+        result = manager.dispatcher.dispatch_event(event, immediate=True)
+
+        assert "handlers" in manager._registered_modules
+        assert result.handlers_executed == 1
+
+    def test_manifest_lists_files(self, manager, extensions):
+        manager.discover_handlers([extensions])
+
+        data = json.loads((extensions / HANDLER_MANIFEST_NAME).read_text())
+
+        assert set(data["files"]) == {"handlers.py", "helpers.py"}
+        assert data["files"]["helpers.py"]["handlers"] == []
+
+    def test_dynamic_modules_load_eagerly(self, manager, tmp_path):
+        (tmp_path / "dynamic.py").write_text(DYNAMIC_MODULE)
+
+        assert manager.discover_handlers([tmp_path]) == 1
+        assert "dynamic" in manager._registered_modules
+
+    def test_eager_discovery(self, manager, tmp_path):
+        (tmp_path / "handlers.py").write_text(HANDLER_MODULE)
+
+        assert manager.discover_handlers([tmp_path], lazy=False) == 2
+        assert "handlers" in manager._registered_modules
+        assert "handlers" not in sys.modules
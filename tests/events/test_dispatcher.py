@@ -0,0 +1,451 @@
+"""
+Tests for the event dispatcher.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from revitpy.events.dispatcher import EventDispatcher
+from revitpy.events.filters import (
+    EventFilter,
+    category,
+    custom,
+    element_id,
+    event_type,
+    parameter_changed,
+)
+from revitpy.events.handlers import AsyncCallableEventHandler, CallableEventHandler
+from revitpy.events.types import (
+    ElementEventData,
+    EventData,
+    EventPriority,
+    EventResult,
+    EventType,
+)
+
+
+def make_handler(
+    name: str,
+    calls: list[str] | None = None,
+    priority: EventPriority = EventPriority.NORMAL,
+    event_filter: EventFilter | None = None,
+) -> CallableEventHandler:
+    """Create a handler that records its name when invoked."""
+
+    def callback(event_data: EventData) -> EventResult:
+        if calls is not None:
+            calls.append(name)
+        return EventResult.CONTINUE
+
+    return CallableEventHandler(
+        callback, name=name, priority=priority, event_filter=event_filter
+    )
+
+
+@pytest.fixture
+def dispatcher() -> EventDispatcher:
+    """Provide a dispatcher that is stopped after the test."""
+    instance = EventDispatcher()
+    yield instance
+    instance.stop_processing(timeout=1.0)
+
+
+class TestDispatchTables:
+    """Tests for precomputed dispatch tables."""
+
+    def test_priority_order_across_global_and_typed(self, dispatcher):
+        low = make_handler("low", priority=EventPriority.LOW)
+        high = make_handler("high", priority=EventPriority.HIGH)
+        global_normal = make_handler("global", priority=EventPriority.NORMAL)
+
+        dispatcher.register_handler(low, [EventType.ELEMENT_CREATED])
+        dispatcher.register_handler(global_normal)
+        dispatcher.register_handler(high, [EventType.ELEMENT_CREATED])
+
+        names = [
+            h.name for h in dispatcher.get_handlers_for_event(EventType.ELEMENT_CREATED)
+        ]
+        assert names == ["high", "global", "low"]
+
+    def test_typed_handlers_precede_global_of_same_priority(self, dispatcher):
+        dispatcher.register_handler(make_handler("global"))
+        dispatcher.register_handler(make_handler("typed"), [EventType.ELEMENT_MODIFIED])
+
+        names = [
+            h.name
+            for h in dispatcher.get_handlers_for_event(EventType.ELEMENT_MODIFIED)
+        ]
+        assert names == ["typed", "global"]
+
+    def test_unmapped_type_uses_global_table(self, dispatcher):
+        dispatcher.register_handler(make_handler("global"))
+        dispatcher.register_handler(make_handler("typed"), [EventType.VIEW_CREATED])
+
+        names = [
+            h.name for h in dispatcher.get_handlers_for_event(EventType.DOCUMENT_SAVED)
+        ]
+        assert names == ["global"]
+
+    def test_unregister_rebuilds_table(self, dispatcher):
+        handler = make_handler("typed")
+        dispatcher.register_handler(handler, [EventType.ELEMENT_DELETED])
+        dispatcher.unregister_handler(handler, [EventType.ELEMENT_DELETED])
+
+        assert dispatcher.get_handlers_for_event(EventType.ELEMENT_DELETED) == []
+
+    def test_unregister_everywhere(self, dispatcher):
+        handler = make_handler("typed")
+        dispatcher.register_handler(handler, [EventType.ELEMENT_DELETED])
+        dispatcher.register_handler(handler)
+        dispatcher.unregister_handler(handler)
+
+        assert dispatcher.get_handlers_for_event(EventType.ELEMENT_DELETED) == []
+        assert dispatcher.get_handlers_for_event(EventType.CUSTOM) == []
+
+    def test_returned_list_does_not_alias_table(self, dispatcher):
+        dispatcher.register_handler(make_handler("a"), [EventType.CUSTOM])
+
+        handlers = dispatcher.get_handlers_for_event(EventType.CUSTOM)
+        handlers.clear()
+
+        assert len(dispatcher.get_handlers_for_event(EventType.CUSTOM)) == 1
+
+    def test_snapshot_survives_registration_during_dispatch(self, dispatcher):
+        calls: list[str] = []
+        late = make_handler("late", calls)
+
+        def register_late(event_data: EventData) -> EventResult:
+            calls.append("first")
+            dispatcher.register_handler(late, [EventType.CUSTOM])
+            return EventResult.CONTINUE
+
+        dispatcher.register_handler(
+            CallableEventHandler(register_late, name="first"), [EventType.CUSTOM]
+        )
+
+        dispatcher.dispatch_event(EventData(EventType.CUSTOM), immediate=True)
+        assert calls == ["first"]
+
+        dispatcher.dispatch_event(EventData(EventType.CUSTOM), immediate=True)
+        assert calls == ["first", "first", "late"]
+
+    def test_rebuild_after_priority_change(self, dispatcher):
+        a = make_handler("a", priority=EventPriority.HIGH)
+        b = make_handler("b", priority=EventPriority.LOW)
+        dispatcher.register_handler(a, [EventType.CUSTOM])
+        dispatcher.register_handler(b, [EventType.CUSTOM])
+
+        b.metadata.priority = EventPriority.HIGHEST
+        dispatcher.rebuild_dispatch_tables()
+
+        names = [h.name for h in dispatcher.get_handlers_for_event(EventType.CUSTOM)]
+        assert names == ["b", "a"]
+
+    def test_immediate_dispatch_runs_in_priority_order(self, dispatcher):
+        calls: list[str] = []
+        dispatcher.register_handler(
+            make_handler("low", calls, EventPriority.LOW), [EventType.CUSTOM]
+        )
+        dispatcher.register_handler(make_handler("global", calls))
+        dispatcher.register_handler(
+            make_handler("high", calls, EventPriority.HIGHEST), [EventType.CUSTOM]
+        )
+
+        result = dispatcher.dispatch_event(EventData(EventType.CUSTOM), immediate=True)
+
+        assert calls == ["high", "global", "low"]
+        assert result.handlers_executed == 3
+
+
+def modified(element_id: int, category: str = "Walls", **kwargs) -> ElementEventData:
+    """Create an element-modified event."""
+    return ElementEventData(
+        event_type=EventType.ELEMENT_MODIFIED,
+        element_id=element_id,
+        category=category,
+        **kwargs,
+    )
+
+
+class TestFilterRouting:
+    """Tests for indexed filter routing."""
+
+    def routed_names(self, dispatcher, event_data) -> list[str]:
+        table = dispatcher._dispatch_table_for(event_data.event_type)
+        return [handler.name for handler in table.route(event_data)]
+
+    def test_element_id_routing(self, dispatcher):
+        for i in range(100):
+            dispatcher.register_handler(
+                make_handler(f"element_{i}", event_filter=element_id(i)),
+                [EventType.ELEMENT_MODIFIED],
+            )
+
+        assert self.routed_names(dispatcher, modified(42)) == ["element_42"]
+        assert self.routed_names(dispatcher, modified(1000)) == []
+
+    def test_routing_preserves_priority_order(self, dispatcher):
+        dispatcher.register_handler(
+            make_handler("walls", event_filter=category("Walls")),
+            [EventType.ELEMENT_MODIFIED],
+        )
+        dispatcher.register_handler(
+            make_handler("any", priority=EventPriority.LOW),
+            [EventType.ELEMENT_MODIFIED],
+        )
+        dispatcher.register_handler(
+            make_handler(
+                "element",
+                priority=EventPriority.HIGH,
+                event_filter=element_id(1),
+            ),
+            [EventType.ELEMENT_MODIFIED],
+        )
+        dispatcher.register_handler(
+            make_handler("residual", event_filter=custom(lambda e: False)),
+        )
+
+        assert self.routed_names(dispatcher, modified(1)) == [
+            "element",
+            "walls",
+            "residual",
+            "any",
+        ]
+        assert self.routed_names(dispatcher, modified(2, category="Doors")) == [
+            "residual",
+            "any",
+        ]
+
+    def test_event_type_filter_prunes_table(self, dispatcher):
+        dispatcher.register_handler(
+            make_handler("views", event_filter=event_type(EventType.VIEW_CREATED))
+        )
+        dispatcher.register_handler(make_handler("typed"), [EventType.CUSTOM])
+
+        assert self.routed_names(dispatcher, EventData(EventType.CUSTOM)) == ["typed"]
+        assert self.routed_names(dispatcher, EventData(EventType.VIEW_CREATED)) == [
+            "views"
+        ]
+
+    def test_parameter_name_routing(self, dispatcher):
+        dispatcher.register_handler(
+            make_handler("height", event_filter=parameter_changed("Height")),
+            [EventType.ELEMENT_MODIFIED],
+        )
+        dispatcher.register_handler(
+            make_handler("width", event_filter=parameter_changed("Width")),
+            [EventType.ELEMENT_MODIFIED],
+        )
+
+        event = modified(1, parameters_changed=["Width", "Height"])
+        assert self.routed_names(dispatcher, event) == ["height", "width"]
+
+    def test_residual_filter_still_applies(self, dispatcher):
+        calls: list[str] = []
+        dispatcher.register_handler(
+            make_handler(
+                "walls_1",
+                calls,
+                event_filter=category("Walls") & element_id(1),
+            ),
+            [EventType.ELEMENT_MODIFIED],
+        )
+
+        dispatcher.dispatch_event(modified(1, category="Doors"), immediate=True)
+        dispatcher.dispatch_event(modified(1, category="Walls"), immediate=True)
+
+        assert calls == ["walls_1"]
+
+    def test_unhashable_routing_value(self, dispatcher):
+        dispatcher.register_handler(
+            make_handler("element", event_filter=element_id(1)),
+            [EventType.ELEMENT_MODIFIED],
+        )
+
+        assert self.routed_names(dispatcher, modified([1])) == []
+
+
+class TestQueueProcessing:
+    """Tests for the background processing thread."""
+
+    def test_queued_event_wakes_worker(self, dispatcher):
+        handled = threading.Event()
+
+        def on_event(event_data: EventData) -> EventResult:
+            handled.set()
+            return EventResult.CONTINUE
+
+        dispatcher.register_handler(
+            CallableEventHandler(on_event, name="waker"), [EventType.CUSTOM]
+        )
+
+        dispatcher.dispatch_event(EventData(EventType.CUSTOM))
+
+        assert handled.wait(1.0)
+        assert dispatcher.is_processing
+
+    def test_idle_worker_stops_promptly(self, dispatcher):
+        dispatcher.dispatch_event(EventData(EventType.CUSTOM))
+        thread = dispatcher._worker_threads[0]
+
+        start = time.perf_counter()
+        dispatcher.stop_processing(timeout=1.0)
+
+        assert time.perf_counter() - start < 0.5
+        assert not thread.is_alive()
+        assert not dispatcher.is_processing
+
+    def test_restart_after_stop(self, dispatcher):
+        handled = threading.Event()
+
+        def on_event(event_data: EventData) -> EventResult:
+            handled.set()
+            return EventResult.CONTINUE
+
+        dispatcher.register_handler(
+            CallableEventHandler(on_event, name="restart"), [EventType.CUSTOM]
+        )
+        dispatcher.dispatch_event(EventData(EventType.VIEW_CREATED))
+        dispatcher.stop_processing(timeout=1.0)
+
+        dispatcher.dispatch_event(EventData(EventType.CUSTOM))
+
+        assert handled.wait(1.0)
+
+
+class TestWorkerPool:
+    """Tests for multi-worker, key-partitioned dispatch."""
+
+    @pytest.fixture
+    def pool(self) -> EventDispatcher:
+        """Provide a four-worker dispatcher that is stopped after the test."""
+        instance = EventDispatcher(num_workers=4)
+        yield instance
+        instance.stop_processing(timeout=1.0)
+
+    def wait_for(self, condition, timeout: float = 2.0) -> bool:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if condition():
+                return True
+            time.sleep(0.005)
+        return condition()
+
+    def test_invalid_worker_count(self):
+        with pytest.raises(ValueError):
+            EventDispatcher(num_workers=0)
+
+    def test_same_element_events_stay_ordered(self, pool):
+        seen: dict[int, list[int]] = {}
+        lock = threading.Lock()
+
+        def record(event_data: EventData) -> EventResult:
+            with lock:
+                seen.setdefault(event_data.element_id, []).append(
+                    event_data.data["sequence"]
+                )
+            return EventResult.CONTINUE
+
+        pool.register_handler(
+            CallableEventHandler(record, name="record"), [EventType.ELEMENT_MODIFIED]
+        )
+
+        for sequence in range(50):
+            for element in range(8):
+                pool.dispatch_event(modified(element, data={"sequence": sequence}))
+
+        assert self.wait_for(lambda: sum(len(v) for v in seen.values()) == 400)
+        for element in range(8):
+            assert seen[element] == list(range(50))
+
+    def test_slow_element_does_not_block_others(self, pool):
+        release = threading.Event()
+        fast_done = threading.Event()
+
+        def handle(event_data: EventData) -> EventResult:
+            if event_data.element_id == 0:
+                release.wait(2.0)
+            else:
+                fast_done.set()
+            return EventResult.CONTINUE
+
+        pool.register_handler(
+            CallableEventHandler(handle, name="handle"), [EventType.ELEMENT_MODIFIED]
+        )
+
+        slow_worker = pool._partition_for(modified(0))
+        fast_id = next(
+            i for i in range(1, 100) if pool._partition_for(modified(i)) != slow_worker
+        )
+
+        pool.dispatch_event(modified(0))
+        pool.dispatch_event(modified(fast_id))
+
+        try:
+            assert fast_done.wait(1.0)
+        finally:
+            release.set()
+
+    def test_worker_stats(self, pool):
+        release = threading.Event()
+
+        def block(event_data: EventData) -> EventResult:
+            release.wait(2.0)
+            return EventResult.CONTINUE
+
+        pool.register_handler(
+            CallableEventHandler(block, name="block"), [EventType.ELEMENT_MODIFIED]
+        )
+        worker = pool._partition_for(modified(1))
+
+        for _ in range(5):
+            pool.dispatch_event(modified(1))
+
+        try:
+            assert len(pool.stats.worker_queue_depths) == 4
+            assert pool.stats.worker_peak_queue_depths[worker] >= 4
+        finally:
+            release.set()
+
+        assert self.wait_for(lambda: pool.stats.events_by_worker[worker] == 5)
+        assert pool.stats.worker_queue_depths[worker] == 0
+        assert sum(pool.stats.events_by_worker) == 5
+
+    def test_custom_partition_key(self):
+        dispatcher = EventDispatcher(
+            num_workers=3, partition_key=lambda e: e.data["tenant"]
+        )
+
+        first = EventData(EventType.CUSTOM, data={"tenant": "a"})
+        second = EventData(EventType.CUSTOM, data={"tenant": "a"})
+
+        assert dispatcher._partition_for(first) == dispatcher._partition_for(second)
+
+    def test_async_handlers_run_on_worker_loop(self, pool):
+        results: list[int] = []
+        done = threading.Event()
+
+        async def handle(event_data: EventData) -> EventResult:
+            results.append(event_data.element_id)
+            if len(results) == 3:
+                done.set()
+            return EventResult.CONTINUE
+
+        pool.register_handler(
+            AsyncCallableEventHandler(handle, name="async"),
+            [EventType.ELEMENT_MODIFIED],
+        )
+        for element in range(3):
+            pool.dispatch_event(modified(element))
+
+        assert done.wait(2.0)
+        loop = pool._worker_loop
+
+        pool.stop_processing(timeout=1.0)
+
+        assert sorted(results) == [0, 1, 2]
+        assert loop.is_closed()
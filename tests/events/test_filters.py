@@ -0,0 +1,138 @@
+"""
+Tests for event filters and their routing constraints.
+"""
+
+from __future__ import annotations
+
+from revitpy.events.filters import (
+    RoutingDimension,
+    category,
+    custom,
+    data_equals,
+    element_id,
+    event_type,
+    parameter_changed,
+    routing_values,
+)
+from revitpy.events.types import (
+    ElementEventData,
+    EventData,
+    EventType,
+    ParameterEventData,
+)
+
+
+def element_event(**kwargs) -> ElementEventData:
+    """Create an element-modified event."""
+    return ElementEventData(event_type=EventType.ELEMENT_MODIFIED, **kwargs)
+
+
+class TestRoutingConstraints:
+    """Tests for EventFilter.routing_constraints."""
+
+    def test_simple_filters(self):
+        assert event_type(EventType.VIEW_CREATED).routing_constraints() == {
+            RoutingDimension.EVENT_TYPE: frozenset({EventType.VIEW_CREATED})
+        }
+        assert element_id(1, 2).routing_constraints() == {
+            RoutingDimension.ELEMENT_ID: frozenset({1, 2})
+        }
+        assert category("Walls").routing_constraints() == {
+            RoutingDimension.CATEGORY: frozenset({"Walls"})
+        }
+        assert parameter_changed("Height").routing_constraints() == {
+            RoutingDimension.PARAMETER_NAME: frozenset({"Height"})
+        }
+
+    def test_non_decomposable_filters(self):
+        assert parameter_changed("H.*", use_regex=True).routing_constraints() == {}
+        assert data_equals("key", 1).routing_constraints() == {}
+        assert (~category("Walls")).routing_constraints() == {}
+
+    def test_and_intersects_constraints(self):
+        combined = category("Walls", "Doors") & category("Doors") & element_id(5)
+
+        assert combined.routing_constraints() == {
+            RoutingDimension.CATEGORY: frozenset({"Doors"}),
+            RoutingDimension.ELEMENT_ID: frozenset({5}),
+        }
+
+    def test_and_ignores_residual_children(self):
+        combined = category("Walls") & custom(lambda e: True)
+
+        assert combined.routing_constraints() == {
+            RoutingDimension.CATEGORY: frozenset({"Walls"})
+        }
+
+    def test_or_keeps_shared_dimensions(self):
+        either = category("Walls") | (category("Doors") & element_id(1))
+
+        assert either.routing_constraints() == {
+            RoutingDimension.CATEGORY: frozenset({"Walls", "Doors"})
+        }
+        assert (category("Walls") | element_id(1)).routing_constraints() == {}
+
+
+class TestRoutingValues:
+    """Tests for routing_values."""
+
+    def test_element_event(self):
+        event = element_event(
+            element_id=7, category="Walls", parameters_changed=["A", "B"]
+        )
+
+        assert routing_values(event, RoutingDimension.ELEMENT_ID) == (7,)
+        assert routing_values(event, RoutingDimension.CATEGORY) == ("Walls",)
+        assert routing_values(event, RoutingDimension.PARAMETER_NAME) == ("A", "B")
+
+    def test_parameter_event(self):
+        event = ParameterEventData(
+            event_type=EventType.PARAMETER_CHANGED, element_id=3, parameter_name="H"
+        )
+
+        assert routing_values(event, RoutingDimension.ELEMENT_ID) == (3,)
+        assert routing_values(event, RoutingDimension.CATEGORY) == ()
+        assert routing_values(event, RoutingDimension.PARAMETER_NAME) == ("H",)
+
+    def test_base_event(self):
+        event = EventData(EventType.CUSTOM)
+
+        assert routing_values(event, RoutingDimension.EVENT_TYPE) == (EventType.CUSTOM,)
+        assert routing_values(event, RoutingDimension.ELEMENT_ID) == ()
+
+
+class TestCompiledFilters:
+    """Tests for compiled filter predicates."""
+
+    def test_compiled_matches_agree(self):
+        filters = [
+            category("Walls") & element_id(1),
+            category("Walls") | element_id(2),
+            ~category("Walls"),
+            category("Walls") & element_id(1) & parameter_changed("Height"),
+        ]
+        events = [
+            element_event(element_id=1, category="Walls"),
+            element_event(element_id=2, category="Doors"),
+            element_event(
+                element_id=1, category="Walls", parameters_changed=["Height"]
+            ),
+            EventData(EventType.CUSTOM),
+        ]
+
+        for event_filter in filters:
+            matcher = event_filter.compile()
+            for event in events:
+                assert matcher(event) == event_filter.matches(event)
+
+    def test_regex_parameter_filter(self):
+        event_filter = parameter_changed("^Height$", "Wid", use_regex=True)
+
+        assert event_filter.matches(element_event(parameters_changed=["Width"]))
+        assert event_filter.matches(element_event(parameters_changed=["Height"]))
+        assert not event_filter.matches(element_event(parameters_changed=["Heights"]))
+
+    def test_empty_regex_parameter_filter(self):
+        event_filter = parameter_changed(use_regex=True)
+
+        assert not event_filter.matches(element_event(parameters_changed=["A"]))
@@ -0,0 +1,213 @@
+"""
+Tests for handler latency histograms, timeouts and circuit breakers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from revitpy.events.dispatcher import EventDispatcher
+from revitpy.events.handlers import AsyncCallableEventHandler, CallableEventHandler
+from revitpy.events.health import (
+    CircuitBreaker,
+    CircuitState,
+    HandlerTimeoutError,
+    LatencyHistogram,
+)
+from revitpy.events.types import ElementEventData, EventResult, EventType
+
+
+def modified(element_id: int = 1) -> ElementEventData:
+    """Create an element-modified event."""
+    return ElementEventData(
+        event_type=EventType.ELEMENT_MODIFIED, element_id=element_id
+    )
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_percentiles_within_bucket_accuracy(self):
+        histogram = LatencyHistogram()
+        for millis in range(1, 1001):
+            histogram.record(millis / 1000)
+
+        assert histogram.count == 1000
+        assert histogram.percentile(50) == pytest.approx(0.5, rel=0.13)
+        assert histogram.percentile(99) == pytest.approx(0.99, rel=0.13)
+        assert histogram.percentile(100) == pytest.approx(1.0)
+        assert histogram.mean == pytest.approx(0.5005)
+
+    def test_empty_and_out_of_range(self):
+        histogram = LatencyHistogram(max_value=1.0)
+
+        assert histogram.percentile(99) == 0.0
+
+        histogram.record(0.0)
+        histogram.record(50.0)
+        assert histogram.percentile(100) == 50.0
+
+        with pytest.raises(ValueError):
+            histogram.percentile(101)
+
+    def test_snapshot_and_reset(self):
+        histogram = LatencyHistogram()
+        histogram.record(0.01)
+
+        assert set(histogram.snapshot()) == {
+            "count",
+            "mean",
+            "p50",
+            "p95",
+            "p99",
+            "max",
+        }
+
+        histogram.reset()
+        assert histogram.count == 0
+        assert histogram.max == 0.0
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=60)
+
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow()
+        assert breaker.stats.rejected_calls == 1
+
+    def test_half_open_probe_closes_or_reopens(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()  # Only one probe at a time
+
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+
+        time.sleep(0.02)
+        assert breaker.allow()
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.stats.times_opened == 2
+
+    def test_slow_calls_count_as_failures(self):
+        breaker = CircuitBreaker(failure_threshold=2, slow_call_threshold=0.1)
+
+        breaker.record_success(0.05)
+        breaker.record_success(0.5)
+        breaker.record_success(0.5)
+
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.stats.slow_calls == 2
+
+
+class TestDispatcherHealth:
+    """Tests for handler health tracking in the dispatcher."""
+
+    def test_handler_latency_is_recorded(self):
+        dispatcher = EventDispatcher()
+        handler = CallableEventHandler(lambda e: EventResult.CONTINUE, name="fast")
+        dispatcher.register_handler(handler, [EventType.ELEMENT_MODIFIED])
+
+        for _ in range(20):
+            dispatcher.dispatch_event(modified(), immediate=True)
+
+        latency = dispatcher.get_handler_stats()["fast"]["latency"]
+        assert latency["count"] == 20
+        assert 0 < latency["p50"] <= latency["p99"]
+
+    def test_timeout_does_not_block_dispatch(self):
+        release = threading.Event()
+        dispatcher = EventDispatcher(handler_timeout=0.05)
+        slow = CallableEventHandler(lambda e: release.wait(2), name="slow")
+        dispatcher.register_handler(slow, [EventType.ELEMENT_MODIFIED])
+
+        start = time.perf_counter()
+        result = dispatcher.dispatch_event(modified(), immediate=True)
+        elapsed = time.perf_counter() - start
+        release.set()
+
+        assert elapsed < 1.0
+        assert result.handlers_failed == 1
+        assert isinstance(result.errors[0], HandlerTimeoutError)
+        assert slow.metadata.timeout_count == 1
+        assert dispatcher.stats.handler_timeouts == 1
+
+    def test_handler_timeout_overrides_default(self):
+        dispatcher = EventDispatcher(handler_timeout=0.05)
+        handler = CallableEventHandler(lambda e: None, timeout=5.0)
+        dispatcher.register_handler(handler, [EventType.ELEMENT_MODIFIED])
+
+        assert handler.timeout == 5.0
+
+    def test_failing_handler_is_short_circuited(self):
+        calls = []
+
+        def failing(event_data):
+            calls.append(event_data)
+            raise RuntimeError("boom")
+
+        dispatcher = EventDispatcher(failure_threshold=3, recovery_timeout=0.05)
+        handler = CallableEventHandler(failing, name="failing")
+        healthy = CallableEventHandler(lambda e: None, name="healthy")
+        dispatcher.register_handler(handler, [EventType.ELEMENT_MODIFIED])
+        dispatcher.register_handler(healthy, [EventType.ELEMENT_MODIFIED])
+
+        for _ in range(10):
+            dispatcher.dispatch_event(modified(), immediate=True)
+
+        assert len(calls) == 3
+        assert healthy.metadata.execution_count == 10
+        assert dispatcher.stats.handlers_short_circuited == 7
+        assert handler.circuit_breaker.state == CircuitState.OPEN
+
+        # After the recovery timeout one probe is let through
+        time.sleep(0.06)
+        dispatcher.dispatch_event(modified(), immediate=True)
+        assert len(calls) == 4
+        assert handler.circuit_breaker.state == CircuitState.OPEN
+
+    def test_async_handler_timeout(self):
+        async def hang(event_data):
+            await asyncio.sleep(5)
+
+        dispatcher = EventDispatcher(failure_threshold=1, recovery_timeout=60)
+        handler = AsyncCallableEventHandler(hang, name="hang", timeout=0.05)
+        dispatcher.register_handler(handler, [EventType.ELEMENT_MODIFIED])
+
+        result = asyncio.run(dispatcher.dispatch_event_async(modified()))
+
+        assert result.handlers_failed == 1
+        assert isinstance(result.errors[0], HandlerTimeoutError)
+        assert handler.circuit_breaker.state == CircuitState.OPEN
+
+    def test_queue_wait_is_recorded(self):
+        dispatcher = EventDispatcher()
+        done = threading.Event()
+        dispatcher.register_handler(
+            CallableEventHandler(lambda e: done.set()), [EventType.ELEMENT_MODIFIED]
+        )
+
+        dispatcher.dispatch_event(modified())
+        assert done.wait(2.0)
+        dispatcher.stop_processing()
+
+        assert dispatcher.stats.queue_wait.count == 1
@@ -0,0 +1,205 @@
+"""
+Tests for the memory-mapped event journal.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from revitpy.events.dispatcher import EventDispatcher
+from revitpy.events.handlers import CallableEventHandler
+from revitpy.events.journal import EventJournal
+from revitpy.events.types import (
+    ElementEventData,
+    EventData,
+    EventResult,
+    EventType,
+)
+
+
+def modified(element_id: int, **kwargs) -> ElementEventData:
+    """Create an element-modified event."""
+    return ElementEventData(
+        event_type=EventType.ELEMENT_MODIFIED, element_id=element_id, **kwargs
+    )
+
+
+@pytest.fixture
+def journal(tmp_path) -> EventJournal:
+    """Provide a journal that is closed after the test."""
+    instance = EventJournal(tmp_path / "journal", segment_size=4096)
+    yield instance
+    instance.close()
+
+
+class TestEventJournal:
+    """Tests for recording and reading journaled events."""
+
+    def test_round_trip(self, journal):
+        events = [modified(i, category="Walls", data={"n": i}) for i in range(10)]
+        for event in events:
+            journal.record(event)
+
+        assert journal.flush()
+
+        restored = list(journal.iter_events())
+        assert [e.event_id for e in restored] == [e.event_id for e in events]
+        assert restored[3].element_id == 3
+        assert restored[3].category == "Walls"
+        assert restored[3].data == {"n": 3}
+        assert journal.stats.records_written == 10
+
+    def test_source_is_not_journaled(self, journal):
+        journal.record(EventData(EventType.CUSTOM, source=object()))
+        journal.flush()
+
+        (restored,) = journal.iter_events()
+        assert restored.source is None
+
+    def test_unserializable_event_is_counted(self, journal):
+        journal.record(EventData(EventType.CUSTOM, data={"fn": lambda: None}))
+        journal.record(EventData(EventType.CUSTOM))
+        journal.flush()
+
+        assert journal.stats.records_dropped == 1
+        assert len(list(journal.iter_events())) == 1
+
+    def test_record_is_a_snapshot(self, journal):
+        event = modified(1, data={"state": "before"})
+        journal.record(event)
+        event.set_data("state", "after")
+        event.element_id = 2
+        journal.flush()
+
+        (restored,) = journal.iter_events()
+        assert restored.element_id == 1
+        assert restored.data == {"state": "before"}
+
+    def test_segments_rotate(self, journal):
+        for i in range(200):
+            journal.record(modified(i))
+        journal.flush()
+
+        assert len(journal.segment_paths()) > 1
+        assert [e.element_id for e in journal.iter_events()] == list(range(200))
+
+    def test_filter_by_type_and_time(self, journal):
+        base = datetime(2024, 1, 1, 12, 0, 0)
+        for minute in range(5):
+            journal.record(modified(minute, timestamp=base + timedelta(minutes=minute)))
+            journal.record(
+                EventData(EventType.CUSTOM, timestamp=base + timedelta(minutes=minute))
+            )
+        journal.flush()
+
+        window = list(
+            journal.iter_events(
+                start=base + timedelta(minutes=1),
+                end=base + timedelta(minutes=3),
+                event_types=[EventType.ELEMENT_MODIFIED],
+            )
+        )
+
+        assert [e.element_id for e in window] == [1, 2, 3]
+
+    def test_reopen_appends_new_segment(self, tmp_path):
+        directory = tmp_path / "journal"
+        with EventJournal(directory) as first:
+            first.record(modified(1))
+
+        with EventJournal(directory) as second:
+            second.record(modified(2))
+            second.flush()
+
+            assert [e.element_id for e in second.iter_events()] == [1, 2]
+            assert len(second.segment_paths()) == 2
+
+    def test_closed_segments_are_trimmed(self, tmp_path):
+        directory = tmp_path / "journal"
+        with EventJournal(directory, segment_size=1024 * 1024) as journal:
+            journal.record(modified(1))
+
+        (segment,) = journal.segment_paths()
+        assert 0 < segment.stat().st_size < 1024
+
+    def test_retention_by_size(self, tmp_path):
+        journal = EventJournal(tmp_path / "journal", segment_size=4096, max_bytes=8192)
+        for i in range(500):
+            journal.record(modified(i))
+        journal.close()
+
+        total = sum(path.stat().st_size for path in journal.segment_paths())
+        assert total <= 8192 + 4096
+        assert journal.stats.segments_deleted > 0
+        remaining = [e.element_id for e in journal.iter_events()]
+        assert remaining == list(range(500 - len(remaining), 500))
+
+    def test_retention_by_age(self, tmp_path):
+        directory = tmp_path / "journal"
+        with EventJournal(directory) as old:
+            old.record(modified(1))
+        (old_segment,) = old.segment_paths()
+        stale = time.time() - 3600
+        os.utime(old_segment, (stale, stale))
+
+        with EventJournal(directory, max_age_seconds=60) as journal:
+            assert not old_segment.exists()
+            assert journal.stats.segments_deleted == 1
+
+    def test_corrupt_tail_is_ignored(self, tmp_path):
+        directory = tmp_path / "journal"
+        with EventJournal(directory) as journal:
+            journal.record(modified(1))
+            journal.record(modified(2))
+
+        (segment,) = journal.segment_paths()
+        data = bytearray(segment.read_bytes())
+        data[-1] ^= 0xFF
+        segment.write_bytes(bytes(data))
+
+        assert [e.element_id for e in journal.iter_events()] == [1]
+
+
+class TestJournalReplay:
+    """Tests for replaying journaled events into a dispatcher."""
+
+    def test_dispatcher_records_and_replays(self, tmp_path):
+        journal = EventJournal(tmp_path / "journal")
+        source = EventDispatcher(journal=journal)
+        for i in range(3):
+            source.dispatch_event(modified(i), immediate=True)
+        journal.flush()
+
+        seen: list[int] = []
+
+        def record(event_data: EventData) -> EventResult:
+            seen.append(event_data.element_id)
+            return EventResult.CONTINUE
+
+        target = EventDispatcher(journal=journal)
+        target.register_handler(
+            CallableEventHandler(record, name="record"), [EventType.ELEMENT_MODIFIED]
+        )
+
+        assert journal.replay(target) == 3
+        assert seen == [0, 1, 2]
+
+        # Replayed events are not journaled again
+        journal.flush()
+        assert len(list(journal.iter_events())) == 3
+        journal.close()
+
+    def test_rate_limited_replay(self, journal):
+        for i in range(5):
+            journal.record(modified(i))
+        journal.flush()
+
+        start = time.monotonic()
+        count = journal.replay(EventDispatcher(), rate=100)
+
+        assert count == 5
+        assert time.monotonic() - start >= 0.035
@@ -0,0 +1,211 @@
+"""
+Tests for priority lanes in the event dispatcher.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from revitpy.events.dispatcher import EventDispatcher
+from revitpy.events.filters import EventTypeFilter
+from revitpy.events.handlers import CallableEventHandler
+from revitpy.events.lanes import DEFAULT_LANE_WEIGHTS, EventLane, LaneQueue
+from revitpy.events.types import EventData, EventResult, EventType
+
+
+class GatedRecorder:
+    """Handler callback that blocks on the first event and records order."""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.seen: list[tuple[EventType, int]] = []
+
+    def __call__(self, event_data: EventData) -> EventResult:
+        self.started.set()
+        self.release.wait(5.0)
+        self.seen.append((event_data.event_type, event_data.data.get("n")))
+        return EventResult.CONTINUE
+
+
+def event(event_type: EventType, n: int) -> EventData:
+    """Create an event carrying a sequence number."""
+    return EventData(event_type, data={"n": n})
+
+
+def wait_for(condition, timeout: float = 2.0) -> bool:
+    """Poll until condition() is true or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.005)
+    return condition()
+
+
+@pytest.fixture
+def gate() -> GatedRecorder:
+    """Provide a gated recorder."""
+    instance = GatedRecorder()
+    yield instance
+    instance.release.set()
+
+
+def held_dispatcher(gate: GatedRecorder, **kwargs) -> EventDispatcher:
+    """Create a dispatcher whose worker is held by the gate after one event."""
+    dispatcher = EventDispatcher(**kwargs)
+    dispatcher.register_handler(CallableEventHandler(gate, name="gate"))
+    dispatcher.dispatch_event(event(EventType.CUSTOM, -1))
+    assert gate.started.wait(1.0)
+    return dispatcher
+
+
+class TestLaneQueue:
+    """Tests for weighted round-robin lane scheduling."""
+
+    def test_take_interleaves_by_weight(self):
+        queue = LaneQueue({EventLane.CRITICAL: 3, EventLane.BACKGROUND: 1})
+        for n in range(20):
+            queue.append(EventLane.CRITICAL, ("c", n))
+            queue.append(EventLane.BACKGROUND, ("b", n))
+
+        taken = [lane for lane, _ in queue.take(8)]
+
+        assert taken.count(EventLane.CRITICAL) == 6
+        assert taken.count(EventLane.BACKGROUND) == 2
+        assert len(queue) == 32
+
+    def test_low_lane_is_not_starved(self):
+        queue = LaneQueue(DEFAULT_LANE_WEIGHTS)
+        for n in range(1000):
+            queue.append(EventLane.CRITICAL, n)
+        queue.append(EventLane.BACKGROUND, "bulk")
+
+        taken = [item for _, item in queue.take(13)]
+
+        assert "bulk" in taken
+
+    def test_order_is_kept_within_lane_and_on_requeue(self):
+        queue = LaneQueue(DEFAULT_LANE_WEIGHTS)
+        for n in range(5):
+            queue.append(EventLane.NORMAL, n)
+
+        taken = queue.take(3)
+        queue.requeue(taken[1:])
+
+        assert [item for _, item in taken] == [0, 1, 2]
+        assert [item for _, item in queue.take(10)] == [1, 2, 3, 4]
+
+    def test_pop_lowest_and_clear(self):
+        queue = LaneQueue(DEFAULT_LANE_WEIGHTS)
+        queue.append(EventLane.CRITICAL, "ui")
+        queue.append(EventLane.BACKGROUND, "bulk")
+
+        assert queue.pop_lowest() == "bulk"
+        assert queue.depths()[EventLane.CRITICAL] == 1
+        assert queue.clear() == 1
+        with pytest.raises(IndexError):
+            queue.pop_lowest()
+
+    def test_invalid_weights(self):
+        with pytest.raises(ValueError):
+            LaneQueue({EventLane.NORMAL: 0})
+        with pytest.raises(ValueError):
+            LaneQueue({})
+
+
+class TestDispatcherLanes:
+    """Tests for lane assignment and scheduling in the dispatcher."""
+
+    def test_selection_overtakes_flood(self, gate):
+        dispatcher = held_dispatcher(gate)
+        for n in range(200):
+            dispatcher.dispatch_event(event(EventType.ELEMENT_MODIFIED, n))
+        dispatcher.dispatch_event(event(EventType.SELECTION_CHANGED, 0))
+
+        assert dispatcher.stats.lane_queue_depths[EventLane.CRITICAL] == 1
+        gate.release.set()
+
+        assert wait_for(lambda: len(gate.seen) == 202)
+        position = gate.seen.index((EventType.SELECTION_CHANGED, 0))
+        assert position <= 2
+        assert dispatcher.stats.events_by_lane[EventLane.CRITICAL] == 1
+        dispatcher.stop_processing(timeout=1.0)
+
+    def test_top_lane_preempts_running_batch(self, gate):
+        dispatcher = held_dispatcher(gate)
+        processing = threading.Event()
+        critical_queued = threading.Event()
+
+        def hold_first(event_data: EventData) -> None:
+            if event_data.data.get("n") == 0:
+                processing.set()
+                critical_queued.wait(1.0)
+
+        dispatcher.register_handler(CallableEventHandler(hold_first, name="hold"))
+        # Queued while the worker is held, so they are taken as one batch
+        for n in range(50):
+            dispatcher.dispatch_event(event(EventType.ELEMENT_MODIFIED, n))
+        gate.release.set()
+        assert processing.wait(1.0)
+        dispatcher.dispatch_event(event(EventType.SELECTION_CHANGED, 0))
+        critical_queued.set()
+
+        assert wait_for(lambda: len(gate.seen) == 1 + 50 + 1)
+        assert dispatcher.stats.lane_preemptions >= 1
+        assert gate.seen.index((EventType.SELECTION_CHANGED, 0)) == 2
+        dispatcher.stop_processing(timeout=1.0)
+
+    def test_assign_lane_by_type_and_filter(self):
+        dispatcher = EventDispatcher(
+            lane_assignments={EventType.ELEMENT_MODIFIED: EventLane.BACKGROUND}
+        )
+        dispatcher.assign_lane(
+            EventLane.CRITICAL, event_filter=EventTypeFilter(EventType.CUSTOM)
+        )
+        dispatcher.assign_lane(EventLane.NORMAL, [EventType.VIEW_ACTIVATED])
+
+        assert (
+            dispatcher._lane_for(event(EventType.ELEMENT_MODIFIED, 0))
+            == EventLane.BACKGROUND
+        )
+        assert dispatcher._lane_for(event(EventType.CUSTOM, 0)) == EventLane.CRITICAL
+        assert dispatcher._lane_for(event(EventType.VIEW_ACTIVATED, 0)) == (
+            EventLane.NORMAL
+        )
+        assert dispatcher._lane_for(event(EventType.SELECTION_CHANGED, 0)) == (
+            EventLane.CRITICAL
+        )
+
+        with pytest.raises(ValueError):
+            dispatcher.assign_lane(EventLane.NORMAL)
+
+    def test_unconfigured_lane_falls_back(self):
+        dispatcher = EventDispatcher(lane_weights={EventLane.NORMAL: 1})
+
+        assert dispatcher._lane_for(event(EventType.SELECTION_CHANGED, 0)) == (
+            EventLane.NORMAL
+        )
+        with pytest.raises(ValueError):
+            dispatcher.assign_lane(EventLane.CRITICAL, [EventType.CUSTOM])
+
+    def test_drop_oldest_evicts_lowest_lane_first(self, gate):
+        dispatcher = held_dispatcher(
+            gate,
+            max_queue_size=3,
+            lane_assignments={EventType.ELEMENT_MODIFIED: EventLane.BACKGROUND},
+        )
+        dispatcher.dispatch_event(event(EventType.SELECTION_CHANGED, 0))
+        dispatcher.dispatch_event(event(EventType.ELEMENT_MODIFIED, 1))
+        dispatcher.dispatch_event(event(EventType.CUSTOM, 2))
+        dispatcher.dispatch_event(event(EventType.CUSTOM, 3))
+
+        gate.release.set()
+
+        assert wait_for(lambda: len(gate.seen) == 4)
+        assert (EventType.ELEMENT_MODIFIED, 1) not in gate.seen
+        assert dispatcher.stats.dropped_events == 1
+        dispatcher.stop_processing(timeout=1.0)
@@ -7,6 +7,7 @@ from unittest.mock import Mock
 
 import pytest
 
+from revitpy.api.spatial import BoundingBox, SpatialIndex
 from revitpy.orm.cache import CacheManager
 from revitpy.orm.exceptions import QueryError
 from revitpy.orm.query_builder import LazyQueryExecutor, QueryBuilder, QueryPlan
@@ -458,3 +459,65 @@ class TestQueryBuilderFactory:
 
 if __name__ == "__main__":
     pytest.main([__file__])
+
+
+class TestSpatialQueries:
+    """Test spatial predicates on the ORM query builder."""
+
+    @pytest.fixture
+    def spatial_elements(self):
+        elements = []
+        for i in range(6):
+            element = MockElement(i + 1, f"Column-{i}", "Column")
+            element.bounding_box = BoundingBox(i * 10, 0, 0, i * 10 + 1, 1, 3)
+            elements.append(element)
+        return elements
+
+    @pytest.mark.parametrize("use_index", [True, False])
+    def test_intersects(self, spatial_elements, use_index):
+        provider = MockProvider(spatial_elements)
+        if use_index:
+            provider.spatial_index = SpatialIndex.from_elements(spatial_elements)
+
+        query = QueryBuilder(provider).intersects(BoundingBox(5, 0, 0, 21, 1, 1))
+        assert [e.name for e in query.to_list()] == ["Column-1", "Column-2"]
+
+    @pytest.mark.parametrize("use_index", [True, False])
+    def test_nearest_after_filter(self, spatial_elements, use_index):
+        provider = MockProvider(spatial_elements)
+        if use_index:
+            provider.spatial_index = SpatialIndex.from_elements(spatial_elements)
+
+        query = (
+            QueryBuilder(provider)
+            .where(lambda e: e.name != "Column-3")
+            .nearest((31, 0, 0), count=2)
+        )
+        assert [e.name for e in query.to_list()] == ["Column-4", "Column-2"]
+
+    def test_index_follows_moved_and_added_elements(self, spatial_elements):
+        provider = MockProvider(spatial_elements)
+        provider.spatial_index = SpatialIndex.from_elements(spatial_elements)
+        box = BoundingBox(5, 0, 0, 21, 1, 1)
+        assert len(QueryBuilder(provider).intersects(box).to_list()) == 2
+
+        spatial_elements[1].bounding_box = BoundingBox(50, 0, 0, 51, 1, 3)
+        added = MockElement(7, "Added", "Column")
+        added.bounding_box = BoundingBox(18, 0, 0, 19, 1, 3)
+        spatial_elements.append(added)
+
+        query = QueryBuilder(provider).intersects(box)
+        assert [e.name for e in query.to_list()] == ["Column-2", "Added"]
+
+        spatial_elements[5].bounding_box = BoundingBox(100, 0, 0, 101, 1, 3)
+        nearest = QueryBuilder(provider).nearest((50.5, 0, 0), count=2)
+        assert [e.name for e in nearest.to_list()] == ["Column-1", "Column-4"]
+
+    def test_contains_point(self, spatial_elements):
+        provider = MockProvider(spatial_elements)
+        query = QueryBuilder(provider).contains_point((40.5, 0.5, 1))
+        assert [e.name for e in query.to_list()] == ["Column-4"]
+
+    def test_nearest_count_must_be_positive(self, mock_provider):
+        with pytest.raises(ValueError):
+            QueryBuilder(mock_provider).nearest((0, 0, 0), count=0)
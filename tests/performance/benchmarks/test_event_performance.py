@@ -0,0 +1,62 @@
+"""Performance benchmarks for the RevitPy event dispatcher.
+
+Measures enqueue-to-handler latency of the background processing thread.
+"""
+
+import statistics
+import threading
+import time
+
+import pytest
+
+from revitpy.events.dispatcher import EventDispatcher
+from revitpy.events.handlers import CallableEventHandler
+from revitpy.events.types import EventData, EventResult, EventType
+
+
+def _percentiles(samples: list[float]) -> tuple[float, float]:
+    """Return the p50 and p99 of the samples in milliseconds."""
+    cut_points = statistics.quantiles(samples, n=100, method="inclusive")
+    return cut_points[49] * 1000, cut_points[98] * 1000
+
+
+class TestEventDispatchLatency:
+    """Latency benchmarks for queued event dispatch."""
+
+    @pytest.fixture
+    def dispatcher(self):
+        """Dispatcher that is stopped after the benchmark."""
+        instance = EventDispatcher()
+        yield instance
+        instance.stop_processing(timeout=1.0)
+
+    @pytest.mark.performance
+    def test_enqueue_to_handler_latency(self, dispatcher):
+        """Benchmark latency from enqueue to handler start on an idle queue."""
+        event_count = 200
+        latencies: list[float] = []
+        handled = threading.Event()
+
+        def record(event_data: EventData) -> EventResult:
+            latencies.append(time.perf_counter() - event_data.data["enqueued_at"])
+            handled.set()
+            return EventResult.CONTINUE
+
+        dispatcher.register_handler(
+            CallableEventHandler(record, name="latency_probe"), [EventType.CUSTOM]
+        )
+
+        for _ in range(event_count):
+            handled.clear()
+            event = EventData(EventType.CUSTOM)
+            event.data["enqueued_at"] = time.perf_counter()
+            dispatcher.dispatch_event(event)
+            assert handled.wait(1.0)
+            # Let the worker go idle again before the next event
+            time.sleep(0.002)
+
+        p50, p99 = _percentiles(latencies)
+
+        assert len(latencies) == event_count
+        assert p50 < 2.0, f"p50 enqueue-to-handler latency {p50:.3f}ms"
+        assert p99 < 20.0, f"p99 enqueue-to-handler latency {p99:.3f}ms"